@@ -1,6 +1,10 @@
 -- Instead of calling require or dofile, just get the globals.
 local Strings = _G["RanckorsGalleryStrings"]
 local Colors  = _G["RanckorsGalleryColors"]
+local Loader = _G["RanckorsGalleryLoader"]
+-- Lookup indexes over the data tables, generated by scripts/data_excel_to_lua.py.
+-- The tables themselves are built by the Loader when their items are needed.
+local Data = _G["RanckorsGalleryData"]
 
 local RanckorsGallery = {}
 local addonName = "RanckorsGallery"
@@ -29,8 +33,40 @@ function RanckorsGallery:OnPlayerActivated(event)
     -- You can add any additional actions to perform upon login here.
 end
 
+-- Returns every item of a data table (e.g. "paintings"), for its view.
+-- Only the first call after the add-on loads, or after CloseCategory, builds the table.
+function RanckorsGallery:OpenCategory(tableName)
+    return Loader.GetItems(tableName)
+end
+
+-- Lets the data table of a view that was closed be garbage collected.
+function RanckorsGallery:CloseCategory(tableName)
+    Loader.Release(tableName)
+end
+
+-- Returns the item with this itemId and the name of its data table, or nil.
+function RanckorsGallery:GetItemByItemId(itemId)
+    return Loader.GetIndexedItem(Data.byItemId[tonumber(itemId)])
+end
+
+-- Returns the item with this furnDataId and the name of its data table, or nil.
+function RanckorsGallery:GetItemByFurnDataId(furnDataId)
+    return Loader.GetIndexedItem(Data.byFurnDataId[tostring(furnDataId)])
+end
+
+-- Returns true if the data table (e.g. "paintings") holds the item.
+function RanckorsGallery:IsInCollection(tableName, itemId)
+    local members = Data.members[tableName]
+    return members ~= nil and members[tonumber(itemId)] == true
+end
+
 function RanckorsGallery:OnFurniturePlaced(event, furnitureData)
-    d(Colors.Green .. "Furniture placed: " .. tostring(furnitureData.itemId) .. Colors.Reset)
+    local item, tableName = self:GetItemByItemId(furnitureData.itemId)
+    if item then
+        d(Colors.Green .. "Furniture placed: " .. item.name .. " (" .. tableName .. ")" .. Colors.Reset)
+    else
+        d(Colors.Green .. "Furniture placed: " .. tostring(furnitureData.itemId) .. Colors.Reset)
+    end
 end
 
 EVENT_MANAGER:RegisterForEvent(addonName, EVENT_ADD_ON_LOADED, function(event, addon)
@@ -1,2302 +0,0 @@
-local banners = {
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_housingmuseumbanner003.dds",
-        itemId = 210890,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=210890&quality=4",
-        name = "10-Year Anniversary Banner, Large",
-        allNames = "10-Year Anniversary Banner, Large",
-        furnDataId = "10267",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Celebrate the 10-Year Anniversary of The Elder Scrolls Online with this large banner featuring the Ouroboros.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_housingmuseumbanner002.dds",
-        itemId = 210891,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=210891&quality=4",
-        name = "10-Year Anniversary Banner, Medium",
-        allNames = "10-Year Anniversary Banner, Medium",
-        furnDataId = "10268",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Celebrate the 10-Year Anniversary of The Elder Scrolls Online with this medium banner featuring the Ouroboros.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_housingmuseumbanner001.dds",
-        itemId = 210892,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=210892&quality=3",
-        name = "10-Year Anniversary Banner, Small",
-        allNames = "10-Year Anniversary Banner, Small",
-        furnDataId = "10269",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Celebrate the 10-Year Anniversary of The Elder Scrolls Online with this small banner featuring the Ouroboros.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_lsb_hewsbanebanner003.dds",
-        itemId = 119965,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119965&quality=4",
-        name = "Abah's Landing Banner",
-        allNames = "Abah's Landing Banner",
-        furnDataId = "2399",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The flag of the Free and Open Trading Port of Abah's Landing.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignguildforesters001.dds",
-        itemId = 120044,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120044&quality=4",
-        name = "Alchemist's Sign",
-        allNames = "Alchemist's Sign",
-        furnDataId = "2460",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A sign with the symbol used by all those who can tell an alembic from a calcinator.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_banneralinormedium001.dds",
-        itemId = 139376,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139376&quality=2",
-        name = "Alinor Banner, Hanging",
-        allNames = "Alinor Banner, Hanging",
-        furnDataId = "5327",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhbanneranvil002.dds",
-        itemId = 187791,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=187791&quality=4",
-        name = "Anvil Banner, Large",
-        allNames = "Anvil Banner, Large",
-        furnDataId = "8449",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_longbannerset002.dds",
-        itemId = 115527,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115527&quality=4",
-        name = "Argonian Banner, Half Hands",
-        allNames = "Argonian Banner, Half Hands",
-        furnDataId = "829",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_bannerhanging002.dds",
-        itemId = 115451,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115451&quality=2",
-        name = "Argonian Banner, Hanging",
-        allNames = "Argonian Banner, Hanging",
-        furnDataId = "753",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_longbannerset001.dds",
-        itemId = 115526,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115526&quality=4",
-        name = "Argonian Banners, Frilled",
-        allNames = "Argonian Banners, Frilled",
-        furnDataId = "828",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_lsb_ascendantbanner002.dds",
-        itemId = 192426,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192426&quality=4",
-        name = "Ascendant Knight Banner",
-        allNames = "Ascendant Knight Banner",
-        furnDataId = "8810",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A rally banner for the Ascendant Order, knights and brigands all as one.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_signgeneral001.dds",
-        itemId = 134429,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134429&quality=4",
-        name = "Banker's Sign, Large",
-        allNames = "Banker's Sign, Large",
-        furnDataId = "4677",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsigngeneral001.dds",
-        itemId = 134432,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134432&quality=3",
-        name = "Banker's Sign, Small",
-        allNames = "Banker's Sign, Small",
-        furnDataId = "4680",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerazurasmall001.dds",
-        itemId = 126118,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126118&quality=5",
-        name = "Banner of Azura",
-        allNames = "Banner of Azura",
-        furnDataId = "3375",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard sized house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerboethiahsmall001.dds",
-        itemId = 152258,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=152258&quality=5",
-        name = "Banner of Boethiah",
-        allNames = "Banner of Boethiah",
-        furnDataId = "6378",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerhermaeusmorasmall001.dds",
-        itemId = 147636,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=147636&quality=5",
-        name = "Banner of Hermaeus Mora",
-        allNames = "Banner of Hermaeus Mora",
-        furnDataId = "5940",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerhircinesmall001.dds",
-        itemId = 119690,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119690&quality=5",
-        name = "Banner of Hircine",
-        allNames = "Banner of Hircine",
-        furnDataId = "2169",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a medium house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerdressmall001.dds",
-        itemId = 126623,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126623&quality=3",
-        name = "Banner of House Dres",
-        allNames = "Banner of House Dres",
-        furnDataId = "3694",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A long reeled cloth marked for the members and allied of House Dres.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerhlaalusmall001.dds",
-        itemId = 126621,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126621&quality=3",
-        name = "Banner of House Hlaalu",
-        allNames = "Banner of House Hlaalu",
-        furnDataId = "3692",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A long reeled cloth marked for the members and allied of House Hlaalu.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerindorilsmall001.dds",
-        itemId = 126624,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126624&quality=3",
-        name = "Banner of House Indoril",
-        allNames = "Banner of House Indoril",
-        furnDataId = "3695",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A long reeled cloth marked for the members and allied of House Indoril.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerredoransmall001.dds",
-        itemId = 126620,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126620&quality=3",
-        name = "Banner of House Redoran",
-        allNames = "Banner of House Redoran",
-        furnDataId = "3691",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A long reeled cloth marked for the members and allied of House Redoran.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannertelvannismall001.dds",
-        itemId = 126622,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126622&quality=3",
-        name = "Banner of House Telvanni",
-        allNames = "Banner of House Telvanni",
-        furnDataId = "3693",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A long reeled cloth marked for the members and allied of House Telvanni.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerjyggalagsmall001.dds",
-        itemId = 150775,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=150775&quality=5",
-        name = "Banner of Jyggalag",
-        allNames = "Banner of Jyggalag",
-        furnDataId = "6331",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_lsb_leyleyawiinbannermedium001.dds",
-        itemId = 175707,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175707&quality=4",
-        name = "Banner of Leyawiin",
-        allNames = "Banner of Leyawiin",
-        furnDataId = "7801",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The spring green and glinting gold of Leyawiin's banner provide the perfect backdrop for the city's proud, equine emblem. Long may the White Stallion ride!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_summereventbanner002.dds",
-        itemId = 126720,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126720&quality=3",
-        name = "Banner of Mayhem",
-        allNames = "Banner of Mayhem",
-        furnDataId = "3783",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner of champions, and reminder of the senseless violence during the Midyear. It has an air of violence about it.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannermehronesdagonsmall001.dds",
-        itemId = 152259,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=152259&quality=5",
-        name = "Banner of Mehrunes Dagon",
-        allNames = "Banner of Mehrunes Dagon",
-        furnDataId = "6379",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannermephalasmall001.dds",
-        itemId = 152257,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=152257&quality=5",
-        name = "Banner of Mephala",
-        allNames = "Banner of Mephala",
-        furnDataId = "6377",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannernamirasmall001.dds",
-        itemId = 147599,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=147599&quality=5",
-        name = "Banner of Namira",
-        allNames = "Banner of Namira",
-        furnDataId = "5938",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerperyitesmall001.dds",
-        itemId = 134855,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134855&quality=5",
-        name = "Banner of Peryite",
-        allNames = "Banner of Peryite",
-        furnDataId = "4838",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannersheogorathsmall001.dds",
-        itemId = 130190,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130190&quality=5",
-        name = "Banner of Sheogorath",
-        allNames = "Banner of Sheogorath",
-        furnDataId = "3940",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_lsb_tgbannertaneth003.dds",
-        itemId = 119969,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119969&quality=4",
-        name = "Banner of Taneth",
-        allNames = "Banner of Taneth",
-        furnDataId = "2403",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The esteemed banner of the Kingdom of Taneth in Hammerfell.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannervaerminasmall001.dds",
-        itemId = 150774,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=150774&quality=5",
-        name = "Banner of Vaermina",
-        allNames = "Banner of Vaermina",
-        furnDataId = "6330",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerfiredrakessm001.dds",
-        itemId = 126649,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126649&quality=3",
-        name = "Banner of the Fire Drakes",
-        allNames = "Banner of the Fire Drakes",
-        furnDataId = "3720",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This banner displaying the stylized symbol of the Fire Drakes hangs from a wall mount.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannerrevereiesmedium001.dds",
-        itemId = 139388,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139388&quality=3",
-        name = "Banner of the House of Reveries, Hanging",
-        allNames = "Banner of the House of Reveries, Hanging",
-        furnDataId = "5339",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Come one, come all to the House of Reveries: be cheered, be moved, be changed forever!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhbannerkvatchguard003.dds",
-        itemId = 119947,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119947&quality=4",
-        name = "Banner of the Kvatch Guard",
-        allNames = "Banner of the Kvatch Guard",
-        furnDataId = "2388",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The noble wolf's-head banner of the respected Kvatch Guard.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerpitdaemonssm001.dds",
-        itemId = 126712,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126712&quality=3",
-        name = "Banner of the Pit Daemons",
-        allNames = "Banner of the Pit Daemons",
-        furnDataId = "3775",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This banner displaying the stylized symbol of the Pit Daemons hangs from a wall mount.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannersapiarchsmedium001.dds",
-        itemId = 139377,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139377&quality=3",
-        name = "Banner of the Sapiarchs, Hanging",
-        allNames = "Banner of the Sapiarchs, Hanging",
-        furnDataId = "5328",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The symbol of the Sapiarchs, ancient order of the Wise who help guide the realm of Summerset.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_mrkbannersilverdawnsmall001.dds",
-        itemId = 141858,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=141858&quality=4",
-        name = "Banner of the Silver Dawn",
-        allNames = "Banner of the Silver Dawn",
-        furnDataId = "5512",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This pristine banner is one of the few relics to survive Vykosa's corruption of Moon Hunter Keep.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerstormlordssm001.dds",
-        itemId = 126650,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126650&quality=3",
-        name = "Banner of the Storm Lords",
-        allNames = "Banner of the Storm Lords",
-        furnDataId = "3721",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This banner displaying the stylized symbol of the Storm Lords hangs from a wall mount.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_anequinabannersmall002.dds",
-        itemId = 151781,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151781&quality=3",
-        name = "Banner, Anequina",
-        allNames = "Banner, Anequina",
-        furnDataId = "6178",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The arid northern region of Elsweyr, called Anequina, has bred hearty warriors and pragmatic thinkers, though some have learned to work the land. Show your respect for the traditions of Anequina by hanging this banner in your abode.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhbanneranvil003.dds",
-        itemId = 175760,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175760&quality=3",
-        name = "Banner, Anvil",
-        allNames = "Banner, Anvil",
-        furnDataId = "7825",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_lsb_bannersboethia002.dds",
-        itemId = 192574,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192574&quality=4",
-        name = "Banner, Boethiah Standard",
-        allNames = "Banner, Boethiah Standard",
-        furnDataId = "8832",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_mrkbannerstribelarge002.dds",
-        itemId = 145406,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145406&quality=3",
-        name = "Banner, Bright-Throat",
-        allNames = "Banner, Bright-Throat",
-        furnDataId = "5709",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The Bright-Throat tribal banner always serves as an invitation to warm welcomes, bizarre meals, and honest trade.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerclavicusvilesmall001.dds",
-        itemId = 125480,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=125480&quality=5",
-        name = "Banner, Clavicus Vile",
-        allNames = "Banner, Clavicus Vile",
-        furnDataId = "3242",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbannerclana005.dds",
-        itemId = 118079,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118079&quality=3",
-        name = "Banner, Crafting",
-        allNames = "Banner, Crafting",
-        furnDataId = "1571",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_mrkbannerstribe001.dds",
-        itemId = 145404,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145404&quality=3",
-        name = "Banner, Dead-Water",
-        allNames = "Banner, Dead-Water",
-        furnDataId = "5707",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This Naga battle-standard features the Dead-Water tribe's frightful iconography, emblazoned on a wamasu skin. At least, you hope it's a wamasu skin.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannervender001.dds",
-        itemId = 203145,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203145&quality=2",
-        name = "Banner, Foodhall",
-        allNames = "Banner, Foodhall",
-        furnDataId = "9584",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbannerclana003.dds",
-        itemId = 118077,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118077&quality=2",
-        name = "Banner, Forceful",
-        allNames = "Banner, Forceful",
-        furnDataId = "1569",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbannerclana002.dds",
-        itemId = 118076,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118076&quality=3",
-        name = "Banner, Forge",
-        allNames = "Banner, Forge",
-        furnDataId = "1568",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerhousingfurnishingvendor002.dds",
-        itemId = 153699,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=153699&quality=5",
-        name = "Banner, Furnishings",
-        allNames = "Banner, Furnishings",
-        furnDataId = "6486",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_jesterbanner002.dds",
-        itemId = 203271,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203271&quality=4",
-        name = "Banner, Jester's Festival",
-        allNames = "Banner, Jester's Festival",
-        furnDataId = "9632",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_jesterbanner001.dds",
-        itemId = 120995,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120995&quality=4",
-        name = "Banner, Jester's Standard",
-        allNames = "Banner, Jester's Standard",
-        furnDataId = "3138",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Behold the cheerful banner of the Lords and Ladies of Misrule!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignguildjewelry001.dds",
-        itemId = 145488,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145488&quality=4",
-        name = "Banner, Jewelry Crafting",
-        allNames = "Banner, Jewelry Crafting",
-        furnDataId = "5791",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Master Jewelers proudly display this banner overhead when selling their wares.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannermalacathsmall001.dds",
-        itemId = 134474,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134474&quality=5",
-        name = "Banner, Malacath",
-        allNames = "Banner, Malacath",
-        furnDataId = "4721",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannermeridiasmall001.dds",
-        itemId = 175578,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175578&quality=5",
-        name = "Banner, Meridia",
-        allNames = "Banner, Meridia",
-        furnDataId = "7674",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbannerclana004.dds",
-        itemId = 118078,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118078&quality=3",
-        name = "Banner, Mighty",
-        allNames = "Banner, Mighty",
-        furnDataId = "1570",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_lsb_housingmoragtongbanner001.dds",
-        itemId = 126628,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126628&quality=4",
-        name = "Banner, Morag Tong",
-        allNames = "Banner, Morag Tong",
-        furnDataId = "3699",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A tattered reminder of the Morag Tong.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannernocturnalsmall001.dds",
-        itemId = 139138,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139138&quality=5",
-        name = "Banner, Nocturnal",
-        allNames = "Banner, Nocturnal",
-        furnDataId = "5089",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhorderofthehourbanner003.dds",
-        itemId = 145487,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145487&quality=4",
-        name = "Banner, Order of the Hour",
-        allNames = "Banner, Order of the Hour",
-        furnDataId = "5790",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_lsb_bannertransmog001.dds",
-        itemId = 141763,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=141763&quality=4",
-        name = "Banner, Outfit",
-        allNames = "Banner, Outfit",
-        furnDataId = "5461",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannertransmogsmall001.dds",
-        itemId = 141764,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=141764&quality=4",
-        name = "Banner, Outfit Small",
-        allNames = "Banner, Outfit Small",
-        furnDataId = "5462",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannervendormerchantmed001.dds",
-        itemId = 153700,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=153700&quality=3",
-        name = "Banner, Packs",
-        allNames = "Banner, Packs",
-        furnDataId = "6487",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_rimmenbannersmall001.dds",
-        itemId = 151780,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151780&quality=3",
-        name = "Banner, Rimmen",
-        allNames = "Banner, Rimmen",
-        furnDataId = "6177",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Show your support for Rimmen's independence from tyranny by hanging this colorful banner in your home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_lsb_mrkbannershistlarge001.dds",
-        itemId = 145405,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145405&quality=3",
-        name = "Banner, Root-Whisper",
-        allNames = "Banner, Root-Whisper",
-        furnDataId = "5708",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The freshly-painted symbols on this banner fill even the most cynical heart with hope and optimism for the Root-Whisper tribe's future.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannertattered002.dds",
-        itemId = 120997,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120997&quality=2",
-        name = "Banner, Tattered Blue",
-        allNames = "Banner, Tattered Blue",
-        furnDataId = "3140",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_lsb_dedmehronesdagonbanner001.dds",
-        itemId = 175703,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175703&quality=4",
-        name = "Banner, Tattered Mehrunes Dagon",
-        allNames = "Banner, Tattered Mehrunes Dagon",
-        furnDataId = "7797",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Every ambitious soul needs grit to prevail—so it's fitting that grit worked its way deep into the fabric of this well-worn blood-red banner of the Razor Prince!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannertattered001.dds",
-        itemId = 120996,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120996&quality=2",
-        name = "Banner, Tattered Red",
-        allNames = "Banner, Tattered Red",
-        furnDataId = "3139",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_lsb_bannerretrait001.dds",
-        itemId = 141765,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=141765&quality=4",
-        name = "Banner, Transmute",
-        allNames = "Banner, Transmute",
-        furnDataId = "5463",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_lsb_bannerretraitsmall001.dds",
-        itemId = 141766,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=141766&quality=4",
-        name = "Banner, Transmute Small",
-        allNames = "Banner, Transmute Small",
-        furnDataId = "5464",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_varhlavivectapestry001.dds",
-        itemId = 126146,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126146&quality=4",
-        name = "Banner, Vivec",
-        allNames = "Banner, Vivec",
-        furnDataId = "3396",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbannerclana001.dds",
-        itemId = 118075,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118075&quality=3",
-        name = "Banner, War",
-        allNames = "Banner, War",
-        furnDataId = "1567",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_duc_fngnecrobanner001.dds",
-        itemId = 134908,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134908&quality=4",
-        name = "Blackmarrow Banner",
-        allNames = "Blackmarrow Banner",
-        furnDataId = "4891",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "No one leaves the Blackmarrow, but every now and then, someone tries.  And every now and then, a Blackmarrow banner grows that much longer.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignguildblacksmith001.dds",
-        itemId = 120046,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120046&quality=4",
-        name = "Blacksmith's Sign",
-        allNames = "Blacksmith's Sign",
-        furnDataId = "2462",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A sign earned by one who's become a master of the forge and hammer.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhfactionbanner002.dds",
-        itemId = 121270,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=121270&quality=4",
-        name = "Brotherhood Banner, Large",
-        allNames = "Brotherhood Banner, Large",
-        furnDataId = "3202",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a huge house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhfactionbanner001.dds",
-        itemId = 134943,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134943&quality=4",
-        name = "Brotherhood Banner, Long",
-        allNames = "Brotherhood Banner, Long",
-        furnDataId = "4926",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a huge house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignclothier001.dds",
-        itemId = 120048,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120048&quality=4",
-        name = "Clothier's Sign",
-        allNames = "Clothier's Sign",
-        furnDataId = "2463",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A sign earned by one who's become a master of the needle and scissors.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannercloudrestmedium001.dds",
-        itemId = 139393,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139393&quality=3",
-        name = "Cloudrest Banner, Hanging",
-        allNames = "Cloudrest Banner, Hanging",
-        furnDataId = "5344",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Municipal symbol of Cloudrest, the High Elves' city atop the towering peak of Eton Nir.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_exc_daggerfallshield001.dds",
-        itemId = 120064,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120064&quality=4",
-        name = "Covenant Hero Shield",
-        allNames = "Covenant Hero Shield",
-        furnDataId = "2477",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This crest is awarded only to the greatest heroes of the Daggerfall Covenant.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_lsb_bannerlarge002.dds",
-        itemId = 130085,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130085&quality=3",
-        name = "Daedric Banner, Molag Bal",
-        allNames = "Daedric Banner, Molag Bal",
-        furnDataId = "3909",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_lsb_bannermedium001.dds",
-        itemId = 130086,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130086&quality=3",
-        name = "Daedric Pennant, Molag Bal",
-        allNames = "Daedric Pennant, Molag Bal",
-        furnDataId = "3910",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhfactionbanner003.dds",
-        itemId = 119945,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119945&quality=4",
-        name = "Dark Brotherhood Banner",
-        allNames = "Dark Brotherhood Banner",
-        furnDataId = "2387",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This hanging banner announces one's membership in the Dark Brotherhood. Display it with caution.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_inc_houseflag001.dds",
-        itemId = 115307,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115307&quality=3",
-        name = "Dark Elf Flags, Hanging",
-        allNames = "Dark Elf Flags, Hanging",
-        furnDataId = "611",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannerdirennimedium001.dds",
-        itemId = 139386,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139386&quality=3",
-        name = "Direnni Banner, Hanging",
-        allNames = "Direnni Banner, Hanging",
-        furnDataId = "5337",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The symbol of Clan Direnni, wayward High Elves who long ago left Summerset to establish their own realm on Balfiera Island.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_exc_aldmerishield001.dds",
-        itemId = 120063,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120063&quality=4",
-        name = "Dominion Hero Shield",
-        allNames = "Dominion Hero Shield",
-        furnDataId = "2476",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This crest is awarded only to the greatest heroes of the Aldmeri Dominion.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_bannerdragonguardmedium001.dds",
-        itemId = 153887,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=153887&quality=4",
-        name = "Dragonguard Banner",
-        allNames = "Dragonguard Banner",
-        furnDataId = "6508",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "With Dragons threatening Elsweyr, the ancient order of the Dragonguard reforms to relentlessly hunt these mighty creatures. This majestic banner serves as a call to arms for those who seek to join their efforts!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_duelingguildfightersstandard001.dds",
-        itemId = 120002,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120002&quality=4",
-        name = "Dueling Banner",
-        allNames = "Dueling Banner",
-        furnDataId = "2433",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner representing a challenge to the death. Only a supremely confident duelist would decorate their home with such a thing.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignguildrunecrafters001.dds",
-        itemId = 120050,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120050&quality=4",
-        name = "Enchanter's Sign",
-        allNames = "Enchanter's Sign",
-        furnDataId = "2464",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A sign earned by one who's become a master of Aspect, Essence, and Potency.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_mourninggroundbanner001.dds",
-        itemId = 119883,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119883&quality=3",
-        name = "Evermore Mourning Banner",
-        allNames = "Evermore Mourning Banner",
-        furnDataId = "2342",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "In Evermore, those who have lost a loved one display their mourning banner on a spear, to represent the wound in their heart.",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212587,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212587&quality=3",
-        name = "Unknown Item #212587",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212587, level 66, and quality 3!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_bannerjusticevendor001.dds",
-        itemId = 120957,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120957&quality=4",
-        name = "Faded Fence Banner",
-        allNames = "Faded Fence Banner",
-        furnDataId = "3108",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "When you've sold that many stolen items to the fences, the least they could do is give you a banner.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_exc_farhangingfabric003.dds",
-        itemId = 182220,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182220&quality=1",
-        name = "Fargrave Flag, Long",
-        allNames = "Fargrave Flag, Long",
-        furnDataId = "8088",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_exc_farhangingfabric004.dds",
-        itemId = 182218,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182218&quality=1",
-        name = "Fargrave Flag, Regular",
-        allNames = "Fargrave Flag, Regular",
-        furnDataId = "8086",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_exc_farhangingfabric001.dds",
-        itemId = 182219,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182219&quality=1",
-        name = "Fargrave Flag, Short",
-        allNames = "Fargrave Flag, Short",
-        furnDataId = "8087",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_exc_housingfarhangingfabricbridge001.dds",
-        itemId = 182214,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182214&quality=2",
-        name = "Fargrave Flags, String",
-        allNames = "Fargrave Flags, String",
-        furnDataId = "8082",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_exc_farbannerline005.dds",
-        itemId = 182215,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182215&quality=2",
-        name = "Fargrave Pennants, Long String",
-        allNames = "Fargrave Pennants, Long String",
-        furnDataId = "8083",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_exc_farbannerline004.dds",
-        itemId = 182216,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182216&quality=1",
-        name = "Fargrave Pennants, String",
-        allNames = "Fargrave Pennants, String",
-        furnDataId = "8084",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerfighterguildmed001.dds",
-        itemId = 120019,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120019&quality=4",
-        name = "Fighters Guild Banner",
-        allNames = "Fighters Guild Banner",
-        furnDataId = "2441",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner presented to one who has more than earned the right to display Fighters Guild affiliation.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignguildffighters001.dds",
-        itemId = 171414,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171414&quality=4",
-        name = "Fighters Guild Sign, Large",
-        allNames = "Fighters Guild Sign, Large",
-        furnDataId = "7483",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikesdragonflaglong001.dds",
-        itemId = 211530,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211530&quality=3",
-        name = "Fire Drake Banner, Long",
-        allNames = "Fire Drake Banner, Long",
-        furnDataId = "10415",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikesdragonflagshort001.dds",
-        itemId = 211531,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211531&quality=3",
-        name = "Fire Drake Banner, Short",
-        allNames = "Fire Drake Banner, Short",
-        furnDataId = "10416",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_lsb_gonfalonbanner003.dds",
-        itemId = 187866,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=187866&quality=4",
-        name = "Gonfalon Bay Banner",
-        allNames = "Gonfalon Bay Banner",
-        furnDataId = "8524",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The teal and silver of this elegant banner often matches the sparkling waters of the bay itself, making it a perfect fit as the city's banner.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bos_lsb_nexusbannersinn001.dds",
-        itemId = 192571,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192571&quality=3",
-        name = "Grahtwood Banner, Hanging Inn",
-        allNames = "Grahtwood Banner, Hanging Inn",
-        furnDataId = "8829",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bos_lsb_nexusbannersfighters001.dds",
-        itemId = 182622,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182622&quality=4",
-        name = "Grahtwood Fighters Guild Banner",
-        allNames = "Grahtwood Fighters Guild Banner",
-        furnDataId = "8209",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_lsb_bannergreymoorsmall002.dds",
-        itemId = 166020,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166020&quality=3",
-        name = "Greymoor Keep Banner, Hanging",
-        allNames = "Greymoor Keep Banner, Hanging",
-        furnDataId = "7172",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A dramatic banner representing Greymoor Keep in Blackreach, that most fabled of places.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_contestbannerdauntlessbananas001.dds",
-        itemId = 178472,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178472&quality=5",
-        name = "Guild Banner, Dauntless Bananas",
-        allNames = "Guild Banner, Dauntless Bananas",
-        furnDataId = "7880",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_contestbannergoldleaf001.dds",
-        itemId = 178474,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178474&quality=5",
-        name = "Guild Banner, Goldleaf Acquisitions",
-        allNames = "Guild Banner, Goldleaf Acquisitions",
-        furnDataId = "7882",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_contestbannernomadsnirn001.dds",
-        itemId = 178476,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178476&quality=5",
-        name = "Guild Banner, Nomads of Nirn",
-        allNames = "Guild Banner, Nomads of Nirn",
-        furnDataId = "7884",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_akaviribanner001.dds",
-        itemId = 151681,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151681&quality=2",
-        name = "Hakoshae Banner, Blue",
-        allNames = "Hakoshae Banner, Blue",
-        furnDataId = "6078",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_akaviribanner003.dds",
-        itemId = 151683,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151683&quality=2",
-        name = "Hakoshae Banner, Square",
-        allNames = "Hakoshae Banner, Square",
-        furnDataId = "6080",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_akaviribanner002.dds",
-        itemId = 151682,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151682&quality=2",
-        name = "Hakoshae Banner, Triple Insignia",
-        allNames = "Hakoshae Banner, Triple Insignia",
-        furnDataId = "6079",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_akaviristring002.dds",
-        itemId = 151868,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151868&quality=3",
-        name = "Hakoshae Banners, Festival",
-        allNames = "Hakoshae Banners, Festival",
-        furnDataId = "6265",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_lsb_sombanner003.dds",
-        itemId = 197720,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197720&quality=4",
-        name = "Hermaeus Mora Banner",
-        allNames = "Hermaeus Mora Banner",
-        furnDataId = "9182",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "No one can entertain doubts as to your affiliation when you hang this banner featuring the Golden Eye's symbols in your home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_lsb_sombanner001.dds",
-        itemId = 194422,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194422&quality=4",
-        name = "Hermaeus Mora Banner, Extra Long",
-        allNames = "Hermaeus Mora Banner, Extra Long",
-        furnDataId = "8960",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a huge house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_lsb_sombanner002.dds",
-        itemId = 203202,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203202&quality=4",
-        name = "Hermaeus Mora Banner, Large",
-        allNames = "Hermaeus Mora Banner, Large",
-        furnDataId = "9608",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_lsb_sombanner005.dds",
-        itemId = 194423,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194423&quality=4",
-        name = "Hermaeus Mora Banner, Long",
-        allNames = "Hermaeus Mora Banner, Long",
-        furnDataId = "8961",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_alt_fur_thronebannerlong001.dds",
-        itemId = 114422,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=114422&quality=4",
-        name = "High Elf Banner, Gilded",
-        allNames = "High Elf Banner, Gilded",
-        furnDataId = "349",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_hlatapestryplain002.dds",
-        itemId = 126366,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126366&quality=3",
-        name = "Hlaalu Banner, Floral",
-        allNames = "Hlaalu Banner, Floral",
-        furnDataId = "3441",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhtapestryakatoshhourglasssm001.dds",
-        itemId = 159451,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=159451&quality=4",
-        name = "Hourglass Banner, Akatosh",
-        allNames = "Hourglass Banner, Akatosh",
-        furnDataId = "6692",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_icereachwitchbanner002.dds",
-        itemId = 159453,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=159453&quality=4",
-        name = "Icereach Coven Totem, Emblem",
-        allNames = "Icereach Coven Totem, Emblem",
-        furnDataId = "6694",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The witches of Icereach Coven mark their territory with unsettling totems that showcase their emblem. Some claim this blood-hued wicker spiral represents their eternal hunger for power no matter the cost.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_lsb_bannerimperiallarge001.dds",
-        itemId = 119983,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119983&quality=4",
-        name = "Imperial Banner",
-        allNames = "Imperial Banner",
-        furnDataId = "2415",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner earned for plumbing the labyrinth of sewers beneath the Imperical City.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestryakatoshmediuma003.dds",
-        itemId = 94094,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94094&quality=2",
-        name = "Imperial Banner, Arkay",
-        allNames = "Imperial Banner, Arkay",
-        furnDataId = "161",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhtapestrydibellaflowersm001.dds",
-        itemId = 94192,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94192&quality=4",
-        name = "Imperial Banner, Dibella",
-        allNames = "Imperial Banner, Dibella",
-        furnDataId = "251",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_lsb_bannerimperialmedium001.dds",
-        itemId = 208159,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=208159&quality=4",
-        name = "Imperial Banner, Emperor's",
-        allNames = "Imperial Banner, Emperor's",
-        furnDataId = "10231",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestrykynemediuma003.dds",
-        itemId = 94095,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94095&quality=2",
-        name = "Imperial Banner, Kyne",
-        allNames = "Imperial Banner, Kyne",
-        furnDataId = "162",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestrystendarrmediuma003.dds",
-        itemId = 94096,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94096&quality=2",
-        name = "Imperial Banner, Stendarr",
-        allNames = "Imperial Banner, Stendarr",
-        furnDataId = "163",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_lsb_hlabanneralmalexia001.dds",
-        itemId = 126553,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126553&quality=4",
-        name = "Indoril Banner, Almalexia",
-        allNames = "Indoril Banner, Almalexia",
-        furnDataId = "3628",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_lsb_hlabannersothasil001.dds",
-        itemId = 126554,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126554&quality=4",
-        name = "Indoril Banner, Sotha Sil",
-        allNames = "Indoril Banner, Sotha Sil",
-        furnDataId = "3629",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_lsb_hlabannervivec001.dds",
-        itemId = 126555,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126555&quality=4",
-        name = "Indoril Banner, Vivec",
-        allNames = "Indoril Banner, Vivec",
-        furnDataId = "3630",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_signinn001.dds",
-        itemId = 192572,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192572&quality=3",
-        name = "Inn Sign, Hanging",
-        allNames = "Inn Sign, Hanging",
-        furnDataId = "8830",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_lsb_tgbannerironwheel003.dds",
-        itemId = 119966,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119966&quality=4",
-        name = "Iron Wheel Banner",
-        allNames = "Iron Wheel Banner",
-        furnDataId = "2400",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The banner of those over-achieving law enforcers known as the Iron Wheel.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_holjesterbannerline002.dds",
-        itemId = 211553,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211553&quality=3",
-        name = "Jester's Festival Garland, Long Flags",
-        allNames = "Jester's Festival Garland, Long Flags",
-        furnDataId = "10438",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_holjesterbannerline001.dds",
-        itemId = 211552,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211552&quality=2",
-        name = "Jester's Festival Garland, Short Flags",
-        allNames = "Jester's Festival Garland, Short Flags",
-        furnDataId = "10437",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_holjestersbanner003.dds",
-        itemId = 211559,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211559&quality=4",
-        name = "Jester's Festival Sign",
-        allNames = "Jester's Festival Sign",
-        furnDataId = "10444",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_holjubileetapestry001.dds",
-        itemId = 211549,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211549&quality=4",
-        name = "Jubilee Banner, Hanging",
-        allNames = "Jubilee Banner, Hanging",
-        furnDataId = "10434",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_holjubileetapestrystanding001.dds",
-        itemId = 211550,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211550&quality=2",
-        name = "Jubilee Banner, Small",
-        allNames = "Jubilee Banner, Small",
-        furnDataId = "10435",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_holjublieestreamers001.dds",
-        itemId = 211551,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211551&quality=3",
-        name = "Jubilee Garland, Streamers",
-        allNames = "Jubilee Garland, Streamers",
-        furnDataId = "10436",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_lsb_bannerkarthaldsmall001.dds",
-        itemId = 166021,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166021&quality=3",
-        name = "Karthwatch Banner, Hanging",
-        allNames = "Karthwatch Banner, Hanging",
-        furnDataId = "7173",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "With its knotwork tower, the gray banner of Karthwatch symbolizes the bravery and steadfastness of the Nords who live there.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_lsb_thormarbanner001.dds",
-        itemId = 115651,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115651&quality=2",
-        name = "Khajiit Banner, Claw",
-        allNames = "Khajiit Banner, Claw",
-        furnDataId = "951",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_lsb_banner003.dds",
-        itemId = 115648,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115648&quality=2",
-        name = "Khajiit Banner, Crescents",
-        allNames = "Khajiit Banner, Crescents",
-        furnDataId = "948",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_lsb_banner001.dds",
-        itemId = 115669,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115669&quality=3",
-        name = "Khajiit Banner, Hooked",
-        allNames = "Khajiit Banner, Hooked",
-        furnDataId = "969",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_lsb_banner002.dds",
-        itemId = 115647,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115647&quality=2",
-        name = "Khajiit Banner, Moons",
-        allNames = "Khajiit Banner, Moons",
-        furnDataId = "947",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerknightoftheflameswordmed001.dds",
-        itemId = 119863,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119863&quality=4",
-        name = "Knights of the Flame Banner",
-        allNames = "Knights of the Flame Banner",
-        furnDataId = "2323",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner representing the noble knightly order of Alcaire in High Rock.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_nor_lsb_templebannerkyneorange001.dds",
-        itemId = 166024,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166024&quality=3",
-        name = "Kyne's Aegis Banner, Hanging",
-        allNames = "Kyne's Aegis Banner, Hanging",
-        furnDataId = "7176",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The Mother of Nords watches over those who display this colorful banner of the Hawk Ascendant—or so popular Nord sentiment claims!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannerlillandrilmedium001.dds",
-        itemId = 139387,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139387&quality=3",
-        name = "Lillandril Banner, Hanging",
-        allNames = "Lillandril Banner, Hanging",
-        furnDataId = "5338",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner displaying the Flask of Lillandril, that Summerset city's famous symbol.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannermageguildmed001.dds",
-        itemId = 120011,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120011&quality=4",
-        name = "Mages Guild Banner",
-        allNames = "Mages Guild Banner",
-        furnDataId = "2437",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner presented to one who has more than earned the right to display Mages Guild affiliation.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignguildmages001.dds",
-        itemId = 171413,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171413&quality=4",
-        name = "Mages Guild Sign, Large",
-        allNames = "Mages Guild Sign, Large",
-        furnDataId = "7482",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannercrafting001.dds",
-        itemId = 139391,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139391&quality=5",
-        name = "Master Crafter's Banner, Hanging",
-        allNames = "Master Crafter's Banner, Hanging",
-        furnDataId = "5342",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Only a master of every major tradeskill has the right to display this sigil above their workshop.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_signbank001.dds",
-        itemId = 134428,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134428&quality=4",
-        name = "Merchant's Sign, Large",
-        allNames = "Merchant's Sign, Large",
-        furnDataId = "4676",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignbank001.dds",
-        itemId = 134431,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134431&quality=3",
-        name = "Merchant's Sign, Small",
-        allNames = "Merchant's Sign, Small",
-        furnDataId = "4679",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_lsb_banner001.dds",
-        itemId = 119833,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119833&quality=4",
-        name = "Molag Bal Banner",
-        allNames = "Molag Bal Banner",
-        furnDataId = "2293",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner brought back in triumph from the heroic challenges of Coldharbour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_dagothancestralbanner001.dds",
-        itemId = 127149,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=127149&quality=4",
-        name = "Morrowind Banner of the 6th House",
-        allNames = "Morrowind Banner of the 6th House",
-        furnDataId = "3844",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_lsb_bannermorthalsmall001.dds",
-        itemId = 166022,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166022&quality=3",
-        name = "Morthal Banner, Hanging",
-        allNames = "Morthal Banner, Hanging",
-        furnDataId = "7174",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Morthal's banner features a white triskelion on a field of gray reminiscent of its misty marshes. Whether the triskelion symbolizes the unity of the mind, body, and spirit—or something else entirely—serves as the subject of scholarly debates.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannervendorarcanistsmall001.dds",
-        itemId = 182621,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182621&quality=3",
-        name = "Mystic's Banner",
-        allNames = "Mystic's Banner",
-        furnDataId = "8208",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerhighf002.dds",
-        itemId = 197741,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197741&quality=4",
-        name = "Necrom Banner, Long Patterned",
-        allNames = "Necrom Banner, Long Patterned",
-        furnDataId = "9205",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerlowc002.dds",
-        itemId = 197696,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197696&quality=4",
-        name = "Necrom Banner, Medium Bronze-Stitched",
-        allNames = "Necrom Banner, Medium Bronze-Stitched",
-        furnDataId = "9156",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerhighc002.dds",
-        itemId = 197694,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197694&quality=4",
-        name = "Necrom Banner, Medium Patterned",
-        allNames = "Necrom Banner, Medium Patterned",
-        furnDataId = "9154",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerlowg002.dds",
-        itemId = 197697,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197697&quality=3",
-        name = "Necrom Banner, Medium Sage-Stitched",
-        allNames = "Necrom Banner, Medium Sage-Stitched",
-        furnDataId = "9157",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerlowd003.dds",
-        itemId = 197742,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197742&quality=3",
-        name = "Necrom Banner, Narrow Bronze-Stitched",
-        allNames = "Necrom Banner, Narrow Bronze-Stitched",
-        furnDataId = "9206",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerhighd003.dds",
-        itemId = 197695,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197695&quality=4",
-        name = "Necrom Banner, Narrow Patterned",
-        allNames = "Necrom Banner, Narrow Patterned",
-        furnDataId = "9155",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerhighe004.dds",
-        itemId = 197740,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197740&quality=3",
-        name = "Necrom Banner, Small Patterned",
-        allNames = "Necrom Banner, Small Patterned",
-        furnDataId = "9204",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_tlv_lsb_necbannerlowg003.dds",
-        itemId = 197743,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197743&quality=3",
-        name = "Necrom Banner, Small Sage-Stitched",
-        allNames = "Necrom Banner, Small Sage-Stitched",
-        furnDataId = "9207",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_lsb_nedicbannerspirit001.dds",
-        itemId = 198045,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=198045&quality=4",
-        name = "Nedic Banner, Ancestral",
-        allNames = "Nedic Banner, Ancestral",
-        furnDataId = "9314",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_lsb_banners002.dds",
-        itemId = 184250,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=184250&quality=2",
-        name = "Nedic Banner, Ancient",
-        allNames = "Nedic Banner, Ancient",
-        furnDataId = "8379",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_lsb_nedicbannerblood001.dds",
-        itemId = 192575,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192575&quality=3",
-        name = "Nedic Banner, Blood",
-        allNames = "Nedic Banner, Blood",
-        furnDataId = "8833",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_lsb_nedicbannerwood001.dds",
-        itemId = 198046,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=198046&quality=4",
-        name = "Nedic Banner, Forest",
-        allNames = "Nedic Banner, Forest",
-        furnDataId = "9315",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_hlawinterfestivalbanner001.dds",
-        itemId = 134290,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134290&quality=3",
-        name = "New Life Celebrant's Standard",
-        allNames = "New Life Celebrant's Standard",
-        furnDataId = "4538",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Honor Magnus as winter's grip weakens, and the days begin to lengthen.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_newlifebanner001.dds",
-        itemId = 146061,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=146061&quality=3",
-        name = "New Life Triptych Banner",
-        allNames = "New Life Triptych Banner",
-        furnDataId = "5848",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_bannermooncultmedium001.dds",
-        itemId = 156758,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156758&quality=4",
-        name = "New Moon Cult Banner",
-        allNames = "New Moon Cult Banner",
-        furnDataId = "6607",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Promising much to vulnerable Khajiit, the Order of the New Moon provides a place for them to go. Yet, in halls strewn with banners such as these, many find more than they expect … or want.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_bannermooncultlarge001.dds",
-        itemId = 156757,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156757&quality=4",
-        name = "New Moon Cult Banner, Large",
-        allNames = "New Moon Cult Banner, Large",
-        furnDataId = "6606",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Promising much to vulnerable Khajiit, the Order of the New Moon provides a place for them to go. Yet, in halls strewn with banners such as these, many find more than they expect … or want.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_lsb_markknighthollowvampiresigilsmall001.dds",
-        itemId = 171387,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171387&quality=4",
-        name = "Nighthollow Banner",
-        allNames = "Nighthollow Banner",
-        furnDataId = "7456",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The banners of the Nighthollow clan have clung to the walls of their crumbling empire for thousands of years. May this one serve you equally as long!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_nor_inc_tapestry001.dds",
-        itemId = 115413,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115413&quality=4",
-        name = "Nord Banner, Knotwork",
-        allNames = "Nord Banner, Knotwork",
-        furnDataId = "715",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_lsb_bannerobservatory001.dds",
-        itemId = 119935,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119935&quality=5",
-        name = "Observatory Banner",
-        allNames = "Observatory Banner",
-        furnDataId = "2379",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This long banner depicts a stylized and ordered version of the sky, as observed by the Stargazers of Craglorn.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_snowwtgorcbanner002.dds",
-        itemId = 116374,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116374&quality=2",
-        name = "Orcish Banner, Faded",
-        allNames = "Orcish Banner, Faded",
-        furnDataId = "1045",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbannegolkarr001.dds",
-        itemId = 203140,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203140&quality=4",
-        name = "Orcish Banner, Golkarr",
-        allNames = "Orcish Banner, Golkarr",
-        furnDataId = "9579",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbanner001.dds",
-        itemId = 116415,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116415&quality=3",
-        name = "Orcish Banner, Hammer Fist",
-        allNames = "Orcish Banner, Hammer Fist",
-        furnDataId = "1086",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_ironorcbanner001.dds",
-        itemId = 182616,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182616&quality=4",
-        name = "Orcish Banner, Iron",
-        allNames = "Orcish Banner, Iron",
-        furnDataId = "8203",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_lsb_wtgorcbanner002.dds",
-        itemId = 116375,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116375&quality=2",
-        name = "Orcish Banner, Worn",
-        allNames = "Orcish Banner, Worn",
-        furnDataId = "1046",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_lsb_dbhbannerbackorderofthehour001.dds",
-        itemId = 119944,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119944&quality=4",
-        name = "Order of the Hour Banner",
-        allNames = "Order of the Hour Banner",
-        furnDataId = "2386",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner \"borrowed\" from the Akatosh-worshiping knights of the Order of the Hour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhtapestryakatoshhourglasslg001.dds",
-        itemId = 204631,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204631&quality=4",
-        name = "Order of the Hour Banner, Large",
-        allNames = "Order of the Hour Banner, Large",
-        furnDataId = "9915",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_outlawbannermedium001.dds",
-        itemId = 120023,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120023&quality=4",
-        name = "Outlaw Banner",
-        allNames = "Outlaw Banner",
-        furnDataId = "2442",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner proudly displaying the covert three-bladed symbol of Tamriel's outlaws. (Wait, that's supposed to be secret!)",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_exc_ebonheartshield001.dds",
-        itemId = 120065,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120065&quality=4",
-        name = "Pact Hero Shield",
-        allNames = "Pact Hero Shield",
-        furnDataId = "2478",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This crest is awarded only to the greatest heroes of the Ebonheart Pact.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_lsb_tgbannerpirate001.dds",
-        itemId = 119984,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119984&quality=4",
-        name = "Pirate Banner",
-        allNames = "Pirate Banner",
-        furnDataId = "2416",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Proudly fly the flag of Abecean piracy after recruiting freebooters for a daring venture.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikesskullflaglong001.dds",
-        itemId = 211536,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211536&quality=3",
-        name = "Pit Daemon Banner, Long",
-        allNames = "Pit Daemon Banner, Long",
-        furnDataId = "10421",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikesskullflagshort001.dds",
-        itemId = 211537,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211537&quality=3",
-        name = "Pit Daemon Banner, Short",
-        allNames = "Pit Daemon Banner, Short",
-        furnDataId = "10422",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsigninn001.dds",
-        itemId = 120052,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120052&quality=4",
-        name = "Provisioner's Sign",
-        allNames = "Provisioner's Sign",
-        furnDataId = "2466",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A sign earned by one who's become a master of the cooking fire and spoons.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannerpsijiicmedium001.dds",
-        itemId = 139170,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139170&quality=3",
-        name = "Psijic Banner",
-        allNames = "Psijic Banner",
-        furnDataId = "5121",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannerpsijiiclarge001.dds",
-        itemId = 139173,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139173&quality=4",
-        name = "Psijic Banner, Large",
-        allNames = "Psijic Banner, Large",
-        furnDataId = "5124",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannerpsijiiclarge002.dds",
-        itemId = 141822,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=141822&quality=4",
-        name = "Psijic Banner, Long",
-        allNames = "Psijic Banner, Long",
-        furnDataId = "5472",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a huge house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_lsb_bannerimperialmediumdestroyed001.dds",
-        itemId = 119884,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119884&quality=4",
-        name = "Ragged Imperial Banner",
-        allNames = "Ragged Imperial Banner",
-        furnDataId = "2343",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "One of the few relatively intact banners recovered following the Imperial occupation of Southern Bangkorai.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_exc_icereachwitchbanner003.dds",
-        itemId = 192581,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192581&quality=3",
-        name = "Reachfolk Banner, Ice Witch",
-        allNames = "Reachfolk Banner, Ice Witch",
-        furnDataId = "8839",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_ext_rchfortbanner002.dds",
-        itemId = 171386,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171386&quality=3",
-        name = "Reachfolk Banner, Markarth",
-        allNames = "Reachfolk Banner, Markarth",
-        furnDataId = "7455",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_reachbanners003.dds",
-        itemId = 167344,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=167344&quality=3",
-        name = "Reachfolk Banner, Moonburst",
-        allNames = "Reachfolk Banner, Moonburst",
-        furnDataId = "7326",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_reachbanners001.dds",
-        itemId = 151954,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151954&quality=3",
-        name = "Reachmen Banner, Bull",
-        allNames = "Reachmen Banner, Bull",
-        furnDataId = "6328",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_lsb_postlight001.dds",
-        itemId = 117695,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=117695&quality=2",
-        name = "Redguard Banner, Post",
-        allNames = "Redguard Banner, Post",
-        furnDataId = "1217",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_exc_rkrdecorativehidebsnow001.dds",
-        itemId = 156663,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156663&quality=3",
-        name = "Riekling Banner, Boar Pelt",
-        allNames = "Riekling Banner, Boar Pelt",
-        furnDataId = "6591",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_exc_rkrdecorativehidedsnow001.dds",
-        itemId = 156662,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156662&quality=3",
-        name = "Riekling Banner, Wolf Pelt",
-        allNames = "Riekling Banner, Wolf Pelt",
-        furnDataId = "6590",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_mao_lsb_banner002.dds",
-        itemId = 119840,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119840&quality=4",
-        name = "Sea Elf Banner",
-        allNames = "Sea Elf Banner",
-        furnDataId = "2300",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner originally taken as a trophy, following the defeat of the invading Maormer at Seaside Sanctuary.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_lsb_senchalbannersmall002.dds",
-        itemId = 156763,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156763&quality=4",
-        name = "Senchal Banner",
-        allNames = "Senchal Banner",
-        furnDataId = "6612",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The blue and gold Senchal banner features lunar symbolism, reflecting the Khajiit's cultural reverence for the moons Jone and Jode.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannershimmerenemedium001.dds",
-        itemId = 139378,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139378&quality=3",
-        name = "Shimmerene Banner, Hanging",
-        allNames = "Shimmerene Banner, Hanging",
-        furnDataId = "5329",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Municipal symbol of the celebrated City of Lights.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_knightssilverrosebannersmall001.dds",
-        itemId = 181510,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=181510&quality=4",
-        name = "Silver Rose Banner",
-        allNames = "Silver Rose Banner",
-        furnDataId = "7987",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The Knights of the Silver Rose proudly display this banner on their well-defended holds, proclaiming to all that Daedra and their sympathizers best beware.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannerblue001.dds",
-        itemId = 118067,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118067&quality=2",
-        name = "Simple Blue Banner",
-        allNames = "Simple Blue Banner",
-        furnDataId = "1562",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannerbrown001.dds",
-        itemId = 118068,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118068&quality=2",
-        name = "Simple Brown Banner",
-        allNames = "Simple Brown Banner",
-        furnDataId = "1563",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannergray001.dds",
-        itemId = 118069,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118069&quality=2",
-        name = "Simple Gray Banner",
-        allNames = "Simple Gray Banner",
-        furnDataId = "1564",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannerpurple001.dds",
-        itemId = 118070,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118070&quality=2",
-        name = "Simple Purple Banner",
-        allNames = "Simple Purple Banner",
-        furnDataId = "1565",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_blankbannerred001.dds",
-        itemId = 118071,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118071&quality=2",
-        name = "Simple Red Banner",
-        allNames = "Simple Red Banner",
-        furnDataId = "1566",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212214,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212214&quality=4",
-        name = "Unknown Item #212214",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212214, level 66, and quality 4!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_lsb_skgbanner001.dds",
-        itemId = 204781,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204781&quality=4",
-        name = "Skingrad Banner, Small",
-        allNames = "Skingrad Banner, Small",
-        furnDataId = "10065",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Share your love of Skingrad, home to high-quality wines and cheeses, by hanging this small banner within your home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_lsb_bannersolitudesmall001.dds",
-        itemId = 166023,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166023&quality=3",
-        name = "Solitude Banner, Hanging",
-        allNames = "Solitude Banner, Hanging",
-        furnDataId = "7175",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Throughout Solitude's long history, it has been watched over by the wolves on its banners. Legends claim that so long as one wolf flies on the ramparts of Solitude, Mara's protective embrace will grace the city's walls.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_signstable001.dds",
-        itemId = 134430,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134430&quality=4",
-        name = "Stablemaster's Sign, Large",
-        allNames = "Stablemaster's Sign, Large",
-        furnDataId = "4678",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smlsignstable001.dds",
-        itemId = 134433,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134433&quality=3",
-        name = "Stablemaster's Sign, Small",
-        allNames = "Stablemaster's Sign, Small",
-        furnDataId = "4681",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_summereventbanner001.dds",
-        itemId = 126719,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126719&quality=3",
-        name = "Standard of Mayhem",
-        allNames = "Standard of Mayhem",
-        furnDataId = "3782",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A standard of champions, and reminder of the senseless violence during the Midyear. It smells vaguely of blood and oil.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerfiredrakesmed001.dds",
-        itemId = 126646,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126646&quality=3",
-        name = "Standard of the Fire Drakes",
-        allNames = "Standard of the Fire Drakes",
-        furnDataId = "3717",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This standard displaying the stylized symbol of the Fire Drakes hangs from a central pole.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerpitdaemonsmed001.dds",
-        itemId = 126648,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126648&quality=3",
-        name = "Standard of the Pit Daemons",
-        allNames = "Standard of the Pit Daemons",
-        furnDataId = "3719",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This standard displaying the stylized symbol of the Pit Daemons hangs from a central pole.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerstormlordsmed001.dds",
-        itemId = 126647,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126647&quality=3",
-        name = "Standard of the Storm Lords",
-        allNames = "Standard of the Storm Lords",
-        furnDataId = "3718",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This standard displaying the stylized symbol of the Storm Lords hangs from a central pole.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikescrownnflaglong001.dds",
-        itemId = 211526,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211526&quality=3",
-        name = "Storm Lord Banner, Long",
-        allNames = "Storm Lord Banner, Long",
-        furnDataId = "10411",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikescrownflagshort001.dds",
-        itemId = 211524,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211524&quality=3",
-        name = "Storm Lord Banner, Short",
-        allNames = "Storm Lord Banner, Short",
-        furnDataId = "10409",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_lsb_bannersunholdmedium001.dds",
-        itemId = 139392,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139392&quality=3",
-        name = "Sunhold Banner, Hanging",
-        allNames = "Sunhold Banner, Hanging",
-        furnDataId = "5343",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The solar-symbol banner of the southern Summerset port city of Sunhold.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_tributebannerflat001.dds",
-        itemId = 187803,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=187803&quality=3",
-        name = "Tales of Tribute Banner",
-        allNames = "Tales of Tribute Banner",
-        furnDataId = "8461",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Using red, gold, and blue, this banner provides a vibrant way to inform others of your passion for the Tales of Tribute card game.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannermalacath001.dds",
-        itemId = 134473,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134473&quality=5",
-        name = "Tapestry, Malacath",
-        allNames = "Tapestry, Malacath",
-        furnDataId = "4720",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerthierrygagnonmed001.dds",
-        itemId = 119856,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119856&quality=4",
-        name = "Torn Lion Guard Banner",
-        allNames = "Torn Lion Guard Banner",
-        furnDataId = "2316",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "The Lion Guard are at their strongest with their backs against a wall.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_bannerblackwormcultistmedium001.dds",
-        itemId = 119922,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119922&quality=4",
-        name = "Torn Worm Cult Banner",
-        allNames = "Torn Worm Cult Banner",
-        furnDataId = "2371",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "One of many trophies taken following the defeat of the Worm Cult in The Rift.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_lsb_undauntedbanner001.dds",
-        itemId = 120036,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120036&quality=4",
-        name = "Undaunted Banner",
-        allNames = "Undaunted Banner",
-        furnDataId = "2454",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A banner presented to one who has more than earned the right to display affiliation with the Undaunted.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bos_lsb_nexusbannersmages001.dds",
-        itemId = 203146,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203146&quality=4",
-        name = "Wood Elf Banner, Mages Guild",
-        allNames = "Wood Elf Banner, Mages Guild",
-        furnDataId = "9585",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_exc_shrineofmalacathbanner001.dds",
-        itemId = 119844,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119844&quality=4",
-        name = "Wood Orc Malacath Banner",
-        allNames = "Wood Orc Malacath Banner",
-        furnDataId = "2304",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "Like their cousins in northern Tamriel, most Wood Orcs honor Malacath.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_smsignwoodworking001.dds",
-        itemId = 120054,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120054&quality=4",
-        name = "Woodworker's Sign",
-        allNames = "Woodworker's Sign",
-        furnDataId = "2468",
-        furnCategory = "Parlor:Banners (3:58)",
-        description = "A sign earned by one who's become a master of the chisel and saw.",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212551,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212551&quality=4",
-        name = "Unknown Item #212551",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212551, level 66, and quality 4!",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212550,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212550&quality=3",
-        name = "Unknown Item #212550",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212550, level 66, and quality 3!",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212552,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212552&quality=3",
-        name = "Unknown Item #212552",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212552, level 66, and quality 3!",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212549,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212549&quality=3",
-        name = "Unknown Item #212549",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212549, level 66, and quality 3!",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212548,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212548&quality=2",
-        name = "Unknown Item #212548",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212548, level 66, and quality 2!",
-    },
-}
\ No newline at end of file
@@ -0,0 +1,310 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 2 of banners, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.banners = Data.chunks.banners or {}
+Data.chunks.banners[2] = function()
+    local banners = {
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_blankbannerblue001.dds",
+            itemId = 118067,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118067&quality=2",
+            name = "Simple Blue Banner",
+            allNames = "Simple Blue Banner",
+            furnDataId = "1562",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_blankbannerbrown001.dds",
+            itemId = 118068,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118068&quality=2",
+            name = "Simple Brown Banner",
+            allNames = "Simple Brown Banner",
+            furnDataId = "1563",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_blankbannergray001.dds",
+            itemId = 118069,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118069&quality=2",
+            name = "Simple Gray Banner",
+            allNames = "Simple Gray Banner",
+            furnDataId = "1564",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_blankbannerpurple001.dds",
+            itemId = 118070,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118070&quality=2",
+            name = "Simple Purple Banner",
+            allNames = "Simple Purple Banner",
+            furnDataId = "1565",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_blankbannerred001.dds",
+            itemId = 118071,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118071&quality=2",
+            name = "Simple Red Banner",
+            allNames = "Simple Red Banner",
+            furnDataId = "1566",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/icon_missing.dds",
+            itemId = 212214,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=212214&quality=4",
+            name = "Unknown Item #212214",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "",
+            description = "No item found matching itemId # 212214, level 66, and quality 4!",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_lsb_skgbanner001.dds",
+            itemId = 204781,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204781&quality=4",
+            name = "Skingrad Banner, Small",
+            allNames = "Skingrad Banner, Small",
+            furnDataId = "10065",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "Share your love of Skingrad, home to high-quality wines and cheeses, by hanging this small banner within your home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_lsb_bannersolitudesmall001.dds",
+            itemId = 166023,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166023&quality=3",
+            name = "Solitude Banner, Hanging",
+            allNames = "Solitude Banner, Hanging",
+            furnDataId = "7175",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "Throughout Solitude's long history, it has been watched over by the wolves on its banners. Legends claim that so long as one wolf flies on the ramparts of Solitude, Mara's protective embrace will grace the city's walls.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_lsb_signstable001.dds",
+            itemId = 134430,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134430&quality=4",
+            name = "Stablemaster's Sign, Large",
+            allNames = "Stablemaster's Sign, Large",
+            furnDataId = "4678",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_lsb_smlsignstable001.dds",
+            itemId = 134433,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134433&quality=3",
+            name = "Stablemaster's Sign, Small",
+            allNames = "Stablemaster's Sign, Small",
+            furnDataId = "4681",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_lsb_summereventbanner001.dds",
+            itemId = 126719,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126719&quality=3",
+            name = "Standard of Mayhem",
+            allNames = "Standard of Mayhem",
+            furnDataId = "3782",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "A standard of champions, and reminder of the senseless violence during the Midyear. It smells vaguely of blood and oil.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_bannerfiredrakesmed001.dds",
+            itemId = 126646,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126646&quality=3",
+            name = "Standard of the Fire Drakes",
+            allNames = "Standard of the Fire Drakes",
+            furnDataId = "3717",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This standard displaying the stylized symbol of the Fire Drakes hangs from a central pole.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_bannerpitdaemonsmed001.dds",
+            itemId = 126648,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126648&quality=3",
+            name = "Standard of the Pit Daemons",
+            allNames = "Standard of the Pit Daemons",
+            furnDataId = "3719",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This standard displaying the stylized symbol of the Pit Daemons hangs from a central pole.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_bannerstormlordsmed001.dds",
+            itemId = 126647,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126647&quality=3",
+            name = "Standard of the Storm Lords",
+            allNames = "Standard of the Storm Lords",
+            furnDataId = "3718",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This standard displaying the stylized symbol of the Storm Lords hangs from a central pole.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikescrownnflaglong001.dds",
+            itemId = 211526,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=211526&quality=3",
+            name = "Storm Lord Banner, Long",
+            allNames = "Storm Lord Banner, Long",
+            furnDataId = "10411",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_holwhitestrikescrownflagshort001.dds",
+            itemId = 211524,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=211524&quality=3",
+            name = "Storm Lord Banner, Short",
+            allNames = "Storm Lord Banner, Short",
+            furnDataId = "10409",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_lsb_bannersunholdmedium001.dds",
+            itemId = 139392,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139392&quality=3",
+            name = "Sunhold Banner, Hanging",
+            allNames = "Sunhold Banner, Hanging",
+            furnDataId = "5343",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "The solar-symbol banner of the southern Summerset port city of Sunhold.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_tributebannerflat001.dds",
+            itemId = 187803,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187803&quality=3",
+            name = "Tales of Tribute Banner",
+            allNames = "Tales of Tribute Banner",
+            furnDataId = "8461",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "Using red, gold, and blue, this banner provides a vibrant way to inform others of your passion for the Tales of Tribute card game.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_dae_lsb_bannermalacath001.dds",
+            itemId = 134473,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134473&quality=5",
+            name = "Tapestry, Malacath",
+            allNames = "Tapestry, Malacath",
+            furnDataId = "4720",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_lsb_bannerthierrygagnonmed001.dds",
+            itemId = 119856,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=119856&quality=4",
+            name = "Torn Lion Guard Banner",
+            allNames = "Torn Lion Guard Banner",
+            furnDataId = "2316",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "The Lion Guard are at their strongest with their backs against a wall.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_lsb_bannerblackwormcultistmedium001.dds",
+            itemId = 119922,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=119922&quality=4",
+            name = "Torn Worm Cult Banner",
+            allNames = "Torn Worm Cult Banner",
+            furnDataId = "2371",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "One of many trophies taken following the defeat of the Worm Cult in The Rift.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_lsb_undauntedbanner001.dds",
+            itemId = 120036,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120036&quality=4",
+            name = "Undaunted Banner",
+            allNames = "Undaunted Banner",
+            furnDataId = "2454",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "A banner presented to one who has more than earned the right to display affiliation with the Undaunted.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bos_lsb_nexusbannersmages001.dds",
+            itemId = 203146,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203146&quality=4",
+            name = "Wood Elf Banner, Mages Guild",
+            allNames = "Wood Elf Banner, Mages Guild",
+            furnDataId = "9585",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_orc_exc_shrineofmalacathbanner001.dds",
+            itemId = 119844,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=119844&quality=4",
+            name = "Wood Orc Malacath Banner",
+            allNames = "Wood Orc Malacath Banner",
+            furnDataId = "2304",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "Like their cousins in northern Tamriel, most Wood Orcs honor Malacath.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_lsb_smsignwoodworking001.dds",
+            itemId = 120054,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120054&quality=4",
+            name = "Woodworker's Sign",
+            allNames = "Woodworker's Sign",
+            furnDataId = "2468",
+            furnCategory = "Parlor:Banners (3:58)",
+            description = "A sign earned by one who's become a master of the chisel and saw.",
+        },
+        {
+            icon = "/esoui/art/icons/icon_missing.dds",
+            itemId = 212551,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=212551&quality=4",
+            name = "Unknown Item #212551",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "",
+            description = "No item found matching itemId # 212551, level 66, and quality 4!",
+        },
+        {
+            icon = "/esoui/art/icons/icon_missing.dds",
+            itemId = 212550,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=212550&quality=3",
+            name = "Unknown Item #212550",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "",
+            description = "No item found matching itemId # 212550, level 66, and quality 3!",
+        },
+        {
+            icon = "/esoui/art/icons/icon_missing.dds",
+            itemId = 212552,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=212552&quality=3",
+            name = "Unknown Item #212552",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "",
+            description = "No item found matching itemId # 212552, level 66, and quality 3!",
+        },
+        {
+            icon = "/esoui/art/icons/icon_missing.dds",
+            itemId = 212549,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=212549&quality=3",
+            name = "Unknown Item #212549",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "",
+            description = "No item found matching itemId # 212549, level 66, and quality 3!",
+        },
+        {
+            icon = "/esoui/art/icons/icon_missing.dds",
+            itemId = 212548,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=212548&quality=2",
+            name = "Unknown Item #212548",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "",
+            description = "No item found matching itemId # 212548, level 66, and quality 2!",
+        },
+    }
+    return banners
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
@@ -0,0 +1,24 @@
+-- Generated by scripts/data_excel_to_lua.py: the data tables and their chunks, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+
+Data.categories = {
+    banners = { count = 230, chunkSize = 200, chunks = 2 },
+    esoplus = { count = 68, chunkSize = 200, chunks = 1 },
+    literature = { count = 563, chunkSize = 200, chunks = 3 },
+    maps = { count = 40, chunkSize = 200, chunks = 1 },
+    musicBoxes = { count = 51, chunkSize = 200, chunks = 1 },
+    paintings = { count = 134, chunkSize = 200, chunks = 1 },
+    tapestries = { count = 158, chunkSize = 200, chunks = 1 },
+}
+
+Data.categoryOrder = {
+    "banners",
+    "esoplus",
+    "literature",
+    "maps",
+    "musicBoxes",
+    "paintings",
+    "tapestries",
+}
+
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
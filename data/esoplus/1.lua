@@ -0,0 +1,690 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 1 of esoplus, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.esoplus = Data.chunks.esoplus or {}
+Data.chunks.esoplus[1] = function()
+    local esoplus = {
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_housingkeyartpainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10440&quality=5",
+            name = "Painting: All Flags on High",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting featuring Gonfalon Bay nestled among its protective waters and cliffs, with a mysterious knight overlooking it all.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingbalfoyen001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11433&quality=5",
+            name = "Painting: Arrival at Bal Foyen",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "The light of dawn caresses the spires of Bal Foyen as a trader and their travel-burdened guar arrive at this Dark Elf sanctum by the sea.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_housingwoodframewakingflamepainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=9571&quality=5",
+            name = "Painting: Baron Zaudrus Triumphs",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting of the Havocrel named Baron Zaudrus, defeating those who oppose him.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_housingwoodframedagonpainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10183&quality=5",
+            name = "Painting: Dagon's Mercy",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting of Mehrunes Dagon, towering over his cultists in the Deadlands.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingu37firesonggalenzone001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11219&quality=5",
+            name = "Painting: Galen in Harmony",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting presenting a peaceful blending of Breton and druidic architecture, set against the wild lushness of Galen's flora.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingu41endlessarchive001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12060&quality=5",
+            name = "Painting: Infinite Archive",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "\"Those whom Hermaeus Mora calls to the Infinite Archive may serve him—or may choose to leave. But who, upon understanding the limitless knowledge they may access, dares refuse the Lord of Secrets without feeling bereft forever after?\"—Mage Allierwen",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingblackwoodkeyartpainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=9517&quality=5",
+            name = "Painting: Leyawiin Awaits",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting of Leyawiin, the Nibenese city standing at the mouth of the Niben River and known for its majestic chapel honoring Zenithar.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingu44lucentcitadelpainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=13091&quality=5",
+            name = "Painting: Lucent Citadel",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "Shrouded in mystery, the Lucent Citadel gleams in the sand of Fargrave's wastelands.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingnorthernelsweyr001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12419&quality=5",
+            name = "Painting: The Stitches",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "Located within the Scar in Northern Elsweyr, the Stitches draws the eye of many an artist seeking the challenge of illustrating a more vertically oriented settlement.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingsanitysedgepainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11474&quality=5",
+            name = "Painting: Sanity's Edge",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "\"As you can see by my attached references, I am one of the foremost experts in vicinage wards, forfending spells, and the art of research. If anyone can deal with the Dreamstone's ire, it is me. I hope you come to the same conclusion.\"—Warlock Vanton",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_housingkeyartpainting002.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10846&quality=5",
+            name = "Painting: Systres Archipelago",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting by Vaudrie Barthel, well-known for her landscapes and scenes depicting life and nature in the Systres Isles.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingu40apocryphalibrarypainting001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11640&quality=5",
+            name = "Painting: The Endless Library",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting depicting just one of the innumerable studies within the Endless Library of Hermaeus Mora.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingcarouselclockworkcity001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10221&quality=5",
+            name = "Painting: The Gates of Brass",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A painting of the Brass Fortress, seat of power for the Clockwork God, Sotha Sil.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintingnorthernelsweyr001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12419&quality=5",
+            name = "Painting: The Stitches",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "Located within the Scar in Northern Elsweyr, the Stitches draws the eye of many an artist seeking the challenge of illustrating a more vertically oriented settlement.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_antstalessiaparavantstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8320&quality=5",
+            name = "Statuette: Alessia, Liberator",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Alessia, the liberator of the humans of Cyrodiil.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuetteascendantlord001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11063&quality=5",
+            name = "Statuette: Ascendant Lord",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the mysterious Ascendant Lord, who seeks to claim an ancient legacy.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_housingaurielxarxesstatue001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6928&quality=5",
+            name = "Statuette: Auri-El and Xarxes",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Auri-El and Xarxes, based on the statues in the Monastery of Serene Harmony in Shimmerene.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_ayl_run_dbhstatuegarlasmalatarsmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=7506&quality=5",
+            name = "Statuette: Auri-El, Aldmer King",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Auri-El, chief deity of the Aldmeri pantheon, with an eagle.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuetteperyite001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12418&quality=5",
+            name = "Statuette: Peryite, Blightlord",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Peryite, the Daedric Prince of Pestilence.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatueazura002.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6053&quality=5",
+            name = "Statuette: Azura, Moon and Star",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Azura, bearing Moon and Star sigils.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_benduolocolossusstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11062&quality=5",
+            name = "Statuette: Baron-Admiral Olo",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Bendu Olo, Baron-Admiral of the All Flags Navy, as sculpted in High Isle.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_antshrineofboethrastatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8885&quality=5",
+            name = "Statuette: Boethra, Orkha-Bane",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Boethra and feline companion, a banisher of the demon Orkha.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_nor_exc_lightstatuestatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8884&quality=5",
+            name = "Statuette: Child of the Sky",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a Nord skald with hawk and horn.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingclavicusvileshrine001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6057&quality=5",
+            name = "Statuette: Clavicus Vile, Masque",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Clavicus Vile, holding aloft his Masque.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_nib_exc_housingdibellastatue001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6810&quality=5",
+            name = "Statuette: Dibella, Blessed Lady",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Divine Dibella, the Lady of Love, Beauty, Art, and Music.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuetteduchessmartinne001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10845&quality=5",
+            name = "Statuette: Duchess Martinne",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Duchess Martinne Guimard, leader of the consortium that purchased the Systres Archipelago.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettedwemer001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11432&quality=5",
+            name = "Statuette: Dwemer Guardian",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a sentinel found outside many Dwarven ruins in Morrowind.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatuehircine001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6054&quality=5",
+            name = "Statuette: Hircine, the Huntsman",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Hircine, the Huntsman.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_stnerevarsmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8374&quality=5",
+            name = "Statuette: Hortator Nerevar",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Hortator Nerevar",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettedemonspire001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11217&quality=5",
+            name = "Statuette: Kaalgrontiid",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Kaalgrontiid, the emerald sovereign of wrath and terror.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettestkaladas001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10181&quality=5",
+            name = "Statuette: Kaladas of Leyawiin",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Saint Kaladas, builder of the Great Chapel of Zenithar in Leyawiin.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_exc_statuecorgradstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8886&quality=5",
+            name = "Statuette: Kinlord Nemfarion",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Kinlord Nemfarion, founder of Corgrad on Summerset Isle.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettekynareth002.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10844&quality=5",
+            name = "Statuette: Kynareth of the Winds",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Kynareth, goddess of the elements, as sculpted in High Isle.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettekynareth001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=9248&quality=5",
+            name = "Statuette: Kynareth, Air Goddess",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Kynareth, Divine patron of sailors and travelers.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatuemalacath003.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12058&quality=5",
+            name = "Statuette: Malacath, Furious One",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "\"Hold your grudges well. Keep them close to your heart. Let them punctuate every blow you make as you fulfill upon your promise of vengeance. And display this statue in your dwelling so that all may know the cost of crossing you.\"—Lucky Lashgikh",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatuemalacath002.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6294&quality=5",
+            name = "Statuette: Malacath, Orc-Father",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Malacath, the Orc-Father.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_exc_housingstatuemanesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6975&quality=5",
+            name = "Statuette: Mane, Moons-Blessed",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue depicting one of the Manes, the spiritual leaders of the Khajiit.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettedagon001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10182&quality=5",
+            name = "Statuette: Mehrunes Dagon",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Mehrunes Dagon, Daedric Prince of Destruction and Ambition.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingmephalla001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6811&quality=5",
+            name = "Statuette: Mephala, Webspinner",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Mephala, the Daedric Prince of Secrets and Murder.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_housingstatuemeridia001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6573&quality=5",
+            name = "Statuette: Meridia, Bright Lady",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Meridia, the Bright Lady.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_nib_exc_dbhselkiestatuesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=7505&quality=5",
+            name = "Statuette: Mermaid of Anvil",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature version of the enigmatic mermaid statue found in Anvil.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatuemolagbal001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6055&quality=5",
+            name = "Statuette: Molag Bal, the Brutal",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Molag Bal, Lord of Brutality.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_hermaeusmorastatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11472&quality=5",
+            name = "Statuette: Mora, Lord of Secrets",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "All statues of the Inevitable Knower are, after a fashion, access points from Apocrypha to Nirn. Given that, go carefully as you invite Hermaeus Mora into your home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_antmorwhasblessingstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8322&quality=5",
+            name = "Statuette: Morwha, Desire's Root",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Morwha, the Yokudan goddess of fertility and love.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_nocturnalstatuesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8075&quality=5",
+            name = "Statuette: Nocturnal, Gloamqueen",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Nocturnal, the Night Mistress.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_statuetteorcheavystatue001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11218&quality=5",
+            name = "Statuette: Orc Warrior",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of an Orc warrior emanating strength.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuetteperyite001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12418&quality=5",
+            name = "Statuette: Peryite, Blightlord",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Peryite, the Daedric Prince of Pestilence.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_duc_housingstatuesmallperyitedragon001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6574&quality=5",
+            name = "Statuette: Peryite, Taskmaster",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Peryite, the Taskmaster.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_exc_housingsestatueprideofalkosh001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6976&quality=5",
+            name = "Statuette: Pride of Alkosh Hero",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a hero of the Pride of Alkosh, standing triumphantly over her foe.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housinghewstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10220&quality=5",
+            name = "Statuette: Prince Hew",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Yokudan Prince Hew, who is also known as Prince Hubalajad.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_dbhnightmotherstatuesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8077&quality=5",
+            name = "Statuette: Revered Night Mother",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Night Mother, worshiped by the Dark Brotherhood.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettesaisahan001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=9566&quality=5",
+            name = "Statuette: Sai Sahan, Deliverer",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Sai Sahan, the liberator of Leyawiin.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_sanguinestatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12773&quality=5",
+            name = "Statuette: Sanguine",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Daedric Prince Sanguine, hoisting a tankard during a revelry.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_vampirelordsmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8376&quality=5",
+            name = "Statuette: Scion of Bal",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Scion of Bal",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_exc_housingstatuesenchesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6974&quality=5",
+            name = "Statuette: Senche-raht",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a Senche-raht Khajiit and its chosen battlemate.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatuesheogorath001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6058&quality=5",
+            name = "Statuette: Sheogorath, the Mad",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Sheogorath, the Mad God.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_sithissmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=7504&quality=5",
+            name = "Statuette: Sithis, Dread Lord",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Sithis, patron of the Dark Brotherhood.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_exc_heavynordstatuesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8375&quality=5",
+            name = "Statuette: Son of Skyrim",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a Son of Skyrim",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_str_housingsothasilstatue001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6812&quality=5",
+            name = "Statuette: Sotha Sil, Tinkerer",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Sotha Sil, the Clockwork God.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_stendarrstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=10219&quality=5",
+            name = "Statuette: Steadfast Stendarr",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Divine Stendarr, God of Mercy, Justice, and Charity.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_exc_housingstatuesuthay001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6575&quality=5",
+            name = "Statuette: Suthay, Nimble Bishop",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a Suthay furstock Moon-Bishop.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettesyrabane001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=9247&quality=5",
+            name = "Statuette: Syrabane, the Warlock",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Syrabane, an Aldmeri god-ancestor of magic.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_dae_exc_trinimacstatuesmall001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8076&quality=5",
+            name = "Statuette: Trinimac, Paragon",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the divine warrior Trinimac, holding aloft a sword.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettevaermina001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11431&quality=5",
+            name = "Statuette: Vaermina, Dreamweaver",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the Daedric Prince Vaermina, the Lady of Nightmares.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingu40vivecstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=11473&quality=5",
+            name = "Statuette: Vivec's Triumph",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature version of the \"Thirty-Fourth Sermon\" statue, carved by the people of Necrom.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_housingstatuevivec002.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=6056&quality=5",
+            name = "Statuette: Vivec, Warrior-Poet",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of the living god Lord Vivec, Warrior-Poet.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_nor_exc_mediumstatuette001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=8321&quality=5",
+            name = "Statuette: Wolf and Warrior",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of a Nord warrior with his wolf companion.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_statuettezenithar001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=9567&quality=5",
+            name = "Statuette: Zenithar, God of Toil",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Gallery",
+            description = "A miniature statue of Zenithar, holding an anvil.",
+        },
+    }
+    return esoplus
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
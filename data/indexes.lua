@@ -0,0 +1,3486 @@
+-- Generated by scripts/data_excel_to_lua.py: lookups over every table in RanckorsGalleryData.
+-- Entries are table number * 65536 + position, the table numbered as in Data.categoryOrder; Loader.GetIndexedItem resolves them.
+local Data = _G["RanckorsGalleryData"] or {}
+
+Data.byItemId = {
+    [210890] = 65537,
+    [210891] = 65538,
+    [210892] = 65539,
+    [119965] = 65540,
+    [120044] = 65541,
+    [139376] = 65542,
+    [187791] = 65543,
+    [115527] = 65544,
+    [115451] = 65545,
+    [115526] = 65546,
+    [192426] = 65547,
+    [134429] = 65548,
+    [134432] = 65549,
+    [126118] = 65550,
+    [152258] = 65551,
+    [147636] = 65552,
+    [119690] = 65553,
+    [126623] = 65554,
+    [126621] = 65555,
+    [126624] = 65556,
+    [126620] = 65557,
+    [126622] = 65558,
+    [150775] = 65559,
+    [175707] = 65560,
+    [126720] = 65561,
+    [152259] = 65562,
+    [152257] = 65563,
+    [147599] = 65564,
+    [134855] = 65565,
+    [130190] = 65566,
+    [119969] = 65567,
+    [150774] = 65568,
+    [126649] = 65569,
+    [139388] = 65570,
+    [119947] = 65571,
+    [126712] = 65572,
+    [139377] = 65573,
+    [141858] = 65574,
+    [126650] = 65575,
+    [151781] = 65576,
+    [175760] = 65577,
+    [192574] = 65578,
+    [145406] = 65579,
+    [125480] = 65580,
+    [118079] = 65581,
+    [145404] = 65582,
+    [203145] = 65583,
+    [118077] = 65584,
+    [118076] = 65585,
+    [153699] = 65586,
+    [203271] = 65587,
+    [120995] = 65588,
+    [145488] = 65589,
+    [134474] = 65590,
+    [175578] = 65591,
+    [118078] = 65592,
+    [126628] = 65593,
+    [139138] = 65594,
+    [145487] = 65595,
+    [141763] = 65596,
+    [141764] = 65597,
+    [153700] = 65598,
+    [151780] = 65599,
+    [145405] = 65600,
+    [120997] = 65601,
+    [175703] = 65602,
+    [120996] = 65603,
+    [141765] = 65604,
+    [141766] = 65605,
+    [126146] = 65606,
+    [118075] = 65607,
+    [134908] = 65608,
+    [120046] = 65609,
+    [121270] = 65610,
+    [134943] = 65611,
+    [120048] = 65612,
+    [139393] = 65613,
+    [120064] = 65614,
+    [130085] = 65615,
+    [130086] = 65616,
+    [119945] = 65617,
+    [115307] = 65618,
+    [139386] = 65619,
+    [120063] = 65620,
+    [153887] = 65621,
+    [120002] = 65622,
+    [120050] = 65623,
+    [119883] = 65624,
+    [212587] = 65625,
+    [120957] = 65626,
+    [182220] = 65627,
+    [182218] = 65628,
+    [182219] = 65629,
+    [182214] = 65630,
+    [182215] = 65631,
+    [182216] = 65632,
+    [120019] = 65633,
+    [171414] = 65634,
+    [211530] = 65635,
+    [211531] = 65636,
+    [187866] = 65637,
+    [192571] = 65638,
+    [182622] = 65639,
+    [166020] = 65640,
+    [178472] = 65641,
+    [178474] = 65642,
+    [178476] = 65643,
+    [151681] = 65644,
+    [151683] = 65645,
+    [151682] = 65646,
+    [151868] = 65647,
+    [197720] = 65648,
+    [194422] = 65649,
+    [203202] = 65650,
+    [194423] = 65651,
+    [114422] = 65652,
+    [126366] = 65653,
+    [159451] = 65654,
+    [159453] = 65655,
+    [119983] = 65656,
+    [94094] = 65657,
+    [94192] = 65658,
+    [208159] = 65659,
+    [94095] = 65660,
+    [94096] = 65661,
+    [126553] = 65662,
+    [126554] = 65663,
+    [126555] = 65664,
+    [192572] = 65665,
+    [119966] = 65666,
+    [211553] = 65667,
+    [211552] = 65668,
+    [211559] = 65669,
+    [211549] = 65670,
+    [211550] = 65671,
+    [211551] = 65672,
+    [166021] = 65673,
+    [115651] = 65674,
+    [115648] = 65675,
+    [115669] = 65676,
+    [115647] = 65677,
+    [119863] = 65678,
+    [166024] = 65679,
+    [139387] = 65680,
+    [120011] = 65681,
+    [171413] = 65682,
+    [139391] = 65683,
+    [134428] = 65684,
+    [134431] = 65685,
+    [119833] = 65686,
+    [127149] = 65687,
+    [166022] = 65688,
+    [182621] = 65689,
+    [197741] = 65690,
+    [197696] = 65691,
+    [197694] = 65692,
+    [197697] = 65693,
+    [197742] = 65694,
+    [197695] = 65695,
+    [197740] = 65696,
+    [197743] = 65697,
+    [198045] = 65698,
+    [184250] = 65699,
+    [192575] = 65700,
+    [198046] = 65701,
+    [134290] = 65702,
+    [146061] = 65703,
+    [156758] = 65704,
+    [156757] = 65705,
+    [171387] = 65706,
+    [115413] = 65707,
+    [119935] = 65708,
+    [116374] = 65709,
+    [203140] = 65710,
+    [116415] = 65711,
+    [182616] = 65712,
+    [116375] = 65713,
+    [119944] = 65714,
+    [204631] = 65715,
+    [120023] = 65716,
+    [120065] = 65717,
+    [119984] = 65718,
+    [211536] = 65719,
+    [211537] = 65720,
+    [120052] = 65721,
+    [139170] = 65722,
+    [139173] = 65723,
+    [141822] = 65724,
+    [119884] = 65725,
+    [192581] = 65726,
+    [171386] = 65727,
+    [167344] = 65728,
+    [151954] = 65729,
+    [117695] = 65730,
+    [156663] = 65731,
+    [156662] = 65732,
+    [119840] = 65733,
+    [156763] = 65734,
+    [139378] = 65735,
+    [181510] = 65736,
+    [118067] = 65737,
+    [118068] = 65738,
+    [118069] = 65739,
+    [118070] = 65740,
+    [118071] = 65741,
+    [212214] = 65742,
+    [204781] = 65743,
+    [166023] = 65744,
+    [134430] = 65745,
+    [134433] = 65746,
+    [126719] = 65747,
+    [126646] = 65748,
+    [126648] = 65749,
+    [126647] = 65750,
+    [211526] = 65751,
+    [211524] = 65752,
+    [139392] = 65753,
+    [187803] = 65754,
+    [134473] = 65755,
+    [119856] = 65756,
+    [119922] = 65757,
+    [120036] = 65758,
+    [203146] = 65759,
+    [119844] = 65760,
+    [120054] = 65761,
+    [212551] = 65762,
+    [212550] = 65763,
+    [212552] = 65764,
+    [212549] = 65765,
+    [212548] = 65766,
+    [120197] = 196609,
+    [203377] = 196610,
+    [203430] = 196611,
+    [203429] = 196612,
+    [203446] = 196613,
+    [203447] = 196614,
+    [203448] = 196615,
+    [120406] = 196616,
+    [126138] = 196617,
+    [120120] = 196618,
+    [120354] = 196619,
+    [120343] = 196620,
+    [194453] = 196621,
+    [194452] = 196622,
+    [194451] = 196623,
+    [120257] = 196624,
+    [120276] = 196625,
+    [203439] = 196626,
+    [120297] = 196627,
+    [203411] = 196628,
+    [203459] = 196629,
+    [120255] = 196630,
+    [203420] = 196631,
+    [178498] = 196632,
+    [120083] = 196633,
+    [120214] = 196634,
+    [145927] = 196635,
+    [120144] = 196636,
+    [120286] = 196637,
+    [120367] = 196638,
+    [178502] = 196639,
+    [120260] = 196640,
+    [120183] = 196641,
+    [120175] = 196642,
+    [120176] = 196643,
+    [120189] = 196644,
+    [120177] = 196645,
+    [120178] = 196646,
+    [120185] = 196647,
+    [120179] = 196648,
+    [120180] = 196649,
+    [120174] = 196650,
+    [203392] = 196651,
+    [120181] = 196652,
+    [198393] = 196653,
+    [198428] = 196654,
+    [198427] = 196655,
+    [198440] = 196656,
+    [194460] = 196657,
+    [203203] = 196658,
+    [197704] = 196659,
+    [120200] = 196660,
+    [203465] = 196661,
+    [120263] = 196662,
+    [203400] = 196663,
+    [120360] = 196664,
+    [120116] = 196665,
+    [120327] = 196666,
+    [120278] = 196667,
+    [120240] = 196668,
+    [120326] = 196669,
+    [120143] = 196670,
+    [203396] = 196671,
+    [120114] = 196672,
+    [120210] = 196673,
+    [120211] = 196674,
+    [203434] = 196675,
+    [203404] = 196676,
+    [194446] = 196677,
+    [120104] = 196678,
+    [194445] = 196679,
+    [120145] = 196680,
+    [197747] = 196681,
+    [197545] = 196682,
+    [197746] = 196683,
+    [197745] = 196684,
+    [121045] = 196685,
+    [139164] = 196686,
+    [121047] = 196687,
+    [121056] = 196688,
+    [139165] = 196689,
+    [118482] = 196690,
+    [197544] = 196691,
+    [187862] = 196692,
+    [182285] = 196693,
+    [130211] = 196694,
+    [130210] = 196695,
+    [156644] = 196696,
+    [118711] = 196697,
+    [118709] = 196698,
+    [118712] = 196699,
+    [118715] = 196700,
+    [118710] = 196701,
+    [118714] = 196702,
+    [118713] = 196703,
+    [118716] = 196704,
+    [118717] = 196705,
+    [203431] = 196706,
+    [120361] = 196707,
+    [203467] = 196708,
+    [203385] = 196709,
+    [120352] = 196710,
+    [121046] = 196711,
+    [203436] = 196712,
+    [120132] = 196713,
+    [120362] = 196714,
+    [120168] = 196715,
+    [120300] = 196716,
+    [134363] = 196717,
+    [134361] = 196718,
+    [134362] = 196719,
+    [120349] = 196720,
+    [130093] = 196721,
+    [120323] = 196722,
+    [120310] = 196723,
+    [203427] = 196724,
+    [120198] = 196725,
+    [134257] = 196726,
+    [194443] = 196727,
+    [130212] = 196728,
+    [134265] = 196729,
+    [134266] = 196730,
+    [203437] = 196731,
+    [119953] = 196732,
+    [120299] = 196733,
+    [120221] = 196734,
+    [197918] = 196735,
+    [203433] = 196736,
+    [134961] = 196737,
+    [120107] = 196738,
+    [194459] = 196739,
+    [120289] = 196740,
+    [203454] = 196741,
+    [120182] = 196743,
+    [120294] = 196744,
+    [120186] = 196745,
+    [120187] = 196746,
+    [120188] = 196747,
+    [120212] = 196748,
+    [120345] = 196749,
+    [203378] = 196750,
+    [120245] = 196751,
+    [120350] = 196752,
+    [204780] = 196753,
+    [204782] = 196754,
+    [204783] = 196755,
+    [204790] = 196756,
+    [120254] = 196757,
+    [120315] = 196758,
+    [203451] = 196759,
+    [182225] = 196760,
+    [182217] = 196761,
+    [203452] = 196762,
+    [204410] = 196763,
+    [120234] = 196764,
+    [199126] = 196765,
+    [120093] = 196766,
+    [120152] = 196767,
+    [120256] = 196768,
+    [146047] = 196769,
+    [120241] = 196770,
+    [203464] = 196771,
+    [120134] = 196772,
+    [120338] = 196773,
+    [194448] = 196774,
+    [120162] = 196775,
+    [178499] = 196776,
+    [194441] = 196777,
+    [120135] = 196778,
+    [120271] = 196779,
+    [120086] = 196780,
+    [120279] = 196781,
+    [120207] = 196782,
+    [120381] = 196783,
+    [120401] = 196784,
+    [120380] = 196785,
+    [120385] = 196786,
+    [120405] = 196787,
+    [120384] = 196788,
+    [120399] = 196789,
+    [120386] = 196790,
+    [120387] = 196791,
+    [120388] = 196792,
+    [120398] = 196793,
+    [120377] = 196794,
+    [120402] = 196795,
+    [120403] = 196796,
+    [120389] = 196797,
+    [120390] = 196798,
+    [120391] = 196799,
+    [120397] = 196800,
+    [120392] = 196801,
+    [120393] = 196802,
+    [120394] = 196803,
+    [120404] = 196804,
+    [120379] = 196805,
+    [120382] = 196806,
+    [120396] = 196807,
+    [120378] = 196808,
+    [120395] = 196809,
+    [120400] = 196810,
+    [120383] = 196811,
+    [120184] = 196812,
+    [208358] = 196813,
+    [194455] = 196814,
+    [203417] = 196816,
+    [203432] = 196817,
+    [120242] = 196818,
+    [120243] = 196819,
+    [120106] = 196820,
+    [120111] = 196821,
+    [120108] = 196822,
+    [203469] = 196823,
+    [120246] = 196824,
+    [203416] = 196825,
+    [120407] = 196826,
+    [120353] = 196828,
+    [134881] = 196829,
+    [194449] = 196830,
+    [120329] = 196831,
+    [199119] = 196832,
+    [120148] = 196833,
+    [194456] = 196834,
+    [145403] = 196835,
+    [120137] = 196836,
+    [120366] = 196837,
+    [194442] = 196838,
+    [203381] = 196839,
+    [203382] = 196840,
+    [203383] = 196841,
+    [203384] = 196842,
+    [203397] = 196843,
+    [120317] = 196844,
+    [120292] = 196845,
+    [203419] = 196846,
+    [203408] = 196847,
+    [120295] = 196848,
+    [197779] = 196849,
+    [188201] = 196850,
+    [188202] = 196851,
+    [197780] = 196852,
+    [211505] = 196853,
+    [211503] = 196854,
+    [118487] = 196855,
+    [145923] = 196856,
+    [203418] = 196857,
+    [120318] = 196858,
+    [120201] = 196859,
+    [119951] = 196860,
+    [120341] = 196861,
+    [120113] = 196862,
+    [145596] = 196863,
+    [194458] = 196864,
+    [120202] = 196865,
+    [203460] = 196866,
+    [120203] = 196867,
+    [120347] = 196868,
+    [120348] = 196869,
+    [203423] = 196870,
+    [203472] = 196871,
+    [120149] = 196873,
+    [120158] = 196874,
+    [120156] = 196875,
+    [120157] = 196876,
+    [120160] = 196877,
+    [120159] = 196878,
+    [120346] = 196879,
+    [120128] = 196880,
+    [120265] = 196881,
+    [203453] = 196882,
+    [178500] = 196883,
+    [197710] = 196884,
+    [120194] = 196885,
+    [120195] = 196886,
+    [120161] = 196887,
+    [120264] = 196888,
+    [120110] = 196889,
+    [120213] = 196890,
+    [120358] = 196891,
+    [203409] = 196892,
+    [203463] = 196893,
+    [197917] = 196894,
+    [120235] = 196895,
+    [203441] = 196896,
+    [203412] = 196897,
+    [203386] = 196898,
+    [120224] = 196899,
+    [120288] = 196900,
+    [203393] = 196901,
+    [203415] = 196902,
+    [120205] = 196903,
+    [120259] = 196904,
+    [120229] = 196905,
+    [203422] = 196906,
+    [120092] = 196907,
+    [120150] = 196908,
+    [203405] = 196909,
+    [120283] = 196910,
+    [120097] = 196911,
+    [120244] = 196912,
+    [120098] = 196913,
+    [203449] = 196914,
+    [203425] = 196915,
+    [118489] = 196916,
+    [203461] = 196917,
+    [194444] = 196918,
+    [197921] = 196919,
+    [120274] = 196920,
+    [203455] = 196921,
+    [203435] = 196922,
+    [134258] = 196923,
+    [203457] = 196924,
+    [120236] = 196925,
+    [120209] = 196926,
+    [120359] = 196927,
+    [203410] = 196928,
+    [120206] = 196929,
+    [120122] = 196930,
+    [120123] = 196931,
+    [120124] = 196932,
+    [120311] = 196933,
+    [120253] = 196934,
+    [120248] = 196935,
+    [120133] = 196937,
+    [120217] = 196938,
+    [140220] = 196939,
+    [120096] = 196940,
+    [120131] = 196941,
+    [120298] = 196942,
+    [145597] = 196943,
+    [120091] = 196944,
+    [118491] = 196945,
+    [118490] = 196946,
+    [120281] = 196947,
+    [120130] = 196948,
+    [120293] = 196949,
+    [120109] = 196950,
+    [118528] = 196951,
+    [120218] = 196952,
+    [203470] = 196953,
+    [120237] = 196954,
+    [120308] = 196955,
+    [120309] = 196956,
+    [120303] = 196957,
+    [120364] = 196958,
+    [145928] = 196959,
+    [120225] = 196960,
+    [120285] = 196961,
+    [194447] = 196962,
+    [120250] = 196963,
+    [120376] = 196964,
+    [120374] = 196965,
+    [120375] = 196966,
+    [120363] = 196967,
+    [126792] = 196968,
+    [120319] = 196969,
+    [145926] = 196970,
+    [120368] = 196971,
+    [120142] = 196972,
+    [120369] = 196973,
+    [203394] = 196974,
+    [120154] = 196975,
+    [120169] = 196976,
+    [120102] = 196977,
+    [120230] = 196978,
+    [120170] = 196979,
+    [120355] = 196980,
+    [203379] = 196981,
+    [203387] = 196982,
+    [120220] = 196983,
+    [120231] = 196984,
+    [120322] = 196985,
+    [120095] = 196986,
+    [120261] = 196987,
+    [120280] = 196988,
+    [120232] = 196989,
+    [120370] = 196990,
+    [126152] = 196991,
+    [120082] = 196992,
+    [120219] = 196993,
+    [120284] = 196994,
+    [203413] = 196995,
+    [203421] = 196996,
+    [120325] = 196997,
+    [197920] = 196998,
+    [120222] = 196999,
+    [120223] = 197000,
+    [120146] = 197001,
+    [120344] = 197002,
+    [120336] = 197003,
+    [120371] = 197004,
+    [203398] = 197005,
+    [120215] = 197006,
+    [120233] = 197007,
+    [126128] = 197008,
+    [203401] = 197009,
+    [120121] = 197010,
+    [120262] = 197011,
+    [120337] = 197012,
+    [134861] = 197013,
+    [120190] = 197014,
+    [120147] = 197015,
+    [120273] = 197016,
+    [120136] = 197017,
+    [194439] = 197018,
+    [120291] = 197019,
+    [120094] = 197020,
+    [203458] = 197021,
+    [120372] = 197022,
+    [134246] = 197023,
+    [120312] = 197024,
+    [120112] = 197025,
+    [197919] = 197026,
+    [120328] = 197027,
+    [120191] = 197028,
+    [120357] = 197029,
+    [120356] = 197030,
+    [203440] = 197031,
+    [120290] = 197032,
+    [120155] = 197033,
+    [120192] = 197034,
+    [120193] = 197035,
+    [203399] = 197036,
+    [120340] = 197037,
+    [178501] = 197038,
+    [120204] = 197039,
+    [120332] = 197040,
+    [120373] = 197041,
+    [120247] = 197042,
+    [120216] = 197043,
+    [120115] = 197044,
+    [203456] = 197045,
+    [120196] = 197046,
+    [203389] = 197047,
+    [203390] = 197048,
+    [203391] = 197049,
+    [120277] = 197050,
+    [203462] = 197051,
+    [120105] = 197052,
+    [120251] = 197053,
+    [120316] = 197054,
+    [120304] = 197055,
+    [120258] = 197056,
+    [120129] = 197057,
+    [120249] = 197058,
+    [145445] = 197059,
+    [203466] = 197060,
+    [120228] = 197061,
+    [126157] = 197062,
+    [126158] = 197063,
+    [126159] = 197064,
+    [126160] = 197065,
+    [126161] = 197066,
+    [126162] = 197067,
+    [126163] = 197068,
+    [126164] = 197069,
+    [178497] = 197070,
+    [120153] = 197071,
+    [203424] = 197072,
+    [203471] = 197073,
+    [120287] = 197074,
+    [120103] = 197075,
+    [120282] = 197076,
+    [120166] = 197077,
+    [120151] = 197078,
+    [120087] = 197079,
+    [120118] = 197080,
+    [120119] = 197081,
+    [134547] = 197082,
+    [134548] = 197083,
+    [134557] = 197084,
+    [134558] = 197085,
+    [134559] = 197086,
+    [134549] = 197087,
+    [134550] = 197088,
+    [134551] = 197089,
+    [134552] = 197090,
+    [134553] = 197091,
+    [134554] = 197092,
+    [134555] = 197093,
+    [134556] = 197094,
+    [203402] = 197095,
+    [203403] = 197096,
+    [120117] = 197097,
+    [203468] = 197099,
+    [120307] = 197100,
+    [120238] = 197101,
+    [194454] = 197102,
+    [145467] = 197103,
+    [120275] = 197104,
+    [120085] = 197105,
+    [120351] = 197106,
+    [120333] = 197107,
+    [130228] = 197108,
+    [203388] = 197109,
+    [120339] = 197110,
+    [120270] = 197111,
+    [120306] = 197112,
+    [194450] = 197113,
+    [203450] = 197114,
+    [120365] = 197115,
+    [120099] = 197116,
+    [120173] = 197117,
+    [194440] = 197118,
+    [203438] = 197119,
+    [120302] = 197120,
+    [120100] = 197121,
+    [203395] = 197122,
+    [120141] = 197123,
+    [120140] = 197124,
+    [120138] = 197125,
+    [120139] = 197126,
+    [120084] = 197127,
+    [120125] = 197128,
+    [203414] = 197129,
+    [120305] = 197130,
+    [120272] = 197131,
+    [120226] = 197132,
+    [120227] = 197133,
+    [120126] = 197134,
+    [120127] = 197135,
+    [120266] = 197136,
+    [120088] = 197137,
+    [120267] = 197138,
+    [120313] = 197139,
+    [120320] = 197140,
+    [120268] = 197141,
+    [120089] = 197142,
+    [120321] = 197143,
+    [120334] = 197144,
+    [203428] = 197145,
+    [120163] = 197146,
+    [203406] = 197147,
+    [203407] = 197148,
+    [120199] = 197149,
+    [120324] = 197150,
+    [120167] = 197151,
+    [120296] = 197152,
+    [120172] = 197153,
+    [120101] = 197154,
+    [120208] = 197155,
+    [203426] = 197156,
+    [203442] = 197157,
+    [120165] = 197158,
+    [203445] = 197159,
+    [203444] = 197160,
+    [120171] = 197161,
+    [120314] = 197162,
+    [120164] = 197163,
+    [120335] = 197164,
+    [120331] = 197166,
+    [120239] = 197167,
+    [203443] = 197168,
+    [203380] = 197169,
+    [120090] = 197170,
+    [120342] = 197171,
+    [163710] = 262145,
+    [197712] = 262146,
+    [163717] = 262147,
+    [163711] = 262148,
+    [178459] = 262149,
+    [165993] = 262150,
+    [165994] = 262151,
+    [163713] = 262152,
+    [163715] = 262153,
+    [187922] = 262154,
+    [192431] = 262155,
+    [163707] = 262156,
+    [163718] = 262157,
+    [163719] = 262158,
+    [165997] = 262159,
+    [187799] = 262160,
+    [163720] = 262161,
+    [163726] = 262162,
+    [163727] = 262163,
+    [163721] = 262164,
+    [163709] = 262165,
+    [163714] = 262166,
+    [163728] = 262167,
+    [163712] = 262168,
+    [163708] = 262169,
+    [163725] = 262170,
+    [163716] = 262171,
+    [163724] = 262172,
+    [204424] = 262173,
+    [165992] = 262174,
+    [163723] = 262175,
+    [183196] = 262176,
+    [165996] = 262177,
+    [171431] = 262178,
+    [197711] = 262179,
+    [163706] = 262180,
+    [120056] = 262181,
+    [151968] = 262182,
+    [156762] = 262183,
+    [166463] = 262184,
+    [151909] = 327681,
+    [156554] = 327682,
+    [204422] = 327683,
+    [190938] = 327684,
+    [145322] = 327685,
+    [151910] = 327686,
+    [190939] = 327687,
+    [189464] = 327688,
+    [153634] = 327689,
+    [190941] = 327690,
+    [163431] = 327691,
+    [159598] = 327692,
+    [163429] = 327693,
+    [171542] = 327694,
+    [181636] = 327695,
+    [171543] = 327696,
+    [142235] = 327697,
+    [197829] = 327698,
+    [189465] = 327699,
+    [187667] = 327700,
+    [147507] = 327701,
+    [167006] = 327702,
+    [178521] = 327703,
+    [212420] = 327704,
+    [204423] = 327705,
+    [190942] = 327706,
+    [211498] = 327707,
+    [167428] = 327708,
+    [167429] = 327709,
+    [199113] = 327710,
+    [197625] = 327711,
+    [147506] = 327712,
+    [178522] = 327713,
+    [190940] = 327714,
+    [208160] = 327715,
+    [187666] = 327716,
+    [167007] = 327717,
+    [156553] = 327718,
+    [153633] = 327719,
+    [171943] = 327720,
+    [159596] = 327721,
+    [163432] = 327722,
+    [171944] = 327723,
+    [163428] = 327724,
+    [181637] = 327725,
+    [194399] = 327726,
+    [197826] = 327727,
+    [147505] = 327728,
+    [183201] = 327729,
+    [183200] = 327730,
+    [204807] = 393217,
+    [165834] = 393218,
+    [178444] = 393219,
+    [165836] = 393220,
+    [187873] = 393221,
+    [197782] = 393222,
+    [204803] = 393223,
+    [204804] = 393224,
+    [187868] = 393225,
+    [204806] = 393226,
+    [165829] = 393227,
+    [181507] = 393228,
+    [166447] = 393229,
+    [165831] = 393230,
+    [120855] = 393231,
+    [204755] = 393232,
+    [204805] = 393233,
+    [166443] = 393234,
+    [166439] = 393235,
+    [165842] = 393236,
+    [165849] = 393237,
+    [165833] = 393238,
+    [165832] = 393239,
+    [165830] = 393240,
+    [165827] = 393241,
+    [165826] = 393242,
+    [178446] = 393243,
+    [166441] = 393244,
+    [187877] = 393245,
+    [187870] = 393246,
+    [187876] = 393247,
+    [204801] = 393248,
+    [178450] = 393249,
+    [187871] = 393250,
+    [178442] = 393251,
+    [165837] = 393252,
+    [178445] = 393253,
+    [165828] = 393254,
+    [166440] = 393255,
+    [187872] = 393256,
+    [166444] = 393257,
+    [187874] = 393258,
+    [178447] = 393259,
+    [197752] = 393260,
+    [197749] = 393261,
+    [187869] = 393262,
+    [197754] = 393263,
+    [139074] = 393264,
+    [139076] = 393265,
+    [118267] = 393266,
+    [159437] = 393267,
+    [118266] = 393268,
+    [139070] = 393269,
+    [118141] = 393270,
+    [118220] = 393271,
+    [118218] = 393272,
+    [118268] = 393273,
+    [139069] = 393274,
+    [139071] = 393275,
+    [118222] = 393276,
+    [165835] = 393277,
+    [118219] = 393278,
+    [139072] = 393279,
+    [118138] = 393280,
+    [165838] = 393281,
+    [118223] = 393282,
+    [118217] = 393283,
+    [139075] = 393284,
+    [118216] = 393285,
+    [118221] = 393286,
+    [139073] = 393287,
+    [118142] = 393288,
+    [118143] = 393289,
+    [118139] = 393290,
+    [118265] = 393291,
+    [118145] = 393292,
+    [118144] = 393293,
+    [118140] = 393294,
+    [165845] = 393295,
+    [178443] = 393296,
+    [197783] = 393297,
+    [204800] = 393298,
+    [166438] = 393299,
+    [178451] = 393300,
+    [165843] = 393301,
+    [166449] = 393302,
+    [197755] = 393303,
+    [165841] = 393304,
+    [166446] = 393305,
+    [166437] = 393306,
+    [204754] = 393307,
+    [197751] = 393308,
+    [197750] = 393309,
+    [126469] = 393310,
+    [126470] = 393311,
+    [126468] = 393312,
+    [126466] = 393313,
+    [126467] = 393314,
+    [126465] = 393315,
+    [126463] = 393316,
+    [126464] = 393317,
+    [126462] = 393318,
+    [197753] = 393319,
+    [165840] = 393320,
+    [197781] = 393321,
+    [166442] = 393322,
+    [166434] = 393323,
+    [166445] = 393324,
+    [178449] = 393325,
+    [165844] = 393326,
+    [167332] = 393327,
+    [204799] = 393328,
+    [166448] = 393329,
+    [187875] = 393330,
+    [178448] = 393331,
+    [165839] = 393332,
+    [126602] = 393333,
+    [126594] = 393334,
+    [126608] = 393335,
+    [126603] = 393336,
+    [126595] = 393337,
+    [126609] = 393338,
+    [126601] = 393339,
+    [126597] = 393340,
+    [126607] = 393341,
+    [126604] = 393342,
+    [126592] = 393343,
+    [126598] = 393344,
+    [126599] = 393345,
+    [126593] = 393346,
+    [126605] = 393347,
+    [204808] = 393348,
+    [167340] = 393349,
+    [204802] = 393350,
+    [210896] = 458753,
+    [139313] = 458754,
+    [139312] = 458755,
+    [139314] = 458756,
+    [139321] = 458757,
+    [139322] = 458758,
+    [139323] = 458759,
+    [115508] = 458760,
+    [115509] = 458761,
+    [115487] = 458762,
+    [115488] = 458763,
+    [188272] = 458764,
+    [188273] = 458765,
+    [115255] = 458767,
+    [115244] = 458768,
+    [115239] = 458769,
+    [115253] = 458770,
+    [121271] = 458771,
+    [134845] = 458772,
+    [199116] = 458773,
+    [199117] = 458774,
+    [204721] = 458775,
+    [204723] = 458776,
+    [204722] = 458777,
+    [204625] = 458778,
+    [204624] = 458779,
+    [208117] = 458780,
+    [204623] = 458781,
+    [119931] = 458782,
+    [130084] = 458783,
+    [115284] = 458784,
+    [182245] = 458785,
+    [182243] = 458786,
+    [182244] = 458787,
+    [182246] = 458788,
+    [184097] = 458789,
+    [192570] = 458790,
+    [126774] = 458791,
+    [126364] = 458792,
+    [191189] = 458793,
+    [151677] = 458794,
+    [151678] = 458795,
+    [151676] = 458796,
+    [151759] = 458797,
+    [151761] = 458798,
+    [151760] = 458799,
+    [151758] = 458800,
+    [211562] = 458801,
+    [192403] = 458802,
+    [192404] = 458803,
+    [166030] = 458804,
+    [188274] = 458805,
+    [188275] = 458806,
+    [193784] = 458807,
+    [193783] = 458808,
+    [114400] = 458809,
+    [114424] = 458810,
+    [114339] = 458811,
+    [114364] = 458812,
+    [114363] = 458813,
+    [189468] = 458814,
+    [188276] = 458815,
+    [188277] = 458816,
+    [126365] = 458817,
+    [126775] = 458818,
+    [175761] = 458819,
+    [94129] = 458820,
+    [94191] = 458821,
+    [94130] = 458822,
+    [94158] = 458823,
+    [94131] = 458824,
+    [126550] = 458825,
+    [126776] = 458826,
+    [126551] = 458827,
+    [126552] = 458828,
+    [115676] = 458829,
+    [115692] = 458830,
+    [115642] = 458831,
+    [188278] = 458832,
+    [188279] = 458833,
+    [175602] = 458834,
+    [175696] = 458835,
+    [175697] = 458836,
+    [175605] = 458837,
+    [175601] = 458838,
+    [181504] = 458839,
+    [175603] = 458840,
+    [175604] = 458841,
+    [151826] = 458842,
+    [151828] = 458843,
+    [151827] = 458844,
+    [151825] = 458845,
+    [151824] = 458846,
+    [193810] = 458847,
+    [192412] = 458848,
+    [193786] = 458849,
+    [193785] = 458850,
+    [204413] = 458851,
+    [204414] = 458852,
+    [145390] = 458853,
+    [145396] = 458854,
+    [145395] = 458855,
+    [145401] = 458856,
+    [115392] = 458857,
+    [115414] = 458858,
+    [116454] = 458859,
+    [116455] = 458860,
+    [116513] = 458861,
+    [116457] = 458862,
+    [116456] = 458863,
+    [116477] = 458864,
+    [188280] = 458865,
+    [188281] = 458866,
+    [188282] = 458867,
+    [188283] = 458868,
+    [117694] = 458869,
+    [117693] = 458870,
+    [117738] = 458871,
+    [117808] = 458872,
+    [117861] = 458873,
+    [126777] = 458874,
+    [204415] = 458875,
+    [204416] = 458876,
+    [199114] = 458877,
+    [199115] = 458878,
+    [188284] = 458879,
+    [188285] = 458880,
+    [166015] = 458881,
+    [126117] = 458882,
+    [119685] = 458883,
+    [147600] = 458884,
+    [134854] = 458885,
+    [130189] = 458886,
+    [175765] = 458887,
+    [165998] = 458888,
+    [165999] = 458889,
+    [126713] = 458890,
+    [126715] = 458891,
+    [126714] = 458892,
+    [125654] = 458893,
+    [118243] = 458894,
+    [156774] = 458895,
+    [126627] = 458896,
+    [139137] = 458897,
+    [126149] = 458898,
+    [126778] = 458899,
+    [192401] = 458900,
+    [192402] = 458901,
+    [165617] = 458902,
+    [165615] = 458903,
+    [165616] = 458904,
+    [126600] = 458905,
+    [126596] = 458906,
+    [126606] = 458907,
+    [115616] = 458908,
+    [115615] = 458909,
+    [115617] = 458910,
+}
+
+Data.byFurnDataId = {
+    ["10267"] = 65537,
+    ["10268"] = 65538,
+    ["10269"] = 65539,
+    ["2399"] = 65540,
+    ["2460"] = 65541,
+    ["5327"] = 65542,
+    ["8449"] = 65543,
+    ["829"] = 65544,
+    ["753"] = 65545,
+    ["828"] = 65546,
+    ["8810"] = 65547,
+    ["4677"] = 65548,
+    ["4680"] = 65549,
+    ["3375"] = 65550,
+    ["6378"] = 65551,
+    ["5940"] = 65552,
+    ["2169"] = 65553,
+    ["3694"] = 65554,
+    ["3692"] = 65555,
+    ["3695"] = 65556,
+    ["3691"] = 65557,
+    ["3693"] = 65558,
+    ["6331"] = 65559,
+    ["7801"] = 65560,
+    ["3783"] = 65561,
+    ["6379"] = 65562,
+    ["6377"] = 65563,
+    ["5938"] = 65564,
+    ["4838"] = 65565,
+    ["3940"] = 65566,
+    ["2403"] = 65567,
+    ["6330"] = 65568,
+    ["3720"] = 65569,
+    ["5339"] = 65570,
+    ["2388"] = 65571,
+    ["3775"] = 65572,
+    ["5328"] = 65573,
+    ["5512"] = 65574,
+    ["3721"] = 65575,
+    ["6178"] = 65576,
+    ["7825"] = 65577,
+    ["8832"] = 65578,
+    ["5709"] = 65579,
+    ["3242"] = 65580,
+    ["1571"] = 65581,
+    ["5707"] = 65582,
+    ["9584"] = 65583,
+    ["1569"] = 65584,
+    ["1568"] = 65585,
+    ["6486"] = 65586,
+    ["9632"] = 65587,
+    ["3138"] = 65588,
+    ["5791"] = 65589,
+    ["4721"] = 65590,
+    ["7674"] = 65591,
+    ["1570"] = 65592,
+    ["3699"] = 65593,
+    ["5089"] = 65594,
+    ["5790"] = 65595,
+    ["5461"] = 65596,
+    ["5462"] = 65597,
+    ["6487"] = 65598,
+    ["6177"] = 65599,
+    ["5708"] = 65600,
+    ["3140"] = 65601,
+    ["7797"] = 65602,
+    ["3139"] = 65603,
+    ["5463"] = 65604,
+    ["5464"] = 65605,
+    ["3396"] = 65606,
+    ["1567"] = 65607,
+    ["4891"] = 65608,
+    ["2462"] = 65609,
+    ["3202"] = 65610,
+    ["4926"] = 65611,
+    ["2463"] = 65612,
+    ["5344"] = 65613,
+    ["2477"] = 65614,
+    ["3909"] = 65615,
+    ["3910"] = 65616,
+    ["2387"] = 65617,
+    ["611"] = 65618,
+    ["5337"] = 65619,
+    ["2476"] = 65620,
+    ["6508"] = 65621,
+    ["2433"] = 65622,
+    ["2464"] = 65623,
+    ["2342"] = 65624,
+    ["3108"] = 65626,
+    ["8088"] = 65627,
+    ["8086"] = 65628,
+    ["8087"] = 65629,
+    ["8082"] = 65630,
+    ["8083"] = 65631,
+    ["8084"] = 65632,
+    ["2441"] = 65633,
+    ["7483"] = 65634,
+    ["10415"] = 65635,
+    ["10416"] = 65636,
+    ["8524"] = 65637,
+    ["8829"] = 65638,
+    ["8209"] = 65639,
+    ["7172"] = 65640,
+    ["7880"] = 65641,
+    ["7882"] = 65642,
+    ["7884"] = 65643,
+    ["6078"] = 65644,
+    ["6080"] = 65645,
+    ["6079"] = 65646,
+    ["6265"] = 65647,
+    ["9182"] = 65648,
+    ["8960"] = 65649,
+    ["9608"] = 65650,
+    ["8961"] = 65651,
+    ["349"] = 65652,
+    ["3441"] = 65653,
+    ["6692"] = 65654,
+    ["6694"] = 65655,
+    ["2415"] = 65656,
+    ["161"] = 65657,
+    ["251"] = 65658,
+    ["10231"] = 65659,
+    ["162"] = 65660,
+    ["163"] = 65661,
+    ["3628"] = 65662,
+    ["3629"] = 65663,
+    ["3630"] = 65664,
+    ["8830"] = 65665,
+    ["2400"] = 65666,
+    ["10438"] = 65667,
+    ["10437"] = 65668,
+    ["10444"] = 65669,
+    ["10434"] = 65670,
+    ["10435"] = 65671,
+    ["10436"] = 65672,
+    ["7173"] = 65673,
+    ["951"] = 65674,
+    ["948"] = 65675,
+    ["969"] = 65676,
+    ["947"] = 65677,
+    ["2323"] = 65678,
+    ["7176"] = 65679,
+    ["5338"] = 65680,
+    ["2437"] = 65681,
+    ["7482"] = 65682,
+    ["5342"] = 65683,
+    ["4676"] = 65684,
+    ["4679"] = 65685,
+    ["2293"] = 65686,
+    ["3844"] = 65687,
+    ["7174"] = 65688,
+    ["8208"] = 65689,
+    ["9205"] = 65690,
+    ["9156"] = 65691,
+    ["9154"] = 65692,
+    ["9157"] = 65693,
+    ["9206"] = 65694,
+    ["9155"] = 65695,
+    ["9204"] = 65696,
+    ["9207"] = 65697,
+    ["9314"] = 65698,
+    ["8379"] = 65699,
+    ["8833"] = 65700,
+    ["9315"] = 65701,
+    ["4538"] = 65702,
+    ["5848"] = 65703,
+    ["6607"] = 65704,
+    ["6606"] = 65705,
+    ["7456"] = 65706,
+    ["715"] = 65707,
+    ["2379"] = 65708,
+    ["1045"] = 65709,
+    ["9579"] = 65710,
+    ["1086"] = 65711,
+    ["8203"] = 65712,
+    ["1046"] = 65713,
+    ["2386"] = 65714,
+    ["9915"] = 65715,
+    ["2442"] = 65716,
+    ["2478"] = 65717,
+    ["2416"] = 65718,
+    ["10421"] = 65719,
+    ["10422"] = 65720,
+    ["2466"] = 65721,
+    ["5121"] = 65722,
+    ["5124"] = 65723,
+    ["5472"] = 65724,
+    ["2343"] = 65725,
+    ["8839"] = 65726,
+    ["7455"] = 65727,
+    ["7326"] = 65728,
+    ["6328"] = 65729,
+    ["1217"] = 65730,
+    ["6591"] = 65731,
+    ["6590"] = 65732,
+    ["2300"] = 65733,
+    ["6612"] = 65734,
+    ["5329"] = 65735,
+    ["7987"] = 65736,
+    ["1562"] = 65737,
+    ["1563"] = 65738,
+    ["1564"] = 65739,
+    ["1565"] = 65740,
+    ["1566"] = 65741,
+    ["10065"] = 65743,
+    ["7175"] = 65744,
+    ["4678"] = 65745,
+    ["4681"] = 65746,
+    ["3782"] = 65747,
+    ["3717"] = 65748,
+    ["3719"] = 65749,
+    ["3718"] = 65750,
+    ["10411"] = 65751,
+    ["10409"] = 65752,
+    ["5343"] = 65753,
+    ["8461"] = 65754,
+    ["4720"] = 65755,
+    ["2316"] = 65756,
+    ["2371"] = 65757,
+    ["2454"] = 65758,
+    ["9585"] = 65759,
+    ["2304"] = 65760,
+    ["2468"] = 65761,
+    ["2599"] = 196609,
+    ["9680"] = 196610,
+    ["9733"] = 196611,
+    ["9732"] = 196612,
+    ["9749"] = 196613,
+    ["9750"] = 196614,
+    ["9751"] = 196615,
+    ["2779"] = 196616,
+    ["3389"] = 196617,
+    ["2522"] = 196618,
+    ["2756"] = 196619,
+    ["2745"] = 196620,
+    ["8981"] = 196621,
+    ["8980"] = 196622,
+    ["8979"] = 196623,
+    ["2659"] = 196624,
+    ["2678"] = 196625,
+    ["9742"] = 196626,
+    ["2699"] = 196627,
+    ["9714"] = 196628,
+    ["9762"] = 196629,
+    ["2657"] = 196630,
+    ["9723"] = 196631,
+    ["7887"] = 196632,
+    ["2485"] = 196633,
+    ["2616"] = 196634,
+    ["5830"] = 196635,
+    ["2546"] = 196636,
+    ["2688"] = 196637,
+    ["2769"] = 196638,
+    ["7891"] = 196639,
+    ["2662"] = 196640,
+    ["2585"] = 196641,
+    ["2577"] = 196642,
+    ["2578"] = 196643,
+    ["2591"] = 196644,
+    ["2579"] = 196645,
+    ["2580"] = 196646,
+    ["2587"] = 196647,
+    ["2581"] = 196648,
+    ["2582"] = 196649,
+    ["2576"] = 196650,
+    ["9695"] = 196651,
+    ["2583"] = 196652,
+    ["9387"] = 196653,
+    ["9422"] = 196654,
+    ["9421"] = 196655,
+    ["9434"] = 196656,
+    ["8988"] = 196657,
+    ["2602"] = 196660,
+    ["9768"] = 196661,
+    ["2665"] = 196662,
+    ["9703"] = 196663,
+    ["2762"] = 196664,
+    ["2518"] = 196665,
+    ["2729"] = 196666,
+    ["2680"] = 196667,
+    ["2642"] = 196668,
+    ["2728"] = 196669,
+    ["2545"] = 196670,
+    ["9699"] = 196671,
+    ["2516"] = 196672,
+    ["2612"] = 196673,
+    ["2613"] = 196674,
+    ["9737"] = 196675,
+    ["9707"] = 196676,
+    ["8974"] = 196677,
+    ["2506"] = 196678,
+    ["8973"] = 196679,
+    ["2547"] = 196680,
+    ["9211"] = 196681,
+    ["9102"] = 196682,
+    ["9210"] = 196683,
+    ["9209"] = 196684,
+    ["3186"] = 196685,
+    ["5115"] = 196686,
+    ["3188"] = 196687,
+    ["3196"] = 196688,
+    ["5116"] = 196689,
+    ["1825"] = 196690,
+    ["9101"] = 196691,
+    ["8520"] = 196692,
+    ["8153"] = 196693,
+    ["3960"] = 196694,
+    ["3959"] = 196695,
+    ["6572"] = 196696,
+    ["1888"] = 196697,
+    ["1886"] = 196698,
+    ["1889"] = 196699,
+    ["1892"] = 196700,
+    ["1887"] = 196701,
+    ["1891"] = 196702,
+    ["1890"] = 196703,
+    ["1893"] = 196704,
+    ["1894"] = 196705,
+    ["9734"] = 196706,
+    ["2763"] = 196707,
+    ["9770"] = 196708,
+    ["9688"] = 196709,
+    ["2754"] = 196710,
+    ["3187"] = 196711,
+    ["9739"] = 196712,
+    ["2534"] = 196713,
+    ["2764"] = 196714,
+    ["2570"] = 196715,
+    ["2702"] = 196716,
+    ["4611"] = 196717,
+    ["4609"] = 196718,
+    ["4610"] = 196719,
+    ["2751"] = 196720,
+    ["3917"] = 196721,
+    ["2725"] = 196722,
+    ["2712"] = 196723,
+    ["9730"] = 196724,
+    ["2600"] = 196725,
+    ["4505"] = 196726,
+    ["8971"] = 196727,
+    ["3961"] = 196728,
+    ["4513"] = 196729,
+    ["4514"] = 196730,
+    ["9740"] = 196731,
+    ["2393"] = 196732,
+    ["2701"] = 196733,
+    ["2623"] = 196734,
+    ["9258"] = 196735,
+    ["9736"] = 196736,
+    ["4947"] = 196737,
+    ["2509"] = 196738,
+    ["8987"] = 196739,
+    ["2691"] = 196740,
+    ["9757"] = 196741,
+    ["2584"] = 196743,
+    ["2696"] = 196744,
+    ["2588"] = 196745,
+    ["2589"] = 196746,
+    ["2590"] = 196747,
+    ["2614"] = 196748,
+    ["2747"] = 196749,
+    ["9681"] = 196750,
+    ["2647"] = 196751,
+    ["2752"] = 196752,
+    ["10064"] = 196753,
+    ["10066"] = 196754,
+    ["10067"] = 196755,
+    ["10074"] = 196756,
+    ["2656"] = 196757,
+    ["2717"] = 196758,
+    ["9754"] = 196759,
+    ["8093"] = 196760,
+    ["8085"] = 196761,
+    ["9755"] = 196762,
+    ["9847"] = 196763,
+    ["2636"] = 196764,
+    ["9544"] = 196765,
+    ["2495"] = 196766,
+    ["2554"] = 196767,
+    ["2658"] = 196768,
+    ["5834"] = 196769,
+    ["2643"] = 196770,
+    ["9767"] = 196771,
+    ["2536"] = 196772,
+    ["2740"] = 196773,
+    ["8976"] = 196774,
+    ["2564"] = 196775,
+    ["7888"] = 196776,
+    ["8969"] = 196777,
+    ["2537"] = 196778,
+    ["2673"] = 196779,
+    ["2488"] = 196780,
+    ["2681"] = 196781,
+    ["2609"] = 196782,
+    ["2586"] = 196812,
+    ["10242"] = 196813,
+    ["8983"] = 196814,
+    ["9720"] = 196816,
+    ["9735"] = 196817,
+    ["2644"] = 196818,
+    ["2645"] = 196819,
+    ["2508"] = 196820,
+    ["2513"] = 196821,
+    ["2510"] = 196822,
+    ["9772"] = 196823,
+    ["2648"] = 196824,
+    ["9719"] = 196825,
+    ["2780"] = 196826,
+    ["2755"] = 196828,
+    ["4864"] = 196829,
+    ["8977"] = 196830,
+    ["2731"] = 196831,
+    ["9537"] = 196832,
+    ["2550"] = 196833,
+    ["8984"] = 196834,
+    ["5706"] = 196835,
+    ["2539"] = 196836,
+    ["2768"] = 196837,
+    ["8970"] = 196838,
+    ["9684"] = 196839,
+    ["9685"] = 196840,
+    ["9686"] = 196841,
+    ["9687"] = 196842,
+    ["9700"] = 196843,
+    ["2719"] = 196844,
+    ["2694"] = 196845,
+    ["9722"] = 196846,
+    ["9711"] = 196847,
+    ["2697"] = 196848,
+    ["9222"] = 196849,
+    ["8568"] = 196850,
+    ["8569"] = 196851,
+    ["9223"] = 196852,
+    ["10390"] = 196853,
+    ["10388"] = 196854,
+    ["1826"] = 196855,
+    ["5828"] = 196856,
+    ["9721"] = 196857,
+    ["2720"] = 196858,
+    ["2603"] = 196859,
+    ["2391"] = 196860,
+    ["2743"] = 196861,
+    ["2515"] = 196862,
+    ["8986"] = 196864,
+    ["2604"] = 196865,
+    ["9763"] = 196866,
+    ["2605"] = 196867,
+    ["2749"] = 196868,
+    ["2750"] = 196869,
+    ["9726"] = 196870,
+    ["9775"] = 196871,
+    ["2551"] = 196873,
+    ["2560"] = 196874,
+    ["2558"] = 196875,
+    ["2559"] = 196876,
+    ["2562"] = 196877,
+    ["2561"] = 196878,
+    ["2748"] = 196879,
+    ["2530"] = 196880,
+    ["2667"] = 196881,
+    ["9756"] = 196882,
+    ["7889"] = 196883,
+    ["9170"] = 196884,
+    ["2596"] = 196885,
+    ["2597"] = 196886,
+    ["2563"] = 196887,
+    ["2666"] = 196888,
+    ["2512"] = 196889,
+    ["2615"] = 196890,
+    ["2760"] = 196891,
+    ["9712"] = 196892,
+    ["9766"] = 196893,
+    ["9257"] = 196894,
+    ["2637"] = 196895,
+    ["9744"] = 196896,
+    ["9715"] = 196897,
+    ["9689"] = 196898,
+    ["2626"] = 196899,
+    ["2690"] = 196900,
+    ["9696"] = 196901,
+    ["9718"] = 196902,
+    ["2607"] = 196903,
+    ["2661"] = 196904,
+    ["2631"] = 196905,
+    ["9725"] = 196906,
+    ["2494"] = 196907,
+    ["2552"] = 196908,
+    ["9708"] = 196909,
+    ["2685"] = 196910,
+    ["2499"] = 196911,
+    ["2646"] = 196912,
+    ["2500"] = 196913,
+    ["9752"] = 196914,
+    ["9728"] = 196915,
+    ["1827"] = 196916,
+    ["9764"] = 196917,
+    ["8972"] = 196918,
+    ["9261"] = 196919,
+    ["2676"] = 196920,
+    ["9758"] = 196921,
+    ["9738"] = 196922,
+    ["4506"] = 196923,
+    ["9760"] = 196924,
+    ["2638"] = 196925,
+    ["2611"] = 196926,
+    ["2761"] = 196927,
+    ["9713"] = 196928,
+    ["2608"] = 196929,
+    ["2524"] = 196930,
+    ["2525"] = 196931,
+    ["2526"] = 196932,
+    ["2713"] = 196933,
+    ["2655"] = 196934,
+    ["2650"] = 196935,
+    ["2535"] = 196937,
+    ["2619"] = 196938,
+    ["5353"] = 196939,
+    ["2498"] = 196940,
+    ["2533"] = 196941,
+    ["2700"] = 196942,
+    ["5827"] = 196943,
+    ["2493"] = 196944,
+    ["1829"] = 196945,
+    ["1828"] = 196946,
+    ["2683"] = 196947,
+    ["2532"] = 196948,
+    ["2695"] = 196949,
+    ["2511"] = 196950,
+    ["1837"] = 196951,
+    ["2620"] = 196952,
+    ["9773"] = 196953,
+    ["2639"] = 196954,
+    ["2710"] = 196955,
+    ["2711"] = 196956,
+    ["2705"] = 196957,
+    ["2766"] = 196958,
+    ["5831"] = 196959,
+    ["2627"] = 196960,
+    ["2687"] = 196961,
+    ["8975"] = 196962,
+    ["2652"] = 196963,
+    ["2778"] = 196964,
+    ["2776"] = 196965,
+    ["2777"] = 196966,
+    ["2765"] = 196967,
+    ["2721"] = 196969,
+    ["5829"] = 196970,
+    ["2770"] = 196971,
+    ["2544"] = 196972,
+    ["2771"] = 196973,
+    ["9697"] = 196974,
+    ["2556"] = 196975,
+    ["2571"] = 196976,
+    ["2504"] = 196977,
+    ["2632"] = 196978,
+    ["2572"] = 196979,
+    ["2757"] = 196980,
+    ["9682"] = 196981,
+    ["9690"] = 196982,
+    ["2622"] = 196983,
+    ["2633"] = 196984,
+    ["2724"] = 196985,
+    ["2497"] = 196986,
+    ["2663"] = 196987,
+    ["2682"] = 196988,
+    ["2634"] = 196989,
+    ["2772"] = 196990,
+    ["3401"] = 196991,
+    ["2484"] = 196992,
+    ["2621"] = 196993,
+    ["2686"] = 196994,
+    ["9716"] = 196995,
+    ["9724"] = 196996,
+    ["2727"] = 196997,
+    ["9260"] = 196998,
+    ["2624"] = 196999,
+    ["2625"] = 197000,
+    ["2548"] = 197001,
+    ["2746"] = 197002,
+    ["2738"] = 197003,
+    ["2773"] = 197004,
+    ["9701"] = 197005,
+    ["2617"] = 197006,
+    ["2635"] = 197007,
+    ["3382"] = 197008,
+    ["9704"] = 197009,
+    ["2523"] = 197010,
+    ["2664"] = 197011,
+    ["2739"] = 197012,
+    ["4844"] = 197013,
+    ["2592"] = 197014,
+    ["2549"] = 197015,
+    ["2675"] = 197016,
+    ["2538"] = 197017,
+    ["8966"] = 197018,
+    ["2693"] = 197019,
+    ["2496"] = 197020,
+    ["9761"] = 197021,
+    ["2774"] = 197022,
+    ["4494"] = 197023,
+    ["2714"] = 197024,
+    ["2514"] = 197025,
+    ["9259"] = 197026,
+    ["2730"] = 197027,
+    ["2593"] = 197028,
+    ["2759"] = 197029,
+    ["2758"] = 197030,
+    ["9743"] = 197031,
+    ["2692"] = 197032,
+    ["2557"] = 197033,
+    ["2594"] = 197034,
+    ["2595"] = 197035,
+    ["9702"] = 197036,
+    ["2742"] = 197037,
+    ["7890"] = 197038,
+    ["2606"] = 197039,
+    ["2734"] = 197040,
+    ["2775"] = 197041,
+    ["2649"] = 197042,
+    ["2618"] = 197043,
+    ["2517"] = 197044,
+    ["9759"] = 197045,
+    ["2598"] = 197046,
+    ["9692"] = 197047,
+    ["9693"] = 197048,
+    ["9694"] = 197049,
+    ["2679"] = 197050,
+    ["9765"] = 197051,
+    ["2507"] = 197052,
+    ["2653"] = 197053,
+    ["2718"] = 197054,
+    ["2706"] = 197055,
+    ["2660"] = 197056,
+    ["2531"] = 197057,
+    ["2651"] = 197058,
+    ["5748"] = 197059,
+    ["9769"] = 197060,
+    ["2630"] = 197061,
+    ["3405"] = 197062,
+    ["3406"] = 197063,
+    ["3407"] = 197064,
+    ["3408"] = 197065,
+    ["3409"] = 197066,
+    ["3410"] = 197067,
+    ["3411"] = 197068,
+    ["3412"] = 197069,
+    ["7886"] = 197070,
+    ["2555"] = 197071,
+    ["9727"] = 197072,
+    ["9774"] = 197073,
+    ["2689"] = 197074,
+    ["2505"] = 197075,
+    ["2684"] = 197076,
+    ["2568"] = 197077,
+    ["2553"] = 197078,
+    ["2489"] = 197079,
+    ["2520"] = 197080,
+    ["2521"] = 197081,
+    ["4723"] = 197083,
+    ["4732"] = 197084,
+    ["4733"] = 197085,
+    ["4734"] = 197086,
+    ["4724"] = 197087,
+    ["4725"] = 197088,
+    ["4726"] = 197089,
+    ["4727"] = 197090,
+    ["4728"] = 197091,
+    ["4729"] = 197092,
+    ["4730"] = 197093,
+    ["4731"] = 197094,
+    ["9705"] = 197095,
+    ["9706"] = 197096,
+    ["2519"] = 197097,
+    ["9771"] = 197099,
+    ["2709"] = 197100,
+    ["2640"] = 197101,
+    ["8982"] = 197102,
+    ["5770"] = 197103,
+    ["2677"] = 197104,
+    ["2487"] = 197105,
+    ["2753"] = 197106,
+    ["2735"] = 197107,
+    ["3976"] = 197108,
+    ["9691"] = 197109,
+    ["2741"] = 197110,
+    ["2672"] = 197111,
+    ["2708"] = 197112,
+    ["8978"] = 197113,
+    ["9753"] = 197114,
+    ["2767"] = 197115,
+    ["2501"] = 197116,
+    ["2575"] = 197117,
+    ["8967"] = 197118,
+    ["9741"] = 197119,
+    ["2704"] = 197120,
+    ["2502"] = 197121,
+    ["9698"] = 197122,
+    ["2543"] = 197123,
+    ["2542"] = 197124,
+    ["2540"] = 197125,
+    ["2541"] = 197126,
+    ["2486"] = 197127,
+    ["2527"] = 197128,
+    ["9717"] = 197129,
+    ["2707"] = 197130,
+    ["2674"] = 197131,
+    ["2628"] = 197132,
+    ["2629"] = 197133,
+    ["2528"] = 197134,
+    ["2529"] = 197135,
+    ["2668"] = 197136,
+    ["2490"] = 197137,
+    ["2669"] = 197138,
+    ["2715"] = 197139,
+    ["2722"] = 197140,
+    ["2670"] = 197141,
+    ["2491"] = 197142,
+    ["2723"] = 197143,
+    ["2736"] = 197144,
+    ["9731"] = 197145,
+    ["2565"] = 197146,
+    ["9709"] = 197147,
+    ["9710"] = 197148,
+    ["2601"] = 197149,
+    ["2726"] = 197150,
+    ["2569"] = 197151,
+    ["2698"] = 197152,
+    ["2574"] = 197153,
+    ["2503"] = 197154,
+    ["2610"] = 197155,
+    ["9729"] = 197156,
+    ["9745"] = 197157,
+    ["2567"] = 197158,
+    ["9748"] = 197159,
+    ["9747"] = 197160,
+    ["2573"] = 197161,
+    ["2716"] = 197162,
+    ["2566"] = 197163,
+    ["2737"] = 197164,
+    ["2733"] = 197166,
+    ["2641"] = 197167,
+    ["9746"] = 197168,
+    ["9683"] = 197169,
+    ["2492"] = 197170,
+    ["2744"] = 197171,
+    ["6800"] = 262145,
+    ["9172"] = 262146,
+    ["6807"] = 262147,
+    ["6801"] = 262148,
+    ["7876"] = 262149,
+    ["7145"] = 262150,
+    ["7146"] = 262151,
+    ["6803"] = 262152,
+    ["6805"] = 262153,
+    ["8541"] = 262154,
+    ["8815"] = 262155,
+    ["6797"] = 262156,
+    ["6808"] = 262157,
+    ["6809"] = 262158,
+    ["7149"] = 262159,
+    ["8457"] = 262160,
+    ["6810"] = 262161,
+    ["6816"] = 262162,
+    ["6817"] = 262163,
+    ["6811"] = 262164,
+    ["6799"] = 262165,
+    ["6804"] = 262166,
+    ["6818"] = 262167,
+    ["6802"] = 262168,
+    ["6798"] = 262169,
+    ["6815"] = 262170,
+    ["6806"] = 262171,
+    ["6814"] = 262172,
+    ["9866"] = 262173,
+    ["7144"] = 262174,
+    ["6813"] = 262175,
+    ["8245"] = 262176,
+    ["7148"] = 262177,
+    ["7499"] = 262178,
+    ["9171"] = 262179,
+    ["6796"] = 262180,
+    ["2469"] = 262181,
+    ["6329"] = 262182,
+    ["6611"] = 262183,
+    ["7205"] = 262184,
+    ["6305"] = 327681,
+    ["6530"] = 327682,
+    ["9862"] = 327683,
+    ["8690"] = 327684,
+    ["5625"] = 327685,
+    ["6306"] = 327686,
+    ["8691"] = 327687,
+    ["8624"] = 327688,
+    ["6436"] = 327689,
+    ["8693"] = 327690,
+    ["6839"] = 327691,
+    ["6712"] = 327692,
+    ["6771"] = 327693,
+    ["7511"] = 327694,
+    ["8056"] = 327695,
+    ["7512"] = 327696,
+    ["5585"] = 327697,
+    ["9241"] = 327698,
+    ["8625"] = 327699,
+    ["8425"] = 327700,
+    ["5890"] = 327701,
+    ["7248"] = 327702,
+    ["7893"] = 327703,
+    ["9863"] = 327705,
+    ["8694"] = 327706,
+    ["10383"] = 327707,
+    ["7376"] = 327708,
+    ["7377"] = 327709,
+    ["9531"] = 327710,
+    ["5889"] = 327712,
+    ["7894"] = 327713,
+    ["8692"] = 327714,
+    ["10235"] = 327715,
+    ["8424"] = 327716,
+    ["7249"] = 327717,
+    ["6529"] = 327718,
+    ["6435"] = 327719,
+    ["7610"] = 327720,
+    ["6711"] = 327721,
+    ["6840"] = 327722,
+    ["7611"] = 327723,
+    ["6770"] = 327724,
+    ["8057"] = 327725,
+    ["8935"] = 327726,
+    ["9240"] = 327727,
+    ["5888"] = 327728,
+    ["8248"] = 327729,
+    ["8247"] = 327730,
+    ["10091"] = 393217,
+    ["7097"] = 393218,
+    ["7868"] = 393219,
+    ["7099"] = 393220,
+    ["8531"] = 393221,
+    ["9225"] = 393222,
+    ["10087"] = 393223,
+    ["10088"] = 393224,
+    ["8526"] = 393225,
+    ["10090"] = 393226,
+    ["7092"] = 393227,
+    ["7984"] = 393228,
+    ["7198"] = 393229,
+    ["7094"] = 393230,
+    ["3065"] = 393231,
+    ["10039"] = 393232,
+    ["10089"] = 393233,
+    ["7194"] = 393234,
+    ["7190"] = 393235,
+    ["7105"] = 393236,
+    ["7112"] = 393237,
+    ["7096"] = 393238,
+    ["7095"] = 393239,
+    ["7093"] = 393240,
+    ["7090"] = 393241,
+    ["7089"] = 393242,
+    ["7870"] = 393243,
+    ["7192"] = 393244,
+    ["8535"] = 393245,
+    ["8528"] = 393246,
+    ["8534"] = 393247,
+    ["10085"] = 393248,
+    ["7874"] = 393249,
+    ["8529"] = 393250,
+    ["7866"] = 393251,
+    ["7100"] = 393252,
+    ["7869"] = 393253,
+    ["7091"] = 393254,
+    ["7191"] = 393255,
+    ["8530"] = 393256,
+    ["7195"] = 393257,
+    ["8532"] = 393258,
+    ["7871"] = 393259,
+    ["9216"] = 393260,
+    ["9213"] = 393261,
+    ["8527"] = 393262,
+    ["9218"] = 393263,
+    ["5025"] = 393264,
+    ["5027"] = 393265,
+    ["1743"] = 393266,
+    ["6678"] = 393267,
+    ["1742"] = 393268,
+    ["5021"] = 393269,
+    ["1630"] = 393270,
+    ["1705"] = 393271,
+    ["1703"] = 393272,
+    ["1744"] = 393273,
+    ["5020"] = 393274,
+    ["5022"] = 393275,
+    ["1707"] = 393276,
+    ["7098"] = 393277,
+    ["1704"] = 393278,
+    ["5023"] = 393279,
+    ["1627"] = 393280,
+    ["7101"] = 393281,
+    ["1708"] = 393282,
+    ["1702"] = 393283,
+    ["5026"] = 393284,
+    ["1701"] = 393285,
+    ["1706"] = 393286,
+    ["5024"] = 393287,
+    ["1631"] = 393288,
+    ["1632"] = 393289,
+    ["1628"] = 393290,
+    ["1741"] = 393291,
+    ["1634"] = 393292,
+    ["1633"] = 393293,
+    ["1629"] = 393294,
+    ["7108"] = 393295,
+    ["7867"] = 393296,
+    ["9226"] = 393297,
+    ["10084"] = 393298,
+    ["7189"] = 393299,
+    ["7875"] = 393300,
+    ["7106"] = 393301,
+    ["7200"] = 393302,
+    ["9219"] = 393303,
+    ["7104"] = 393304,
+    ["7197"] = 393305,
+    ["7188"] = 393306,
+    ["10038"] = 393307,
+    ["9215"] = 393308,
+    ["9214"] = 393309,
+    ["3544"] = 393310,
+    ["3545"] = 393311,
+    ["3543"] = 393312,
+    ["3541"] = 393313,
+    ["3542"] = 393314,
+    ["3540"] = 393315,
+    ["3538"] = 393316,
+    ["3539"] = 393317,
+    ["3537"] = 393318,
+    ["9217"] = 393319,
+    ["7103"] = 393320,
+    ["9224"] = 393321,
+    ["7193"] = 393322,
+    ["7185"] = 393323,
+    ["7196"] = 393324,
+    ["7873"] = 393325,
+    ["7107"] = 393326,
+    ["7251"] = 393327,
+    ["10083"] = 393328,
+    ["7199"] = 393329,
+    ["8533"] = 393330,
+    ["7872"] = 393331,
+    ["7102"] = 393332,
+    ["3673"] = 393333,
+    ["3665"] = 393334,
+    ["3679"] = 393335,
+    ["3674"] = 393336,
+    ["3666"] = 393337,
+    ["3680"] = 393338,
+    ["3672"] = 393339,
+    ["3668"] = 393340,
+    ["3678"] = 393341,
+    ["3675"] = 393342,
+    ["3663"] = 393343,
+    ["3669"] = 393344,
+    ["3670"] = 393345,
+    ["3664"] = 393346,
+    ["3676"] = 393347,
+    ["10092"] = 393348,
+    ["7322"] = 393349,
+    ["10086"] = 393350,
+    ["10273"] = 458753,
+    ["5264"] = 458754,
+    ["5263"] = 458755,
+    ["5265"] = 458756,
+    ["5272"] = 458757,
+    ["5273"] = 458758,
+    ["5274"] = 458759,
+    ["810"] = 458760,
+    ["811"] = 458761,
+    ["789"] = 458762,
+    ["790"] = 458763,
+    ["8582"] = 458764,
+    ["8583"] = 458765,
+    ["560"] = 458767,
+    ["549"] = 458768,
+    ["544"] = 458769,
+    ["558"] = 458770,
+    ["3203"] = 458771,
+    ["4834"] = 458772,
+    ["9534"] = 458773,
+    ["9535"] = 458774,
+    ["10005"] = 458775,
+    ["10007"] = 458776,
+    ["10006"] = 458777,
+    ["9909"] = 458778,
+    ["9908"] = 458779,
+    ["10202"] = 458780,
+    ["9907"] = 458781,
+    ["2376"] = 458782,
+    ["3908"] = 458783,
+    ["588"] = 458784,
+    ["8113"] = 458785,
+    ["8111"] = 458786,
+    ["8112"] = 458787,
+    ["8114"] = 458788,
+    ["8327"] = 458789,
+    ["8828"] = 458790,
+    ["3800"] = 458791,
+    ["3439"] = 458792,
+    ["8744"] = 458793,
+    ["6074"] = 458794,
+    ["6075"] = 458795,
+    ["6073"] = 458796,
+    ["6156"] = 458797,
+    ["6158"] = 458798,
+    ["6157"] = 458799,
+    ["6155"] = 458800,
+    ["10447"] = 458801,
+    ["8787"] = 458802,
+    ["8788"] = 458803,
+    ["7182"] = 458804,
+    ["8584"] = 458805,
+    ["8585"] = 458806,
+    ["8847"] = 458807,
+    ["8846"] = 458808,
+    ["327"] = 458809,
+    ["351"] = 458810,
+    ["274"] = 458811,
+    ["291"] = 458812,
+    ["290"] = 458813,
+    ["8632"] = 458814,
+    ["8586"] = 458815,
+    ["8587"] = 458816,
+    ["3440"] = 458817,
+    ["3801"] = 458818,
+    ["7826"] = 458819,
+    ["188"] = 458820,
+    ["250"] = 458821,
+    ["189"] = 458822,
+    ["217"] = 458823,
+    ["190"] = 458824,
+    ["3625"] = 458825,
+    ["3802"] = 458826,
+    ["3626"] = 458827,
+    ["3627"] = 458828,
+    ["976"] = 458829,
+    ["992"] = 458830,
+    ["942"] = 458831,
+    ["8588"] = 458832,
+    ["8589"] = 458833,
+    ["7696"] = 458834,
+    ["7790"] = 458835,
+    ["7791"] = 458836,
+    ["7699"] = 458837,
+    ["7695"] = 458838,
+    ["7981"] = 458839,
+    ["7697"] = 458840,
+    ["7698"] = 458841,
+    ["6223"] = 458842,
+    ["6225"] = 458843,
+    ["6224"] = 458844,
+    ["6222"] = 458845,
+    ["6221"] = 458846,
+    ["8886"] = 458847,
+    ["8796"] = 458848,
+    ["8849"] = 458849,
+    ["8848"] = 458850,
+    ["9850"] = 458851,
+    ["9851"] = 458852,
+    ["5693"] = 458853,
+    ["5699"] = 458854,
+    ["5698"] = 458855,
+    ["5704"] = 458856,
+    ["694"] = 458857,
+    ["716"] = 458858,
+    ["1125"] = 458859,
+    ["1126"] = 458860,
+    ["1179"] = 458861,
+    ["1128"] = 458862,
+    ["1127"] = 458863,
+    ["1148"] = 458864,
+    ["8590"] = 458865,
+    ["8591"] = 458866,
+    ["8592"] = 458867,
+    ["8593"] = 458868,
+    ["1216"] = 458869,
+    ["1215"] = 458870,
+    ["1260"] = 458871,
+    ["1327"] = 458872,
+    ["1374"] = 458873,
+    ["3803"] = 458874,
+    ["9852"] = 458875,
+    ["9853"] = 458876,
+    ["9532"] = 458877,
+    ["9533"] = 458878,
+    ["8594"] = 458879,
+    ["8595"] = 458880,
+    ["7167"] = 458881,
+    ["3374"] = 458882,
+    ["2164"] = 458883,
+    ["5939"] = 458884,
+    ["4837"] = 458885,
+    ["3939"] = 458886,
+    ["7830"] = 458887,
+    ["7150"] = 458888,
+    ["7151"] = 458889,
+    ["3776"] = 458890,
+    ["3778"] = 458891,
+    ["3777"] = 458892,
+    ["3351"] = 458893,
+    ["1722"] = 458894,
+    ["6623"] = 458895,
+    ["3698"] = 458896,
+    ["5088"] = 458897,
+    ["3398"] = 458898,
+    ["3804"] = 458899,
+    ["8785"] = 458900,
+    ["8786"] = 458901,
+    ["6880"] = 458902,
+    ["6878"] = 458903,
+    ["6879"] = 458904,
+    ["3671"] = 458905,
+    ["3667"] = 458906,
+    ["3677"] = 458907,
+    ["916"] = 458908,
+    ["915"] = 458909,
+    ["917"] = 458910,
+}
+
+Data.members = {
+    banners = {
+        [210890] = true,
+        [210891] = true,
+        [210892] = true,
+        [119965] = true,
+        [120044] = true,
+        [139376] = true,
+        [187791] = true,
+        [115527] = true,
+        [115451] = true,
+        [115526] = true,
+        [192426] = true,
+        [134429] = true,
+        [134432] = true,
+        [126118] = true,
+        [152258] = true,
+        [147636] = true,
+        [119690] = true,
+        [126623] = true,
+        [126621] = true,
+        [126624] = true,
+        [126620] = true,
+        [126622] = true,
+        [150775] = true,
+        [175707] = true,
+        [126720] = true,
+        [152259] = true,
+        [152257] = true,
+        [147599] = true,
+        [134855] = true,
+        [130190] = true,
+        [119969] = true,
+        [150774] = true,
+        [126649] = true,
+        [139388] = true,
+        [119947] = true,
+        [126712] = true,
+        [139377] = true,
+        [141858] = true,
+        [126650] = true,
+        [151781] = true,
+        [175760] = true,
+        [192574] = true,
+        [145406] = true,
+        [125480] = true,
+        [118079] = true,
+        [145404] = true,
+        [203145] = true,
+        [118077] = true,
+        [118076] = true,
+        [153699] = true,
+        [203271] = true,
+        [120995] = true,
+        [145488] = true,
+        [134474] = true,
+        [175578] = true,
+        [118078] = true,
+        [126628] = true,
+        [139138] = true,
+        [145487] = true,
+        [141763] = true,
+        [141764] = true,
+        [153700] = true,
+        [151780] = true,
+        [145405] = true,
+        [120997] = true,
+        [175703] = true,
+        [120996] = true,
+        [141765] = true,
+        [141766] = true,
+        [126146] = true,
+        [118075] = true,
+        [134908] = true,
+        [120046] = true,
+        [121270] = true,
+        [134943] = true,
+        [120048] = true,
+        [139393] = true,
+        [120064] = true,
+        [130085] = true,
+        [130086] = true,
+        [119945] = true,
+        [115307] = true,
+        [139386] = true,
+        [120063] = true,
+        [153887] = true,
+        [120002] = true,
+        [120050] = true,
+        [119883] = true,
+        [212587] = true,
+        [120957] = true,
+        [182220] = true,
+        [182218] = true,
+        [182219] = true,
+        [182214] = true,
+        [182215] = true,
+        [182216] = true,
+        [120019] = true,
+        [171414] = true,
+        [211530] = true,
+        [211531] = true,
+        [187866] = true,
+        [192571] = true,
+        [182622] = true,
+        [166020] = true,
+        [178472] = true,
+        [178474] = true,
+        [178476] = true,
+        [151681] = true,
+        [151683] = true,
+        [151682] = true,
+        [151868] = true,
+        [197720] = true,
+        [194422] = true,
+        [203202] = true,
+        [194423] = true,
+        [114422] = true,
+        [126366] = true,
+        [159451] = true,
+        [159453] = true,
+        [119983] = true,
+        [94094] = true,
+        [94192] = true,
+        [208159] = true,
+        [94095] = true,
+        [94096] = true,
+        [126553] = true,
+        [126554] = true,
+        [126555] = true,
+        [192572] = true,
+        [119966] = true,
+        [211553] = true,
+        [211552] = true,
+        [211559] = true,
+        [211549] = true,
+        [211550] = true,
+        [211551] = true,
+        [166021] = true,
+        [115651] = true,
+        [115648] = true,
+        [115669] = true,
+        [115647] = true,
+        [119863] = true,
+        [166024] = true,
+        [139387] = true,
+        [120011] = true,
+        [171413] = true,
+        [139391] = true,
+        [134428] = true,
+        [134431] = true,
+        [119833] = true,
+        [127149] = true,
+        [166022] = true,
+        [182621] = true,
+        [197741] = true,
+        [197696] = true,
+        [197694] = true,
+        [197697] = true,
+        [197742] = true,
+        [197695] = true,
+        [197740] = true,
+        [197743] = true,
+        [198045] = true,
+        [184250] = true,
+        [192575] = true,
+        [198046] = true,
+        [134290] = true,
+        [146061] = true,
+        [156758] = true,
+        [156757] = true,
+        [171387] = true,
+        [115413] = true,
+        [119935] = true,
+        [116374] = true,
+        [203140] = true,
+        [116415] = true,
+        [182616] = true,
+        [116375] = true,
+        [119944] = true,
+        [204631] = true,
+        [120023] = true,
+        [120065] = true,
+        [119984] = true,
+        [211536] = true,
+        [211537] = true,
+        [120052] = true,
+        [139170] = true,
+        [139173] = true,
+        [141822] = true,
+        [119884] = true,
+        [192581] = true,
+        [171386] = true,
+        [167344] = true,
+        [151954] = true,
+        [117695] = true,
+        [156663] = true,
+        [156662] = true,
+        [119840] = true,
+        [156763] = true,
+        [139378] = true,
+        [181510] = true,
+        [118067] = true,
+        [118068] = true,
+        [118069] = true,
+        [118070] = true,
+        [118071] = true,
+        [212214] = true,
+        [204781] = true,
+        [166023] = true,
+        [134430] = true,
+        [134433] = true,
+        [126719] = true,
+        [126646] = true,
+        [126648] = true,
+        [126647] = true,
+        [211526] = true,
+        [211524] = true,
+        [139392] = true,
+        [187803] = true,
+        [134473] = true,
+        [119856] = true,
+        [119922] = true,
+        [120036] = true,
+        [203146] = true,
+        [119844] = true,
+        [120054] = true,
+        [212551] = true,
+        [212550] = true,
+        [212552] = true,
+        [212549] = true,
+        [212548] = true,
+    },
+    esoplus = {
+    },
+    literature = {
+        [120197] = true,
+        [203377] = true,
+        [203430] = true,
+        [203429] = true,
+        [203446] = true,
+        [203447] = true,
+        [203448] = true,
+        [120406] = true,
+        [126138] = true,
+        [120120] = true,
+        [120354] = true,
+        [120343] = true,
+        [194453] = true,
+        [194452] = true,
+        [194451] = true,
+        [120257] = true,
+        [120276] = true,
+        [203439] = true,
+        [120297] = true,
+        [203411] = true,
+        [203459] = true,
+        [120255] = true,
+        [203420] = true,
+        [178498] = true,
+        [120083] = true,
+        [120214] = true,
+        [145927] = true,
+        [120144] = true,
+        [120286] = true,
+        [120367] = true,
+        [178502] = true,
+        [120260] = true,
+        [120183] = true,
+        [120175] = true,
+        [120176] = true,
+        [120189] = true,
+        [120177] = true,
+        [120178] = true,
+        [120185] = true,
+        [120179] = true,
+        [120180] = true,
+        [120174] = true,
+        [203392] = true,
+        [120181] = true,
+        [198393] = true,
+        [198428] = true,
+        [198427] = true,
+        [198440] = true,
+        [194460] = true,
+        [203203] = true,
+        [197704] = true,
+        [120200] = true,
+        [203465] = true,
+        [120263] = true,
+        [203400] = true,
+        [120360] = true,
+        [120116] = true,
+        [120327] = true,
+        [120278] = true,
+        [120240] = true,
+        [120326] = true,
+        [120143] = true,
+        [203396] = true,
+        [120114] = true,
+        [120210] = true,
+        [120211] = true,
+        [203434] = true,
+        [203404] = true,
+        [194446] = true,
+        [120104] = true,
+        [194445] = true,
+        [120145] = true,
+        [197747] = true,
+        [197545] = true,
+        [197746] = true,
+        [197745] = true,
+        [121045] = true,
+        [139164] = true,
+        [121047] = true,
+        [121056] = true,
+        [139165] = true,
+        [118482] = true,
+        [197544] = true,
+        [187862] = true,
+        [182285] = true,
+        [130211] = true,
+        [130210] = true,
+        [156644] = true,
+        [118711] = true,
+        [118709] = true,
+        [118712] = true,
+        [118715] = true,
+        [118710] = true,
+        [118714] = true,
+        [118713] = true,
+        [118716] = true,
+        [118717] = true,
+        [203431] = true,
+        [120361] = true,
+        [203467] = true,
+        [203385] = true,
+        [120352] = true,
+        [121046] = true,
+        [203436] = true,
+        [120132] = true,
+        [120362] = true,
+        [120168] = true,
+        [120300] = true,
+        [134363] = true,
+        [134361] = true,
+        [134362] = true,
+        [120349] = true,
+        [130093] = true,
+        [120323] = true,
+        [120310] = true,
+        [203427] = true,
+        [120198] = true,
+        [134257] = true,
+        [194443] = true,
+        [130212] = true,
+        [134265] = true,
+        [134266] = true,
+        [203437] = true,
+        [119953] = true,
+        [120299] = true,
+        [120221] = true,
+        [197918] = true,
+        [203433] = true,
+        [134961] = true,
+        [120107] = true,
+        [194459] = true,
+        [120289] = true,
+        [203454] = true,
+        [120182] = true,
+        [120294] = true,
+        [120186] = true,
+        [120187] = true,
+        [120188] = true,
+        [120212] = true,
+        [120345] = true,
+        [203378] = true,
+        [120245] = true,
+        [120350] = true,
+        [204780] = true,
+        [204782] = true,
+        [204783] = true,
+        [204790] = true,
+        [120254] = true,
+        [120315] = true,
+        [203451] = true,
+        [182225] = true,
+        [182217] = true,
+        [203452] = true,
+        [204410] = true,
+        [120234] = true,
+        [199126] = true,
+        [120093] = true,
+        [120152] = true,
+        [120256] = true,
+        [146047] = true,
+        [120241] = true,
+        [203464] = true,
+        [120134] = true,
+        [120338] = true,
+        [194448] = true,
+        [120162] = true,
+        [178499] = true,
+        [194441] = true,
+        [120135] = true,
+        [120271] = true,
+        [120086] = true,
+        [120279] = true,
+        [120207] = true,
+        [120381] = true,
+        [120401] = true,
+        [120380] = true,
+        [120385] = true,
+        [120405] = true,
+        [120384] = true,
+        [120399] = true,
+        [120386] = true,
+        [120387] = true,
+        [120388] = true,
+        [120398] = true,
+        [120377] = true,
+        [120402] = true,
+        [120403] = true,
+        [120389] = true,
+        [120390] = true,
+        [120391] = true,
+        [120397] = true,
+        [120392] = true,
+        [120393] = true,
+        [120394] = true,
+        [120404] = true,
+        [120379] = true,
+        [120382] = true,
+        [120396] = true,
+        [120378] = true,
+        [120395] = true,
+        [120400] = true,
+        [120383] = true,
+        [120184] = true,
+        [208358] = true,
+        [194455] = true,
+        [203417] = true,
+        [203432] = true,
+        [120242] = true,
+        [120243] = true,
+        [120106] = true,
+        [120111] = true,
+        [120108] = true,
+        [203469] = true,
+        [120246] = true,
+        [203416] = true,
+        [120407] = true,
+        [120353] = true,
+        [134881] = true,
+        [194449] = true,
+        [120329] = true,
+        [199119] = true,
+        [120148] = true,
+        [194456] = true,
+        [145403] = true,
+        [120137] = true,
+        [120366] = true,
+        [194442] = true,
+        [203381] = true,
+        [203382] = true,
+        [203383] = true,
+        [203384] = true,
+        [203397] = true,
+        [120317] = true,
+        [120292] = true,
+        [203419] = true,
+        [203408] = true,
+        [120295] = true,
+        [197779] = true,
+        [188201] = true,
+        [188202] = true,
+        [197780] = true,
+        [211505] = true,
+        [211503] = true,
+        [118487] = true,
+        [145923] = true,
+        [203418] = true,
+        [120318] = true,
+        [120201] = true,
+        [119951] = true,
+        [120341] = true,
+        [120113] = true,
+        [145596] = true,
+        [194458] = true,
+        [120202] = true,
+        [203460] = true,
+        [120203] = true,
+        [120347] = true,
+        [120348] = true,
+        [203423] = true,
+        [203472] = true,
+        [120149] = true,
+        [120158] = true,
+        [120156] = true,
+        [120157] = true,
+        [120160] = true,
+        [120159] = true,
+        [120346] = true,
+        [120128] = true,
+        [120265] = true,
+        [203453] = true,
+        [178500] = true,
+        [197710] = true,
+        [120194] = true,
+        [120195] = true,
+        [120161] = true,
+        [120264] = true,
+        [120110] = true,
+        [120213] = true,
+        [120358] = true,
+        [203409] = true,
+        [203463] = true,
+        [197917] = true,
+        [120235] = true,
+        [203441] = true,
+        [203412] = true,
+        [203386] = true,
+        [120224] = true,
+        [120288] = true,
+        [203393] = true,
+        [203415] = true,
+        [120205] = true,
+        [120259] = true,
+        [120229] = true,
+        [203422] = true,
+        [120092] = true,
+        [120150] = true,
+        [203405] = true,
+        [120283] = true,
+        [120097] = true,
+        [120244] = true,
+        [120098] = true,
+        [203449] = true,
+        [203425] = true,
+        [118489] = true,
+        [203461] = true,
+        [194444] = true,
+        [197921] = true,
+        [120274] = true,
+        [203455] = true,
+        [203435] = true,
+        [134258] = true,
+        [203457] = true,
+        [120236] = true,
+        [120209] = true,
+        [120359] = true,
+        [203410] = true,
+        [120206] = true,
+        [120122] = true,
+        [120123] = true,
+        [120124] = true,
+        [120311] = true,
+        [120253] = true,
+        [120248] = true,
+        [120133] = true,
+        [120217] = true,
+        [140220] = true,
+        [120096] = true,
+        [120131] = true,
+        [120298] = true,
+        [145597] = true,
+        [120091] = true,
+        [118491] = true,
+        [118490] = true,
+        [120281] = true,
+        [120130] = true,
+        [120293] = true,
+        [120109] = true,
+        [118528] = true,
+        [120218] = true,
+        [203470] = true,
+        [120237] = true,
+        [120308] = true,
+        [120309] = true,
+        [120303] = true,
+        [120364] = true,
+        [145928] = true,
+        [120225] = true,
+        [120285] = true,
+        [194447] = true,
+        [120250] = true,
+        [120376] = true,
+        [120374] = true,
+        [120375] = true,
+        [120363] = true,
+        [126792] = true,
+        [120319] = true,
+        [145926] = true,
+        [120368] = true,
+        [120142] = true,
+        [120369] = true,
+        [203394] = true,
+        [120154] = true,
+        [120169] = true,
+        [120102] = true,
+        [120230] = true,
+        [120170] = true,
+        [120355] = true,
+        [203379] = true,
+        [203387] = true,
+        [120220] = true,
+        [120231] = true,
+        [120322] = true,
+        [120095] = true,
+        [120261] = true,
+        [120280] = true,
+        [120232] = true,
+        [120370] = true,
+        [126152] = true,
+        [120082] = true,
+        [120219] = true,
+        [120284] = true,
+        [203413] = true,
+        [203421] = true,
+        [120325] = true,
+        [197920] = true,
+        [120222] = true,
+        [120223] = true,
+        [120146] = true,
+        [120344] = true,
+        [120336] = true,
+        [120371] = true,
+        [203398] = true,
+        [120215] = true,
+        [120233] = true,
+        [126128] = true,
+        [203401] = true,
+        [120121] = true,
+        [120262] = true,
+        [120337] = true,
+        [134861] = true,
+        [120190] = true,
+        [120147] = true,
+        [120273] = true,
+        [120136] = true,
+        [194439] = true,
+        [120291] = true,
+        [120094] = true,
+        [203458] = true,
+        [120372] = true,
+        [134246] = true,
+        [120312] = true,
+        [120112] = true,
+        [197919] = true,
+        [120328] = true,
+        [120191] = true,
+        [120357] = true,
+        [120356] = true,
+        [203440] = true,
+        [120290] = true,
+        [120155] = true,
+        [120192] = true,
+        [120193] = true,
+        [203399] = true,
+        [120340] = true,
+        [178501] = true,
+        [120204] = true,
+        [120332] = true,
+        [120373] = true,
+        [120247] = true,
+        [120216] = true,
+        [120115] = true,
+        [203456] = true,
+        [120196] = true,
+        [203389] = true,
+        [203390] = true,
+        [203391] = true,
+        [120277] = true,
+        [203462] = true,
+        [120105] = true,
+        [120251] = true,
+        [120316] = true,
+        [120304] = true,
+        [120258] = true,
+        [120129] = true,
+        [120249] = true,
+        [145445] = true,
+        [203466] = true,
+        [120228] = true,
+        [126157] = true,
+        [126158] = true,
+        [126159] = true,
+        [126160] = true,
+        [126161] = true,
+        [126162] = true,
+        [126163] = true,
+        [126164] = true,
+        [178497] = true,
+        [120153] = true,
+        [203424] = true,
+        [203471] = true,
+        [120287] = true,
+        [120103] = true,
+        [120282] = true,
+        [120166] = true,
+        [120151] = true,
+        [120087] = true,
+        [120118] = true,
+        [120119] = true,
+        [134547] = true,
+        [134548] = true,
+        [134557] = true,
+        [134558] = true,
+        [134559] = true,
+        [134549] = true,
+        [134550] = true,
+        [134551] = true,
+        [134552] = true,
+        [134553] = true,
+        [134554] = true,
+        [134555] = true,
+        [134556] = true,
+        [203402] = true,
+        [203403] = true,
+        [120117] = true,
+        [203468] = true,
+        [120307] = true,
+        [120238] = true,
+        [194454] = true,
+        [145467] = true,
+        [120275] = true,
+        [120085] = true,
+        [120351] = true,
+        [120333] = true,
+        [130228] = true,
+        [203388] = true,
+        [120339] = true,
+        [120270] = true,
+        [120306] = true,
+        [194450] = true,
+        [203450] = true,
+        [120365] = true,
+        [120099] = true,
+        [120173] = true,
+        [194440] = true,
+        [203438] = true,
+        [120302] = true,
+        [120100] = true,
+        [203395] = true,
+        [120141] = true,
+        [120140] = true,
+        [120138] = true,
+        [120139] = true,
+        [120084] = true,
+        [120125] = true,
+        [203414] = true,
+        [120305] = true,
+        [120272] = true,
+        [120226] = true,
+        [120227] = true,
+        [120126] = true,
+        [120127] = true,
+        [120266] = true,
+        [120088] = true,
+        [120267] = true,
+        [120313] = true,
+        [120320] = true,
+        [120268] = true,
+        [120089] = true,
+        [120321] = true,
+        [120334] = true,
+        [203428] = true,
+        [120163] = true,
+        [203406] = true,
+        [203407] = true,
+        [120199] = true,
+        [120324] = true,
+        [120167] = true,
+        [120296] = true,
+        [120172] = true,
+        [120101] = true,
+        [120208] = true,
+        [203426] = true,
+        [203442] = true,
+        [120165] = true,
+        [203445] = true,
+        [203444] = true,
+        [120171] = true,
+        [120314] = true,
+        [120164] = true,
+        [120335] = true,
+        [120331] = true,
+        [120239] = true,
+        [203443] = true,
+        [203380] = true,
+        [120090] = true,
+        [120342] = true,
+    },
+    maps = {
+        [163710] = true,
+        [197712] = true,
+        [163717] = true,
+        [163711] = true,
+        [178459] = true,
+        [165993] = true,
+        [165994] = true,
+        [163713] = true,
+        [163715] = true,
+        [187922] = true,
+        [192431] = true,
+        [163707] = true,
+        [163718] = true,
+        [163719] = true,
+        [165997] = true,
+        [187799] = true,
+        [163720] = true,
+        [163726] = true,
+        [163727] = true,
+        [163721] = true,
+        [163709] = true,
+        [163714] = true,
+        [163728] = true,
+        [163712] = true,
+        [163708] = true,
+        [163725] = true,
+        [163716] = true,
+        [163724] = true,
+        [204424] = true,
+        [165992] = true,
+        [163723] = true,
+        [183196] = true,
+        [165996] = true,
+        [171431] = true,
+        [197711] = true,
+        [163706] = true,
+        [120056] = true,
+        [151968] = true,
+        [156762] = true,
+        [166463] = true,
+    },
+    musicBoxes = {
+        [151909] = true,
+        [156554] = true,
+        [204422] = true,
+        [190938] = true,
+        [145322] = true,
+        [151910] = true,
+        [190939] = true,
+        [189464] = true,
+        [153634] = true,
+        [190941] = true,
+        [163431] = true,
+        [159598] = true,
+        [163429] = true,
+        [171542] = true,
+        [181636] = true,
+        [171543] = true,
+        [142235] = true,
+        [197829] = true,
+        [189465] = true,
+        [187667] = true,
+        [147507] = true,
+        [167006] = true,
+        [178521] = true,
+        [212420] = true,
+        [204423] = true,
+        [190942] = true,
+        [211498] = true,
+        [167428] = true,
+        [167429] = true,
+        [199113] = true,
+        [197625] = true,
+        [147506] = true,
+        [178522] = true,
+        [190940] = true,
+        [208160] = true,
+        [187666] = true,
+        [167007] = true,
+        [156553] = true,
+        [153633] = true,
+        [171943] = true,
+        [159596] = true,
+        [163432] = true,
+        [171944] = true,
+        [163428] = true,
+        [181637] = true,
+        [194399] = true,
+        [197826] = true,
+        [147505] = true,
+        [183201] = true,
+        [183200] = true,
+    },
+    paintings = {
+        [204807] = true,
+        [165834] = true,
+        [178444] = true,
+        [165836] = true,
+        [187873] = true,
+        [197782] = true,
+        [204803] = true,
+        [204804] = true,
+        [187868] = true,
+        [204806] = true,
+        [165829] = true,
+        [181507] = true,
+        [166447] = true,
+        [165831] = true,
+        [120855] = true,
+        [204755] = true,
+        [204805] = true,
+        [166443] = true,
+        [166439] = true,
+        [165842] = true,
+        [165849] = true,
+        [165833] = true,
+        [165832] = true,
+        [165830] = true,
+        [165827] = true,
+        [165826] = true,
+        [178446] = true,
+        [166441] = true,
+        [187877] = true,
+        [187870] = true,
+        [187876] = true,
+        [204801] = true,
+        [178450] = true,
+        [187871] = true,
+        [178442] = true,
+        [165837] = true,
+        [178445] = true,
+        [165828] = true,
+        [166440] = true,
+        [187872] = true,
+        [166444] = true,
+        [187874] = true,
+        [178447] = true,
+        [197752] = true,
+        [197749] = true,
+        [187869] = true,
+        [197754] = true,
+        [139074] = true,
+        [139076] = true,
+        [118267] = true,
+        [159437] = true,
+        [118266] = true,
+        [139070] = true,
+        [118141] = true,
+        [118220] = true,
+        [118218] = true,
+        [118268] = true,
+        [139069] = true,
+        [139071] = true,
+        [118222] = true,
+        [165835] = true,
+        [118219] = true,
+        [139072] = true,
+        [118138] = true,
+        [165838] = true,
+        [118223] = true,
+        [118217] = true,
+        [139075] = true,
+        [118216] = true,
+        [118221] = true,
+        [139073] = true,
+        [118142] = true,
+        [118143] = true,
+        [118139] = true,
+        [118265] = true,
+        [118145] = true,
+        [118144] = true,
+        [118140] = true,
+        [165845] = true,
+        [178443] = true,
+        [197783] = true,
+        [204800] = true,
+        [166438] = true,
+        [178451] = true,
+        [165843] = true,
+        [166449] = true,
+        [197755] = true,
+        [165841] = true,
+        [166446] = true,
+        [166437] = true,
+        [204754] = true,
+        [197751] = true,
+        [197750] = true,
+        [126469] = true,
+        [126470] = true,
+        [126468] = true,
+        [126466] = true,
+        [126467] = true,
+        [126465] = true,
+        [126463] = true,
+        [126464] = true,
+        [126462] = true,
+        [197753] = true,
+        [165840] = true,
+        [197781] = true,
+        [166442] = true,
+        [166434] = true,
+        [166445] = true,
+        [178449] = true,
+        [165844] = true,
+        [167332] = true,
+        [204799] = true,
+        [166448] = true,
+        [187875] = true,
+        [178448] = true,
+        [165839] = true,
+        [126602] = true,
+        [126594] = true,
+        [126608] = true,
+        [126603] = true,
+        [126595] = true,
+        [126609] = true,
+        [126601] = true,
+        [126597] = true,
+        [126607] = true,
+        [126604] = true,
+        [126592] = true,
+        [126598] = true,
+        [126599] = true,
+        [126593] = true,
+        [126605] = true,
+        [204808] = true,
+        [167340] = true,
+        [204802] = true,
+    },
+    tapestries = {
+        [210896] = true,
+        [139313] = true,
+        [139312] = true,
+        [139314] = true,
+        [139321] = true,
+        [139322] = true,
+        [139323] = true,
+        [115508] = true,
+        [115509] = true,
+        [115487] = true,
+        [115488] = true,
+        [188272] = true,
+        [188273] = true,
+        [115255] = true,
+        [115244] = true,
+        [115239] = true,
+        [115253] = true,
+        [121271] = true,
+        [134845] = true,
+        [199116] = true,
+        [199117] = true,
+        [204721] = true,
+        [204723] = true,
+        [204722] = true,
+        [204625] = true,
+        [204624] = true,
+        [208117] = true,
+        [204623] = true,
+        [119931] = true,
+        [130084] = true,
+        [115284] = true,
+        [182245] = true,
+        [182243] = true,
+        [182244] = true,
+        [182246] = true,
+        [184097] = true,
+        [192570] = true,
+        [126774] = true,
+        [126364] = true,
+        [191189] = true,
+        [151677] = true,
+        [151678] = true,
+        [151676] = true,
+        [151759] = true,
+        [151761] = true,
+        [151760] = true,
+        [151758] = true,
+        [211562] = true,
+        [192403] = true,
+        [192404] = true,
+        [166030] = true,
+        [188274] = true,
+        [188275] = true,
+        [193784] = true,
+        [193783] = true,
+        [114400] = true,
+        [114424] = true,
+        [114339] = true,
+        [114364] = true,
+        [114363] = true,
+        [189468] = true,
+        [188276] = true,
+        [188277] = true,
+        [126365] = true,
+        [126775] = true,
+        [175761] = true,
+        [94129] = true,
+        [94191] = true,
+        [94130] = true,
+        [94158] = true,
+        [94131] = true,
+        [126550] = true,
+        [126776] = true,
+        [126551] = true,
+        [126552] = true,
+        [115676] = true,
+        [115692] = true,
+        [115642] = true,
+        [188278] = true,
+        [188279] = true,
+        [175602] = true,
+        [175696] = true,
+        [175697] = true,
+        [175605] = true,
+        [175601] = true,
+        [181504] = true,
+        [175603] = true,
+        [175604] = true,
+        [151826] = true,
+        [151828] = true,
+        [151827] = true,
+        [151825] = true,
+        [151824] = true,
+        [193810] = true,
+        [192412] = true,
+        [193786] = true,
+        [193785] = true,
+        [204413] = true,
+        [204414] = true,
+        [145390] = true,
+        [145396] = true,
+        [145395] = true,
+        [145401] = true,
+        [115392] = true,
+        [115414] = true,
+        [116454] = true,
+        [116455] = true,
+        [116513] = true,
+        [116457] = true,
+        [116456] = true,
+        [116477] = true,
+        [188280] = true,
+        [188281] = true,
+        [188282] = true,
+        [188283] = true,
+        [117694] = true,
+        [117693] = true,
+        [117738] = true,
+        [117808] = true,
+        [117861] = true,
+        [126777] = true,
+        [204415] = true,
+        [204416] = true,
+        [199114] = true,
+        [199115] = true,
+        [188284] = true,
+        [188285] = true,
+        [166015] = true,
+        [126117] = true,
+        [119685] = true,
+        [147600] = true,
+        [134854] = true,
+        [130189] = true,
+        [175765] = true,
+        [165998] = true,
+        [165999] = true,
+        [126713] = true,
+        [126715] = true,
+        [126714] = true,
+        [125654] = true,
+        [118243] = true,
+        [156774] = true,
+        [126627] = true,
+        [139137] = true,
+        [126149] = true,
+        [126778] = true,
+        [192401] = true,
+        [192402] = true,
+        [165617] = true,
+        [165615] = true,
+        [165616] = true,
+        [126600] = true,
+        [126596] = true,
+        [126606] = true,
+        [115616] = true,
+        [115615] = true,
+        [115617] = true,
+    },
+}
+
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
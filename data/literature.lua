@@ -1,5632 +0,0 @@
-local literature = {
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120197,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120197&quality=2",
-        name = "16 Accords of Madness, Vol. VI",
-        allNames = "16 Accords of Madness, Vol. VI",
-        furnDataId = "2599",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 203377,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203377&quality=3",
-        name = "A Brief History of Ald Sotha",
-        allNames = "A Brief History of Ald Sotha",
-        furnDataId = "9680",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Clockwork City.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable001.dds",
-        itemId = 203430,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203430&quality=3",
-        name = "A Brief History of House Telvanni",
-        allNames = "A Brief History of House Telvanni",
-        furnDataId = "9733",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203429,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203429&quality=3",
-        name = "A Feast Among the Dead, Chapter I",
-        allNames = "A Feast Among the Dead, Chapter I",
-        furnDataId = "9732",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203446,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203446&quality=3",
-        name = "A Feast Among the Dead, Chapter II",
-        allNames = "A Feast Among the Dead, Chapter II",
-        furnDataId = "9749",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203447,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203447&quality=3",
-        name = "A Feast Among the Dead, Chapter III",
-        allNames = "A Feast Among the Dead, Chapter III",
-        furnDataId = "9750",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203448,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203448&quality=3",
-        name = "A Feast Among the Dead, Chapter IV",
-        allNames = "A Feast Among the Dead, Chapter IV",
-        furnDataId = "9751",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
-        itemId = 120406,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120406&quality=3",
-        name = "A Gift of Sanctuary",
-        allNames = "A Gift of Sanctuary",
-        furnDataId = "2779",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook003.dds",
-        itemId = 126138,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126138&quality=5",
-        name = "A Guide to Dwemer Mega-Structures",
-        allNames = "A Guide to Dwemer Mega-Structures",
-        furnDataId = "3389",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120120,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120120&quality=2",
-        name = "A Life Barbaric and Brutal",
-        allNames = "A Life Barbaric and Brutal",
-        furnDataId = "2522",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120354,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120354&quality=2",
-        name = "A Life of Strife and Struggle",
-        allNames = "A Life of Strife and Struggle",
-        furnDataId = "2756",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120343,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120343&quality=2",
-        name = "A Looter's Paradise",
-        allNames = "A Looter's Paradise",
-        furnDataId = "2745",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 194453,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194453&quality=3",
-        name = "A Memory Book, Part 1",
-        allNames = "A Memory Book, Part 1",
-        furnDataId = "8981",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 194452,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194452&quality=3",
-        name = "A Memory Book, Part 2",
-        allNames = "A Memory Book, Part 2",
-        furnDataId = "8980",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
-        itemId = 194451,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194451&quality=3",
-        name = "A Memory Book, Part 3",
-        allNames = "A Memory Book, Part 3",
-        furnDataId = "8979",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120257,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120257&quality=2",
-        name = "A Mother's Nursery Rhyme",
-        allNames = "A Mother's Nursery Rhyme",
-        furnDataId = "2659",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120276,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120276&quality=2",
-        name = "A Nereid Stole My Husband",
-        allNames = "A Nereid Stole My Husband",
-        furnDataId = "2678",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203439,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203439&quality=3",
-        name = "A New Cult Arises",
-        allNames = "A New Cult Arises",
-        furnDataId = "9742",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120297,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120297&quality=2",
-        name = "A Pocket Guide to Mournhold",
-        allNames = "A Pocket Guide to Mournhold",
-        furnDataId = "2699",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203411,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203411&quality=3",
-        name = "A Report on the Dusksabers",
-        allNames = "A Report on the Dusksabers",
-        furnDataId = "9714",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203459,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203459&quality=3",
-        name = "A Servant's Tale",
-        allNames = "A Servant's Tale",
-        furnDataId = "9762",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120255,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120255&quality=2",
-        name = "A Shallow Pool",
-        allNames = "A Shallow Pool",
-        furnDataId = "2657",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_inc_openbook001.dds",
-        itemId = 203420,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203420&quality=3",
-        name = "A Summoner's Guide to Nymics",
-        allNames = "A Summoner's Guide to Nymics",
-        furnDataId = "9723",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 178498,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178498&quality=5",
-        name = "A Tale of the Dauntless Bananas",
-        allNames = "A Tale of the Dauntless Bananas",
-        furnDataId = "7887",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120083,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120083&quality=2",
-        name = "A Warning to the Aldmeri Dominion",
-        allNames = "A Warning to the Aldmeri Dominion",
-        furnDataId = "2485",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120214,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120214&quality=2",
-        name = "A Werewolf's Confession",
-        allNames = "A Werewolf's Confession",
-        furnDataId = "2616",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
-        itemId = 145927,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145927&quality=3",
-        name = "Acts of Honoring",
-        allNames = "Acts of Honoring",
-        furnDataId = "5830",
-        furnCategory = "Library:Literature (4:62)",
-        description = "The words of Nisswo Xeewulm, preserved exactly as written.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120144,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120144&quality=2",
-        name = "Aedra and Daedra",
-        allNames = "Aedra and Daedra",
-        furnDataId = "2546",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120286,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120286&quality=2",
-        name = "All About Giants",
-        allNames = "All About Giants",
-        furnDataId = "2688",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120367,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120367&quality=2",
-        name = "An Accounting of the Elder Scrolls",
-        allNames = "An Accounting of the Elder Scrolls",
-        furnDataId = "2769",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_paper001.dds",
-        itemId = 178502,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178502&quality=5",
-        name = "An Ode to the Disenfranchised",
-        allNames = "An Ode to the Disenfranchised",
-        furnDataId = "7891",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120260,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120260&quality=2",
-        name = "Ancestors and the Dunmer (Abridged)",
-        allNames = "Ancestors and the Dunmer (Abridged)",
-        furnDataId = "2662",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120183,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120183&quality=2",
-        name = "Ancient Scrolls of the Dwemer I-B",
-        allNames = "Ancient Scrolls of the Dwemer I-B",
-        furnDataId = "2585",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120175,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120175&quality=2",
-        name = "Ancient Scrolls of the Dwemer II",
-        allNames = "Ancient Scrolls of the Dwemer II",
-        furnDataId = "2577",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120176,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120176&quality=2",
-        name = "Ancient Scrolls of the Dwemer III",
-        allNames = "Ancient Scrolls of the Dwemer III",
-        furnDataId = "2578",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120189,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120189&quality=2",
-        name = "Ancient Scrolls of the Dwemer IV",
-        allNames = "Ancient Scrolls of the Dwemer IV",
-        furnDataId = "2591",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120177,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120177&quality=2",
-        name = "Ancient Scrolls of the Dwemer V",
-        allNames = "Ancient Scrolls of the Dwemer V",
-        furnDataId = "2579",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120178,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120178&quality=2",
-        name = "Ancient Scrolls of the Dwemer VI",
-        allNames = "Ancient Scrolls of the Dwemer VI",
-        furnDataId = "2580",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120185,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120185&quality=2",
-        name = "Ancient Scrolls of the Dwemer VIII",
-        allNames = "Ancient Scrolls of the Dwemer VIII",
-        furnDataId = "2587",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120179,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120179&quality=2",
-        name = "Ancient Scrolls of the Dwemer X",
-        allNames = "Ancient Scrolls of the Dwemer X",
-        furnDataId = "2581",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120180,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120180&quality=2",
-        name = "Ancient Scrolls of the Dwemer XI",
-        allNames = "Ancient Scrolls of the Dwemer XI",
-        furnDataId = "2582",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120174,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120174&quality=2",
-        name = "Ancient Scrolls of the Dwemer, I-A",
-        allNames = "Ancient Scrolls of the Dwemer, I-A",
-        furnDataId = "2576",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 203392,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203392&quality=3",
-        name = "Anequina and Pellitine: An Introduction",
-        allNames = "Anequina and Pellitine: An Introduction",
-        furnDataId = "9695",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Northern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120181,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120181&quality=2",
-        name = "Antecedents of Dwemer Law",
-        allNames = "Antecedents of Dwemer Law",
-        furnDataId = "2583",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_duc_housinglibstalactite002.dds",
-        itemId = 198393,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=198393&quality=3",
-        name = "Apocrypha Book Pile, Large Twisted",
-        allNames = "Apocrypha Book Pile, Large Twisted",
-        furnDataId = "9387",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbookstack005.dds",
-        itemId = 198428,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=198428&quality=3",
-        name = "Apocrypha Book Pile, Medium",
-        allNames = "Apocrypha Book Pile, Medium",
-        furnDataId = "9422",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbookstack002.dds",
-        itemId = 198427,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=198427&quality=2",
-        name = "Apocrypha Book Pile, Short",
-        allNames = "Apocrypha Book Pile, Short",
-        furnDataId = "9421",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_str_libbooksfloating001.dds",
-        itemId = 198440,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=198440&quality=3",
-        name = "Apocrypha Book Piles, Floating",
-        allNames = "Apocrypha Book Piles, Floating",
-        furnDataId = "9434",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 194460,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194460&quality=3",
-        name = "Apocrypha, Apocrypha",
-        allNames = "Apocrypha, Apocrypha",
-        furnDataId = "8988",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/book_arquitius_002.dds",
-        itemId = 203203,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203203&quality=5",
-        name = "Apocryphal Pages",
-        allNames = "Apocryphal Pages",
-        furnDataId = "",
-        furnCategory = "",
-        description = "A mysterious tome containing all of the books in the Apocryphal Pages collection.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_bookofwhispers001.dds",
-        itemId = 197704,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197704&quality=5",
-        name = "Apocryphal Tome",
-        allNames = "Apocryphal Tome",
-        furnDataId = "0",
-        furnCategory = ": (:)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120200,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120200&quality=2",
-        name = "Arcana Restored",
-        allNames = "Arcana Restored",
-        furnDataId = "2602",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
-        itemId = 203465,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203465&quality=3",
-        name = "Archmagister Mavon's Ascension",
-        allNames = "Archmagister Mavon's Ascension",
-        furnDataId = "9768",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120263,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120263&quality=2",
-        name = "Argonians Among Us",
-        allNames = "Argonians Among Us",
-        furnDataId = "2665",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203400,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203400&quality=3",
-        name = "Artaeum Lost",
-        allNames = "Artaeum Lost",
-        furnDataId = "9703",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Summerset.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120360,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120360&quality=2",
-        name = "Arx Corinium: First Seed Report",
-        allNames = "Arx Corinium: First Seed Report",
-        furnDataId = "2762",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120116,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120116&quality=2",
-        name = "Aspects of Lord Hircine",
-        allNames = "Aspects of Lord Hircine",
-        furnDataId = "2518",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120327,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120327&quality=2",
-        name = "Aurbic Enigma 4: The Elden Tree",
-        allNames = "Aurbic Enigma 4: The Elden Tree",
-        furnDataId = "2729",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120278,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120278&quality=2",
-        name = "Ayleid Cities of Valenwood",
-        allNames = "Ayleid Cities of Valenwood",
-        furnDataId = "2680",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120240,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120240&quality=2",
-        name = "Ayleid Inscriptions Translated",
-        allNames = "Ayleid Inscriptions Translated",
-        furnDataId = "2642",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120326,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120326&quality=2",
-        name = "Ayleid Survivals in Valenwood",
-        allNames = "Ayleid Survivals in Valenwood",
-        furnDataId = "2728",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120143,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120143&quality=2",
-        name = "Ayrenn: The Unforeseen Queen",
-        allNames = "Ayrenn: The Unforeseen Queen",
-        furnDataId = "2545",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 203396,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203396&quality=3",
-        name = "Azurah's Crossing",
-        allNames = "Azurah's Crossing",
-        furnDataId = "9699",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Southern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120114,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120114&quality=2",
-        name = "Bangkorai, Shield of High Rock",
-        allNames = "Bangkorai, Shield of High Rock",
-        furnDataId = "2516",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120210,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120210&quality=2",
-        name = "Before the Ages of Man: Dawn Era",
-        allNames = "Before the Ages of Man: Dawn Era",
-        furnDataId = "2612",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120211,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120211&quality=2",
-        name = "Before the Ages of Man: Merethic Era",
-        allNames = "Before the Ages of Man: Merethic Era",
-        furnDataId = "2613",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_inc_openbook001.dds",
-        itemId = 203434,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203434&quality=3",
-        name = "Beverages for the Bereaved",
-        allNames = "Beverages for the Bereaved",
-        furnDataId = "9737",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203404,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203404&quality=3",
-        name = "Birds of Wrothgar",
-        allNames = "Birds of Wrothgar",
-        furnDataId = "9707",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Wrothgar.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 194446,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194446&quality=3",
-        name = "Bisnensel: Our Ancient Roots",
-        allNames = "Bisnensel: Our Ancient Roots",
-        furnDataId = "8974",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120104,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120104&quality=2",
-        name = "Bloodfiends of Rivenspire",
-        allNames = "Bloodfiends of Rivenspire",
-        furnDataId = "2506",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 194445,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194445&quality=3",
-        name = "Boethiah and Her Avatars",
-        allNames = "Boethiah and Her Avatars",
-        furnDataId = "8973",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120145,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120145&quality=2",
-        name = "Boethiah's Proving",
-        allNames = "Boethiah's Proving",
-        furnDataId = "2547",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_exc_floatingbooks003.dds",
-        itemId = 197747,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197747&quality=4",
-        name = "Book Pile, Circle Levitating",
-        allNames = "Book Pile, Circle Levitating",
-        furnDataId = "9211",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbookstack004.dds",
-        itemId = 197545,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197545&quality=3",
-        name = "Book Pile, Large",
-        allNames = "Book Pile, Large",
-        furnDataId = "9102",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_exc_bobbingbooks002.dds",
-        itemId = 197746,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197746&quality=4",
-        name = "Book Pile, Spiral Levitating",
-        allNames = "Book Pile, Spiral Levitating",
-        furnDataId = "9210",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_exc_bobbingbooks002.dds",
-        itemId = 197745,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197745&quality=3",
-        name = "Book Pile, Vertical Levitating",
-        allNames = "Book Pile, Vertical Levitating",
-        furnDataId = "9209",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_row002.dds",
-        itemId = 121045,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=121045&quality=2",
-        name = "Book Row, Decorative",
-        allNames = "Book Row, Decorative",
-        furnDataId = "3186",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_fur_booksfloatingset001.dds",
-        itemId = 139164,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139164&quality=2",
-        name = "Book Row, Levitating",
-        allNames = "Book Row, Levitating",
-        furnDataId = "5115",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_row005.dds",
-        itemId = 121047,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=121047&quality=2",
-        name = "Book Row, Long",
-        allNames = "Book Row, Long",
-        furnDataId = "3188",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_stack002.dds",
-        itemId = 121056,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=121056&quality=2",
-        name = "Book Stack, Decorative",
-        allNames = "Book Stack, Decorative",
-        furnDataId = "3196",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_fur_booksfloatingset003.dds",
-        itemId = 139165,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139165&quality=2",
-        name = "Book Stack, Levitating",
-        allNames = "Book Stack, Levitating",
-        furnDataId = "5116",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_bookpile001.dds",
-        itemId = 118482,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118482&quality=2",
-        name = "Book Stack, Tall",
-        allNames = "Book Stack, Tall",
-        furnDataId = "1825",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbookstack001.dds",
-        itemId = 197544,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197544&quality=2",
-        name = "Book Stack, Trio",
-        allNames = "Book Stack, Trio",
-        furnDataId = "9101",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_inc_books002.dds",
-        itemId = 187862,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=187862&quality=2",
-        name = "Book Stack, Well-Read",
-        allNames = "Book Stack, Well-Read",
-        furnDataId = "8520",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_farwallfloatingbooks001.dds",
-        itemId = 182285,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182285&quality=3",
-        name = "Book Wall, Levitating",
-        allNames = "Book Wall, Levitating",
-        furnDataId = "8153",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 130211,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130211&quality=4",
-        name = "Books, Ordered Row",
-        allNames = "Books, Ordered Row",
-        furnDataId = "3960",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book003.dds",
-        itemId = 130210,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130210&quality=4",
-        name = "Books, Scattered Row",
-        allNames = "Books, Scattered Row",
-        furnDataId = "3959",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_bookpile005.dds",
-        itemId = 156644,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156644&quality=5",
-        name = "Books, Towering Pile",
-        allNames = "Books, Towering Pile",
-        furnDataId = "6572",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollargonian001.dds",
-        itemId = 118711,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118711&quality=5",
-        name = "Bounty Sheet: Argonian Male",
-        allNames = "Bounty Sheet: Argonian Male",
-        furnDataId = "1888",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscroll001.dds",
-        itemId = 118709,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118709&quality=5",
-        name = "Bounty Sheet: Breton Man",
-        allNames = "Bounty Sheet: Breton Man",
-        furnDataId = "1886",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollfemale001.dds",
-        itemId = 118712,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118712&quality=5",
-        name = "Bounty Sheet: Breton Woman",
-        allNames = "Bounty Sheet: Breton Woman",
-        furnDataId = "1889",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrolloldmale001.dds",
-        itemId = 118715,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118715&quality=5",
-        name = "Bounty Sheet: Colovian Man",
-        allNames = "Bounty Sheet: Colovian Man",
-        furnDataId = "1892",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollaltmer001.dds",
-        itemId = 118710,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118710&quality=5",
-        name = "Bounty Sheet: High Elf Male",
-        allNames = "Bounty Sheet: High Elf Male",
-        furnDataId = "1887",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollmale001.dds",
-        itemId = 118714,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118714&quality=5",
-        name = "Bounty Sheet: Imperial Man",
-        allNames = "Bounty Sheet: Imperial Man",
-        furnDataId = "1891",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollkhajiit001.dds",
-        itemId = 118713,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118713&quality=5",
-        name = "Bounty Sheet: Khajiiti Male",
-        allNames = "Bounty Sheet: Khajiiti Male",
-        furnDataId = "1890",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollorc001.dds",
-        itemId = 118716,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118716&quality=5",
-        name = "Bounty Sheet: Orc Female",
-        allNames = "Bounty Sheet: Orc Female",
-        furnDataId = "1893",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollredguard001.dds",
-        itemId = 118717,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118717&quality=5",
-        name = "Bounty Sheet: Orc Male",
-        allNames = "Bounty Sheet: Orc Male",
-        furnDataId = "1894",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203431,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203431&quality=3",
-        name = "Brave Little Scrib and the River Troll",
-        allNames = "Brave Little Scrib and the River Troll",
-        furnDataId = "9734",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120361,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120361&quality=2",
-        name = "Burning Vestige, Vol. I",
-        allNames = "Burning Vestige, Vol. I",
-        furnDataId = "2763",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203467,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203467&quality=3",
-        name = "Captain Burwarah's Records",
-        allNames = "Captain Burwarah's Records",
-        furnDataId = "9770",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 203385,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203385&quality=3",
-        name = "Cathedral Hierarchy",
-        allNames = "Cathedral Hierarchy",
-        furnDataId = "9688",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Gold Coast.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120352,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120352&quality=2",
-        name = "Chaotic Creatia: The Azure Plasm",
-        allNames = "Chaotic Creatia: The Azure Plasm",
-        furnDataId = "2754",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 121046,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=121046&quality=2",
-        name = "Cheeses of Tamriel",
-        allNames = "Cheeses of Tamriel",
-        furnDataId = "3187",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Master Chef Gilbard Larocque's timeless treatise on cheeses across Tamriel, from Skyrim to Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203436,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203436&quality=3",
-        name = "Ciphers of the Eye",
-        allNames = "Ciphers of the Eye",
-        furnDataId = "9739",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
-        itemId = 120132,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120132&quality=3",
-        name = "Circus of Cheerful Slaughter",
-        allNames = "Circus of Cheerful Slaughter",
-        furnDataId = "2534",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120362,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120362&quality=2",
-        name = "Civility and Etiquette V. 5: Undead",
-        allNames = "Civility and Etiquette V. 5: Undead",
-        furnDataId = "2764",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120168,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120168&quality=2",
-        name = "Civility and Etiquette: Wood Orcs I",
-        allNames = "Civility and Etiquette: Wood Orcs I",
-        furnDataId = "2570",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120300,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120300&quality=2",
-        name = "Clans of the Reach: A Guide",
-        allNames = "Clans of the Reach: A Guide",
-        furnDataId = "2702",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_inc_scrollplate001.dds",
-        itemId = 134363,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134363&quality=2",
-        name = "Clockwork Sequence Plaque, Single",
-        allNames = "Clockwork Sequence Plaque, Single",
-        furnDataId = "4611",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_inc_scrollfolded001.dds",
-        itemId = 134361,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134361&quality=3",
-        name = "Clockwork Sequence Plaques, Folded",
-        allNames = "Clockwork Sequence Plaques, Folded",
-        furnDataId = "4609",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_inc_scrollopen001.dds",
-        itemId = 134362,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134362&quality=3",
-        name = "Clockwork Sequence Plaques, Unfolded",
-        allNames = "Clockwork Sequence Plaques, Unfolded",
-        furnDataId = "4610",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120349,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120349&quality=2",
-        name = "Cohort Briefing: Arenthia",
-        allNames = "Cohort Briefing: Arenthia",
-        furnDataId = "2751",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookopen001.dds",
-        itemId = 130093,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130093&quality=4",
-        name = "Coldharbour Compact",
-        allNames = "Coldharbour Compact",
-        furnDataId = "3917",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120323,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120323&quality=2",
-        name = "Common Arms of Valenwood",
-        allNames = "Common Arms of Valenwood",
-        furnDataId = "2725",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120310,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120310&quality=2",
-        name = "Crimes of the Daggerfall Covenant",
-        allNames = "Crimes of the Daggerfall Covenant",
-        furnDataId = "2712",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203427,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203427&quality=3",
-        name = "Critter Dangers: Telvanni Peninsula",
-        allNames = "Critter Dangers: Telvanni Peninsula",
-        furnDataId = "9730",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120198,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120198&quality=2",
-        name = "Crow and Raven: Three Short Fables",
-        allNames = "Crow and Raven: Three Short Fables",
-        furnDataId = "2600",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookopen001.dds",
-        itemId = 134257,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134257&quality=3",
-        name = "Daedra Dossier: Cold-Flame Atronach",
-        allNames = "Daedra Dossier: Cold-Flame Atronach",
-        furnDataId = "4505",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Being an autobiographical account of Denogorath the Dread Archivist's quest to bring the Cold-Flame Atronach's chilling beauty to Coldharbour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 194443,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194443&quality=3",
-        name = "Daedra Dossier: The Titans",
-        allNames = "Daedra Dossier: The Titans",
-        furnDataId = "8971",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book001.dds",
-        itemId = 130212,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130212&quality=4",
-        name = "Daedra Worship: The Ayleids",
-        allNames = "Daedra Worship: The Ayleids",
-        furnDataId = "3961",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookpile001.dds",
-        itemId = 134265,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134265&quality=3",
-        name = "Daedric Books, Piled",
-        allNames = "Daedric Books, Piled",
-        furnDataId = "4513",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookpile003.dds",
-        itemId = 134266,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134266&quality=2",
-        name = "Daedric Books, Stacked",
-        allNames = "Daedric Books, Stacked",
-        furnDataId = "4514",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 203437,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203437&quality=3",
-        name = "Daedric Worship and the Dark Elves",
-        allNames = "Daedric Worship and the Dark Elves",
-        furnDataId = "9740",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_inc_dbhledger001.dds",
-        itemId = 119953,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119953&quality=5",
-        name = "Dark Ledger",
-        allNames = "Dark Ledger",
-        furnDataId = "2393",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Every Dark Brotherhood Sanctuary has a book that balances the costs of living against the wages of death.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120299,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120299&quality=2",
-        name = "Dark Ruins",
-        allNames = "Dark Ruins",
-        furnDataId = "2701",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120221,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120221&quality=2",
-        name = "Darkest Darkness",
-        allNames = "Darkest Darkness",
-        furnDataId = "2623",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 197918,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197918&quality=3",
-        name = "Deal with a Daedric Prince",
-        allNames = "Deal with a Daedric Prince",
-        furnDataId = "9258",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203433,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203433&quality=3",
-        name = "Denizens of Apocrypha",
-        allNames = "Denizens of Apocrypha",
-        furnDataId = "9736",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 134961,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134961&quality=3",
-        name = "Dibella's Mysteries and Revelations",
-        allNames = "Dibella's Mysteries and Revelations",
-        furnDataId = "4947",
-        furnCategory = "Library:Literature (4:62)",
-        description = "In which Sibyl Augustine Viliane answers the questions of several new novices to the House of Dibella on a beautiful spring day.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120107,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120107&quality=2",
-        name = "Dire Legends of the Doomcrag",
-        allNames = "Dire Legends of the Doomcrag",
-        furnDataId = "2509",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
-        itemId = 194459,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194459&quality=3",
-        name = "Dream of a Thousand Dreamers",
-        allNames = "Dream of a Thousand Dreamers",
-        furnDataId = "8987",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120289,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120289&quality=2",
-        name = "Dreamwalkers",
-        allNames = "Dreamwalkers",
-        furnDataId = "2691",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203454,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203454&quality=3",
-        name = "Dusksaber Report",
-        allNames = "Dusksaber Report",
-        furnDataId = "9757",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120255,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120255&quality=2",
-        name = "A Shallow Pool",
-        allNames = "A Shallow Pool",
-        furnDataId = "2657",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120182,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120182&quality=2",
-        name = "Dwarven Automatons",
-        allNames = "Dwarven Automatons",
-        furnDataId = "2584",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120294,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120294&quality=2",
-        name = "Dwemer Dungeons: What I Know",
-        allNames = "Dwemer Dungeons: What I Know",
-        furnDataId = "2696",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120186,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120186&quality=2",
-        name = "Dwemer Inquiries Volume I",
-        allNames = "Dwemer Inquiries Volume I",
-        furnDataId = "2588",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120187,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120187&quality=2",
-        name = "Dwemer Inquiries Volume II",
-        allNames = "Dwemer Inquiries Volume II",
-        furnDataId = "2589",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120188,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120188&quality=2",
-        name = "Dwemer Inquiries Volume III",
-        allNames = "Dwemer Inquiries Volume III",
-        furnDataId = "2590",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120212,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120212&quality=2",
-        name = "Ebony Blade History",
-        allNames = "Ebony Blade History",
-        furnDataId = "2614",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120345,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120345&quality=2",
-        name = "Elven Eyes, Elven Spies",
-        allNames = "Elven Eyes, Elven Spies",
-        furnDataId = "2747",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_inc_bookopen001.dds",
-        itemId = 203378,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203378&quality=3",
-        name = "Engine of Expression",
-        allNames = "Engine of Expression",
-        furnDataId = "9681",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Clockwork City.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120245,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120245&quality=2",
-        name = "Eulogy for Emperor Varen",
-        allNames = "Eulogy for Emperor Varen",
-        furnDataId = "2647",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120350,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120350&quality=2",
-        name = "Exegesis of Merid-Nunda",
-        allNames = "Exegesis of Merid-Nunda",
-        furnDataId = "2752",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scryingbookdragon001.dds",
-        itemId = 204780,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204780&quality=3",
-        name = "Fable of the Dragon",
-        allNames = "Fable of the Dragon",
-        furnDataId = "10064",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A beautiful replica of the Fable of the Dragon, taken from the shelves of the Scholarium beneath Eyevea.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scryingbookgriffin001.dds",
-        itemId = 204782,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204782&quality=3",
-        name = "Fable of the Gryphon",
-        allNames = "Fable of the Gryphon",
-        furnDataId = "10066",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A beautiful replica of the Fable of the Gryphon, taken from the shelves of the Scholarium beneath Eyevea.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scryingbookindrik001.dds",
-        itemId = 204783,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204783&quality=3",
-        name = "Fable of the Indrik",
-        allNames = "Fable of the Indrik",
-        furnDataId = "10067",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A beautiful replica of the Fable of the Indrik, taken from the shelves of the Scholarium beneath Eyevea.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scryingbooknetch001.dds",
-        itemId = 204790,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204790&quality=3",
-        name = "Fable of the Netch",
-        allNames = "Fable of the Netch",
-        furnDataId = "10074",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A beautiful replica of the Fable of the Netch, taken from the shelves of the Scholarium beneath Eyevea.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120254,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120254&quality=2",
-        name = "Fair Argonian Maiden",
-        allNames = "Fair Argonian Maiden",
-        furnDataId = "2656",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120315,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120315&quality=2",
-        name = "Fang of the Sea Vipers",
-        allNames = "Fang of the Sea Vipers",
-        furnDataId = "2717",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203451,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203451&quality=3",
-        name = "Fanlyrion's Journal",
-        allNames = "Fanlyrion's Journal",
-        furnDataId = "9754",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_farfloatingbookstack003.dds",
-        itemId = 182225,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182225&quality=4",
-        name = "Fargrave Book Stack, Levitating",
-        allNames = "Fargrave Book Stack, Levitating",
-        furnDataId = "8093",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_dedpapers001.dds",
-        itemId = 182217,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182217&quality=1",
-        name = "Fargrave Clutter, Papers",
-        allNames = "Fargrave Clutter, Papers",
-        furnDataId = "8085",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203452,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203452&quality=3",
-        name = "First Mate Dalmir's Log",
-        allNames = "First Mate Dalmir's Log",
-        furnDataId = "9755",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_u42fivecompanionsbook001.dds",
-        itemId = 204410,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204410&quality=5",
-        name = "Five Companions Tome",
-        allNames = "Five Companions Tome",
-        furnDataId = "9847",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120234,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120234&quality=2",
-        name = "Flesh to Cut from Bone",
-        allNames = "Flesh to Cut from Bone",
-        furnDataId = "2636",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_blackbook001.dds",
-        itemId = 199126,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199126&quality=4",
-        name = "Forged Black Book",
-        allNames = "Forged Black Book",
-        furnDataId = "9544",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A remarkable simulacrum of the real thing. Mind your sanity, now. This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120093,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120093&quality=2",
-        name = "Founding of the Spirit Wardens",
-        allNames = "Founding of the Spirit Wardens",
-        furnDataId = "2495",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120152,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120152&quality=2",
-        name = "Fragmentae Abyssum Hermaeus Morus",
-        allNames = "Fragmentae Abyssum Hermaeus Morus",
-        furnDataId = "2554",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120256,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120256&quality=2",
-        name = "Freedom's Price",
-        allNames = "Freedom's Price",
-        furnDataId = "2658",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 146047,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=146047&quality=3",
-        name = "From Old Life To New",
-        allNames = "From Old Life To New",
-        furnDataId = "5834",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A Tale of Two Festivals, by Botjolf Meadwarmer.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120241,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120241&quality=2",
-        name = "Frontier, Conquest",
-        allNames = "Frontier, Conquest",
-        furnDataId = "2643",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203464,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203464&quality=3",
-        name = "Fynboar the Resurrected",
-        allNames = "Fynboar the Resurrected",
-        furnDataId = "9767",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120134,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120134&quality=2",
-        name = "Galerion the Mystic",
-        allNames = "Galerion the Mystic",
-        furnDataId = "2536",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120338,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120338&quality=2",
-        name = "Gifts of the Nereids",
-        allNames = "Gifts of the Nereids",
-        furnDataId = "2740",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 194448,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194448&quality=3",
-        name = "Glorious Upheaval",
-        allNames = "Glorious Upheaval",
-        furnDataId = "8976",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120162,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120162&quality=2",
-        name = "Gods and Worship in Tamriel",
-        allNames = "Gods and Worship in Tamriel",
-        furnDataId = "2564",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 178499,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178499&quality=5",
-        name = "Goldleaf Acquisitions, Manager's Notes",
-        allNames = "Goldleaf Acquisitions, Manager's Notes",
-        furnDataId = "7888",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 194441,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194441&quality=3",
-        name = "Graccus' Journal, Volume I",
-        allNames = "Graccus' Journal, Volume I",
-        furnDataId = "8969",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120135,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120135&quality=2",
-        name = "Great Harbingers of the Companions",
-        allNames = "Great Harbingers of the Companions",
-        furnDataId = "2537",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120271,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120271&quality=2",
-        name = "Green Lady, My Lady",
-        allNames = "Green Lady, My Lady",
-        furnDataId = "2673",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120086,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120086&quality=2",
-        name = "Guide to the Daggerfall Covenant",
-        allNames = "Guide to the Daggerfall Covenant",
-        furnDataId = "2488",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120279,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120279&quality=2",
-        name = "Guide to the Ebonheart Pact",
-        allNames = "Guide to the Ebonheart Pact",
-        furnDataId = "2681",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120207,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120207&quality=2",
-        name = "Guild Memo on Soul-Trapping",
-        allNames = "Guild Memo on Soul-Trapping",
-        furnDataId = "2609",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120381,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120381&quality=2",
-        name = "Guild Reprint: Alik'r Desert Lore",
-        allNames = "Guild Reprint: Alik'r Desert Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Alik'r Desert Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120401,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120401&quality=2",
-        name = "Guild Reprint: Auridon Lore",
-        allNames = "Guild Reprint: Auridon Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Auridon Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120380,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120380&quality=2",
-        name = "Guild Reprint: Bangkorai Lore",
-        allNames = "Guild Reprint: Bangkorai Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Bangkorai Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120385,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120385&quality=2",
-        name = "Guild Reprint: Biographies",
-        allNames = "Guild Reprint: Biographies",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Biographies\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120405,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120405&quality=2",
-        name = "Guild Reprint: Coldharbour Lore",
-        allNames = "Guild Reprint: Coldharbour Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Coldharbour Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120384,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120384&quality=2",
-        name = "Guild Reprint: Daedric Princes",
-        allNames = "Guild Reprint: Daedric Princes",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Daedric Princes\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120399,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120399&quality=2",
-        name = "Guild Reprint: Deshaan Lore",
-        allNames = "Guild Reprint: Deshaan Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Deshaan Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120386,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120386&quality=2",
-        name = "Guild Reprint: Divines and Deities",
-        allNames = "Guild Reprint: Divines and Deities",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Divines and Deities\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120387,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120387&quality=2",
-        name = "Guild Reprint: Dungeon Lore",
-        allNames = "Guild Reprint: Dungeon Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Dungeon Lore\" collection, in 17 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120388,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120388&quality=2",
-        name = "Guild Reprint: Dwemer",
-        allNames = "Guild Reprint: Dwemer",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Dwemer\" collection, in 16 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120398,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120398&quality=2",
-        name = "Guild Reprint: Eastmarch Lore",
-        allNames = "Guild Reprint: Eastmarch Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Eastmarch Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120377,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120377&quality=2",
-        name = "Guild Reprint: Glenumbra Lore",
-        allNames = "Guild Reprint: Glenumbra Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Glenumbra Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120402,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120402&quality=2",
-        name = "Guild Reprint: Grahtwood Lore",
-        allNames = "Guild Reprint: Grahtwood Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Grahtwood Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120403,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120403&quality=2",
-        name = "Guild Reprint: Greenshade Lore",
-        allNames = "Guild Reprint: Greenshade Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Greenshade Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120389,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120389&quality=2",
-        name = "Guild Reprint: Legends of Nirn",
-        allNames = "Guild Reprint: Legends of Nirn",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Legends of Nirn\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120390,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120390&quality=2",
-        name = "Guild Reprint: Literature",
-        allNames = "Guild Reprint: Literature",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Literature\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120391,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120391&quality=2",
-        name = "Guild Reprint: Magic and Magicka",
-        allNames = "Guild Reprint: Magic and Magicka",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Magic and Magicka\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120397,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120397&quality=2",
-        name = "Guild Reprint: Malabal Tor Lore",
-        allNames = "Guild Reprint: Malabal Tor Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Malabal Tor Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120392,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120392&quality=2",
-        name = "Guild Reprint: Myths of the Mundus",
-        allNames = "Guild Reprint: Myths of the Mundus",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Myths of the Mundus\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120393,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120393&quality=2",
-        name = "Guild Reprint: Oblivion Lore",
-        allNames = "Guild Reprint: Oblivion Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Oblivion Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120394,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120394&quality=2",
-        name = "Guild Reprint: Poetry and Song",
-        allNames = "Guild Reprint: Poetry and Song",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Poetry and Song\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120404,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120404&quality=2",
-        name = "Guild Reprint: Reaper's March Lore",
-        allNames = "Guild Reprint: Reaper's March Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Reaper's March Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120379,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120379&quality=2",
-        name = "Guild Reprint: Rivenspire Lore",
-        allNames = "Guild Reprint: Rivenspire Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Rivenspire Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120382,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120382&quality=2",
-        name = "Guild Reprint: Shadowfen Lore",
-        allNames = "Guild Reprint: Shadowfen Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Shadowfen Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120396,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120396&quality=2",
-        name = "Guild Reprint: Stonefalls Lore",
-        allNames = "Guild Reprint: Stonefalls Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Stonefalls Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120378,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120378&quality=2",
-        name = "Guild Reprint: Stormhaven Lore",
-        allNames = "Guild Reprint: Stormhaven Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Stormhaven Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120395,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120395&quality=2",
-        name = "Guild Reprint: Tamriel History",
-        allNames = "Guild Reprint: Tamriel History",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"Tamriel History\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
-        itemId = 120400,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120400&quality=2",
-        name = "Guild Reprint: The Rift Lore",
-        allNames = "Guild Reprint: The Rift Lore",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"The Rift Lore\" collection, in 10 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_row002.dds",
-        itemId = 120383,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120383&quality=3",
-        name = "Guild Reprint: The Trial of Eyevea",
-        allNames = "Guild Reprint: The Trial of Eyevea",
-        furnDataId = "",
-        furnCategory = "",
-        description = "Mages Guild reprinting of the \"The Trial of Eyevea\" collection, in 4 individual books for use in personal libraries.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 120184,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120184&quality=2",
-        name = "Guylaine's Dwemer Architecture",
-        allNames = "Guylaine's Dwemer Architecture",
-        furnDataId = "2586",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 208358,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=208358&quality=5",
-        name = "Handbook for New Homeowners",
-        allNames = "Handbook for New Homeowners",
-        furnDataId = "10242",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A handy all-in-one reference for new homeowners.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 194455,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194455&quality=3",
-        name = "Havocrel: Strangers from Oblivion",
-        allNames = "Havocrel: Strangers from Oblivion",
-        furnDataId = "8983",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 194455,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194455&quality=3",
-        name = "Havocrel: Strangers from Oblivion",
-        allNames = "Havocrel: Strangers from Oblivion",
-        furnDataId = "8983",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 203417,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203417&quality=3",
-        name = "Herma-Mora: The Woodland Man?",
-        allNames = "Herma-Mora: The Woodland Man?",
-        furnDataId = "9720",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
-        itemId = 203432,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203432&quality=3",
-        name = "History of Necrom: The City of the Dead",
-        allNames = "History of Necrom: The City of the Dead",
-        furnDataId = "9735",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120242,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120242&quality=2",
-        name = "History of the Fighters Guild Pt. 1",
-        allNames = "History of the Fighters Guild Pt. 1",
-        furnDataId = "2644",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120243,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120243&quality=2",
-        name = "History of the Fighters Guild Pt. 2",
-        allNames = "History of the Fighters Guild Pt. 2",
-        furnDataId = "2645",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120106,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120106&quality=2",
-        name = "Horse-Folk of Silverhoof",
-        allNames = "Horse-Folk of Silverhoof",
-        furnDataId = "2508",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120111,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120111&quality=2",
-        name = "House Ravenwatch Proclamation",
-        allNames = "House Ravenwatch Proclamation",
-        furnDataId = "2513",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120108,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120108&quality=2",
-        name = "House Tamrith: A Recent History",
-        allNames = "House Tamrith: A Recent History",
-        furnDataId = "2510",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203469,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203469&quality=3",
-        name = "House Telvanni Song",
-        allNames = "House Telvanni Song",
-        furnDataId = "9772",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120246,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120246&quality=2",
-        name = "House Tharn of Nibenay",
-        allNames = "House Tharn of Nibenay",
-        furnDataId = "2648",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203416,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203416&quality=3",
-        name = "How Rajhin Stole the Book that Knows",
-        allNames = "How Rajhin Stole the Book that Knows",
-        furnDataId = "9719",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
-        itemId = 120407,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120407&quality=3",
-        name = "How the Kwama Lost His Shoes",
-        allNames = "How the Kwama Lost His Shoes",
-        furnDataId = "2780",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Reprint, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scryingbookgeneric001.dds",
-        itemId = "",
-        link = "https://esoitem.uesp.net/itemLink.php?&collectid=12706&quality=5",
-        name = "How to Scribe",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "Library",
-        description = "Any who possess this tome have, at their fingertips, a comprehensive guide to the art of scribing spells.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120353,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120353&quality=2",
-        name = "I was Summoned by a Mortal",
-        allNames = "I was Summoned by a Mortal",
-        furnDataId = "2755",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 134881,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134881&quality=3",
-        name = "In Defense of Prince Hubalajad",
-        allNames = "In Defense of Prince Hubalajad",
-        furnDataId = "4864",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Lady Cinnabar of Taneth's spirited arguments in favor of a more balanced view of the Ra Gada Prince's accomplishments in the face of adversity.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
-        itemId = 194449,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194449&quality=3",
-        name = "In Dreams We Awaken",
-        allNames = "In Dreams We Awaken",
-        furnDataId = "8977",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120329,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120329&quality=2",
-        name = "In the Company of Wood Orcs",
-        allNames = "In the Company of Wood Orcs",
-        furnDataId = "2731",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_hermaeusmorabook001.dds",
-        itemId = 199119,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199119&quality=5",
-        name = "Infinite Tome",
-        allNames = "Infinite Tome",
-        furnDataId = "9537",
-        furnCategory = "Library:Literature (4:62)",
-        description = "No matter how many pages you turn, more remain. This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120148,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120148&quality=2",
-        name = "Invocation of Azura",
-        allNames = "Invocation of Azura",
-        furnDataId = "2550",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 194456,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194456&quality=3",
-        name = "Invocation of Hircine",
-        allNames = "Invocation of Hircine",
-        furnDataId = "8984",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkparchment001.dds",
-        itemId = 145403,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145403&quality=2",
-        name = "Jel Parchment",
-        allNames = "Jel Parchment",
-        furnDataId = "5706",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120137,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120137&quality=2",
-        name = "Jorunn the Skald-King",
-        allNames = "Jorunn the Skald-King",
-        furnDataId = "2539",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120366,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120366&quality=2",
-        name = "Josef the Intolerant",
-        allNames = "Josef the Intolerant",
-        furnDataId = "2768",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 194442,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194442&quality=3",
-        name = "Journal of Culanwe",
-        allNames = "Journal of Culanwe",
-        furnDataId = "8970",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203381,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203381&quality=3",
-        name = "Journal of Tsona-Ei, Part Four",
-        allNames = "Journal of Tsona-Ei, Part Four",
-        furnDataId = "9684",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Coldharbour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203382,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203382&quality=3",
-        name = "Journal of Tsona-Ei, Part One",
-        allNames = "Journal of Tsona-Ei, Part One",
-        furnDataId = "9685",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Coldharbour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203383,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203383&quality=3",
-        name = "Journal of Tsona-Ei, Part Three",
-        allNames = "Journal of Tsona-Ei, Part Three",
-        furnDataId = "9686",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Coldharbour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203384,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203384&quality=3",
-        name = "Journal of Tsona-Ei, Part Two",
-        allNames = "Journal of Tsona-Ei, Part Two",
-        furnDataId = "9687",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Coldharbour.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203397,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203397&quality=3",
-        name = "Khunzar-ri and the Lost Alfiq",
-        allNames = "Khunzar-ri and the Lost Alfiq",
-        furnDataId = "9700",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Southern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120317,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120317&quality=2",
-        name = "Kinlord Rilis and the Mages Guild",
-        allNames = "Kinlord Rilis and the Mages Guild",
-        furnDataId = "2719",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120292,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120292&quality=2",
-        name = "Kwama Mining for Fun and Profit",
-        allNames = "Kwama Mining for Fun and Profit",
-        furnDataId = "2694",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203419,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203419&quality=3",
-        name = "Kynmarcher Strix's Journal",
-        allNames = "Kynmarcher Strix's Journal",
-        furnDataId = "9722",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_bookopenburned001.dds",
-        itemId = 203408,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203408&quality=3",
-        name = "Larydeilmo is Sane",
-        allNames = "Larydeilmo is Sane",
-        furnDataId = "9711",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120295,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120295&quality=2",
-        name = "Legend of the Ghost Snake",
-        allNames = "Legend of the Ghost Snake",
-        furnDataId = "2697",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libscroll002.dds",
-        itemId = 197779,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197779&quality=4",
-        name = "Letter from Azandar",
-        allNames = "Letter from Azandar",
-        furnDataId = "9222",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A letter from Azandar al-Cybiades, most likely of a personal nature, and suitable for placement within the home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scrollunsealed002.dds",
-        itemId = 188201,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188201&quality=4",
-        name = "Letter from Ember",
-        allNames = "Letter from Ember",
-        furnDataId = "8568",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A letter from Ember, most likely of a personal nature, and suitable for placement within the home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_crf_scroll001.dds",
-        itemId = 188202,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188202&quality=4",
-        name = "Letter from Isobel",
-        allNames = "Letter from Isobel",
-        furnDataId = "8569",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A letter from Isobel Veloise, most likely of a personal nature, and suitable for placement within the home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libpaper001.dds",
-        itemId = 197780,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197780&quality=4",
-        name = "Letter from Sharp",
-        allNames = "Letter from Sharp",
-        furnDataId = "9223",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A letter from Sharp-as-Night, most likely of a personal nature, and suitable for placement within the home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libpaper001.dds",
-        itemId = 211505,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211505&quality=4",
-        name = "Letter from Tanlorin",
-        allNames = "Letter from Tanlorin",
-        furnDataId = "10390",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A letter from Tanlorin, most likely of a personal nature, and suitable for placement within the home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_riteofpropagationscrollopen001.dds",
-        itemId = 211503,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211503&quality=4",
-        name = "Letter from Zerith-var",
-        allNames = "Letter from Zerith-var",
-        furnDataId = "10388",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A letter from Zerith-var, most likely of a personal nature, and suitable for placement within the home.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_paper001.dds",
-        itemId = 118487,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118487&quality=2",
-        name = "Letter, Personal",
-        allNames = "Letter, Personal",
-        furnDataId = "1826",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
-        itemId = 145923,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145923&quality=3",
-        name = "Lies of the Dread-Father",
-        allNames = "Lies of the Dread-Father",
-        furnDataId = "5828",
-        furnCategory = "Library:Literature (4:62)",
-        description = "The words of Nisswo Xeewulm, preserved exactly as written.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203418,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203418&quality=3",
-        name = "Life in the Camonna Tong",
-        allNames = "Life in the Camonna Tong",
-        furnDataId = "9721",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120318,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120318&quality=2",
-        name = "Life in the Eagle's Shadow",
-        allNames = "Life in the Eagle's Shadow",
-        furnDataId = "2720",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120201,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120201&quality=2",
-        name = "Liminal Bridges",
-        allNames = "Liminal Bridges",
-        furnDataId = "2603",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_inc_dbhlitanyofbloodbook001.dds",
-        itemId = 119951,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119951&quality=5",
-        name = "Litany of Blood",
-        allNames = "Litany of Blood",
-        furnDataId = "2391",
-        furnCategory = "Library:Literature (4:62)",
-        description = "A replica of the Dark Brotherhood's sinister tome of death.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120341,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120341&quality=2",
-        name = "Litter-Mates of Darkness",
-        allNames = "Litter-Mates of Darkness",
-        furnDataId = "2743",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120113,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120113&quality=2",
-        name = "Living with Lycanthropy",
-        allNames = "Living with Lycanthropy",
-        furnDataId = "2515",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_row003.dds",
-        itemId = 145596,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145596&quality=3",
-        name = "Look upon Their Nothing Eyes",
-        allNames = "Look upon Their Nothing Eyes",
-        furnDataId = "",
-        furnCategory = "",
-        description = "A carefully transcribed collection of all five of Nisswo Xeewulm's cryptic works on the nature of Sithis.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 194458,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194458&quality=3",
-        name = "Lord Hollowjack's Dream Realm",
-        allNames = "Lord Hollowjack's Dream Realm",
-        furnDataId = "8986",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120202,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120202&quality=2",
-        name = "Magic from the Sky",
-        allNames = "Magic from the Sky",
-        furnDataId = "2604",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203460,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203460&quality=3",
-        name = "Malkhest's Journal",
-        allNames = "Malkhest's Journal",
-        furnDataId = "9763",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120203,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120203&quality=2",
-        name = "Manual of Spellcraft",
-        allNames = "Manual of Spellcraft",
-        furnDataId = "2605",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120347,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120347&quality=2",
-        name = "Master Zoaraym's Tale, Part 1",
-        allNames = "Master Zoaraym's Tale, Part 1",
-        furnDataId = "2749",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120348,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120348&quality=2",
-        name = "Master Zoaraym's Tale, Part 2",
-        allNames = "Master Zoaraym's Tale, Part 2",
-        furnDataId = "2750",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203423,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203423&quality=3",
-        name = "Master of the Tides of Fate",
-        allNames = "Master of the Tides of Fate",
-        furnDataId = "9726",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_vampirelabbook003.dds",
-        itemId = 203472,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203472&quality=3",
-        name = "Materials for Novice Necromancers",
-        allNames = "Materials for Novice Necromancers",
-        furnDataId = "9775",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_vampirelabbook003.dds",
-        itemId = 203472,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203472&quality=3",
-        name = "Materials for Novice Necromancers",
-        allNames = "Materials for Novice Necromancers",
-        furnDataId = "9775",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120149,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120149&quality=2",
-        name = "Modern Heretics",
-        allNames = "Modern Heretics",
-        furnDataId = "2551",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120158,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120158&quality=2",
-        name = "Monomyth: \"Shezarr's Song\"",
-        allNames = "Monomyth: \"Shezarr's Song\"",
-        furnDataId = "2560",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120156,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120156&quality=2",
-        name = "Monomyth: Dragon God & Missing God",
-        allNames = "Monomyth: Dragon God & Missing God",
-        furnDataId = "2558",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120157,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120157&quality=2",
-        name = "Monomyth: Lorkhan and Satakal",
-        allNames = "Monomyth: Lorkhan and Satakal",
-        furnDataId = "2559",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120160,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120160&quality=2",
-        name = "Monomyth: The Heart of the World",
-        allNames = "Monomyth: The Heart of the World",
-        furnDataId = "2562",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120159,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120159&quality=2",
-        name = "Monomyth: The Myth of Aurbis",
-        allNames = "Monomyth: The Myth of Aurbis",
-        furnDataId = "2561",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120346,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120346&quality=2",
-        name = "Moon-Sugar for Glossy Fur? Yes!",
-        allNames = "Moon-Sugar for Glossy Fur? Yes!",
-        furnDataId = "2748",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120128,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120128&quality=2",
-        name = "Motalion Necropolis Report",
-        allNames = "Motalion Necropolis Report",
-        furnDataId = "2530",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120265,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120265&quality=2",
-        name = "Mottos of the Dunmeri Great Houses",
-        allNames = "Mottos of the Dunmeri Great Houses",
-        furnDataId = "2667",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203453,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203453&quality=3",
-        name = "Mouth Vabdru's Journal",
-        allNames = "Mouth Vabdru's Journal",
-        furnDataId = "9756",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
-        itemId = 178500,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178500&quality=5",
-        name = "Museum Guild Letter",
-        allNames = "Museum Guild Letter",
-        furnDataId = "7889",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_mushroombook001.dds",
-        itemId = 197710,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197710&quality=4",
-        name = "Mushroom Classification Book",
-        allNames = "Mushroom Classification Book",
-        furnDataId = "9170",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Flip through the illustrated pages of this Telvanni library staple. While it may not share the deep knowledge that mycoturges possess, it can serve as an entertaining conversation starter at your next gathering.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120194,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120194&quality=2",
-        name = "Myths of Sheogorath, Vol. 1",
-        allNames = "Myths of Sheogorath, Vol. 1",
-        furnDataId = "2596",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120195,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120195&quality=2",
-        name = "Myths of Sheogorath, Vol. 2",
-        allNames = "Myths of Sheogorath, Vol. 2",
-        furnDataId = "2597",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120161,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120161&quality=2",
-        name = "Nine Commands of the Eight Divines",
-        allNames = "Nine Commands of the Eight Divines",
-        furnDataId = "2563",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120264,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120264&quality=2",
-        name = "Nords of Skyrim",
-        allNames = "Nords of Skyrim",
-        furnDataId = "2666",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120110,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120110&quality=2",
-        name = "Northpoint: An Assessment",
-        allNames = "Northpoint: An Assessment",
-        furnDataId = "2512",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120213,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120213&quality=2",
-        name = "Noxiphilic Sanguivoria",
-        allNames = "Noxiphilic Sanguivoria",
-        furnDataId = "2615",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120358,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120358&quality=2",
-        name = "Oath of a Dishonored Clan",
-        allNames = "Oath of a Dishonored Clan",
-        furnDataId = "2760",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203409,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203409&quality=3",
-        name = "Oath of the Keepers",
-        allNames = "Oath of the Keepers",
-        furnDataId = "9712",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 203463,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203463&quality=3",
-        name = "Obscure Killers of the North",
-        allNames = "Obscure Killers of the North",
-        furnDataId = "9766",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 197917,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197917&quality=3",
-        name = "Ode to Vaermina",
-        allNames = "Ode to Vaermina",
-        furnDataId = "9257",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120235,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120235&quality=2",
-        name = "Ode to the Tundrastriders",
-        allNames = "Ode to the Tundrastriders",
-        furnDataId = "2637",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203441,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203441&quality=3",
-        name = "On Cipher's Midden",
-        allNames = "On Cipher's Midden",
-        furnDataId = "9744",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203412,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203412&quality=3",
-        name = "On Joining the Keepers of the Dead",
-        allNames = "On Joining the Keepers of the Dead",
-        furnDataId = "9715",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203386,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203386&quality=3",
-        name = "On Minotaurs",
-        allNames = "On Minotaurs",
-        furnDataId = "9689",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Gold Coast.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120224,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120224&quality=2",
-        name = "On Oblivion",
-        allNames = "On Oblivion",
-        furnDataId = "2626",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120288,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120288&quality=2",
-        name = "On Stepping Lightly",
-        allNames = "On Stepping Lightly",
-        furnDataId = "2690",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203393,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203393&quality=3",
-        name = "On Those Who Know Baan Dar",
-        allNames = "On Those Who Know Baan Dar",
-        furnDataId = "9696",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Northern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
-        itemId = 203415,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203415&quality=3",
-        name = "On Tracts Perilous",
-        allNames = "On Tracts Perilous",
-        furnDataId = "9718",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120205,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120205&quality=2",
-        name = "On the Detachment of the Sheath",
-        allNames = "On the Detachment of the Sheath",
-        furnDataId = "2607",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120259,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120259&quality=2",
-        name = "On the Knahaten Flu",
-        allNames = "On the Knahaten Flu",
-        furnDataId = "2661",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120229,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120229&quality=2",
-        name = "On the Nature of Coldharbour",
-        allNames = "On the Nature of Coldharbour",
-        furnDataId = "2631",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 203422,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203422&quality=3",
-        name = "On the Nature of Nymics",
-        allNames = "On the Nature of Nymics",
-        furnDataId = "9725",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120092,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120092&quality=2",
-        name = "Once",
-        allNames = "Once",
-        furnDataId = "2494",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120150,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120150&quality=2",
-        name = "Opusculus Lamae Bal ta Mezzamortie",
-        allNames = "Opusculus Lamae Bal ta Mezzamortie",
-        furnDataId = "2552",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203405,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203405&quality=3",
-        name = "Orc Clans and Symbology",
-        allNames = "Orc Clans and Symbology",
-        furnDataId = "9708",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Wrothgar.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120283,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120283&quality=2",
-        name = "Orcs of Skyrim",
-        allNames = "Orcs of Skyrim",
-        furnDataId = "2685",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120097,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120097&quality=2",
-        name = "Orcs: The Vermin Among Us",
-        allNames = "Orcs: The Vermin Among Us",
-        furnDataId = "2499",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120244,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120244&quality=2",
-        name = "Origin of the Mages Guild",
-        allNames = "Origin of the Mages Guild",
-        furnDataId = "2646",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120098,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120098&quality=2",
-        name = "Our Calling, Our Pledge",
-        allNames = "Our Calling, Our Pledge",
-        furnDataId = "2500",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 203449,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203449&quality=3",
-        name = "Our Dunmer Heritage",
-        allNames = "Our Dunmer Heritage",
-        furnDataId = "9752",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook002.dds",
-        itemId = 203425,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203425&quality=3",
-        name = "Our Puny Allies",
-        allNames = "Our Puny Allies",
-        furnDataId = "9728",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
-        itemId = 118489,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118489&quality=2",
-        name = "Papers, Stack",
-        allNames = "Papers, Stack",
-        furnDataId = "1827",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203461,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203461&quality=3",
-        name = "Parables of Saint Vorys",
-        allNames = "Parables of Saint Vorys",
-        furnDataId = "9764",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 194444,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194444&quality=3",
-        name = "Persistence of Daedric Veneration",
-        allNames = "Persistence of Daedric Veneration",
-        furnDataId = "8972",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 197921,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197921&quality=3",
-        name = "Peryite's Salvation",
-        allNames = "Peryite's Salvation",
-        furnDataId = "9261",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Bastion Nymic.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120274,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120274&quality=2",
-        name = "Pirates of the Abecean",
-        allNames = "Pirates of the Abecean",
-        furnDataId = "2676",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203455,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203455&quality=3",
-        name = "Plague Concoctor's Instructions",
-        allNames = "Plague Concoctor's Instructions",
-        furnDataId = "9758",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203435,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203435&quality=3",
-        name = "Planar Exploration Vol. 14: Darkreave Curators",
-        allNames = "Planar Exploration Vol. 14: Darkreave Curators",
-        furnDataId = "9738",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_fur_desk002.dds",
-        itemId = 134258,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134258&quality=3",
-        name = "Prayer to the Furious One",
-        allNames = "Prayer to the Furious One",
-        furnDataId = "4506",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This ancient invocation has helped Orcs summon up their fury since the days of the first chieftains.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203457,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203457&quality=3",
-        name = "Preparing Necrom Kwama, Fifth Draft",
-        allNames = "Preparing Necrom Kwama, Fifth Draft",
-        furnDataId = "9760",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120236,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120236&quality=2",
-        name = "Proper-Life: Three Chants",
-        allNames = "Proper-Life: Three Chants",
-        furnDataId = "2638",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120209,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120209&quality=2",
-        name = "Proposal: Schools of Magic",
-        allNames = "Proposal: Schools of Magic",
-        furnDataId = "2611",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120359,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120359&quality=2",
-        name = "Protocols of the Court of Contempt",
-        allNames = "Protocols of the Court of Contempt",
-        furnDataId = "2761",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook003.dds",
-        itemId = 203410,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203410&quality=3",
-        name = "Ranks and Titles of House Telvanni",
-        allNames = "Ranks and Titles of House Telvanni",
-        furnDataId = "9713",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120206,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120206&quality=2",
-        name = "Reality and Other Falsehoods",
-        allNames = "Reality and Other Falsehoods",
-        furnDataId = "2608",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120122,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120122&quality=2",
-        name = "Redguards, History and Heroes, V. 1",
-        allNames = "Redguards, History and Heroes, V. 1",
-        furnDataId = "2524",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120123,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120123&quality=2",
-        name = "Redguards, History and Heroes, V. 2",
-        allNames = "Redguards, History and Heroes, V. 2",
-        furnDataId = "2525",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120124,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120124&quality=2",
-        name = "Redguards, History and Heroes, V. 3",
-        allNames = "Redguards, History and Heroes, V. 3",
-        furnDataId = "2526",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120311,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120311&quality=2",
-        name = "Regarding the Ebonheart Pact",
-        allNames = "Regarding the Ebonheart Pact",
-        furnDataId = "2713",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120253,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120253&quality=2",
-        name = "Remember Me",
-        allNames = "Remember Me",
-        furnDataId = "2655",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120248,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120248&quality=2",
-        name = "Return to Orsinium",
-        allNames = "Return to Orsinium",
-        furnDataId = "2650",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120300,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120300&quality=2",
-        name = "Clans of the Reach: A Guide",
-        allNames = "Clans of the Reach: A Guide",
-        furnDataId = "2702",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
-        itemId = 120133,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120133&quality=3",
-        name = "Robier's Vegetable Garden",
-        allNames = "Robier's Vegetable Garden",
-        furnDataId = "2535",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120217,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120217&quality=2",
-        name = "Ruminations on the Elder Scrolls",
-        allNames = "Ruminations on the Elder Scrolls",
-        furnDataId = "2619",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 140220,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=140220&quality=4",
-        name = "Rumors of the Spiral Skein",
-        allNames = "Rumors of the Spiral Skein",
-        furnDataId = "5353",
-        furnCategory = "Library:Literature (4:62)",
-        description = "The ravings of a lunatic, or the insights of a prophet? One can only pray never to find out firsthand.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120096,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120096&quality=2",
-        name = "Sacred Rites of the Stonechewers",
-        allNames = "Sacred Rites of the Stonechewers",
-        furnDataId = "2498",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120131,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120131&quality=2",
-        name = "Sacrilege and Mayhem in the Alik'r",
-        allNames = "Sacrilege and Mayhem in the Alik'r",
-        furnDataId = "2533",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120298,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120298&quality=2",
-        name = "Sanctioned Murder",
-        allNames = "Sanctioned Murder",
-        furnDataId = "2700",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
-        itemId = 145597,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145597&quality=3",
-        name = "Scales of Shadow",
-        allNames = "Scales of Shadow",
-        furnDataId = "5827",
-        furnCategory = "Library:Literature (4:62)",
-        description = "The words of Nisswo Xeewulm, preserved exactly as written.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120091,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120091&quality=2",
-        name = "Schemes of the Reachmage",
-        allNames = "Schemes of the Reachmage",
-        furnDataId = "2493",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_scroll_closed002.dds",
-        itemId = 118491,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118491&quality=3",
-        name = "Scroll, Bound",
-        allNames = "Scroll, Bound",
-        furnDataId = "1829",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_scroll_closed001.dds",
-        itemId = 118490,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118490&quality=3",
-        name = "Scroll, Rolled",
-        allNames = "Scroll, Rolled",
-        furnDataId = "1828",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120281,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120281&quality=2",
-        name = "Second Invasion: Reports",
-        allNames = "Second Invasion: Reports",
-        furnDataId = "2683",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120130,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120130&quality=2",
-        name = "Sentinel, the Jewel of Alik'r",
-        allNames = "Sentinel, the Jewel of Alik'r",
-        furnDataId = "2532",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120293,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120293&quality=2",
-        name = "Shad Astula Academy Handbook",
-        allNames = "Shad Astula Academy Handbook",
-        furnDataId = "2695",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120109,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120109&quality=2",
-        name = "Shornhelm, Crown City of the North",
-        allNames = "Shornhelm, Crown City of the North",
-        furnDataId = "2511",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_scrollunsealed001.dds",
-        itemId = 118528,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118528&quality=3",
-        name = "Signed Contract",
-        allNames = "Signed Contract",
-        furnDataId = "1837",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120218,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120218&quality=2",
-        name = "Sithis",
-        allNames = "Sithis",
-        furnDataId = "2620",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203470,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203470&quality=3",
-        name = "Song of Fate",
-        allNames = "Song of Fate",
-        furnDataId = "9773",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120237,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120237&quality=2",
-        name = "Song of the Askelde Men",
-        allNames = "Song of the Askelde Men",
-        furnDataId = "2639",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120308,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120308&quality=2",
-        name = "Songs of the Return, Volume 27",
-        allNames = "Songs of the Return, Volume 27",
-        furnDataId = "2710",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120309,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120309&quality=2",
-        name = "Songs of the Return, Volume 49",
-        allNames = "Songs of the Return, Volume 49",
-        furnDataId = "2711",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120303,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120303&quality=2",
-        name = "Songs of the Return, Volume 5",
-        allNames = "Songs of the Return, Volume 5",
-        furnDataId = "2705",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120364,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120364&quality=2",
-        name = "Soul-Trapping I: An Introduction",
-        allNames = "Soul-Trapping I: An Introduction",
-        furnDataId = "2766",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
-        itemId = 145928,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145928&quality=3",
-        name = "Speakers of Nothing",
-        allNames = "Speakers of Nothing",
-        furnDataId = "5831",
-        furnCategory = "Library:Literature (4:62)",
-        description = "The words of Nisswo Xeewulm, preserved exactly as written.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120225,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120225&quality=2",
-        name = "Spirit of the Daedra",
-        allNames = "Spirit of the Daedra",
-        furnDataId = "2627",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120285,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120285&quality=2",
-        name = "Spirits of Skyrim",
-        allNames = "Spirits of Skyrim",
-        furnDataId = "2687",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
-        itemId = 194447,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194447&quality=3",
-        name = "Stonefire Ritual Tome",
-        allNames = "Stonefire Ritual Tome",
-        furnDataId = "8975",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120250,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120250&quality=2",
-        name = "Suril's Journal",
-        allNames = "Suril's Journal",
-        furnDataId = "2652",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120376,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120376&quality=2",
-        name = "Tamrielic Artifacts Part Three",
-        allNames = "Tamrielic Artifacts Part Three",
-        furnDataId = "2778",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120374,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120374&quality=2",
-        name = "Tamrielic Artifacts, Part One",
-        allNames = "Tamrielic Artifacts, Part One",
-        furnDataId = "2776",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120375,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120375&quality=2",
-        name = "Tamrielic Artifacts, Part Two",
-        allNames = "Tamrielic Artifacts, Part Two",
-        furnDataId = "2777",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120363,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120363&quality=2",
-        name = "Tempest Island Briefing",
-        allNames = "Tempest Island Briefing",
-        furnDataId = "2765",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_row004.dds",
-        itemId = 126792,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126792&quality=3",
-        name = "Temple Doctrine: The 36 Lessons",
-        allNames = "Temple Doctrine: The 36 Lessons",
-        furnDataId = "",
-        furnCategory = "",
-        description = "All 36 Sermons, individually bound for use in personal libraries and family shrines.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120319,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120319&quality=2",
-        name = "Thalmor Handbill",
-        allNames = "Thalmor Handbill",
-        furnDataId = "2721",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
-        itemId = 145926,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145926&quality=3",
-        name = "That of Void",
-        allNames = "That of Void",
-        furnDataId = "5829",
-        furnCategory = "Library:Literature (4:62)",
-        description = "The words of Nisswo Xeewulm, preserved exactly as written.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120368,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120368&quality=2",
-        name = "The Adabal-a",
-        allNames = "The Adabal-a",
-        furnDataId = "2770",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120142,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120142&quality=2",
-        name = "The All-Beneficent King Fahara'jad",
-        allNames = "The All-Beneficent King Fahara'jad",
-        furnDataId = "2544",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120369,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120369&quality=2",
-        name = "The Amulet of Kings",
-        allNames = "The Amulet of Kings",
-        furnDataId = "2771",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203394,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203394&quality=3",
-        name = "The Angry Alfiq: A Collection",
-        allNames = "The Angry Alfiq: A Collection",
-        furnDataId = "9697",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Northern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120154,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120154&quality=2",
-        name = "The Anuad Paraphrased",
-        allNames = "The Anuad Paraphrased",
-        furnDataId = "2556",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120169,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120169&quality=2",
-        name = "The Art of Kwama Egg Cooking",
-        allNames = "The Art of Kwama Egg Cooking",
-        furnDataId = "2571",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120102,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120102&quality=2",
-        name = "The Barrows of Westmark Moor",
-        allNames = "The Barrows of Westmark Moor",
-        furnDataId = "2504",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120230,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120230&quality=2",
-        name = "The Battle of Glenumbria Moors",
-        allNames = "The Battle of Glenumbria Moors",
-        furnDataId = "2632",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120170,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120170&quality=2",
-        name = "The Binding Stone",
-        allNames = "The Binding Stone",
-        furnDataId = "2572",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120355,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120355&quality=2",
-        name = "The Black Forge",
-        allNames = "The Black Forge",
-        furnDataId = "2757",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203379,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203379&quality=3",
-        name = "The Blackfeather Court",
-        allNames = "The Blackfeather Court",
-        furnDataId = "9682",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Clockwork City.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203387,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203387&quality=3",
-        name = "The Blade of Woe",
-        allNames = "The Blade of Woe",
-        furnDataId = "9690",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Gold Coast.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120220,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120220&quality=2",
-        name = "The Book of Daedra",
-        allNames = "The Book of Daedra",
-        furnDataId = "2622",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120231,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120231&quality=2",
-        name = "The Book of Dawn and Dusk",
-        allNames = "The Book of Dawn and Dusk",
-        furnDataId = "2633",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120322,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120322&quality=2",
-        name = "The Book of the Great Tree",
-        allNames = "The Book of the Great Tree",
-        furnDataId = "2724",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120095,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120095&quality=2",
-        name = "The Bretons: Mongrels or Paragons?",
-        allNames = "The Bretons: Mongrels or Paragons?",
-        furnDataId = "2497",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120261,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120261&quality=2",
-        name = "The Brothers of Strife",
-        allNames = "The Brothers of Strife",
-        furnDataId = "2663",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120280,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120280&quality=2",
-        name = "The Brothers' War",
-        allNames = "The Brothers' War",
-        furnDataId = "2682",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120232,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120232&quality=2",
-        name = "The Cantatas of Vivec",
-        allNames = "The Cantatas of Vivec",
-        furnDataId = "2634",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120370,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120370&quality=2",
-        name = "The Cleansing of the Fane",
-        allNames = "The Cleansing of the Fane",
-        furnDataId = "2772",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
-        itemId = 126152,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126152&quality=5",
-        name = "The Cliff-Strider Song",
-        allNames = "The Cliff-Strider Song",
-        furnDataId = "3401",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120082,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120082&quality=2",
-        name = "The Code of Mauloch",
-        allNames = "The Code of Mauloch",
-        furnDataId = "2484",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120219,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120219&quality=2",
-        name = "The Consecrations of Arkay",
-        allNames = "The Consecrations of Arkay",
-        furnDataId = "2621",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120284,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120284&quality=2",
-        name = "The Crown of Freydis",
-        allNames = "The Crown of Freydis",
-        furnDataId = "2686",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
-        itemId = 203413,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203413&quality=3",
-        name = "The Currency of Secrets",
-        allNames = "The Currency of Secrets",
-        furnDataId = "9716",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203421,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203421&quality=3",
-        name = "The Dangers of Truth",
-        allNames = "The Dangers of Truth",
-        furnDataId = "9724",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120325,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120325&quality=2",
-        name = "The Devouring of Gil-Var-Delle",
-        allNames = "The Devouring of Gil-Var-Delle",
-        furnDataId = "2727",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 197920,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197920&quality=3",
-        name = "The Doom of the Hushed",
-        allNames = "The Doom of the Hushed",
-        furnDataId = "9260",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120222,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120222&quality=2",
-        name = "The Doors of Oblivion, Part 1",
-        allNames = "The Doors of Oblivion, Part 1",
-        furnDataId = "2624",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120223,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120223&quality=2",
-        name = "The Doors of Oblivion, Part 2",
-        allNames = "The Doors of Oblivion, Part 2",
-        furnDataId = "2625",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120146,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120146&quality=2",
-        name = "The Dreamstride",
-        allNames = "The Dreamstride",
-        furnDataId = "2548",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120344,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120344&quality=2",
-        name = "The Eagle and the Cat",
-        allNames = "The Eagle and the Cat",
-        furnDataId = "2746",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120336,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120336&quality=2",
-        name = "The Eldest: A Pilgrim's Tale",
-        allNames = "The Eldest: A Pilgrim's Tale",
-        furnDataId = "2738",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120371,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120371&quality=2",
-        name = "The Exclusionary Mandates",
-        allNames = "The Exclusionary Mandates",
-        furnDataId = "2773",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 203398,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203398&quality=3",
-        name = "The Favored Daughter of Fadomai",
-        allNames = "The Favored Daughter of Fadomai",
-        furnDataId = "9701",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Southern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120215,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120215&quality=2",
-        name = "The Firmament",
-        allNames = "The Firmament",
-        furnDataId = "2617",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120233,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120233&quality=2",
-        name = "The Five Far Stars",
-        allNames = "The Five Far Stars",
-        furnDataId = "2635",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
-        itemId = 126128,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126128&quality=4",
-        name = "The Five Points of the Star",
-        allNames = "The Five Points of the Star",
-        furnDataId = "3382",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a small house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook002.dds",
-        itemId = 203401,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203401&quality=3",
-        name = "The Flight of Gryphons",
-        allNames = "The Flight of Gryphons",
-        furnDataId = "9704",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Summerset.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120121,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120121&quality=2",
-        name = "The Glenmoril Wyrd",
-        allNames = "The Glenmoril Wyrd",
-        furnDataId = "2523",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120262,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120262&quality=2",
-        name = "The Great Houses and Their Use",
-        allNames = "The Great Houses and Their Use",
-        furnDataId = "2664",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120337,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120337&quality=2",
-        name = "The Green Pact and the Dominion",
-        allNames = "The Green Pact and the Dominion",
-        furnDataId = "2739",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_fur_podiumscroll003.dds",
-        itemId = 134861,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134861&quality=3",
-        name = "The History of Zaan The Scalecaller",
-        allNames = "The History of Zaan The Scalecaller",
-        furnDataId = "4844",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Jorvuld Davaux, Dragon Priest Historian, on the historical significance of the bond between a Dragon Priest and her Dragon Lord.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120190,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120190&quality=2",
-        name = "The Homilies of Blessed Almalexia",
-        allNames = "The Homilies of Blessed Almalexia",
-        furnDataId = "2592",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120147,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120147&quality=2",
-        name = "The House of Troubles",
-        allNames = "The House of Troubles",
-        furnDataId = "2549",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120273,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120273&quality=2",
-        name = "The Humor of Wood Elves",
-        allNames = "The Humor of Wood Elves",
-        furnDataId = "2675",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120136,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120136&quality=2",
-        name = "The Illusion of Death",
-        allNames = "The Illusion of Death",
-        furnDataId = "2538",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
-        itemId = 194439,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194439&quality=3",
-        name = "The Journal of Emperor Leovic",
-        allNames = "The Journal of Emperor Leovic",
-        furnDataId = "8966",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120291,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120291&quality=2",
-        name = "The Judgment of Saint Veloth",
-        allNames = "The Judgment of Saint Veloth",
-        furnDataId = "2693",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120094,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120094&quality=2",
-        name = "The Knightly Orders of High Rock",
-        allNames = "The Knightly Orders of High Rock",
-        furnDataId = "2496",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203458,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203458&quality=3",
-        name = "The Last Addition of Bikkus-Muz",
-        allNames = "The Last Addition of Bikkus-Muz",
-        furnDataId = "9761",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120372,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120372&quality=2",
-        name = "The Last King of the Ayleids",
-        allNames = "The Last King of the Ayleids",
-        furnDataId = "2774",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_fur_housingpodium002.dds",
-        itemId = 134246,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134246&quality=4",
-        name = "The Law of Gears",
-        allNames = "The Law of Gears",
-        furnDataId = "4494",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Proctor Albacron's \"Law of Gears\" provides a firm doctrinal foundation for Clockwork novices and chancellors alike.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120312,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120312&quality=2",
-        name = "The Lay of Firsthold",
-        allNames = "The Lay of Firsthold",
-        furnDataId = "2714",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120112,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120112&quality=2",
-        name = "The Legend of Fallen Grotto",
-        allNames = "The Legend of Fallen Grotto",
-        furnDataId = "2514",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 197919,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197919&quality=3",
-        name = "The Legend of Fathoms Drift",
-        allNames = "The Legend of Fathoms Drift",
-        furnDataId = "9259",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120328,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120328&quality=2",
-        name = "The Legend of Vastarie",
-        allNames = "The Legend of Vastarie",
-        furnDataId = "2730",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120191,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120191&quality=2",
-        name = "The Legendary Scourge",
-        allNames = "The Legendary Scourge",
-        furnDataId = "2593",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120357,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120357&quality=2",
-        name = "The Library of Dusk: Rare Books",
-        allNames = "The Library of Dusk: Rare Books",
-        furnDataId = "2759",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120356,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120356&quality=2",
-        name = "The Lightless Oubliette",
-        allNames = "The Lightless Oubliette",
-        furnDataId = "2758",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203440,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203440&quality=3",
-        name = "The Littlest Tomeshell",
-        allNames = "The Littlest Tomeshell",
-        furnDataId = "9743",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120290,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120290&quality=2",
-        name = "The Living Gods",
-        allNames = "The Living Gods",
-        furnDataId = "2692",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120155,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120155&quality=2",
-        name = "The Lunar Lorkhan",
-        allNames = "The Lunar Lorkhan",
-        furnDataId = "2557",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120192,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120192&quality=2",
-        name = "The Lusty Argonian Maid, Vol. 1",
-        allNames = "The Lusty Argonian Maid, Vol. 1",
-        furnDataId = "2594",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120193,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120193&quality=2",
-        name = "The Lusty Argonian Maid, Vol. 2",
-        allNames = "The Lusty Argonian Maid, Vol. 2",
-        furnDataId = "2595",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203399,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203399&quality=3",
-        name = "The Marriage of Moon and Tide",
-        allNames = "The Marriage of Moon and Tide",
-        furnDataId = "9702",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Southern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120340,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120340&quality=2",
-        name = "The Moon Cats and their Dance",
-        allNames = "The Moon Cats and their Dance",
-        furnDataId = "2742",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
-        itemId = 178501,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178501&quality=5",
-        name = "The Nomads of Nirn",
-        allNames = "The Nomads of Nirn",
-        furnDataId = "7890",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120204,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120204&quality=2",
-        name = "The Old Ways",
-        allNames = "The Old Ways",
-        furnDataId = "2606",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120332,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120332&quality=2",
-        name = "The Ooze: A Fable",
-        allNames = "The Ooze: A Fable",
-        furnDataId = "2734",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120373,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120373&quality=2",
-        name = "The Order of the Ancestor Moth",
-        allNames = "The Order of the Ancestor Moth",
-        furnDataId = "2775",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120247,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120247&quality=2",
-        name = "The Order of the Black Worm",
-        allNames = "The Order of the Black Worm",
-        furnDataId = "2649",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120216,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120216&quality=2",
-        name = "The Pig Children",
-        allNames = "The Pig Children",
-        furnDataId = "2618",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120115,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120115&quality=2",
-        name = "The Posting of the Hunt",
-        allNames = "The Posting of the Hunt",
-        furnDataId = "2517",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
-        itemId = 203456,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203456&quality=3",
-        name = "The Prior's Fulcrum",
-        allNames = "The Prior's Fulcrum",
-        furnDataId = "9759",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120196,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120196&quality=2",
-        name = "The Red Book of Riddles",
-        allNames = "The Red Book of Riddles",
-        furnDataId = "2598",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203389,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203389&quality=3",
-        name = "The Red Curse, Volume 1",
-        allNames = "The Red Curse, Volume 1",
-        furnDataId = "9692",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Hew's Bane.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203390,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203390&quality=3",
-        name = "The Red Curse, Volume 2",
-        allNames = "The Red Curse, Volume 2",
-        furnDataId = "9693",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Hew's Bane.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203391,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203391&quality=3",
-        name = "The Red Curse, Volume 3",
-        allNames = "The Red Curse, Volume 3",
-        furnDataId = "9694",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Hew's Bane.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120277,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120277&quality=2",
-        name = "The Red Paint",
-        allNames = "The Red Paint",
-        furnDataId = "2679",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203462,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203462&quality=3",
-        name = "The Remnant Truth",
-        allNames = "The Remnant Truth",
-        furnDataId = "9765",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120105,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120105&quality=2",
-        name = "The Remnant of Light",
-        allNames = "The Remnant of Light",
-        furnDataId = "2507",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120251,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120251&quality=2",
-        name = "The Right Mattock for the Job",
-        allNames = "The Right Mattock for the Job",
-        furnDataId = "2653",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120316,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120316&quality=2",
-        name = "The Rise of Queen Ayrenn",
-        allNames = "The Rise of Queen Ayrenn",
-        furnDataId = "2718",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120304,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120304&quality=2",
-        name = "The Road to Sovngarde",
-        allNames = "The Road to Sovngarde",
-        furnDataId = "2706",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120258,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120258&quality=2",
-        name = "The Ruby Necklace",
-        allNames = "The Ruby Necklace",
-        furnDataId = "2660",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the Shadowfen Lore book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120129,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120129&quality=2",
-        name = "The Salas En Expedition",
-        allNames = "The Salas En Expedition",
-        furnDataId = "2531",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120249,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120249&quality=2",
-        name = "The Second Akaviri Invasion",
-        allNames = "The Second Akaviri Invasion",
-        furnDataId = "2651",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook002.dds",
-        itemId = 145445,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145445&quality=3",
-        name = "The Sharper Tongue: A Jel Primer",
-        allNames = "The Sharper Tongue: A Jel Primer",
-        furnDataId = "5748",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook001.dds",
-        itemId = 203466,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203466&quality=3",
-        name = "The Silver Rose Blooms over Borderwatch",
-        allNames = "The Silver Rose Blooms over Borderwatch",
-        furnDataId = "9769",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120228,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120228&quality=2",
-        name = "The Slave Pits of Coldharbour",
-        allNames = "The Slave Pits of Coldharbour",
-        furnDataId = "2630",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126157,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126157&quality=4",
-        name = "The Song of Pelinal, Volume 1",
-        allNames = "The Song of Pelinal, Volume 1",
-        furnDataId = "3405",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Name.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126158,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126158&quality=4",
-        name = "The Song of Pelinal, Volume 2",
-        allNames = "The Song of Pelinal, Volume 2",
-        furnDataId = "3406",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Coming.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126159,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126159&quality=4",
-        name = "The Song of Pelinal, Volume 3",
-        allNames = "The Song of Pelinal, Volume 3",
-        furnDataId = "3407",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Enemy.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126160,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126160&quality=4",
-        name = "The Song of Pelinal, Volume 4",
-        allNames = "The Song of Pelinal, Volume 4",
-        furnDataId = "3408",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Deeds.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126161,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126161&quality=4",
-        name = "The Song of Pelinal, Volume 5",
-        allNames = "The Song of Pelinal, Volume 5",
-        furnDataId = "3409",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Love of Morihaus.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126162,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126162&quality=4",
-        name = "The Song of Pelinal, Volume 6",
-        allNames = "The Song of Pelinal, Volume 6",
-        furnDataId = "3410",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Madness.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126163,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126163&quality=4",
-        name = "The Song of Pelinal, Volume 7",
-        allNames = "The Song of Pelinal, Volume 7",
-        furnDataId = "3411",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Battle with Umaril and His Dismemberment.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 126164,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126164&quality=4",
-        name = "The Song of Pelinal, Volume 8",
-        allNames = "The Song of Pelinal, Volume 8",
-        furnDataId = "3412",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint, Second Edition: \"On His Revelation at the Death of the Al-Esh.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
-        itemId = 178497,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178497&quality=5",
-        name = "The Sonnet of Aetherius Art",
-        allNames = "The Sonnet of Aetherius Art",
-        furnDataId = "7886",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120153,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120153&quality=2",
-        name = "The Spawn of Molag Bal",
-        allNames = "The Spawn of Molag Bal",
-        furnDataId = "2555",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 203424,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203424&quality=3",
-        name = "The Spires of the 34th Sermon",
-        allNames = "The Spires of the 34th Sermon",
-        furnDataId = "9727",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203471,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203471&quality=3",
-        name = "The Spotted Towers",
-        allNames = "The Spotted Towers",
-        furnDataId = "9774",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120287,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120287&quality=2",
-        name = "The Stormfist Clan",
-        allNames = "The Stormfist Clan",
-        furnDataId = "2689",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120103,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120103&quality=2",
-        name = "The Story of Princess Eselde",
-        allNames = "The Story of Princess Eselde",
-        furnDataId = "2505",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120282,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120282&quality=2",
-        name = "The Ternion Monks",
-        allNames = "The Ternion Monks",
-        furnDataId = "2684",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120166,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120166&quality=2",
-        name = "The Thief God's Treasures",
-        allNames = "The Thief God's Treasures",
-        furnDataId = "2568",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120151,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120151&quality=2",
-        name = "The Totems of Hircine",
-        allNames = "The Totems of Hircine",
-        furnDataId = "2553",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120087,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120087&quality=2",
-        name = "The True Nature of Orcs",
-        allNames = "The True Nature of Orcs",
-        furnDataId = "2489",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120118,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120118&quality=2",
-        name = "The True-Told Tale of Hallin, Pt. 1",
-        allNames = "The True-Told Tale of Hallin, Pt. 1",
-        furnDataId = "2520",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120119,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120119&quality=2",
-        name = "The True-Told Tale of Hallin, Pt. 2",
-        allNames = "The True-Told Tale of Hallin, Pt. 2",
-        furnDataId = "2521",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_book001.dds",
-        itemId = 134547,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134547&quality=3",
-        name = "The Truth in Sequence",
-        allNames = "The Truth in Sequence",
-        furnDataId = "",
-        furnCategory = "",
-        description = "The collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn—painstakingly etched and precisely bound.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134548,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134548&quality=3",
-        name = "The Truth in Sequence: Volume 1",
-        allNames = "The Truth in Sequence: Volume 1",
-        furnDataId = "4723",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume one of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134557,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134557&quality=3",
-        name = "The Truth in Sequence: Volume 10",
-        allNames = "The Truth in Sequence: Volume 10",
-        furnDataId = "4732",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume ten of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134558,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134558&quality=3",
-        name = "The Truth in Sequence: Volume 11",
-        allNames = "The Truth in Sequence: Volume 11",
-        furnDataId = "4733",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume eleven of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134559,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134559&quality=3",
-        name = "The Truth in Sequence: Volume 12",
-        allNames = "The Truth in Sequence: Volume 12",
-        furnDataId = "4734",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume twelve of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134549,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134549&quality=3",
-        name = "The Truth in Sequence: Volume 2",
-        allNames = "The Truth in Sequence: Volume 2",
-        furnDataId = "4724",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume two of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134550,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134550&quality=3",
-        name = "The Truth in Sequence: Volume 3",
-        allNames = "The Truth in Sequence: Volume 3",
-        furnDataId = "4725",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume three of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134551,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134551&quality=3",
-        name = "The Truth in Sequence: Volume 4",
-        allNames = "The Truth in Sequence: Volume 4",
-        furnDataId = "4726",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume four of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134552,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134552&quality=3",
-        name = "The Truth in Sequence: Volume 5",
-        allNames = "The Truth in Sequence: Volume 5",
-        furnDataId = "4727",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume five of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134553,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134553&quality=3",
-        name = "The Truth in Sequence: Volume 6",
-        allNames = "The Truth in Sequence: Volume 6",
-        furnDataId = "4728",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume six of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134554,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134554&quality=3",
-        name = "The Truth in Sequence: Volume 7",
-        allNames = "The Truth in Sequence: Volume 7",
-        furnDataId = "4729",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume seven of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134555,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134555&quality=3",
-        name = "The Truth in Sequence: Volume 8",
-        allNames = "The Truth in Sequence: Volume 8",
-        furnDataId = "4730",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume eight of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
-        itemId = 134556,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134556&quality=3",
-        name = "The Truth in Sequence: Volume 9",
-        allNames = "The Truth in Sequence: Volume 9",
-        furnDataId = "4731",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Volume nine of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 203402,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203402&quality=3",
-        name = "The Truth of Minotaurs",
-        allNames = "The Truth of Minotaurs",
-        furnDataId = "9705",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Summerset.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 203403,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203403&quality=3",
-        name = "The Ubiquitous Sinking Isle",
-        allNames = "The Ubiquitous Sinking Isle",
-        furnDataId = "9706",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Summerset.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120117,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120117&quality=2",
-        name = "The Viridian Sentinel",
-        allNames = "The Viridian Sentinel",
-        furnDataId = "2519",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120276,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120276&quality=2",
-        name = "A Nereid Stole My Husband",
-        allNames = "A Nereid Stole My Husband",
-        furnDataId = "2678",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203468,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203468&quality=3",
-        name = "The Waiting Door",
-        allNames = "The Waiting Door",
-        furnDataId = "9771",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120307,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120307&quality=2",
-        name = "The Wandering Skald",
-        allNames = "The Wandering Skald",
-        furnDataId = "2709",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120238,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120238&quality=2",
-        name = "The Warrior's Charge",
-        allNames = "The Warrior's Charge",
-        furnDataId = "2640",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 194454,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194454&quality=3",
-        name = "The Waters of Oblivion",
-        allNames = "The Waters of Oblivion",
-        furnDataId = "8982",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
-        itemId = 145467,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145467&quality=3",
-        name = "The Way of Shadow",
-        allNames = "The Way of Shadow",
-        furnDataId = "5770",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120275,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120275&quality=2",
-        name = "The Wedding Feast: A Memoir",
-        allNames = "The Wedding Feast: A Memoir",
-        furnDataId = "2677",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120085,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120085&quality=2",
-        name = "The Werewolf's Hide",
-        allNames = "The Werewolf's Hide",
-        furnDataId = "2487",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120351,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120351&quality=2",
-        name = "The Whithering of Delodiil",
-        allNames = "The Whithering of Delodiil",
-        furnDataId = "2753",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120333,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120333&quality=2",
-        name = "The Wilderking Legend",
-        allNames = "The Wilderking Legend",
-        furnDataId = "2735",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 130228,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130228&quality=4",
-        name = "The Witches of Hag Fen",
-        allNames = "The Witches of Hag Fen",
-        furnDataId = "3976",
-        furnCategory = "Library:Literature (4:62)",
-        description = "This is a tiny house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 203388,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203388&quality=3",
-        name = "The Wolf and the Dragon",
-        allNames = "The Wolf and the Dragon",
-        furnDataId = "9691",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Gold Coast.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120339,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120339&quality=2",
-        name = "The Wood Elf Gourmet, Ch. 1",
-        allNames = "The Wood Elf Gourmet, Ch. 1",
-        furnDataId = "2741",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120270,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120270&quality=2",
-        name = "The Woodsmer",
-        allNames = "The Woodsmer",
-        furnDataId = "2672",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120306,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120306&quality=2",
-        name = "Thenephan's Mysteries of Mead",
-        allNames = "Thenephan's Mysteries of Mead",
-        furnDataId = "2708",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 194450,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194450&quality=3",
-        name = "Thwarting the Daedra: Dagon's Cult",
-        allNames = "Thwarting the Daedra: Dagon's Cult",
-        furnDataId = "8978",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203450,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203450&quality=3",
-        name = "Tidefall Cantos I",
-        allNames = "Tidefall Cantos I",
-        furnDataId = "9753",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120365,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120365&quality=2",
-        name = "To All Who Pass Through",
-        allNames = "To All Who Pass Through",
-        furnDataId = "2767",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120099,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120099&quality=2",
-        name = "To Dream Beyond Dreams",
-        allNames = "To Dream Beyond Dreams",
-        furnDataId = "2501",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120173,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120173&quality=2",
-        name = "To Posterity",
-        allNames = "To Posterity",
-        furnDataId = "2575",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
-        itemId = 194440,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194440&quality=3",
-        name = "Tome of Daedric Portals",
-        allNames = "Tome of Daedric Portals",
-        furnDataId = "8967",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203438,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203438&quality=3",
-        name = "Torvesard's Journal",
-        allNames = "Torvesard's Journal",
-        furnDataId = "9741",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120302,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120302&quality=2",
-        name = "Touch of the Worm's Tongue",
-        allNames = "Touch of the Worm's Tongue",
-        furnDataId = "2704",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120100,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120100&quality=2",
-        name = "Tower of Adamant",
-        allNames = "Tower of Adamant",
-        furnDataId = "2502",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_inc_openbook001.dds",
-        itemId = 203395,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203395&quality=3",
-        name = "Trail and Tide",
-        allNames = "Trail and Tide",
-        furnDataId = "9698",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Northern Elsweyr.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120141,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120141&quality=2",
-        name = "Trials of Saint Alessia",
-        allNames = "Trials of Saint Alessia",
-        furnDataId = "2543",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120140,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120140&quality=2",
-        name = "Triumphs of a Monarch, Ch. 10",
-        allNames = "Triumphs of a Monarch, Ch. 10",
-        furnDataId = "2542",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120138,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120138&quality=2",
-        name = "Triumphs of a Monarch, Ch. 3",
-        allNames = "Triumphs of a Monarch, Ch. 3",
-        furnDataId = "2540",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
-        itemId = 120139,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120139&quality=2",
-        name = "Triumphs of a Monarch, Ch. 6",
-        allNames = "Triumphs of a Monarch, Ch. 6",
-        furnDataId = "2541",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120084,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120084&quality=2",
-        name = "True Heirs of the Empire",
-        allNames = "True Heirs of the Empire",
-        furnDataId = "2486",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120125,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120125&quality=2",
-        name = "Tu'whacca's Prayer",
-        allNames = "Tu'whacca's Prayer",
-        furnDataId = "2527",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/skr_inc_vampirelabbook001.dds",
-        itemId = 203414,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203414&quality=3",
-        name = "Uluscant's Manifesto",
-        allNames = "Uluscant's Manifesto",
-        furnDataId = "9717",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120305,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120305&quality=2",
-        name = "Unexpected Allies",
-        allNames = "Unexpected Allies",
-        furnDataId = "2707",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
-        itemId = 120272,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120272&quality=2",
-        name = "Valenwood: A Study",
-        allNames = "Valenwood: A Study",
-        furnDataId = "2674",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120226,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120226&quality=2",
-        name = "Varieties of Daedra, Part 1",
-        allNames = "Varieties of Daedra, Part 1",
-        furnDataId = "2628",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
-        itemId = 120227,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120227&quality=2",
-        name = "Varieties of Daedra, Part 2",
-        allNames = "Varieties of Daedra, Part 2",
-        furnDataId = "2629",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120126,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120126&quality=2",
-        name = "Varieties of Faith, Crown Redguards",
-        allNames = "Varieties of Faith, Crown Redguards",
-        furnDataId = "2528",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
-        itemId = 120127,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120127&quality=2",
-        name = "Varieties of Faith, The Forebears",
-        allNames = "Varieties of Faith, The Forebears",
-        furnDataId = "2529",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120266,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120266&quality=2",
-        name = "Varieties of Faith: The Argonians",
-        allNames = "Varieties of Faith: The Argonians",
-        furnDataId = "2668",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120088,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120088&quality=2",
-        name = "Varieties of Faith: The Bretons",
-        allNames = "Varieties of Faith: The Bretons",
-        furnDataId = "2490",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120267,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120267&quality=2",
-        name = "Varieties of Faith: The Dark Elves",
-        allNames = "Varieties of Faith: The Dark Elves",
-        furnDataId = "2669",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120313,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120313&quality=2",
-        name = "Varieties of Faith: The High Elves",
-        allNames = "Varieties of Faith: The High Elves",
-        furnDataId = "2715",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120320,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120320&quality=2",
-        name = "Varieties of Faith: The Khajiit",
-        allNames = "Varieties of Faith: The Khajiit",
-        furnDataId = "2722",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120268,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120268&quality=2",
-        name = "Varieties of Faith: The Nords",
-        allNames = "Varieties of Faith: The Nords",
-        furnDataId = "2670",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120089,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120089&quality=2",
-        name = "Varieties of Faith: The Orcs",
-        allNames = "Varieties of Faith: The Orcs",
-        furnDataId = "2491",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120321,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120321&quality=2",
-        name = "Varieties of Faith: The Wood Elves",
-        allNames = "Varieties of Faith: The Wood Elves",
-        furnDataId = "2723",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120334,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120334&quality=2",
-        name = "Visions of the Green Pact Bosmer",
-        allNames = "Visions of the Green Pact Bosmer",
-        furnDataId = "2736",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
-        itemId = 203428,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203428&quality=3",
-        name = "Visitor's Guide: Telvanni Peninsula",
-        allNames = "Visitor's Guide: Telvanni Peninsula",
-        furnDataId = "9731",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 120163,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120163&quality=2",
-        name = "Vivec and Mephala",
-        allNames = "Vivec and Mephala",
-        furnDataId = "2565",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 203406,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203406&quality=3",
-        name = "Vorgrosh Rot-Tusk's Guide to Dirty Fighting",
-        allNames = "Vorgrosh Rot-Tusk's Guide to Dirty Fighting",
-        furnDataId = "9709",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Wrothgar.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook002.dds",
-        itemId = 203407,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203407&quality=3",
-        name = "Vosh Rakh",
-        allNames = "Vosh Rakh",
-        furnDataId = "9710",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Wrothgar.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 120199,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120199&quality=2",
-        name = "Wabbajack",
-        allNames = "Wabbajack",
-        furnDataId = "2601",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
-        itemId = 120324,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120324&quality=2",
-        name = "War Customs of the Tribal Bosmer",
-        allNames = "War Customs of the Tribal Bosmer",
-        furnDataId = "2726",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120167,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120167&quality=2",
-        name = "War Weather",
-        allNames = "War Weather",
-        furnDataId = "2569",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120296,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120296&quality=2",
-        name = "War of Two Houses",
-        allNames = "War of Two Houses",
-        furnDataId = "2698",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120172,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120172&quality=2",
-        name = "Wayrest Sewers: A Short History",
-        allNames = "Wayrest Sewers: A Short History",
-        furnDataId = "2574",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120101,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120101&quality=2",
-        name = "Wayrest, Jewel of the Bay",
-        allNames = "Wayrest, Jewel of the Bay",
-        furnDataId = "2503",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120208,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120208&quality=2",
-        name = "Wayshrines of Tamriel",
-        allNames = "Wayshrines of Tamriel",
-        furnDataId = "2610",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
-        itemId = 203426,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203426&quality=3",
-        name = "We Reject the Pact",
-        allNames = "We Reject the Pact",
-        furnDataId = "9729",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
-        itemId = 203442,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203442&quality=3",
-        name = "What About Glyphics?",
-        allNames = "What About Glyphics?",
-        furnDataId = "9745",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120165,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120165&quality=2",
-        name = "What is Volendrung?",
-        allNames = "What is Volendrung?",
-        furnDataId = "2567",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 203445,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203445&quality=3",
-        name = "What's an Arcanist? Part 1",
-        allNames = "What's an Arcanist? Part 1",
-        furnDataId = "9748",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
-        itemId = 203444,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203444&quality=3",
-        name = "What's an Arcanist? Part 2",
-        allNames = "What's an Arcanist? Part 2",
-        furnDataId = "9747",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120171,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120171&quality=2",
-        name = "Where Magical Paths Meet",
-        allNames = "Where Magical Paths Meet",
-        furnDataId = "2573",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120314,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120314&quality=2",
-        name = "Why Don the Veil?",
-        allNames = "Why Don the Veil?",
-        furnDataId = "2716",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
-        itemId = 120164,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120164&quality=2",
-        name = "With Regards to the Ebony Blade",
-        allNames = "With Regards to the Ebony Blade",
-        furnDataId = "2566",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120335,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120335&quality=2",
-        name = "Woodhearth: A Pocket Guide",
-        allNames = "Woodhearth: A Pocket Guide",
-        furnDataId = "2737",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120338,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120338&quality=2",
-        name = "Gifts of the Nereids",
-        allNames = "Gifts of the Nereids",
-        furnDataId = "2740",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
-        itemId = 120331,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120331&quality=2",
-        name = "Words of Clan Mother Ahnissi, Pt. 2",
-        allNames = "Words of Clan Mother Ahnissi, Pt. 2",
-        furnDataId = "2733",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
-        itemId = 120239,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120239&quality=2",
-        name = "Words of the Wind",
-        allNames = "Words of the Wind",
-        furnDataId = "2641",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
-        itemId = 203443,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203443&quality=3",
-        name = "Working in the Infinite Panopticon",
-        allNames = "Working in the Infinite Panopticon",
-        furnDataId = "9746",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cwc_inc_book001.dds",
-        itemId = 203380,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=203380&quality=3",
-        name = "Worshiping the Illogical",
-        allNames = "Worshiping the Illogical",
-        furnDataId = "9683",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Collected from Treasure Chests in Clockwork City.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120090,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120090&quality=2",
-        name = "Wyresses: The Name-Daughters",
-        allNames = "Wyresses: The Name-Daughters",
-        furnDataId = "2492",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
-        itemId = 120342,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=120342&quality=2",
-        name = "Yours for the Taking!",
-        allNames = "Yours for the Taking!",
-        furnDataId = "2744",
-        furnCategory = "Library:Literature (4:62)",
-        description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
-    },
-}
\ No newline at end of file
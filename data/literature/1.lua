@@ -0,0 +1,2010 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 1 of literature, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.literature = Data.chunks.literature or {}
+Data.chunks.literature[1] = function()
+    local literature = {
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120197,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120197&quality=2",
+            name = "16 Accords of Madness, Vol. VI",
+            allNames = "16 Accords of Madness, Vol. VI",
+            furnDataId = "2599",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 203377,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203377&quality=3",
+            name = "A Brief History of Ald Sotha",
+            allNames = "A Brief History of Ald Sotha",
+            furnDataId = "9680",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Clockwork City.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable001.dds",
+            itemId = 203430,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203430&quality=3",
+            name = "A Brief History of House Telvanni",
+            allNames = "A Brief History of House Telvanni",
+            furnDataId = "9733",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203429,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203429&quality=3",
+            name = "A Feast Among the Dead, Chapter I",
+            allNames = "A Feast Among the Dead, Chapter I",
+            furnDataId = "9732",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203446,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203446&quality=3",
+            name = "A Feast Among the Dead, Chapter II",
+            allNames = "A Feast Among the Dead, Chapter II",
+            furnDataId = "9749",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203447,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203447&quality=3",
+            name = "A Feast Among the Dead, Chapter III",
+            allNames = "A Feast Among the Dead, Chapter III",
+            furnDataId = "9750",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203448,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203448&quality=3",
+            name = "A Feast Among the Dead, Chapter IV",
+            allNames = "A Feast Among the Dead, Chapter IV",
+            furnDataId = "9751",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
+            itemId = 120406,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120406&quality=3",
+            name = "A Gift of Sanctuary",
+            allNames = "A Gift of Sanctuary",
+            furnDataId = "2779",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook003.dds",
+            itemId = 126138,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126138&quality=5",
+            name = "A Guide to Dwemer Mega-Structures",
+            allNames = "A Guide to Dwemer Mega-Structures",
+            furnDataId = "3389",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120120,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120120&quality=2",
+            name = "A Life Barbaric and Brutal",
+            allNames = "A Life Barbaric and Brutal",
+            furnDataId = "2522",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120354,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120354&quality=2",
+            name = "A Life of Strife and Struggle",
+            allNames = "A Life of Strife and Struggle",
+            furnDataId = "2756",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120343,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120343&quality=2",
+            name = "A Looter's Paradise",
+            allNames = "A Looter's Paradise",
+            furnDataId = "2745",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 194453,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194453&quality=3",
+            name = "A Memory Book, Part 1",
+            allNames = "A Memory Book, Part 1",
+            furnDataId = "8981",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 194452,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194452&quality=3",
+            name = "A Memory Book, Part 2",
+            allNames = "A Memory Book, Part 2",
+            furnDataId = "8980",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
+            itemId = 194451,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194451&quality=3",
+            name = "A Memory Book, Part 3",
+            allNames = "A Memory Book, Part 3",
+            furnDataId = "8979",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120257,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120257&quality=2",
+            name = "A Mother's Nursery Rhyme",
+            allNames = "A Mother's Nursery Rhyme",
+            furnDataId = "2659",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120276,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120276&quality=2",
+            name = "A Nereid Stole My Husband",
+            allNames = "A Nereid Stole My Husband",
+            furnDataId = "2678",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203439,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203439&quality=3",
+            name = "A New Cult Arises",
+            allNames = "A New Cult Arises",
+            furnDataId = "9742",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120297,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120297&quality=2",
+            name = "A Pocket Guide to Mournhold",
+            allNames = "A Pocket Guide to Mournhold",
+            furnDataId = "2699",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203411,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203411&quality=3",
+            name = "A Report on the Dusksabers",
+            allNames = "A Report on the Dusksabers",
+            furnDataId = "9714",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203459,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203459&quality=3",
+            name = "A Servant's Tale",
+            allNames = "A Servant's Tale",
+            furnDataId = "9762",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120255,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120255&quality=2",
+            name = "A Shallow Pool",
+            allNames = "A Shallow Pool",
+            furnDataId = "2657",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_openbook001.dds",
+            itemId = 203420,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203420&quality=3",
+            name = "A Summoner's Guide to Nymics",
+            allNames = "A Summoner's Guide to Nymics",
+            furnDataId = "9723",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 178498,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178498&quality=5",
+            name = "A Tale of the Dauntless Bananas",
+            allNames = "A Tale of the Dauntless Bananas",
+            furnDataId = "7887",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120083,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120083&quality=2",
+            name = "A Warning to the Aldmeri Dominion",
+            allNames = "A Warning to the Aldmeri Dominion",
+            furnDataId = "2485",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120214,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120214&quality=2",
+            name = "A Werewolf's Confession",
+            allNames = "A Werewolf's Confession",
+            furnDataId = "2616",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
+            itemId = 145927,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145927&quality=3",
+            name = "Acts of Honoring",
+            allNames = "Acts of Honoring",
+            furnDataId = "5830",
+            furnCategory = "Library:Literature (4:62)",
+            description = "The words of Nisswo Xeewulm, preserved exactly as written.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120144,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120144&quality=2",
+            name = "Aedra and Daedra",
+            allNames = "Aedra and Daedra",
+            furnDataId = "2546",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120286,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120286&quality=2",
+            name = "All About Giants",
+            allNames = "All About Giants",
+            furnDataId = "2688",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120367,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120367&quality=2",
+            name = "An Accounting of the Elder Scrolls",
+            allNames = "An Accounting of the Elder Scrolls",
+            furnDataId = "2769",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_paper001.dds",
+            itemId = 178502,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178502&quality=5",
+            name = "An Ode to the Disenfranchised",
+            allNames = "An Ode to the Disenfranchised",
+            furnDataId = "7891",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120260,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120260&quality=2",
+            name = "Ancestors and the Dunmer (Abridged)",
+            allNames = "Ancestors and the Dunmer (Abridged)",
+            furnDataId = "2662",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120183,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120183&quality=2",
+            name = "Ancient Scrolls of the Dwemer I-B",
+            allNames = "Ancient Scrolls of the Dwemer I-B",
+            furnDataId = "2585",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120175,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120175&quality=2",
+            name = "Ancient Scrolls of the Dwemer II",
+            allNames = "Ancient Scrolls of the Dwemer II",
+            furnDataId = "2577",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120176,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120176&quality=2",
+            name = "Ancient Scrolls of the Dwemer III",
+            allNames = "Ancient Scrolls of the Dwemer III",
+            furnDataId = "2578",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120189,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120189&quality=2",
+            name = "Ancient Scrolls of the Dwemer IV",
+            allNames = "Ancient Scrolls of the Dwemer IV",
+            furnDataId = "2591",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120177,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120177&quality=2",
+            name = "Ancient Scrolls of the Dwemer V",
+            allNames = "Ancient Scrolls of the Dwemer V",
+            furnDataId = "2579",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120178,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120178&quality=2",
+            name = "Ancient Scrolls of the Dwemer VI",
+            allNames = "Ancient Scrolls of the Dwemer VI",
+            furnDataId = "2580",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120185,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120185&quality=2",
+            name = "Ancient Scrolls of the Dwemer VIII",
+            allNames = "Ancient Scrolls of the Dwemer VIII",
+            furnDataId = "2587",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120179,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120179&quality=2",
+            name = "Ancient Scrolls of the Dwemer X",
+            allNames = "Ancient Scrolls of the Dwemer X",
+            furnDataId = "2581",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120180,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120180&quality=2",
+            name = "Ancient Scrolls of the Dwemer XI",
+            allNames = "Ancient Scrolls of the Dwemer XI",
+            furnDataId = "2582",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120174,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120174&quality=2",
+            name = "Ancient Scrolls of the Dwemer, I-A",
+            allNames = "Ancient Scrolls of the Dwemer, I-A",
+            furnDataId = "2576",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 203392,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203392&quality=3",
+            name = "Anequina and Pellitine: An Introduction",
+            allNames = "Anequina and Pellitine: An Introduction",
+            furnDataId = "9695",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Northern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120181,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120181&quality=2",
+            name = "Antecedents of Dwemer Law",
+            allNames = "Antecedents of Dwemer Law",
+            furnDataId = "2583",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_duc_housinglibstalactite002.dds",
+            itemId = 198393,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=198393&quality=3",
+            name = "Apocrypha Book Pile, Large Twisted",
+            allNames = "Apocrypha Book Pile, Large Twisted",
+            furnDataId = "9387",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbookstack005.dds",
+            itemId = 198428,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=198428&quality=3",
+            name = "Apocrypha Book Pile, Medium",
+            allNames = "Apocrypha Book Pile, Medium",
+            furnDataId = "9422",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbookstack002.dds",
+            itemId = 198427,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=198427&quality=2",
+            name = "Apocrypha Book Pile, Short",
+            allNames = "Apocrypha Book Pile, Short",
+            furnDataId = "9421",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_str_libbooksfloating001.dds",
+            itemId = 198440,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=198440&quality=3",
+            name = "Apocrypha Book Piles, Floating",
+            allNames = "Apocrypha Book Piles, Floating",
+            furnDataId = "9434",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 194460,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194460&quality=3",
+            name = "Apocrypha, Apocrypha",
+            allNames = "Apocrypha, Apocrypha",
+            furnDataId = "8988",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/book_arquitius_002.dds",
+            itemId = 203203,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203203&quality=5",
+            name = "Apocryphal Pages",
+            allNames = "Apocryphal Pages",
+            furnDataId = "",
+            furnCategory = "",
+            description = "A mysterious tome containing all of the books in the Apocryphal Pages collection.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_bookofwhispers001.dds",
+            itemId = 197704,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197704&quality=5",
+            name = "Apocryphal Tome",
+            allNames = "Apocryphal Tome",
+            furnDataId = "0",
+            furnCategory = ": (:)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120200,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120200&quality=2",
+            name = "Arcana Restored",
+            allNames = "Arcana Restored",
+            furnDataId = "2602",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
+            itemId = 203465,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203465&quality=3",
+            name = "Archmagister Mavon's Ascension",
+            allNames = "Archmagister Mavon's Ascension",
+            furnDataId = "9768",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120263,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120263&quality=2",
+            name = "Argonians Among Us",
+            allNames = "Argonians Among Us",
+            furnDataId = "2665",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203400,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203400&quality=3",
+            name = "Artaeum Lost",
+            allNames = "Artaeum Lost",
+            furnDataId = "9703",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Summerset.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120360,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120360&quality=2",
+            name = "Arx Corinium: First Seed Report",
+            allNames = "Arx Corinium: First Seed Report",
+            furnDataId = "2762",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120116,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120116&quality=2",
+            name = "Aspects of Lord Hircine",
+            allNames = "Aspects of Lord Hircine",
+            furnDataId = "2518",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120327,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120327&quality=2",
+            name = "Aurbic Enigma 4: The Elden Tree",
+            allNames = "Aurbic Enigma 4: The Elden Tree",
+            furnDataId = "2729",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120278,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120278&quality=2",
+            name = "Ayleid Cities of Valenwood",
+            allNames = "Ayleid Cities of Valenwood",
+            furnDataId = "2680",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120240,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120240&quality=2",
+            name = "Ayleid Inscriptions Translated",
+            allNames = "Ayleid Inscriptions Translated",
+            furnDataId = "2642",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120326,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120326&quality=2",
+            name = "Ayleid Survivals in Valenwood",
+            allNames = "Ayleid Survivals in Valenwood",
+            furnDataId = "2728",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120143,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120143&quality=2",
+            name = "Ayrenn: The Unforeseen Queen",
+            allNames = "Ayrenn: The Unforeseen Queen",
+            furnDataId = "2545",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 203396,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203396&quality=3",
+            name = "Azurah's Crossing",
+            allNames = "Azurah's Crossing",
+            furnDataId = "9699",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Southern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120114,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120114&quality=2",
+            name = "Bangkorai, Shield of High Rock",
+            allNames = "Bangkorai, Shield of High Rock",
+            furnDataId = "2516",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120210,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120210&quality=2",
+            name = "Before the Ages of Man: Dawn Era",
+            allNames = "Before the Ages of Man: Dawn Era",
+            furnDataId = "2612",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120211,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120211&quality=2",
+            name = "Before the Ages of Man: Merethic Era",
+            allNames = "Before the Ages of Man: Merethic Era",
+            furnDataId = "2613",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_openbook001.dds",
+            itemId = 203434,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203434&quality=3",
+            name = "Beverages for the Bereaved",
+            allNames = "Beverages for the Bereaved",
+            furnDataId = "9737",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203404,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203404&quality=3",
+            name = "Birds of Wrothgar",
+            allNames = "Birds of Wrothgar",
+            furnDataId = "9707",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Wrothgar.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 194446,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194446&quality=3",
+            name = "Bisnensel: Our Ancient Roots",
+            allNames = "Bisnensel: Our Ancient Roots",
+            furnDataId = "8974",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120104,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120104&quality=2",
+            name = "Bloodfiends of Rivenspire",
+            allNames = "Bloodfiends of Rivenspire",
+            furnDataId = "2506",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 194445,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194445&quality=3",
+            name = "Boethiah and Her Avatars",
+            allNames = "Boethiah and Her Avatars",
+            furnDataId = "8973",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120145,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120145&quality=2",
+            name = "Boethiah's Proving",
+            allNames = "Boethiah's Proving",
+            furnDataId = "2547",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_exc_floatingbooks003.dds",
+            itemId = 197747,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197747&quality=4",
+            name = "Book Pile, Circle Levitating",
+            allNames = "Book Pile, Circle Levitating",
+            furnDataId = "9211",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbookstack004.dds",
+            itemId = 197545,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197545&quality=3",
+            name = "Book Pile, Large",
+            allNames = "Book Pile, Large",
+            furnDataId = "9102",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_exc_bobbingbooks002.dds",
+            itemId = 197746,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197746&quality=4",
+            name = "Book Pile, Spiral Levitating",
+            allNames = "Book Pile, Spiral Levitating",
+            furnDataId = "9210",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_exc_bobbingbooks002.dds",
+            itemId = 197745,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197745&quality=3",
+            name = "Book Pile, Vertical Levitating",
+            allNames = "Book Pile, Vertical Levitating",
+            furnDataId = "9209",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_row002.dds",
+            itemId = 121045,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=121045&quality=2",
+            name = "Book Row, Decorative",
+            allNames = "Book Row, Decorative",
+            furnDataId = "3186",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_fur_booksfloatingset001.dds",
+            itemId = 139164,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139164&quality=2",
+            name = "Book Row, Levitating",
+            allNames = "Book Row, Levitating",
+            furnDataId = "5115",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_row005.dds",
+            itemId = 121047,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=121047&quality=2",
+            name = "Book Row, Long",
+            allNames = "Book Row, Long",
+            furnDataId = "3188",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_stack002.dds",
+            itemId = 121056,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=121056&quality=2",
+            name = "Book Stack, Decorative",
+            allNames = "Book Stack, Decorative",
+            furnDataId = "3196",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_fur_booksfloatingset003.dds",
+            itemId = 139165,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139165&quality=2",
+            name = "Book Stack, Levitating",
+            allNames = "Book Stack, Levitating",
+            furnDataId = "5116",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_bookpile001.dds",
+            itemId = 118482,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118482&quality=2",
+            name = "Book Stack, Tall",
+            allNames = "Book Stack, Tall",
+            furnDataId = "1825",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbookstack001.dds",
+            itemId = 197544,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197544&quality=2",
+            name = "Book Stack, Trio",
+            allNames = "Book Stack, Trio",
+            furnDataId = "9101",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_books002.dds",
+            itemId = 187862,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187862&quality=2",
+            name = "Book Stack, Well-Read",
+            allNames = "Book Stack, Well-Read",
+            furnDataId = "8520",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_farwallfloatingbooks001.dds",
+            itemId = 182285,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=182285&quality=3",
+            name = "Book Wall, Levitating",
+            allNames = "Book Wall, Levitating",
+            furnDataId = "8153",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 130211,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=130211&quality=4",
+            name = "Books, Ordered Row",
+            allNames = "Books, Ordered Row",
+            furnDataId = "3960",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book003.dds",
+            itemId = 130210,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=130210&quality=4",
+            name = "Books, Scattered Row",
+            allNames = "Books, Scattered Row",
+            furnDataId = "3959",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_bookpile005.dds",
+            itemId = 156644,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=156644&quality=5",
+            name = "Books, Towering Pile",
+            allNames = "Books, Towering Pile",
+            furnDataId = "6572",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollargonian001.dds",
+            itemId = 118711,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118711&quality=5",
+            name = "Bounty Sheet: Argonian Male",
+            allNames = "Bounty Sheet: Argonian Male",
+            furnDataId = "1888",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscroll001.dds",
+            itemId = 118709,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118709&quality=5",
+            name = "Bounty Sheet: Breton Man",
+            allNames = "Bounty Sheet: Breton Man",
+            furnDataId = "1886",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollfemale001.dds",
+            itemId = 118712,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118712&quality=5",
+            name = "Bounty Sheet: Breton Woman",
+            allNames = "Bounty Sheet: Breton Woman",
+            furnDataId = "1889",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrolloldmale001.dds",
+            itemId = 118715,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118715&quality=5",
+            name = "Bounty Sheet: Colovian Man",
+            allNames = "Bounty Sheet: Colovian Man",
+            furnDataId = "1892",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollaltmer001.dds",
+            itemId = 118710,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118710&quality=5",
+            name = "Bounty Sheet: High Elf Male",
+            allNames = "Bounty Sheet: High Elf Male",
+            furnDataId = "1887",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollmale001.dds",
+            itemId = 118714,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118714&quality=5",
+            name = "Bounty Sheet: Imperial Man",
+            allNames = "Bounty Sheet: Imperial Man",
+            furnDataId = "1891",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollkhajiit001.dds",
+            itemId = 118713,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118713&quality=5",
+            name = "Bounty Sheet: Khajiiti Male",
+            allNames = "Bounty Sheet: Khajiiti Male",
+            furnDataId = "1890",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollorc001.dds",
+            itemId = 118716,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118716&quality=5",
+            name = "Bounty Sheet: Orc Female",
+            allNames = "Bounty Sheet: Orc Female",
+            furnDataId = "1893",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_wantedposterscrollredguard001.dds",
+            itemId = 118717,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118717&quality=5",
+            name = "Bounty Sheet: Orc Male",
+            allNames = "Bounty Sheet: Orc Male",
+            furnDataId = "1894",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203431,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203431&quality=3",
+            name = "Brave Little Scrib and the River Troll",
+            allNames = "Brave Little Scrib and the River Troll",
+            furnDataId = "9734",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120361,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120361&quality=2",
+            name = "Burning Vestige, Vol. I",
+            allNames = "Burning Vestige, Vol. I",
+            furnDataId = "2763",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203467,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203467&quality=3",
+            name = "Captain Burwarah's Records",
+            allNames = "Captain Burwarah's Records",
+            furnDataId = "9770",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 203385,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203385&quality=3",
+            name = "Cathedral Hierarchy",
+            allNames = "Cathedral Hierarchy",
+            furnDataId = "9688",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Gold Coast.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120352,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120352&quality=2",
+            name = "Chaotic Creatia: The Azure Plasm",
+            allNames = "Chaotic Creatia: The Azure Plasm",
+            furnDataId = "2754",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 121046,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=121046&quality=2",
+            name = "Cheeses of Tamriel",
+            allNames = "Cheeses of Tamriel",
+            furnDataId = "3187",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Master Chef Gilbard Larocque's timeless treatise on cheeses across Tamriel, from Skyrim to Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203436,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203436&quality=3",
+            name = "Ciphers of the Eye",
+            allNames = "Ciphers of the Eye",
+            furnDataId = "9739",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
+            itemId = 120132,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120132&quality=3",
+            name = "Circus of Cheerful Slaughter",
+            allNames = "Circus of Cheerful Slaughter",
+            furnDataId = "2534",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120362,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120362&quality=2",
+            name = "Civility and Etiquette V. 5: Undead",
+            allNames = "Civility and Etiquette V. 5: Undead",
+            furnDataId = "2764",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120168,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120168&quality=2",
+            name = "Civility and Etiquette: Wood Orcs I",
+            allNames = "Civility and Etiquette: Wood Orcs I",
+            furnDataId = "2570",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120300,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120300&quality=2",
+            name = "Clans of the Reach: A Guide",
+            allNames = "Clans of the Reach: A Guide",
+            furnDataId = "2702",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_inc_scrollplate001.dds",
+            itemId = 134363,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134363&quality=2",
+            name = "Clockwork Sequence Plaque, Single",
+            allNames = "Clockwork Sequence Plaque, Single",
+            furnDataId = "4611",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_inc_scrollfolded001.dds",
+            itemId = 134361,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134361&quality=3",
+            name = "Clockwork Sequence Plaques, Folded",
+            allNames = "Clockwork Sequence Plaques, Folded",
+            furnDataId = "4609",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_inc_scrollopen001.dds",
+            itemId = 134362,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134362&quality=3",
+            name = "Clockwork Sequence Plaques, Unfolded",
+            allNames = "Clockwork Sequence Plaques, Unfolded",
+            furnDataId = "4610",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120349,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120349&quality=2",
+            name = "Cohort Briefing: Arenthia",
+            allNames = "Cohort Briefing: Arenthia",
+            furnDataId = "2751",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookopen001.dds",
+            itemId = 130093,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=130093&quality=4",
+            name = "Coldharbour Compact",
+            allNames = "Coldharbour Compact",
+            furnDataId = "3917",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120323,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120323&quality=2",
+            name = "Common Arms of Valenwood",
+            allNames = "Common Arms of Valenwood",
+            furnDataId = "2725",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120310,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120310&quality=2",
+            name = "Crimes of the Daggerfall Covenant",
+            allNames = "Crimes of the Daggerfall Covenant",
+            furnDataId = "2712",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203427,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203427&quality=3",
+            name = "Critter Dangers: Telvanni Peninsula",
+            allNames = "Critter Dangers: Telvanni Peninsula",
+            furnDataId = "9730",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120198,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120198&quality=2",
+            name = "Crow and Raven: Three Short Fables",
+            allNames = "Crow and Raven: Three Short Fables",
+            furnDataId = "2600",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookopen001.dds",
+            itemId = 134257,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134257&quality=3",
+            name = "Daedra Dossier: Cold-Flame Atronach",
+            allNames = "Daedra Dossier: Cold-Flame Atronach",
+            furnDataId = "4505",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Being an autobiographical account of Denogorath the Dread Archivist's quest to bring the Cold-Flame Atronach's chilling beauty to Coldharbour.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 194443,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194443&quality=3",
+            name = "Daedra Dossier: The Titans",
+            allNames = "Daedra Dossier: The Titans",
+            furnDataId = "8971",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book001.dds",
+            itemId = 130212,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=130212&quality=4",
+            name = "Daedra Worship: The Ayleids",
+            allNames = "Daedra Worship: The Ayleids",
+            furnDataId = "3961",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookpile001.dds",
+            itemId = 134265,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134265&quality=3",
+            name = "Daedric Books, Piled",
+            allNames = "Daedric Books, Piled",
+            furnDataId = "4513",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookpile003.dds",
+            itemId = 134266,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134266&quality=2",
+            name = "Daedric Books, Stacked",
+            allNames = "Daedric Books, Stacked",
+            furnDataId = "4514",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 203437,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203437&quality=3",
+            name = "Daedric Worship and the Dark Elves",
+            allNames = "Daedric Worship and the Dark Elves",
+            furnDataId = "9740",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_dbhledger001.dds",
+            itemId = 119953,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=119953&quality=5",
+            name = "Dark Ledger",
+            allNames = "Dark Ledger",
+            furnDataId = "2393",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Every Dark Brotherhood Sanctuary has a book that balances the costs of living against the wages of death.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120299,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120299&quality=2",
+            name = "Dark Ruins",
+            allNames = "Dark Ruins",
+            furnDataId = "2701",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120221,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120221&quality=2",
+            name = "Darkest Darkness",
+            allNames = "Darkest Darkness",
+            furnDataId = "2623",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 197918,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197918&quality=3",
+            name = "Deal with a Daedric Prince",
+            allNames = "Deal with a Daedric Prince",
+            furnDataId = "9258",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203433,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203433&quality=3",
+            name = "Denizens of Apocrypha",
+            allNames = "Denizens of Apocrypha",
+            furnDataId = "9736",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 134961,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134961&quality=3",
+            name = "Dibella's Mysteries and Revelations",
+            allNames = "Dibella's Mysteries and Revelations",
+            furnDataId = "4947",
+            furnCategory = "Library:Literature (4:62)",
+            description = "In which Sibyl Augustine Viliane answers the questions of several new novices to the House of Dibella on a beautiful spring day.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120107,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120107&quality=2",
+            name = "Dire Legends of the Doomcrag",
+            allNames = "Dire Legends of the Doomcrag",
+            furnDataId = "2509",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
+            itemId = 194459,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194459&quality=3",
+            name = "Dream of a Thousand Dreamers",
+            allNames = "Dream of a Thousand Dreamers",
+            furnDataId = "8987",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120289,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120289&quality=2",
+            name = "Dreamwalkers",
+            allNames = "Dreamwalkers",
+            furnDataId = "2691",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203454,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203454&quality=3",
+            name = "Dusksaber Report",
+            allNames = "Dusksaber Report",
+            furnDataId = "9757",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120255,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120255&quality=2",
+            name = "A Shallow Pool",
+            allNames = "A Shallow Pool",
+            furnDataId = "2657",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120182,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120182&quality=2",
+            name = "Dwarven Automatons",
+            allNames = "Dwarven Automatons",
+            furnDataId = "2584",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120294,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120294&quality=2",
+            name = "Dwemer Dungeons: What I Know",
+            allNames = "Dwemer Dungeons: What I Know",
+            furnDataId = "2696",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120186,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120186&quality=2",
+            name = "Dwemer Inquiries Volume I",
+            allNames = "Dwemer Inquiries Volume I",
+            furnDataId = "2588",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120187,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120187&quality=2",
+            name = "Dwemer Inquiries Volume II",
+            allNames = "Dwemer Inquiries Volume II",
+            furnDataId = "2589",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120188,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120188&quality=2",
+            name = "Dwemer Inquiries Volume III",
+            allNames = "Dwemer Inquiries Volume III",
+            furnDataId = "2590",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120212,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120212&quality=2",
+            name = "Ebony Blade History",
+            allNames = "Ebony Blade History",
+            furnDataId = "2614",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120345,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120345&quality=2",
+            name = "Elven Eyes, Elven Spies",
+            allNames = "Elven Eyes, Elven Spies",
+            furnDataId = "2747",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_inc_bookopen001.dds",
+            itemId = 203378,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203378&quality=3",
+            name = "Engine of Expression",
+            allNames = "Engine of Expression",
+            furnDataId = "9681",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Clockwork City.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120245,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120245&quality=2",
+            name = "Eulogy for Emperor Varen",
+            allNames = "Eulogy for Emperor Varen",
+            furnDataId = "2647",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120350,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120350&quality=2",
+            name = "Exegesis of Merid-Nunda",
+            allNames = "Exegesis of Merid-Nunda",
+            furnDataId = "2752",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scryingbookdragon001.dds",
+            itemId = 204780,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204780&quality=3",
+            name = "Fable of the Dragon",
+            allNames = "Fable of the Dragon",
+            furnDataId = "10064",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A beautiful replica of the Fable of the Dragon, taken from the shelves of the Scholarium beneath Eyevea.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scryingbookgriffin001.dds",
+            itemId = 204782,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204782&quality=3",
+            name = "Fable of the Gryphon",
+            allNames = "Fable of the Gryphon",
+            furnDataId = "10066",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A beautiful replica of the Fable of the Gryphon, taken from the shelves of the Scholarium beneath Eyevea.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scryingbookindrik001.dds",
+            itemId = 204783,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204783&quality=3",
+            name = "Fable of the Indrik",
+            allNames = "Fable of the Indrik",
+            furnDataId = "10067",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A beautiful replica of the Fable of the Indrik, taken from the shelves of the Scholarium beneath Eyevea.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scryingbooknetch001.dds",
+            itemId = 204790,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204790&quality=3",
+            name = "Fable of the Netch",
+            allNames = "Fable of the Netch",
+            furnDataId = "10074",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A beautiful replica of the Fable of the Netch, taken from the shelves of the Scholarium beneath Eyevea.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120254,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120254&quality=2",
+            name = "Fair Argonian Maiden",
+            allNames = "Fair Argonian Maiden",
+            furnDataId = "2656",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120315,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120315&quality=2",
+            name = "Fang of the Sea Vipers",
+            allNames = "Fang of the Sea Vipers",
+            furnDataId = "2717",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203451,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203451&quality=3",
+            name = "Fanlyrion's Journal",
+            allNames = "Fanlyrion's Journal",
+            furnDataId = "9754",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_farfloatingbookstack003.dds",
+            itemId = 182225,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=182225&quality=4",
+            name = "Fargrave Book Stack, Levitating",
+            allNames = "Fargrave Book Stack, Levitating",
+            furnDataId = "8093",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_dedpapers001.dds",
+            itemId = 182217,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=182217&quality=1",
+            name = "Fargrave Clutter, Papers",
+            allNames = "Fargrave Clutter, Papers",
+            furnDataId = "8085",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203452,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203452&quality=3",
+            name = "First Mate Dalmir's Log",
+            allNames = "First Mate Dalmir's Log",
+            furnDataId = "9755",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_u42fivecompanionsbook001.dds",
+            itemId = 204410,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204410&quality=5",
+            name = "Five Companions Tome",
+            allNames = "Five Companions Tome",
+            furnDataId = "9847",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120234,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120234&quality=2",
+            name = "Flesh to Cut from Bone",
+            allNames = "Flesh to Cut from Bone",
+            furnDataId = "2636",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_blackbook001.dds",
+            itemId = 199126,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=199126&quality=4",
+            name = "Forged Black Book",
+            allNames = "Forged Black Book",
+            furnDataId = "9544",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A remarkable simulacrum of the real thing. Mind your sanity, now. This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120093,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120093&quality=2",
+            name = "Founding of the Spirit Wardens",
+            allNames = "Founding of the Spirit Wardens",
+            furnDataId = "2495",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120152,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120152&quality=2",
+            name = "Fragmentae Abyssum Hermaeus Morus",
+            allNames = "Fragmentae Abyssum Hermaeus Morus",
+            furnDataId = "2554",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120256,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120256&quality=2",
+            name = "Freedom's Price",
+            allNames = "Freedom's Price",
+            furnDataId = "2658",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 146047,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=146047&quality=3",
+            name = "From Old Life To New",
+            allNames = "From Old Life To New",
+            furnDataId = "5834",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A Tale of Two Festivals, by Botjolf Meadwarmer.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120241,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120241&quality=2",
+            name = "Frontier, Conquest",
+            allNames = "Frontier, Conquest",
+            furnDataId = "2643",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203464,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203464&quality=3",
+            name = "Fynboar the Resurrected",
+            allNames = "Fynboar the Resurrected",
+            furnDataId = "9767",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120134,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120134&quality=2",
+            name = "Galerion the Mystic",
+            allNames = "Galerion the Mystic",
+            furnDataId = "2536",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120338,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120338&quality=2",
+            name = "Gifts of the Nereids",
+            allNames = "Gifts of the Nereids",
+            furnDataId = "2740",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 194448,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194448&quality=3",
+            name = "Glorious Upheaval",
+            allNames = "Glorious Upheaval",
+            furnDataId = "8976",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120162,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120162&quality=2",
+            name = "Gods and Worship in Tamriel",
+            allNames = "Gods and Worship in Tamriel",
+            furnDataId = "2564",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 178499,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178499&quality=5",
+            name = "Goldleaf Acquisitions, Manager's Notes",
+            allNames = "Goldleaf Acquisitions, Manager's Notes",
+            furnDataId = "7888",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 194441,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194441&quality=3",
+            name = "Graccus' Journal, Volume I",
+            allNames = "Graccus' Journal, Volume I",
+            furnDataId = "8969",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120135,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120135&quality=2",
+            name = "Great Harbingers of the Companions",
+            allNames = "Great Harbingers of the Companions",
+            furnDataId = "2537",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120271,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120271&quality=2",
+            name = "Green Lady, My Lady",
+            allNames = "Green Lady, My Lady",
+            furnDataId = "2673",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120086,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120086&quality=2",
+            name = "Guide to the Daggerfall Covenant",
+            allNames = "Guide to the Daggerfall Covenant",
+            furnDataId = "2488",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120279,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120279&quality=2",
+            name = "Guide to the Ebonheart Pact",
+            allNames = "Guide to the Ebonheart Pact",
+            furnDataId = "2681",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120207,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120207&quality=2",
+            name = "Guild Memo on Soul-Trapping",
+            allNames = "Guild Memo on Soul-Trapping",
+            furnDataId = "2609",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120381,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120381&quality=2",
+            name = "Guild Reprint: Alik'r Desert Lore",
+            allNames = "Guild Reprint: Alik'r Desert Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Alik'r Desert Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120401,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120401&quality=2",
+            name = "Guild Reprint: Auridon Lore",
+            allNames = "Guild Reprint: Auridon Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Auridon Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120380,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120380&quality=2",
+            name = "Guild Reprint: Bangkorai Lore",
+            allNames = "Guild Reprint: Bangkorai Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Bangkorai Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120385,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120385&quality=2",
+            name = "Guild Reprint: Biographies",
+            allNames = "Guild Reprint: Biographies",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Biographies\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120405,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120405&quality=2",
+            name = "Guild Reprint: Coldharbour Lore",
+            allNames = "Guild Reprint: Coldharbour Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Coldharbour Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120384,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120384&quality=2",
+            name = "Guild Reprint: Daedric Princes",
+            allNames = "Guild Reprint: Daedric Princes",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Daedric Princes\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120399,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120399&quality=2",
+            name = "Guild Reprint: Deshaan Lore",
+            allNames = "Guild Reprint: Deshaan Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Deshaan Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120386,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120386&quality=2",
+            name = "Guild Reprint: Divines and Deities",
+            allNames = "Guild Reprint: Divines and Deities",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Divines and Deities\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120387,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120387&quality=2",
+            name = "Guild Reprint: Dungeon Lore",
+            allNames = "Guild Reprint: Dungeon Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Dungeon Lore\" collection, in 17 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120388,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120388&quality=2",
+            name = "Guild Reprint: Dwemer",
+            allNames = "Guild Reprint: Dwemer",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Dwemer\" collection, in 16 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120398,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120398&quality=2",
+            name = "Guild Reprint: Eastmarch Lore",
+            allNames = "Guild Reprint: Eastmarch Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Eastmarch Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120377,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120377&quality=2",
+            name = "Guild Reprint: Glenumbra Lore",
+            allNames = "Guild Reprint: Glenumbra Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Glenumbra Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120402,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120402&quality=2",
+            name = "Guild Reprint: Grahtwood Lore",
+            allNames = "Guild Reprint: Grahtwood Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Grahtwood Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120403,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120403&quality=2",
+            name = "Guild Reprint: Greenshade Lore",
+            allNames = "Guild Reprint: Greenshade Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Greenshade Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120389,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120389&quality=2",
+            name = "Guild Reprint: Legends of Nirn",
+            allNames = "Guild Reprint: Legends of Nirn",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Legends of Nirn\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120390,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120390&quality=2",
+            name = "Guild Reprint: Literature",
+            allNames = "Guild Reprint: Literature",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Literature\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120391,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120391&quality=2",
+            name = "Guild Reprint: Magic and Magicka",
+            allNames = "Guild Reprint: Magic and Magicka",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Magic and Magicka\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120397,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120397&quality=2",
+            name = "Guild Reprint: Malabal Tor Lore",
+            allNames = "Guild Reprint: Malabal Tor Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Malabal Tor Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120392,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120392&quality=2",
+            name = "Guild Reprint: Myths of the Mundus",
+            allNames = "Guild Reprint: Myths of the Mundus",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Myths of the Mundus\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120393,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120393&quality=2",
+            name = "Guild Reprint: Oblivion Lore",
+            allNames = "Guild Reprint: Oblivion Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Oblivion Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120394,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120394&quality=2",
+            name = "Guild Reprint: Poetry and Song",
+            allNames = "Guild Reprint: Poetry and Song",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Poetry and Song\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120404,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120404&quality=2",
+            name = "Guild Reprint: Reaper's March Lore",
+            allNames = "Guild Reprint: Reaper's March Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Reaper's March Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120379,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120379&quality=2",
+            name = "Guild Reprint: Rivenspire Lore",
+            allNames = "Guild Reprint: Rivenspire Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Rivenspire Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120382,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120382&quality=2",
+            name = "Guild Reprint: Shadowfen Lore",
+            allNames = "Guild Reprint: Shadowfen Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Shadowfen Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120396,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120396&quality=2",
+            name = "Guild Reprint: Stonefalls Lore",
+            allNames = "Guild Reprint: Stonefalls Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Stonefalls Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120378,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120378&quality=2",
+            name = "Guild Reprint: Stormhaven Lore",
+            allNames = "Guild Reprint: Stormhaven Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Stormhaven Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+    }
+    return literature
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
@@ -0,0 +1,2010 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 2 of literature, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.literature = Data.chunks.literature or {}
+Data.chunks.literature[2] = function()
+    local literature = {
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120395,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120395&quality=2",
+            name = "Guild Reprint: Tamriel History",
+            allNames = "Guild Reprint: Tamriel History",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"Tamriel History\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_inc_book002.dds",
+            itemId = 120400,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120400&quality=2",
+            name = "Guild Reprint: The Rift Lore",
+            allNames = "Guild Reprint: The Rift Lore",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"The Rift Lore\" collection, in 10 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_row002.dds",
+            itemId = 120383,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120383&quality=3",
+            name = "Guild Reprint: The Trial of Eyevea",
+            allNames = "Guild Reprint: The Trial of Eyevea",
+            furnDataId = "",
+            furnCategory = "",
+            description = "Mages Guild reprinting of the \"The Trial of Eyevea\" collection, in 4 individual books for use in personal libraries.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 120184,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120184&quality=2",
+            name = "Guylaine's Dwemer Architecture",
+            allNames = "Guylaine's Dwemer Architecture",
+            furnDataId = "2586",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dwemer\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 208358,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=208358&quality=5",
+            name = "Handbook for New Homeowners",
+            allNames = "Handbook for New Homeowners",
+            furnDataId = "10242",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A handy all-in-one reference for new homeowners.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 194455,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194455&quality=3",
+            name = "Havocrel: Strangers from Oblivion",
+            allNames = "Havocrel: Strangers from Oblivion",
+            furnDataId = "8983",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 194455,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194455&quality=3",
+            name = "Havocrel: Strangers from Oblivion",
+            allNames = "Havocrel: Strangers from Oblivion",
+            furnDataId = "8983",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 203417,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203417&quality=3",
+            name = "Herma-Mora: The Woodland Man?",
+            allNames = "Herma-Mora: The Woodland Man?",
+            furnDataId = "9720",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
+            itemId = 203432,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203432&quality=3",
+            name = "History of Necrom: The City of the Dead",
+            allNames = "History of Necrom: The City of the Dead",
+            furnDataId = "9735",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120242,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120242&quality=2",
+            name = "History of the Fighters Guild Pt. 1",
+            allNames = "History of the Fighters Guild Pt. 1",
+            furnDataId = "2644",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120243,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120243&quality=2",
+            name = "History of the Fighters Guild Pt. 2",
+            allNames = "History of the Fighters Guild Pt. 2",
+            furnDataId = "2645",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120106,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120106&quality=2",
+            name = "Horse-Folk of Silverhoof",
+            allNames = "Horse-Folk of Silverhoof",
+            furnDataId = "2508",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120111,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120111&quality=2",
+            name = "House Ravenwatch Proclamation",
+            allNames = "House Ravenwatch Proclamation",
+            furnDataId = "2513",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120108,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120108&quality=2",
+            name = "House Tamrith: A Recent History",
+            allNames = "House Tamrith: A Recent History",
+            furnDataId = "2510",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203469,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203469&quality=3",
+            name = "House Telvanni Song",
+            allNames = "House Telvanni Song",
+            furnDataId = "9772",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120246,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120246&quality=2",
+            name = "House Tharn of Nibenay",
+            allNames = "House Tharn of Nibenay",
+            furnDataId = "2648",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203416,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203416&quality=3",
+            name = "How Rajhin Stole the Book that Knows",
+            allNames = "How Rajhin Stole the Book that Knows",
+            furnDataId = "9719",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
+            itemId = 120407,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120407&quality=3",
+            name = "How the Kwama Lost His Shoes",
+            allNames = "How the Kwama Lost His Shoes",
+            furnDataId = "2780",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Reprint, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scryingbookgeneric001.dds",
+            itemId = "",
+            link = "https://esoitem.uesp.net/itemLink.php?&collectid=12706&quality=5",
+            name = "How to Scribe",
+            allNames = "",
+            furnDataId = "",
+            furnCategory = "Library",
+            description = "Any who possess this tome have, at their fingertips, a comprehensive guide to the art of scribing spells.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120353,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120353&quality=2",
+            name = "I was Summoned by a Mortal",
+            allNames = "I was Summoned by a Mortal",
+            furnDataId = "2755",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 134881,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134881&quality=3",
+            name = "In Defense of Prince Hubalajad",
+            allNames = "In Defense of Prince Hubalajad",
+            furnDataId = "4864",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Lady Cinnabar of Taneth's spirited arguments in favor of a more balanced view of the Ra Gada Prince's accomplishments in the face of adversity.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
+            itemId = 194449,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194449&quality=3",
+            name = "In Dreams We Awaken",
+            allNames = "In Dreams We Awaken",
+            furnDataId = "8977",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120329,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120329&quality=2",
+            name = "In the Company of Wood Orcs",
+            allNames = "In the Company of Wood Orcs",
+            furnDataId = "2731",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_hermaeusmorabook001.dds",
+            itemId = 199119,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=199119&quality=5",
+            name = "Infinite Tome",
+            allNames = "Infinite Tome",
+            furnDataId = "9537",
+            furnCategory = "Library:Literature (4:62)",
+            description = "No matter how many pages you turn, more remain. This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120148,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120148&quality=2",
+            name = "Invocation of Azura",
+            allNames = "Invocation of Azura",
+            furnDataId = "2550",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 194456,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194456&quality=3",
+            name = "Invocation of Hircine",
+            allNames = "Invocation of Hircine",
+            furnDataId = "8984",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkparchment001.dds",
+            itemId = 145403,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145403&quality=2",
+            name = "Jel Parchment",
+            allNames = "Jel Parchment",
+            furnDataId = "5706",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120137,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120137&quality=2",
+            name = "Jorunn the Skald-King",
+            allNames = "Jorunn the Skald-King",
+            furnDataId = "2539",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120366,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120366&quality=2",
+            name = "Josef the Intolerant",
+            allNames = "Josef the Intolerant",
+            furnDataId = "2768",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 194442,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194442&quality=3",
+            name = "Journal of Culanwe",
+            allNames = "Journal of Culanwe",
+            furnDataId = "8970",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203381,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203381&quality=3",
+            name = "Journal of Tsona-Ei, Part Four",
+            allNames = "Journal of Tsona-Ei, Part Four",
+            furnDataId = "9684",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Coldharbour.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203382,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203382&quality=3",
+            name = "Journal of Tsona-Ei, Part One",
+            allNames = "Journal of Tsona-Ei, Part One",
+            furnDataId = "9685",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Coldharbour.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203383,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203383&quality=3",
+            name = "Journal of Tsona-Ei, Part Three",
+            allNames = "Journal of Tsona-Ei, Part Three",
+            furnDataId = "9686",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Coldharbour.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203384,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203384&quality=3",
+            name = "Journal of Tsona-Ei, Part Two",
+            allNames = "Journal of Tsona-Ei, Part Two",
+            furnDataId = "9687",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Coldharbour.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203397,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203397&quality=3",
+            name = "Khunzar-ri and the Lost Alfiq",
+            allNames = "Khunzar-ri and the Lost Alfiq",
+            furnDataId = "9700",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Southern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120317,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120317&quality=2",
+            name = "Kinlord Rilis and the Mages Guild",
+            allNames = "Kinlord Rilis and the Mages Guild",
+            furnDataId = "2719",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120292,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120292&quality=2",
+            name = "Kwama Mining for Fun and Profit",
+            allNames = "Kwama Mining for Fun and Profit",
+            furnDataId = "2694",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203419,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203419&quality=3",
+            name = "Kynmarcher Strix's Journal",
+            allNames = "Kynmarcher Strix's Journal",
+            furnDataId = "9722",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_bookopenburned001.dds",
+            itemId = 203408,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203408&quality=3",
+            name = "Larydeilmo is Sane",
+            allNames = "Larydeilmo is Sane",
+            furnDataId = "9711",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120295,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120295&quality=2",
+            name = "Legend of the Ghost Snake",
+            allNames = "Legend of the Ghost Snake",
+            furnDataId = "2697",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libscroll002.dds",
+            itemId = 197779,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197779&quality=4",
+            name = "Letter from Azandar",
+            allNames = "Letter from Azandar",
+            furnDataId = "9222",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A letter from Azandar al-Cybiades, most likely of a personal nature, and suitable for placement within the home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scrollunsealed002.dds",
+            itemId = 188201,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=188201&quality=4",
+            name = "Letter from Ember",
+            allNames = "Letter from Ember",
+            furnDataId = "8568",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A letter from Ember, most likely of a personal nature, and suitable for placement within the home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_crf_scroll001.dds",
+            itemId = 188202,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=188202&quality=4",
+            name = "Letter from Isobel",
+            allNames = "Letter from Isobel",
+            furnDataId = "8569",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A letter from Isobel Veloise, most likely of a personal nature, and suitable for placement within the home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libpaper001.dds",
+            itemId = 197780,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197780&quality=4",
+            name = "Letter from Sharp",
+            allNames = "Letter from Sharp",
+            furnDataId = "9223",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A letter from Sharp-as-Night, most likely of a personal nature, and suitable for placement within the home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libpaper001.dds",
+            itemId = 211505,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=211505&quality=4",
+            name = "Letter from Tanlorin",
+            allNames = "Letter from Tanlorin",
+            furnDataId = "10390",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A letter from Tanlorin, most likely of a personal nature, and suitable for placement within the home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_riteofpropagationscrollopen001.dds",
+            itemId = 211503,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=211503&quality=4",
+            name = "Letter from Zerith-var",
+            allNames = "Letter from Zerith-var",
+            furnDataId = "10388",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A letter from Zerith-var, most likely of a personal nature, and suitable for placement within the home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_paper001.dds",
+            itemId = 118487,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118487&quality=2",
+            name = "Letter, Personal",
+            allNames = "Letter, Personal",
+            furnDataId = "1826",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
+            itemId = 145923,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145923&quality=3",
+            name = "Lies of the Dread-Father",
+            allNames = "Lies of the Dread-Father",
+            furnDataId = "5828",
+            furnCategory = "Library:Literature (4:62)",
+            description = "The words of Nisswo Xeewulm, preserved exactly as written.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203418,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203418&quality=3",
+            name = "Life in the Camonna Tong",
+            allNames = "Life in the Camonna Tong",
+            furnDataId = "9721",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120318,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120318&quality=2",
+            name = "Life in the Eagle's Shadow",
+            allNames = "Life in the Eagle's Shadow",
+            furnDataId = "2720",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120201,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120201&quality=2",
+            name = "Liminal Bridges",
+            allNames = "Liminal Bridges",
+            furnDataId = "2603",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_dbhlitanyofbloodbook001.dds",
+            itemId = 119951,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=119951&quality=5",
+            name = "Litany of Blood",
+            allNames = "Litany of Blood",
+            furnDataId = "2391",
+            furnCategory = "Library:Literature (4:62)",
+            description = "A replica of the Dark Brotherhood's sinister tome of death.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120341,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120341&quality=2",
+            name = "Litter-Mates of Darkness",
+            allNames = "Litter-Mates of Darkness",
+            furnDataId = "2743",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120113,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120113&quality=2",
+            name = "Living with Lycanthropy",
+            allNames = "Living with Lycanthropy",
+            furnDataId = "2515",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_row003.dds",
+            itemId = 145596,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145596&quality=3",
+            name = "Look upon Their Nothing Eyes",
+            allNames = "Look upon Their Nothing Eyes",
+            furnDataId = "",
+            furnCategory = "",
+            description = "A carefully transcribed collection of all five of Nisswo Xeewulm's cryptic works on the nature of Sithis.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 194458,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194458&quality=3",
+            name = "Lord Hollowjack's Dream Realm",
+            allNames = "Lord Hollowjack's Dream Realm",
+            furnDataId = "8986",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120202,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120202&quality=2",
+            name = "Magic from the Sky",
+            allNames = "Magic from the Sky",
+            furnDataId = "2604",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203460,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203460&quality=3",
+            name = "Malkhest's Journal",
+            allNames = "Malkhest's Journal",
+            furnDataId = "9763",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120203,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120203&quality=2",
+            name = "Manual of Spellcraft",
+            allNames = "Manual of Spellcraft",
+            furnDataId = "2605",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120347,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120347&quality=2",
+            name = "Master Zoaraym's Tale, Part 1",
+            allNames = "Master Zoaraym's Tale, Part 1",
+            furnDataId = "2749",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120348,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120348&quality=2",
+            name = "Master Zoaraym's Tale, Part 2",
+            allNames = "Master Zoaraym's Tale, Part 2",
+            furnDataId = "2750",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203423,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203423&quality=3",
+            name = "Master of the Tides of Fate",
+            allNames = "Master of the Tides of Fate",
+            furnDataId = "9726",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirelabbook003.dds",
+            itemId = 203472,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203472&quality=3",
+            name = "Materials for Novice Necromancers",
+            allNames = "Materials for Novice Necromancers",
+            furnDataId = "9775",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirelabbook003.dds",
+            itemId = 203472,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203472&quality=3",
+            name = "Materials for Novice Necromancers",
+            allNames = "Materials for Novice Necromancers",
+            furnDataId = "9775",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120149,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120149&quality=2",
+            name = "Modern Heretics",
+            allNames = "Modern Heretics",
+            furnDataId = "2551",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120158,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120158&quality=2",
+            name = "Monomyth: \"Shezarr's Song\"",
+            allNames = "Monomyth: \"Shezarr's Song\"",
+            furnDataId = "2560",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120156,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120156&quality=2",
+            name = "Monomyth: Dragon God & Missing God",
+            allNames = "Monomyth: Dragon God & Missing God",
+            furnDataId = "2558",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120157,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120157&quality=2",
+            name = "Monomyth: Lorkhan and Satakal",
+            allNames = "Monomyth: Lorkhan and Satakal",
+            furnDataId = "2559",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120160,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120160&quality=2",
+            name = "Monomyth: The Heart of the World",
+            allNames = "Monomyth: The Heart of the World",
+            furnDataId = "2562",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120159,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120159&quality=2",
+            name = "Monomyth: The Myth of Aurbis",
+            allNames = "Monomyth: The Myth of Aurbis",
+            furnDataId = "2561",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120346,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120346&quality=2",
+            name = "Moon-Sugar for Glossy Fur? Yes!",
+            allNames = "Moon-Sugar for Glossy Fur? Yes!",
+            furnDataId = "2748",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120128,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120128&quality=2",
+            name = "Motalion Necropolis Report",
+            allNames = "Motalion Necropolis Report",
+            furnDataId = "2530",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120265,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120265&quality=2",
+            name = "Mottos of the Dunmeri Great Houses",
+            allNames = "Mottos of the Dunmeri Great Houses",
+            furnDataId = "2667",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203453,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203453&quality=3",
+            name = "Mouth Vabdru's Journal",
+            allNames = "Mouth Vabdru's Journal",
+            furnDataId = "9756",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
+            itemId = 178500,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178500&quality=5",
+            name = "Museum Guild Letter",
+            allNames = "Museum Guild Letter",
+            furnDataId = "7889",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_mushroombook001.dds",
+            itemId = 197710,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197710&quality=4",
+            name = "Mushroom Classification Book",
+            allNames = "Mushroom Classification Book",
+            furnDataId = "9170",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Flip through the illustrated pages of this Telvanni library staple. While it may not share the deep knowledge that mycoturges possess, it can serve as an entertaining conversation starter at your next gathering.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120194,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120194&quality=2",
+            name = "Myths of Sheogorath, Vol. 1",
+            allNames = "Myths of Sheogorath, Vol. 1",
+            furnDataId = "2596",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120195,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120195&quality=2",
+            name = "Myths of Sheogorath, Vol. 2",
+            allNames = "Myths of Sheogorath, Vol. 2",
+            furnDataId = "2597",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120161,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120161&quality=2",
+            name = "Nine Commands of the Eight Divines",
+            allNames = "Nine Commands of the Eight Divines",
+            furnDataId = "2563",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120264,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120264&quality=2",
+            name = "Nords of Skyrim",
+            allNames = "Nords of Skyrim",
+            furnDataId = "2666",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120110,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120110&quality=2",
+            name = "Northpoint: An Assessment",
+            allNames = "Northpoint: An Assessment",
+            furnDataId = "2512",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120213,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120213&quality=2",
+            name = "Noxiphilic Sanguivoria",
+            allNames = "Noxiphilic Sanguivoria",
+            furnDataId = "2615",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120358,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120358&quality=2",
+            name = "Oath of a Dishonored Clan",
+            allNames = "Oath of a Dishonored Clan",
+            furnDataId = "2760",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203409,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203409&quality=3",
+            name = "Oath of the Keepers",
+            allNames = "Oath of the Keepers",
+            furnDataId = "9712",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 203463,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203463&quality=3",
+            name = "Obscure Killers of the North",
+            allNames = "Obscure Killers of the North",
+            furnDataId = "9766",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 197917,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197917&quality=3",
+            name = "Ode to Vaermina",
+            allNames = "Ode to Vaermina",
+            furnDataId = "9257",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120235,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120235&quality=2",
+            name = "Ode to the Tundrastriders",
+            allNames = "Ode to the Tundrastriders",
+            furnDataId = "2637",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203441,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203441&quality=3",
+            name = "On Cipher's Midden",
+            allNames = "On Cipher's Midden",
+            furnDataId = "9744",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203412,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203412&quality=3",
+            name = "On Joining the Keepers of the Dead",
+            allNames = "On Joining the Keepers of the Dead",
+            furnDataId = "9715",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203386,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203386&quality=3",
+            name = "On Minotaurs",
+            allNames = "On Minotaurs",
+            furnDataId = "9689",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Gold Coast.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120224,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120224&quality=2",
+            name = "On Oblivion",
+            allNames = "On Oblivion",
+            furnDataId = "2626",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120288,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120288&quality=2",
+            name = "On Stepping Lightly",
+            allNames = "On Stepping Lightly",
+            furnDataId = "2690",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203393,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203393&quality=3",
+            name = "On Those Who Know Baan Dar",
+            allNames = "On Those Who Know Baan Dar",
+            furnDataId = "9696",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Northern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
+            itemId = 203415,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203415&quality=3",
+            name = "On Tracts Perilous",
+            allNames = "On Tracts Perilous",
+            furnDataId = "9718",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120205,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120205&quality=2",
+            name = "On the Detachment of the Sheath",
+            allNames = "On the Detachment of the Sheath",
+            furnDataId = "2607",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120259,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120259&quality=2",
+            name = "On the Knahaten Flu",
+            allNames = "On the Knahaten Flu",
+            furnDataId = "2661",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120229,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120229&quality=2",
+            name = "On the Nature of Coldharbour",
+            allNames = "On the Nature of Coldharbour",
+            furnDataId = "2631",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 203422,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203422&quality=3",
+            name = "On the Nature of Nymics",
+            allNames = "On the Nature of Nymics",
+            furnDataId = "9725",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120092,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120092&quality=2",
+            name = "Once",
+            allNames = "Once",
+            furnDataId = "2494",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120150,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120150&quality=2",
+            name = "Opusculus Lamae Bal ta Mezzamortie",
+            allNames = "Opusculus Lamae Bal ta Mezzamortie",
+            furnDataId = "2552",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203405,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203405&quality=3",
+            name = "Orc Clans and Symbology",
+            allNames = "Orc Clans and Symbology",
+            furnDataId = "9708",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Wrothgar.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120283,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120283&quality=2",
+            name = "Orcs of Skyrim",
+            allNames = "Orcs of Skyrim",
+            furnDataId = "2685",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120097,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120097&quality=2",
+            name = "Orcs: The Vermin Among Us",
+            allNames = "Orcs: The Vermin Among Us",
+            furnDataId = "2499",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120244,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120244&quality=2",
+            name = "Origin of the Mages Guild",
+            allNames = "Origin of the Mages Guild",
+            furnDataId = "2646",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120098,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120098&quality=2",
+            name = "Our Calling, Our Pledge",
+            allNames = "Our Calling, Our Pledge",
+            furnDataId = "2500",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 203449,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203449&quality=3",
+            name = "Our Dunmer Heritage",
+            allNames = "Our Dunmer Heritage",
+            furnDataId = "9752",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook002.dds",
+            itemId = 203425,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203425&quality=3",
+            name = "Our Puny Allies",
+            allNames = "Our Puny Allies",
+            furnDataId = "9728",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
+            itemId = 118489,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118489&quality=2",
+            name = "Papers, Stack",
+            allNames = "Papers, Stack",
+            furnDataId = "1827",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203461,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203461&quality=3",
+            name = "Parables of Saint Vorys",
+            allNames = "Parables of Saint Vorys",
+            furnDataId = "9764",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 194444,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194444&quality=3",
+            name = "Persistence of Daedric Veneration",
+            allNames = "Persistence of Daedric Veneration",
+            furnDataId = "8972",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 197921,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197921&quality=3",
+            name = "Peryite's Salvation",
+            allNames = "Peryite's Salvation",
+            furnDataId = "9261",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Bastion Nymic.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120274,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120274&quality=2",
+            name = "Pirates of the Abecean",
+            allNames = "Pirates of the Abecean",
+            furnDataId = "2676",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203455,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203455&quality=3",
+            name = "Plague Concoctor's Instructions",
+            allNames = "Plague Concoctor's Instructions",
+            furnDataId = "9758",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203435,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203435&quality=3",
+            name = "Planar Exploration Vol. 14: Darkreave Curators",
+            allNames = "Planar Exploration Vol. 14: Darkreave Curators",
+            furnDataId = "9738",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_fur_desk002.dds",
+            itemId = 134258,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134258&quality=3",
+            name = "Prayer to the Furious One",
+            allNames = "Prayer to the Furious One",
+            furnDataId = "4506",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This ancient invocation has helped Orcs summon up their fury since the days of the first chieftains.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203457,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203457&quality=3",
+            name = "Preparing Necrom Kwama, Fifth Draft",
+            allNames = "Preparing Necrom Kwama, Fifth Draft",
+            furnDataId = "9760",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120236,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120236&quality=2",
+            name = "Proper-Life: Three Chants",
+            allNames = "Proper-Life: Three Chants",
+            furnDataId = "2638",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120209,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120209&quality=2",
+            name = "Proposal: Schools of Magic",
+            allNames = "Proposal: Schools of Magic",
+            furnDataId = "2611",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120359,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120359&quality=2",
+            name = "Protocols of the Court of Contempt",
+            allNames = "Protocols of the Court of Contempt",
+            furnDataId = "2761",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook003.dds",
+            itemId = 203410,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203410&quality=3",
+            name = "Ranks and Titles of House Telvanni",
+            allNames = "Ranks and Titles of House Telvanni",
+            furnDataId = "9713",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120206,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120206&quality=2",
+            name = "Reality and Other Falsehoods",
+            allNames = "Reality and Other Falsehoods",
+            furnDataId = "2608",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120122,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120122&quality=2",
+            name = "Redguards, History and Heroes, V. 1",
+            allNames = "Redguards, History and Heroes, V. 1",
+            furnDataId = "2524",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120123,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120123&quality=2",
+            name = "Redguards, History and Heroes, V. 2",
+            allNames = "Redguards, History and Heroes, V. 2",
+            furnDataId = "2525",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120124,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120124&quality=2",
+            name = "Redguards, History and Heroes, V. 3",
+            allNames = "Redguards, History and Heroes, V. 3",
+            furnDataId = "2526",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120311,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120311&quality=2",
+            name = "Regarding the Ebonheart Pact",
+            allNames = "Regarding the Ebonheart Pact",
+            furnDataId = "2713",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120253,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120253&quality=2",
+            name = "Remember Me",
+            allNames = "Remember Me",
+            furnDataId = "2655",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120248,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120248&quality=2",
+            name = "Return to Orsinium",
+            allNames = "Return to Orsinium",
+            furnDataId = "2650",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120300,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120300&quality=2",
+            name = "Clans of the Reach: A Guide",
+            allNames = "Clans of the Reach: A Guide",
+            furnDataId = "2702",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
+            itemId = 120133,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120133&quality=3",
+            name = "Robier's Vegetable Garden",
+            allNames = "Robier's Vegetable Garden",
+            furnDataId = "2535",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Trial of Eyevea\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120217,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120217&quality=2",
+            name = "Ruminations on the Elder Scrolls",
+            allNames = "Ruminations on the Elder Scrolls",
+            furnDataId = "2619",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 140220,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=140220&quality=4",
+            name = "Rumors of the Spiral Skein",
+            allNames = "Rumors of the Spiral Skein",
+            furnDataId = "5353",
+            furnCategory = "Library:Literature (4:62)",
+            description = "The ravings of a lunatic, or the insights of a prophet? One can only pray never to find out firsthand.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120096,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120096&quality=2",
+            name = "Sacred Rites of the Stonechewers",
+            allNames = "Sacred Rites of the Stonechewers",
+            furnDataId = "2498",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120131,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120131&quality=2",
+            name = "Sacrilege and Mayhem in the Alik'r",
+            allNames = "Sacrilege and Mayhem in the Alik'r",
+            furnDataId = "2533",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120298,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120298&quality=2",
+            name = "Sanctioned Murder",
+            allNames = "Sanctioned Murder",
+            furnDataId = "2700",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
+            itemId = 145597,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145597&quality=3",
+            name = "Scales of Shadow",
+            allNames = "Scales of Shadow",
+            furnDataId = "5827",
+            furnCategory = "Library:Literature (4:62)",
+            description = "The words of Nisswo Xeewulm, preserved exactly as written.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120091,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120091&quality=2",
+            name = "Schemes of the Reachmage",
+            allNames = "Schemes of the Reachmage",
+            furnDataId = "2493",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_scroll_closed002.dds",
+            itemId = 118491,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118491&quality=3",
+            name = "Scroll, Bound",
+            allNames = "Scroll, Bound",
+            furnDataId = "1829",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_scroll_closed001.dds",
+            itemId = 118490,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118490&quality=3",
+            name = "Scroll, Rolled",
+            allNames = "Scroll, Rolled",
+            furnDataId = "1828",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120281,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120281&quality=2",
+            name = "Second Invasion: Reports",
+            allNames = "Second Invasion: Reports",
+            furnDataId = "2683",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120130,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120130&quality=2",
+            name = "Sentinel, the Jewel of Alik'r",
+            allNames = "Sentinel, the Jewel of Alik'r",
+            furnDataId = "2532",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120293,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120293&quality=2",
+            name = "Shad Astula Academy Handbook",
+            allNames = "Shad Astula Academy Handbook",
+            furnDataId = "2695",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120109,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120109&quality=2",
+            name = "Shornhelm, Crown City of the North",
+            allNames = "Shornhelm, Crown City of the North",
+            furnDataId = "2511",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_scrollunsealed001.dds",
+            itemId = 118528,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118528&quality=3",
+            name = "Signed Contract",
+            allNames = "Signed Contract",
+            furnDataId = "1837",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120218,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120218&quality=2",
+            name = "Sithis",
+            allNames = "Sithis",
+            furnDataId = "2620",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203470,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203470&quality=3",
+            name = "Song of Fate",
+            allNames = "Song of Fate",
+            furnDataId = "9773",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120237,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120237&quality=2",
+            name = "Song of the Askelde Men",
+            allNames = "Song of the Askelde Men",
+            furnDataId = "2639",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120308,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120308&quality=2",
+            name = "Songs of the Return, Volume 27",
+            allNames = "Songs of the Return, Volume 27",
+            furnDataId = "2710",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120309,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120309&quality=2",
+            name = "Songs of the Return, Volume 49",
+            allNames = "Songs of the Return, Volume 49",
+            furnDataId = "2711",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120303,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120303&quality=2",
+            name = "Songs of the Return, Volume 5",
+            allNames = "Songs of the Return, Volume 5",
+            furnDataId = "2705",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120364,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120364&quality=2",
+            name = "Soul-Trapping I: An Introduction",
+            allNames = "Soul-Trapping I: An Introduction",
+            furnDataId = "2766",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
+            itemId = 145928,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145928&quality=3",
+            name = "Speakers of Nothing",
+            allNames = "Speakers of Nothing",
+            furnDataId = "5831",
+            furnCategory = "Library:Literature (4:62)",
+            description = "The words of Nisswo Xeewulm, preserved exactly as written.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120225,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120225&quality=2",
+            name = "Spirit of the Daedra",
+            allNames = "Spirit of the Daedra",
+            furnDataId = "2627",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120285,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120285&quality=2",
+            name = "Spirits of Skyrim",
+            allNames = "Spirits of Skyrim",
+            furnDataId = "2687",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
+            itemId = 194447,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194447&quality=3",
+            name = "Stonefire Ritual Tome",
+            allNames = "Stonefire Ritual Tome",
+            furnDataId = "8975",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120250,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120250&quality=2",
+            name = "Suril's Journal",
+            allNames = "Suril's Journal",
+            furnDataId = "2652",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120376,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120376&quality=2",
+            name = "Tamrielic Artifacts Part Three",
+            allNames = "Tamrielic Artifacts Part Three",
+            furnDataId = "2778",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120374,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120374&quality=2",
+            name = "Tamrielic Artifacts, Part One",
+            allNames = "Tamrielic Artifacts, Part One",
+            furnDataId = "2776",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120375,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120375&quality=2",
+            name = "Tamrielic Artifacts, Part Two",
+            allNames = "Tamrielic Artifacts, Part Two",
+            furnDataId = "2777",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120363,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120363&quality=2",
+            name = "Tempest Island Briefing",
+            allNames = "Tempest Island Briefing",
+            furnDataId = "2765",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_row004.dds",
+            itemId = 126792,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126792&quality=3",
+            name = "Temple Doctrine: The 36 Lessons",
+            allNames = "Temple Doctrine: The 36 Lessons",
+            furnDataId = "",
+            furnCategory = "",
+            description = "All 36 Sermons, individually bound for use in personal libraries and family shrines.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120319,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120319&quality=2",
+            name = "Thalmor Handbill",
+            allNames = "Thalmor Handbill",
+            furnDataId = "2721",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
+            itemId = 145926,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145926&quality=3",
+            name = "That of Void",
+            allNames = "That of Void",
+            furnDataId = "5829",
+            furnCategory = "Library:Literature (4:62)",
+            description = "The words of Nisswo Xeewulm, preserved exactly as written.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120368,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120368&quality=2",
+            name = "The Adabal-a",
+            allNames = "The Adabal-a",
+            furnDataId = "2770",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120142,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120142&quality=2",
+            name = "The All-Beneficent King Fahara'jad",
+            allNames = "The All-Beneficent King Fahara'jad",
+            furnDataId = "2544",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120369,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120369&quality=2",
+            name = "The Amulet of Kings",
+            allNames = "The Amulet of Kings",
+            furnDataId = "2771",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203394,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203394&quality=3",
+            name = "The Angry Alfiq: A Collection",
+            allNames = "The Angry Alfiq: A Collection",
+            furnDataId = "9697",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Northern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120154,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120154&quality=2",
+            name = "The Anuad Paraphrased",
+            allNames = "The Anuad Paraphrased",
+            furnDataId = "2556",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120169,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120169&quality=2",
+            name = "The Art of Kwama Egg Cooking",
+            allNames = "The Art of Kwama Egg Cooking",
+            furnDataId = "2571",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120102,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120102&quality=2",
+            name = "The Barrows of Westmark Moor",
+            allNames = "The Barrows of Westmark Moor",
+            furnDataId = "2504",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120230,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120230&quality=2",
+            name = "The Battle of Glenumbria Moors",
+            allNames = "The Battle of Glenumbria Moors",
+            furnDataId = "2632",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120170,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120170&quality=2",
+            name = "The Binding Stone",
+            allNames = "The Binding Stone",
+            furnDataId = "2572",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120355,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120355&quality=2",
+            name = "The Black Forge",
+            allNames = "The Black Forge",
+            furnDataId = "2757",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203379,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203379&quality=3",
+            name = "The Blackfeather Court",
+            allNames = "The Blackfeather Court",
+            furnDataId = "9682",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Clockwork City.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203387,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203387&quality=3",
+            name = "The Blade of Woe",
+            allNames = "The Blade of Woe",
+            furnDataId = "9690",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Gold Coast.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120220,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120220&quality=2",
+            name = "The Book of Daedra",
+            allNames = "The Book of Daedra",
+            furnDataId = "2622",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120231,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120231&quality=2",
+            name = "The Book of Dawn and Dusk",
+            allNames = "The Book of Dawn and Dusk",
+            furnDataId = "2633",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120322,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120322&quality=2",
+            name = "The Book of the Great Tree",
+            allNames = "The Book of the Great Tree",
+            furnDataId = "2724",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120095,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120095&quality=2",
+            name = "The Bretons: Mongrels or Paragons?",
+            allNames = "The Bretons: Mongrels or Paragons?",
+            furnDataId = "2497",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120261,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120261&quality=2",
+            name = "The Brothers of Strife",
+            allNames = "The Brothers of Strife",
+            furnDataId = "2663",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120280,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120280&quality=2",
+            name = "The Brothers' War",
+            allNames = "The Brothers' War",
+            furnDataId = "2682",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120232,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120232&quality=2",
+            name = "The Cantatas of Vivec",
+            allNames = "The Cantatas of Vivec",
+            furnDataId = "2634",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120370,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120370&quality=2",
+            name = "The Cleansing of the Fane",
+            allNames = "The Cleansing of the Fane",
+            furnDataId = "2772",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook004.dds",
+            itemId = 126152,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126152&quality=5",
+            name = "The Cliff-Strider Song",
+            allNames = "The Cliff-Strider Song",
+            furnDataId = "3401",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120082,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120082&quality=2",
+            name = "The Code of Mauloch",
+            allNames = "The Code of Mauloch",
+            furnDataId = "2484",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120219,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120219&quality=2",
+            name = "The Consecrations of Arkay",
+            allNames = "The Consecrations of Arkay",
+            furnDataId = "2621",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120284,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120284&quality=2",
+            name = "The Crown of Freydis",
+            allNames = "The Crown of Freydis",
+            furnDataId = "2686",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook003.dds",
+            itemId = 203413,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203413&quality=3",
+            name = "The Currency of Secrets",
+            allNames = "The Currency of Secrets",
+            furnDataId = "9716",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203421,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203421&quality=3",
+            name = "The Dangers of Truth",
+            allNames = "The Dangers of Truth",
+            furnDataId = "9724",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120325,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120325&quality=2",
+            name = "The Devouring of Gil-Var-Delle",
+            allNames = "The Devouring of Gil-Var-Delle",
+            furnDataId = "2727",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 197920,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197920&quality=3",
+            name = "The Doom of the Hushed",
+            allNames = "The Doom of the Hushed",
+            furnDataId = "9260",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120222,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120222&quality=2",
+            name = "The Doors of Oblivion, Part 1",
+            allNames = "The Doors of Oblivion, Part 1",
+            furnDataId = "2624",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120223,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120223&quality=2",
+            name = "The Doors of Oblivion, Part 2",
+            allNames = "The Doors of Oblivion, Part 2",
+            furnDataId = "2625",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120146,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120146&quality=2",
+            name = "The Dreamstride",
+            allNames = "The Dreamstride",
+            furnDataId = "2548",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120344,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120344&quality=2",
+            name = "The Eagle and the Cat",
+            allNames = "The Eagle and the Cat",
+            furnDataId = "2746",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120336,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120336&quality=2",
+            name = "The Eldest: A Pilgrim's Tale",
+            allNames = "The Eldest: A Pilgrim's Tale",
+            furnDataId = "2738",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120371,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120371&quality=2",
+            name = "The Exclusionary Mandates",
+            allNames = "The Exclusionary Mandates",
+            furnDataId = "2773",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 203398,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203398&quality=3",
+            name = "The Favored Daughter of Fadomai",
+            allNames = "The Favored Daughter of Fadomai",
+            furnDataId = "9701",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Southern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120215,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120215&quality=2",
+            name = "The Firmament",
+            allNames = "The Firmament",
+            furnDataId = "2617",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120233,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120233&quality=2",
+            name = "The Five Far Stars",
+            allNames = "The Five Far Stars",
+            furnDataId = "2635",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed001.dds",
+            itemId = 126128,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126128&quality=4",
+            name = "The Five Points of the Star",
+            allNames = "The Five Points of the Star",
+            furnDataId = "3382",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a small house item.",
+        },
+    }
+    return literature
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
@@ -0,0 +1,1640 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 3 of literature, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.literature = Data.chunks.literature or {}
+Data.chunks.literature[3] = function()
+    local literature = {
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook002.dds",
+            itemId = 203401,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203401&quality=3",
+            name = "The Flight of Gryphons",
+            allNames = "The Flight of Gryphons",
+            furnDataId = "9704",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Summerset.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120121,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120121&quality=2",
+            name = "The Glenmoril Wyrd",
+            allNames = "The Glenmoril Wyrd",
+            furnDataId = "2523",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120262,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120262&quality=2",
+            name = "The Great Houses and Their Use",
+            allNames = "The Great Houses and Their Use",
+            furnDataId = "2664",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120337,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120337&quality=2",
+            name = "The Green Pact and the Dominion",
+            allNames = "The Green Pact and the Dominion",
+            furnDataId = "2739",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cra_fur_podiumscroll003.dds",
+            itemId = 134861,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134861&quality=3",
+            name = "The History of Zaan The Scalecaller",
+            allNames = "The History of Zaan The Scalecaller",
+            furnDataId = "4844",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Jorvuld Davaux, Dragon Priest Historian, on the historical significance of the bond between a Dragon Priest and her Dragon Lord.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120190,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120190&quality=2",
+            name = "The Homilies of Blessed Almalexia",
+            allNames = "The Homilies of Blessed Almalexia",
+            furnDataId = "2592",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120147,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120147&quality=2",
+            name = "The House of Troubles",
+            allNames = "The House of Troubles",
+            furnDataId = "2549",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120273,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120273&quality=2",
+            name = "The Humor of Wood Elves",
+            allNames = "The Humor of Wood Elves",
+            furnDataId = "2675",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120136,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120136&quality=2",
+            name = "The Illusion of Death",
+            allNames = "The Illusion of Death",
+            furnDataId = "2538",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
+            itemId = 194439,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194439&quality=3",
+            name = "The Journal of Emperor Leovic",
+            allNames = "The Journal of Emperor Leovic",
+            furnDataId = "8966",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120291,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120291&quality=2",
+            name = "The Judgment of Saint Veloth",
+            allNames = "The Judgment of Saint Veloth",
+            furnDataId = "2693",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120094,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120094&quality=2",
+            name = "The Knightly Orders of High Rock",
+            allNames = "The Knightly Orders of High Rock",
+            furnDataId = "2496",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203458,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203458&quality=3",
+            name = "The Last Addition of Bikkus-Muz",
+            allNames = "The Last Addition of Bikkus-Muz",
+            furnDataId = "9761",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120372,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120372&quality=2",
+            name = "The Last King of the Ayleids",
+            allNames = "The Last King of the Ayleids",
+            furnDataId = "2774",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_fur_housingpodium002.dds",
+            itemId = 134246,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134246&quality=4",
+            name = "The Law of Gears",
+            allNames = "The Law of Gears",
+            furnDataId = "4494",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Proctor Albacron's \"Law of Gears\" provides a firm doctrinal foundation for Clockwork novices and chancellors alike.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120312,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120312&quality=2",
+            name = "The Lay of Firsthold",
+            allNames = "The Lay of Firsthold",
+            furnDataId = "2714",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120112,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120112&quality=2",
+            name = "The Legend of Fallen Grotto",
+            allNames = "The Legend of Fallen Grotto",
+            furnDataId = "2514",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 197919,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197919&quality=3",
+            name = "The Legend of Fathoms Drift",
+            allNames = "The Legend of Fathoms Drift",
+            furnDataId = "9259",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Bastion Nymic. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120328,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120328&quality=2",
+            name = "The Legend of Vastarie",
+            allNames = "The Legend of Vastarie",
+            furnDataId = "2730",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120191,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120191&quality=2",
+            name = "The Legendary Scourge",
+            allNames = "The Legendary Scourge",
+            furnDataId = "2593",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120357,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120357&quality=2",
+            name = "The Library of Dusk: Rare Books",
+            allNames = "The Library of Dusk: Rare Books",
+            furnDataId = "2759",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120356,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120356&quality=2",
+            name = "The Lightless Oubliette",
+            allNames = "The Lightless Oubliette",
+            furnDataId = "2758",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203440,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203440&quality=3",
+            name = "The Littlest Tomeshell",
+            allNames = "The Littlest Tomeshell",
+            furnDataId = "9743",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120290,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120290&quality=2",
+            name = "The Living Gods",
+            allNames = "The Living Gods",
+            furnDataId = "2692",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120155,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120155&quality=2",
+            name = "The Lunar Lorkhan",
+            allNames = "The Lunar Lorkhan",
+            furnDataId = "2557",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120192,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120192&quality=2",
+            name = "The Lusty Argonian Maid, Vol. 1",
+            allNames = "The Lusty Argonian Maid, Vol. 1",
+            furnDataId = "2594",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120193,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120193&quality=2",
+            name = "The Lusty Argonian Maid, Vol. 2",
+            allNames = "The Lusty Argonian Maid, Vol. 2",
+            furnDataId = "2595",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203399,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203399&quality=3",
+            name = "The Marriage of Moon and Tide",
+            allNames = "The Marriage of Moon and Tide",
+            furnDataId = "9702",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Southern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120340,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120340&quality=2",
+            name = "The Moon Cats and their Dance",
+            allNames = "The Moon Cats and their Dance",
+            furnDataId = "2742",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
+            itemId = 178501,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178501&quality=5",
+            name = "The Nomads of Nirn",
+            allNames = "The Nomads of Nirn",
+            furnDataId = "7890",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120204,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120204&quality=2",
+            name = "The Old Ways",
+            allNames = "The Old Ways",
+            furnDataId = "2606",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120332,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120332&quality=2",
+            name = "The Ooze: A Fable",
+            allNames = "The Ooze: A Fable",
+            furnDataId = "2734",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120373,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120373&quality=2",
+            name = "The Order of the Ancestor Moth",
+            allNames = "The Order of the Ancestor Moth",
+            furnDataId = "2775",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Legends of Nirn\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120247,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120247&quality=2",
+            name = "The Order of the Black Worm",
+            allNames = "The Order of the Black Worm",
+            furnDataId = "2649",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120216,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120216&quality=2",
+            name = "The Pig Children",
+            allNames = "The Pig Children",
+            furnDataId = "2618",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Myths of the Mundus\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120115,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120115&quality=2",
+            name = "The Posting of the Hunt",
+            allNames = "The Posting of the Hunt",
+            furnDataId = "2517",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybooktable007.dds",
+            itemId = 203456,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203456&quality=3",
+            name = "The Prior's Fulcrum",
+            allNames = "The Prior's Fulcrum",
+            furnDataId = "9759",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120196,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120196&quality=2",
+            name = "The Red Book of Riddles",
+            allNames = "The Red Book of Riddles",
+            furnDataId = "2598",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203389,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203389&quality=3",
+            name = "The Red Curse, Volume 1",
+            allNames = "The Red Curse, Volume 1",
+            furnDataId = "9692",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Hew's Bane.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203390,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203390&quality=3",
+            name = "The Red Curse, Volume 2",
+            allNames = "The Red Curse, Volume 2",
+            furnDataId = "9693",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Hew's Bane.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203391,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203391&quality=3",
+            name = "The Red Curse, Volume 3",
+            allNames = "The Red Curse, Volume 3",
+            furnDataId = "9694",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Hew's Bane.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120277,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120277&quality=2",
+            name = "The Red Paint",
+            allNames = "The Red Paint",
+            furnDataId = "2679",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203462,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203462&quality=3",
+            name = "The Remnant Truth",
+            allNames = "The Remnant Truth",
+            furnDataId = "9765",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120105,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120105&quality=2",
+            name = "The Remnant of Light",
+            allNames = "The Remnant of Light",
+            furnDataId = "2507",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120251,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120251&quality=2",
+            name = "The Right Mattock for the Job",
+            allNames = "The Right Mattock for the Job",
+            furnDataId = "2653",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Shadowfen Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120316,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120316&quality=2",
+            name = "The Rise of Queen Ayrenn",
+            allNames = "The Rise of Queen Ayrenn",
+            furnDataId = "2718",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120304,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120304&quality=2",
+            name = "The Road to Sovngarde",
+            allNames = "The Road to Sovngarde",
+            furnDataId = "2706",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120258,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120258&quality=2",
+            name = "The Ruby Necklace",
+            allNames = "The Ruby Necklace",
+            furnDataId = "2660",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the Shadowfen Lore book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120129,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120129&quality=2",
+            name = "The Salas En Expedition",
+            allNames = "The Salas En Expedition",
+            furnDataId = "2531",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120249,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120249&quality=2",
+            name = "The Second Akaviri Invasion",
+            allNames = "The Second Akaviri Invasion",
+            furnDataId = "2651",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Tamriel History\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook002.dds",
+            itemId = 145445,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145445&quality=3",
+            name = "The Sharper Tongue: A Jel Primer",
+            allNames = "The Sharper Tongue: A Jel Primer",
+            furnDataId = "5748",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook001.dds",
+            itemId = 203466,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203466&quality=3",
+            name = "The Silver Rose Blooms over Borderwatch",
+            allNames = "The Silver Rose Blooms over Borderwatch",
+            furnDataId = "9769",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120228,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120228&quality=2",
+            name = "The Slave Pits of Coldharbour",
+            allNames = "The Slave Pits of Coldharbour",
+            furnDataId = "2630",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126157,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126157&quality=4",
+            name = "The Song of Pelinal, Volume 1",
+            allNames = "The Song of Pelinal, Volume 1",
+            furnDataId = "3405",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Name.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126158,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126158&quality=4",
+            name = "The Song of Pelinal, Volume 2",
+            allNames = "The Song of Pelinal, Volume 2",
+            furnDataId = "3406",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Coming.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126159,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126159&quality=4",
+            name = "The Song of Pelinal, Volume 3",
+            allNames = "The Song of Pelinal, Volume 3",
+            furnDataId = "3407",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Enemy.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126160,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126160&quality=4",
+            name = "The Song of Pelinal, Volume 4",
+            allNames = "The Song of Pelinal, Volume 4",
+            furnDataId = "3408",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Deeds.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126161,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126161&quality=4",
+            name = "The Song of Pelinal, Volume 5",
+            allNames = "The Song of Pelinal, Volume 5",
+            furnDataId = "3409",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Love of Morihaus.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126162,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126162&quality=4",
+            name = "The Song of Pelinal, Volume 6",
+            allNames = "The Song of Pelinal, Volume 6",
+            furnDataId = "3410",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Madness.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126163,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126163&quality=4",
+            name = "The Song of Pelinal, Volume 7",
+            allNames = "The Song of Pelinal, Volume 7",
+            furnDataId = "3411",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Battle with Umaril and His Dismemberment.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 126164,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126164&quality=4",
+            name = "The Song of Pelinal, Volume 8",
+            allNames = "The Song of Pelinal, Volume 8",
+            furnDataId = "3412",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint, Second Edition: \"On His Revelation at the Death of the Al-Esh.\"",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_paperstack001.dds",
+            itemId = 178497,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178497&quality=5",
+            name = "The Sonnet of Aetherius Art",
+            allNames = "The Sonnet of Aetherius Art",
+            furnDataId = "7886",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Awarded as part of the 2020 Tamriel Together Guild Contest.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120153,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120153&quality=2",
+            name = "The Spawn of Molag Bal",
+            allNames = "The Spawn of Molag Bal",
+            furnDataId = "2555",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 203424,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203424&quality=3",
+            name = "The Spires of the 34th Sermon",
+            allNames = "The Spires of the 34th Sermon",
+            furnDataId = "9727",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203471,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203471&quality=3",
+            name = "The Spotted Towers",
+            allNames = "The Spotted Towers",
+            furnDataId = "9774",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120287,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120287&quality=2",
+            name = "The Stormfist Clan",
+            allNames = "The Stormfist Clan",
+            furnDataId = "2689",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120103,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120103&quality=2",
+            name = "The Story of Princess Eselde",
+            allNames = "The Story of Princess Eselde",
+            furnDataId = "2505",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Rivenspire Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120282,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120282&quality=2",
+            name = "The Ternion Monks",
+            allNames = "The Ternion Monks",
+            furnDataId = "2684",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Eastmarch Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120166,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120166&quality=2",
+            name = "The Thief God's Treasures",
+            allNames = "The Thief God's Treasures",
+            furnDataId = "2568",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120151,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120151&quality=2",
+            name = "The Totems of Hircine",
+            allNames = "The Totems of Hircine",
+            furnDataId = "2553",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Daedric Princes\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120087,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120087&quality=2",
+            name = "The True Nature of Orcs",
+            allNames = "The True Nature of Orcs",
+            furnDataId = "2489",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120118,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120118&quality=2",
+            name = "The True-Told Tale of Hallin, Pt. 1",
+            allNames = "The True-Told Tale of Hallin, Pt. 1",
+            furnDataId = "2520",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120119,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120119&quality=2",
+            name = "The True-Told Tale of Hallin, Pt. 2",
+            allNames = "The True-Told Tale of Hallin, Pt. 2",
+            furnDataId = "2521",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_book001.dds",
+            itemId = 134547,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134547&quality=3",
+            name = "The Truth in Sequence",
+            allNames = "The Truth in Sequence",
+            furnDataId = "",
+            furnCategory = "",
+            description = "The collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn—painstakingly etched and precisely bound.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134548,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134548&quality=3",
+            name = "The Truth in Sequence: Volume 1",
+            allNames = "The Truth in Sequence: Volume 1",
+            furnDataId = "4723",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume one of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134557,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134557&quality=3",
+            name = "The Truth in Sequence: Volume 10",
+            allNames = "The Truth in Sequence: Volume 10",
+            furnDataId = "4732",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume ten of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134558,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134558&quality=3",
+            name = "The Truth in Sequence: Volume 11",
+            allNames = "The Truth in Sequence: Volume 11",
+            furnDataId = "4733",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume eleven of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134559,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134559&quality=3",
+            name = "The Truth in Sequence: Volume 12",
+            allNames = "The Truth in Sequence: Volume 12",
+            furnDataId = "4734",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume twelve of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134549,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134549&quality=3",
+            name = "The Truth in Sequence: Volume 2",
+            allNames = "The Truth in Sequence: Volume 2",
+            furnDataId = "4724",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume two of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134550,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134550&quality=3",
+            name = "The Truth in Sequence: Volume 3",
+            allNames = "The Truth in Sequence: Volume 3",
+            furnDataId = "4725",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume three of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134551,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134551&quality=3",
+            name = "The Truth in Sequence: Volume 4",
+            allNames = "The Truth in Sequence: Volume 4",
+            furnDataId = "4726",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume four of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134552,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134552&quality=3",
+            name = "The Truth in Sequence: Volume 5",
+            allNames = "The Truth in Sequence: Volume 5",
+            furnDataId = "4727",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume five of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134553,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134553&quality=3",
+            name = "The Truth in Sequence: Volume 6",
+            allNames = "The Truth in Sequence: Volume 6",
+            furnDataId = "4728",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume six of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134554,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134554&quality=3",
+            name = "The Truth in Sequence: Volume 7",
+            allNames = "The Truth in Sequence: Volume 7",
+            furnDataId = "4729",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume seven of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134555,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134555&quality=3",
+            name = "The Truth in Sequence: Volume 8",
+            allNames = "The Truth in Sequence: Volume 8",
+            furnDataId = "4730",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume eight of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/quest_cwc_inc_bookplate001.dds",
+            itemId = 134556,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=134556&quality=3",
+            name = "The Truth in Sequence: Volume 9",
+            allNames = "The Truth in Sequence: Volume 9",
+            furnDataId = "4731",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Volume nine of the collected works of Sotha Sil's Fourth Tourbillon, Deldrise Morvayn.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 203402,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203402&quality=3",
+            name = "The Truth of Minotaurs",
+            allNames = "The Truth of Minotaurs",
+            furnDataId = "9705",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Summerset.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 203403,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203403&quality=3",
+            name = "The Ubiquitous Sinking Isle",
+            allNames = "The Ubiquitous Sinking Isle",
+            furnDataId = "9706",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Summerset.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120117,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120117&quality=2",
+            name = "The Viridian Sentinel",
+            allNames = "The Viridian Sentinel",
+            furnDataId = "2519",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Bangkorai Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120276,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120276&quality=2",
+            name = "A Nereid Stole My Husband",
+            allNames = "A Nereid Stole My Husband",
+            furnDataId = "2678",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203468,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203468&quality=3",
+            name = "The Waiting Door",
+            allNames = "The Waiting Door",
+            furnDataId = "9771",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120307,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120307&quality=2",
+            name = "The Wandering Skald",
+            allNames = "The Wandering Skald",
+            furnDataId = "2709",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120238,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120238&quality=2",
+            name = "The Warrior's Charge",
+            allNames = "The Warrior's Charge",
+            furnDataId = "2640",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 194454,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194454&quality=3",
+            name = "The Waters of Oblivion",
+            allNames = "The Waters of Oblivion",
+            furnDataId = "8982",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_arg_inc_mrkbook001.dds",
+            itemId = 145467,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=145467&quality=3",
+            name = "The Way of Shadow",
+            allNames = "The Way of Shadow",
+            furnDataId = "5770",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120275,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120275&quality=2",
+            name = "The Wedding Feast: A Memoir",
+            allNames = "The Wedding Feast: A Memoir",
+            furnDataId = "2677",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120085,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120085&quality=2",
+            name = "The Werewolf's Hide",
+            allNames = "The Werewolf's Hide",
+            furnDataId = "2487",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120351,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120351&quality=2",
+            name = "The Whithering of Delodiil",
+            allNames = "The Whithering of Delodiil",
+            furnDataId = "2753",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Coldharbour Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120333,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120333&quality=2",
+            name = "The Wilderking Legend",
+            allNames = "The Wilderking Legend",
+            furnDataId = "2735",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 130228,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=130228&quality=4",
+            name = "The Witches of Hag Fen",
+            allNames = "The Witches of Hag Fen",
+            furnDataId = "3976",
+            furnCategory = "Library:Literature (4:62)",
+            description = "This is a tiny house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 203388,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203388&quality=3",
+            name = "The Wolf and the Dragon",
+            allNames = "The Wolf and the Dragon",
+            furnDataId = "9691",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Gold Coast.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120339,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120339&quality=2",
+            name = "The Wood Elf Gourmet, Ch. 1",
+            allNames = "The Wood Elf Gourmet, Ch. 1",
+            furnDataId = "2741",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120270,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120270&quality=2",
+            name = "The Woodsmer",
+            allNames = "The Woodsmer",
+            furnDataId = "2672",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120306,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120306&quality=2",
+            name = "Thenephan's Mysteries of Mead",
+            allNames = "Thenephan's Mysteries of Mead",
+            furnDataId = "2708",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 194450,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194450&quality=3",
+            name = "Thwarting the Daedra: Dagon's Cult",
+            allNames = "Thwarting the Daedra: Dagon's Cult",
+            furnDataId = "8978",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203450,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203450&quality=3",
+            name = "Tidefall Cantos I",
+            allNames = "Tidefall Cantos I",
+            furnDataId = "9753",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120365,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120365&quality=2",
+            name = "To All Who Pass Through",
+            allNames = "To All Who Pass Through",
+            furnDataId = "2767",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120099,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120099&quality=2",
+            name = "To Dream Beyond Dreams",
+            allNames = "To Dream Beyond Dreams",
+            furnDataId = "2501",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120173,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120173&quality=2",
+            name = "To Posterity",
+            allNames = "To Posterity",
+            furnDataId = "2575",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_open001.dds",
+            itemId = 194440,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=194440&quality=3",
+            name = "Tome of Daedric Portals",
+            allNames = "Tome of Daedric Portals",
+            furnDataId = "8967",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Scrivener Hall Vault. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203438,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203438&quality=3",
+            name = "Torvesard's Journal",
+            allNames = "Torvesard's Journal",
+            furnDataId = "9741",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120302,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120302&quality=2",
+            name = "Touch of the Worm's Tongue",
+            allNames = "Touch of the Worm's Tongue",
+            furnDataId = "2704",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120100,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120100&quality=2",
+            name = "Tower of Adamant",
+            allNames = "Tower of Adamant",
+            furnDataId = "2502",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_openbook001.dds",
+            itemId = 203395,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203395&quality=3",
+            name = "Trail and Tide",
+            allNames = "Trail and Tide",
+            furnDataId = "9698",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Northern Elsweyr.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120141,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120141&quality=2",
+            name = "Trials of Saint Alessia",
+            allNames = "Trials of Saint Alessia",
+            furnDataId = "2543",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120140,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120140&quality=2",
+            name = "Triumphs of a Monarch, Ch. 10",
+            allNames = "Triumphs of a Monarch, Ch. 10",
+            furnDataId = "2542",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120138,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120138&quality=2",
+            name = "Triumphs of a Monarch, Ch. 3",
+            allNames = "Triumphs of a Monarch, Ch. 3",
+            furnDataId = "2540",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed003.dds",
+            itemId = 120139,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120139&quality=2",
+            name = "Triumphs of a Monarch, Ch. 6",
+            allNames = "Triumphs of a Monarch, Ch. 6",
+            furnDataId = "2541",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Biographies\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120084,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120084&quality=2",
+            name = "True Heirs of the Empire",
+            allNames = "True Heirs of the Empire",
+            furnDataId = "2486",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120125,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120125&quality=2",
+            name = "Tu'whacca's Prayer",
+            allNames = "Tu'whacca's Prayer",
+            furnDataId = "2527",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/skr_inc_vampirelabbook001.dds",
+            itemId = 203414,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203414&quality=3",
+            name = "Uluscant's Manifesto",
+            allNames = "Uluscant's Manifesto",
+            furnDataId = "9717",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120305,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120305&quality=2",
+            name = "Unexpected Allies",
+            allNames = "Unexpected Allies",
+            furnDataId = "2707",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"The Rift Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed004.dds",
+            itemId = 120272,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120272&quality=2",
+            name = "Valenwood: A Study",
+            allNames = "Valenwood: A Study",
+            furnDataId = "2674",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Malabal Tor Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120226,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120226&quality=2",
+            name = "Varieties of Daedra, Part 1",
+            allNames = "Varieties of Daedra, Part 1",
+            furnDataId = "2628",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cld_inc_bookclosed002.dds",
+            itemId = 120227,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120227&quality=2",
+            name = "Varieties of Daedra, Part 2",
+            allNames = "Varieties of Daedra, Part 2",
+            furnDataId = "2629",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Oblivion Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120126,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120126&quality=2",
+            name = "Varieties of Faith, Crown Redguards",
+            allNames = "Varieties of Faith, Crown Redguards",
+            furnDataId = "2528",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook001.dds",
+            itemId = 120127,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120127&quality=2",
+            name = "Varieties of Faith, The Forebears",
+            allNames = "Varieties of Faith, The Forebears",
+            furnDataId = "2529",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Alik'r Desert Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120266,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120266&quality=2",
+            name = "Varieties of Faith: The Argonians",
+            allNames = "Varieties of Faith: The Argonians",
+            furnDataId = "2668",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120088,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120088&quality=2",
+            name = "Varieties of Faith: The Bretons",
+            allNames = "Varieties of Faith: The Bretons",
+            furnDataId = "2490",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120267,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120267&quality=2",
+            name = "Varieties of Faith: The Dark Elves",
+            allNames = "Varieties of Faith: The Dark Elves",
+            furnDataId = "2669",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120313,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120313&quality=2",
+            name = "Varieties of Faith: The High Elves",
+            allNames = "Varieties of Faith: The High Elves",
+            furnDataId = "2715",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120320,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120320&quality=2",
+            name = "Varieties of Faith: The Khajiit",
+            allNames = "Varieties of Faith: The Khajiit",
+            furnDataId = "2722",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120268,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120268&quality=2",
+            name = "Varieties of Faith: The Nords",
+            allNames = "Varieties of Faith: The Nords",
+            furnDataId = "2670",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stonefalls Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120089,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120089&quality=2",
+            name = "Varieties of Faith: The Orcs",
+            allNames = "Varieties of Faith: The Orcs",
+            furnDataId = "2491",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120321,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120321&quality=2",
+            name = "Varieties of Faith: The Wood Elves",
+            allNames = "Varieties of Faith: The Wood Elves",
+            furnDataId = "2723",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120334,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120334&quality=2",
+            name = "Visions of the Green Pact Bosmer",
+            allNames = "Visions of the Green Pact Bosmer",
+            furnDataId = "2736",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook004.dds",
+            itemId = 203428,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203428&quality=3",
+            name = "Visitor's Guide: Telvanni Peninsula",
+            allNames = "Visitor's Guide: Telvanni Peninsula",
+            furnDataId = "9731",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 120163,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120163&quality=2",
+            name = "Vivec and Mephala",
+            allNames = "Vivec and Mephala",
+            furnDataId = "2565",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Divines and Deities\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 203406,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203406&quality=3",
+            name = "Vorgrosh Rot-Tusk's Guide to Dirty Fighting",
+            allNames = "Vorgrosh Rot-Tusk's Guide to Dirty Fighting",
+            furnDataId = "9709",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Wrothgar.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_marklibrarybook002.dds",
+            itemId = 203407,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203407&quality=3",
+            name = "Vosh Rakh",
+            allNames = "Vosh Rakh",
+            furnDataId = "9710",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Wrothgar.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 120199,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120199&quality=2",
+            name = "Wabbajack",
+            allNames = "Wabbajack",
+            furnDataId = "2601",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Literature\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed002.dds",
+            itemId = 120324,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120324&quality=2",
+            name = "War Customs of the Tribal Bosmer",
+            allNames = "War Customs of the Tribal Bosmer",
+            furnDataId = "2726",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Grahtwood Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120167,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120167&quality=2",
+            name = "War Weather",
+            allNames = "War Weather",
+            furnDataId = "2569",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120296,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120296&quality=2",
+            name = "War of Two Houses",
+            allNames = "War of Two Houses",
+            furnDataId = "2698",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Deshaan Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120172,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120172&quality=2",
+            name = "Wayrest Sewers: A Short History",
+            allNames = "Wayrest Sewers: A Short History",
+            furnDataId = "2574",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120101,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120101&quality=2",
+            name = "Wayrest, Jewel of the Bay",
+            allNames = "Wayrest, Jewel of the Bay",
+            furnDataId = "2503",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Stormhaven Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120208,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120208&quality=2",
+            name = "Wayshrines of Tamriel",
+            allNames = "Wayshrines of Tamriel",
+            furnDataId = "2610",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Magic and Magicka\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_crf_tablepropsarcanebook001.dds",
+            itemId = 203426,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203426&quality=3",
+            name = "We Reject the Pact",
+            allNames = "We Reject the Pact",
+            furnDataId = "9729",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook001.dds",
+            itemId = 203442,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203442&quality=3",
+            name = "What About Glyphics?",
+            allNames = "What About Glyphics?",
+            furnDataId = "9745",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120165,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120165&quality=2",
+            name = "What is Volendrung?",
+            allNames = "What is Volendrung?",
+            furnDataId = "2567",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 203445,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203445&quality=3",
+            name = "What's an Arcanist? Part 1",
+            allNames = "What's an Arcanist? Part 1",
+            furnDataId = "9748",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed006.dds",
+            itemId = 203444,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203444&quality=3",
+            name = "What's an Arcanist? Part 2",
+            allNames = "What's an Arcanist? Part 2",
+            furnDataId = "9747",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120171,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120171&quality=2",
+            name = "Where Magical Paths Meet",
+            allNames = "Where Magical Paths Meet",
+            furnDataId = "2573",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120314,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120314&quality=2",
+            name = "Why Don the Veil?",
+            allNames = "Why Don the Veil?",
+            furnDataId = "2716",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Auridon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed005.dds",
+            itemId = 120164,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120164&quality=2",
+            name = "With Regards to the Ebony Blade",
+            allNames = "With Regards to the Ebony Blade",
+            furnDataId = "2566",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Dungeon Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120335,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120335&quality=2",
+            name = "Woodhearth: A Pocket Guide",
+            allNames = "Woodhearth: A Pocket Guide",
+            furnDataId = "2737",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120338,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120338&quality=2",
+            name = "Gifts of the Nereids",
+            allNames = "Gifts of the Nereids",
+            furnDataId = "2740",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed001.dds",
+            itemId = 120331,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120331&quality=2",
+            name = "Words of Clan Mother Ahnissi, Pt. 2",
+            allNames = "Words of Clan Mother Ahnissi, Pt. 2",
+            furnDataId = "2733",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Greenshade Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varbook002.dds",
+            itemId = 120239,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120239&quality=2",
+            name = "Words of the Wind",
+            allNames = "Words of the Wind",
+            furnDataId = "2641",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Poetry and Song\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_apc_inc_libbook002.dds",
+            itemId = 203443,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203443&quality=3",
+            name = "Working in the Infinite Panopticon",
+            allNames = "Working in the Infinite Panopticon",
+            furnDataId = "9746",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from the Infinite Archive. Purchased from Filer Ool in the Infinite Archive.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_cwc_inc_book001.dds",
+            itemId = 203380,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=203380&quality=3",
+            name = "Worshiping the Illogical",
+            allNames = "Worshiping the Illogical",
+            furnDataId = "9683",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Collected from Treasure Chests in Clockwork City.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120090,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120090&quality=2",
+            name = "Wyresses: The Name-Daughters",
+            allNames = "Wyresses: The Name-Daughters",
+            furnDataId = "2492",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Glenumbra Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_book_closed007.dds",
+            itemId = 120342,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120342&quality=2",
+            name = "Yours for the Taking!",
+            allNames = "Yours for the Taking!",
+            furnDataId = "2744",
+            furnCategory = "Library:Literature (4:62)",
+            description = "Reprint volume from the \"Reaper's March Lore\" book collection. Mages Guild Edition, 2E 582.",
+        },
+    }
+    return literature
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
@@ -0,0 +1,410 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 1 of maps, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.maps = Data.chunks.maps or {}
+Data.chunks.maps[1] = function()
+    local maps = {
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsalikrscroll001.dds",
+            itemId = 163710,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163710&quality=2",
+            name = "Antique Map of Alik'r Desert",
+            allNames = "Antique Map of Alik'r Desert",
+            furnDataId = "6800",
+            furnCategory = "Library:Maps (4:64)",
+            description = "This map maker's aesthetic depicts the vast desert of Alik'r in gentle flowing lines, representing dunes that have long since shifted.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsapocrypha001.dds",
+            itemId = 197712,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197712&quality=2",
+            name = "Antique Map of Apocrypha",
+            allNames = "Antique Map of Apocrypha",
+            furnDataId = "9172",
+            furnCategory = "Library:Maps (4:64)",
+            description = "\"Mapping Apocrypha and expecting the result to help anyone else is foolish. Instead consider the map to be more of a visual guide to the cartographer's experiences there—unique to them alone.\"—Excerpt from an unknown Cipher's Journal",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsauridonscroll001.dds",
+            itemId = 163717,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163717&quality=2",
+            name = "Antique Map of Auridon",
+            allNames = "Antique Map of Auridon",
+            furnDataId = "6807",
+            furnCategory = "Library:Maps (4:64)",
+            description = "One of the Summerset Isles, Auridon is painstakingly rendered on this map to the exacting standard of the College of Sapiarchs.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsbangkoraiscroll001.dds",
+            itemId = 163711,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163711&quality=2",
+            name = "Antique Map of Bangkorai",
+            allNames = "Antique Map of Bangkorai",
+            furnDataId = "6801",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The entire region of Bangkorai is shown on this antique map, though much of the detail is focused on the daunting Bangkorai pass.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsleyawiinscroll001.dds",
+            itemId = 178459,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178459&quality=2",
+            name = "Antique Map of Blackwood",
+            allNames = "Antique Map of Blackwood",
+            furnDataId = "7876",
+            furnCategory = "Library:Maps (4:64)",
+            description = "On this heirloom map, the areas populated by Nibenese contain a wealth of details about the terrain, while expanses of wilderness seemingly remain fully unexplored.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropscoldharborscroll001.dds",
+            itemId = 165993,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165993&quality=2",
+            name = "Antique Map of Coldharbour",
+            allNames = "Antique Map of Coldharbour",
+            furnDataId = "7145",
+            furnCategory = "Library:Maps (4:64)",
+            description = "One might question the sanity of the cartographer of this map, but according to experts in planar travel, it's remarkably accurate.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropscraglornscroll001.dds",
+            itemId = 165994,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165994&quality=2",
+            name = "Antique Map of Craglorn",
+            allNames = "Antique Map of Craglorn",
+            furnDataId = "7146",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The cartographer who worked on this antique map detailed the dry wastelands of Lower Craglorn and mountainous regions of Upper Craglorn with a deft hand.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsdeshaanscroll002.dds",
+            itemId = 163713,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163713&quality=2",
+            name = "Antique Map of Deshaan",
+            allNames = "Antique Map of Deshaan",
+            furnDataId = "6803",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The fertile plain of Deshaan stretches out on this artful map.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropseastmarchscroll002.dds",
+            itemId = 163715,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163715&quality=2",
+            name = "Antique Map of Eastmarch",
+            allNames = "Antique Map of Eastmarch",
+            furnDataId = "6805",
+            furnCategory = "Library:Maps (4:64)",
+            description = "A master cartographer lent their skills to the crafting of this map of Eastmarch untold years ago.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsfargravescroll001.dds",
+            itemId = 187922,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187922&quality=2",
+            name = "Antique Map of Fargrave",
+            allNames = "Antique Map of Fargrave",
+            furnDataId = "8541",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Though Fargrave defies most labels, an ambitious cartographer still attempted to map it out. Discerning collectors may wish to hang the result in a place of pride. The original owner no longer needs it.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsgalenscroll001.dds",
+            itemId = 192431,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=192431&quality=2",
+            name = "Antique Map of Galen",
+            allNames = "Antique Map of Galen",
+            furnDataId = "8815",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The artistic touches on this well-preserved map of Galen resemble those of other Breton maps of this period. Its illustrative elements flow organically, casting doubt on the cartographer being a single Breton.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsglenumbrascroll001.dds",
+            itemId = 163707,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163707&quality=2",
+            name = "Antique Map of Glenumbra",
+            allNames = "Antique Map of Glenumbra",
+            furnDataId = "6797",
+            furnCategory = "Library:Maps (4:64)",
+            description = "This detailed map highlights the complex topography of Glenumbra thanks to the artistry of the cartographer who crafted it.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsgrahtwoodscroll001.dds",
+            itemId = 163718,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163718&quality=2",
+            name = "Antique Map of Grahtwood",
+            allNames = "Antique Map of Grahtwood",
+            furnDataId = "6808",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Careful attention was paid to marking the well-trod footpaths through the old growth of Grahtwood.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsgreenshadescroll001.dds",
+            itemId = 163719,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163719&quality=2",
+            name = "Antique Map of Greenshade",
+            allNames = "Antique Map of Greenshade",
+            furnDataId = "6809",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Nearly a work of art in itself, this map of Greenshade provides some insight into what the region might have looked like in an earlier time.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropshewsbanescroll001.dds",
+            itemId = 165997,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165997&quality=2",
+            name = "Antique Map of Hew's Bane",
+            allNames = "Antique Map of Hew's Bane",
+            furnDataId = "7149",
+            furnCategory = "Library:Maps (4:64)",
+            description = "This rare map depicts Hew's Bane, also once called Khefrem's Boot, a peninsula on the south coast of Hammerfell.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropssystresscroll001.dds",
+            itemId = 187799,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187799&quality=2",
+            name = "Antique Map of High Isle",
+            allNames = "Antique Map of High Isle",
+            furnDataId = "8457",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Though outdated, this map's cartographer added enough artful touches to make it worthy of display in even noble homes.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsmalabaltorscroll001.dds",
+            itemId = 163720,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163720&quality=2",
+            name = "Antique Map of Malabal Tor",
+            allNames = "Antique Map of Malabal Tor",
+            furnDataId = "6810",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The cartographer paid special attention to the coast and waterways of Malabal Tor when rendering this map.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsmurkmirescroll001.dds",
+            itemId = 163726,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163726&quality=2",
+            name = "Antique Map of Murkmire",
+            allNames = "Antique Map of Murkmire",
+            furnDataId = "6816",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The surveyor who succeeded in mapping the impenetrable marshlands of Murkmire made certain to note the migration of swamp leviathans.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropselsweyrscroll001.dds",
+            itemId = 163727,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163727&quality=2",
+            name = "Antique Map of Northern Elsweyr",
+            allNames = "Antique Map of Northern Elsweyr",
+            furnDataId = "6817",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The lands of Anequina and its majestic aqueduct are the subject of this skillfully illustrated map.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsreapersmarchscroll001.dds",
+            itemId = 163721,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163721&quality=2",
+            name = "Antique Map of Reaper's March",
+            allNames = "Antique Map of Reaper's March",
+            furnDataId = "6811",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Skillful strokes create the boundaries and landmarks of Reaper's March on this map.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsrivenspirescroll001.dds",
+            itemId = 163709,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163709&quality=2",
+            name = "Antique Map of Rivenspire",
+            allNames = "Antique Map of Rivenspire",
+            furnDataId = "6799",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Somehow the cartographer behind this map accurately rendered Rivenspire in great detail through all its gloom and fog.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsshadowfenscroll001.dds",
+            itemId = 163714,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163714&quality=2",
+            name = "Antique Map of Shadowfen",
+            allNames = "Antique Map of Shadowfen",
+            furnDataId = "6804",
+            furnCategory = "Library:Maps (4:64)",
+            description = "On this aged map, someone took great pains to depict the common paths and hazardous areas of the mire called Shadowfen.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropssouthelsweyrscroll001.dds",
+            itemId = 163728,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163728&quality=2",
+            name = "Antique Map of Southern Elsweyr",
+            allNames = "Antique Map of Southern Elsweyr",
+            furnDataId = "6818",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The kingdom of Pellitine stretches out like a lazing senche on this artistically rendered map.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsstonefallsscroll002.dds",
+            itemId = 163712,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163712&quality=2",
+            name = "Antique Map of Stonefalls",
+            allNames = "Antique Map of Stonefalls",
+            furnDataId = "6802",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Though the ashfall may obscure the features of Stonefalls, the clear lines of this map are an able guide.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsstormhavenscroll001.dds",
+            itemId = 163708,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163708&quality=2",
+            name = "Antique Map of Stormhaven",
+            allNames = "Antique Map of Stormhaven",
+            furnDataId = "6798",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Even early maps of Stormhaven like this one show population centers, making the map a window into the past.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropssummersetscroll001.dds",
+            itemId = 163725,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163725&quality=2",
+            name = "Antique Map of Summerset",
+            allNames = "Antique Map of Summerset",
+            furnDataId = "6815",
+            furnCategory = "Library:Maps (4:64)",
+            description = "While one wouldn't want to use this map for navigation, given its age, it makes for excellent wall art.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropstheriftscroll002.dds",
+            itemId = 163716,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163716&quality=2",
+            name = "Antique Map of The Rift",
+            allNames = "Antique Map of The Rift",
+            furnDataId = "6806",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Despite its name, the sweeping temperate zone called the Rift is a hospitable place for Nords to come together, and this map points the way.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsvvardenfellscroll001.dds",
+            itemId = 163724,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163724&quality=2",
+            name = "Antique Map of Vvardenfell",
+            allNames = "Antique Map of Vvardenfell",
+            furnDataId = "6814",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The vastness of Red Mountain is truly apparent in this scale map of Vvardenfell.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropscolovianhighlandsscroll001.dds",
+            itemId = 204424,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204424&quality=2",
+            name = "Antique Map of West Weald",
+            allNames = "Antique Map of West Weald",
+            furnDataId = "9866",
+            furnCategory = "Library:Maps (4:64)",
+            description = "\"Once you lose sight of the coast, you start to walk the weald. It goes on and on, well out of sight, with only the road cut through the trees a marker to chart your course.\" - Phrastus of Elinhir",
+        },
+        {
+            icon = "/esoui/art/icons/quest_skr_inc_mappropsskyrimquestscroll001.dds",
+            itemId = 165992,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165992&quality=2",
+            name = "Antique Map of Western Skyrim",
+            allNames = "Antique Map of Western Skyrim",
+            furnDataId = "7144",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Explore the regions of Western Skyrim with this masterful map. Elevations, waterways, and roads may be a tad out of date.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropswrothgarscroll001.dds",
+            itemId = 163723,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163723&quality=2",
+            name = "Antique Map of Wrothgar",
+            allNames = "Antique Map of Wrothgar",
+            furnDataId = "6813",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The treacherous mountains of Wrothgar are expertly depicted on this map, though safe passage through them is anyone's guess.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsdeadlandsscroll001.dds",
+            itemId = 183196,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=183196&quality=2",
+            name = "Antique Map of the Deadlands",
+            allNames = "Antique Map of the Deadlands",
+            furnDataId = "8245",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Long ago, several explorers of the Burn and the Sever worked together to map out these areas of the Deadlands, though regrettably not all who started this cartography project lived to see its result.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsgoldcoastscroll001.dds",
+            itemId = 165996,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165996&quality=2",
+            name = "Antique Map of the Gold Coast",
+            allNames = "Antique Map of the Gold Coast",
+            furnDataId = "7148",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Though this antique map doesn't note it, the Gold Coast was once called the Strident Coast.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsthereachscroll001.dds",
+            itemId = 171431,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=171431&quality=2",
+            name = "Antique Map of the Reach",
+            allNames = "Antique Map of the Reach",
+            furnDataId = "7499",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Reachfolk have little use for maps, knowing the land as well as they know their own bodies, so an intrepid explorer must have drafted this cartographic wonder—perfect for hanging on your wall or planning your next Reach excursion.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropstelvann001.dds",
+            itemId = 197711,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197711&quality=2",
+            name = "Antique Map of the Telvanni Peninsula",
+            allNames = "Antique Map of the Telvanni Peninsula",
+            furnDataId = "9171",
+            furnCategory = "Library:Maps (4:64)",
+            description = "The fine detail work on the coastlines contrasts strongly with inland portions of the map. Almost as if House Telvanni had little interest in a truly accurate depiction of the peninsula.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_antdwemerstarchart001.dds",
+            itemId = 163706,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=163706&quality=5",
+            name = "Dwemer Star Chart",
+            allNames = "Dwemer Star Chart",
+            furnDataId = "6796",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Show off your love of Dwarven astronomical knowledge by placing this wondrous star chart in your home.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropstamriel001.dds",
+            itemId = 120056,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120056&quality=4",
+            name = "Hanging Map of Tamriel",
+            allNames = "Hanging Map of Tamriel",
+            furnDataId = "2469",
+            furnCategory = "Library:Maps (4:64)",
+            description = "A well-worn map, clearly used on many a Tamrielic journey.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropselsweyr001.dds",
+            itemId = 151968,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=151968&quality=4",
+            name = "Map of Elsweyr, Hanging",
+            allNames = "Map of Elsweyr, Hanging",
+            furnDataId = "6329",
+            furnCategory = "Library:Maps (4:64)",
+            description = "This map of Elsweyr, when hung on the wall, can help you plan your next adventure. (Plus you can point to it if someone asks you if you're lost in your own home.)",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropssouthelsweyr001.dds",
+            itemId = 156762,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=156762&quality=4",
+            name = "Map of Southern Elsweyr, Hanging",
+            allNames = "Map of Southern Elsweyr, Hanging",
+            furnDataId = "6611",
+            furnCategory = "Library:Maps (4:64)",
+            description = "Also called Pellitine, Southern Elsweyr features a port city, several Khajiiti sacred places, an artist's retreat, locations of a scurrilous nature, an Imperial citadel, and plenty of stories both brilliant and dark.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_gen_inc_mappropsskyrim001.dds",
+            itemId = 166463,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166463&quality=4",
+            name = "Map of Western Skyrim, Hanging",
+            allNames = "Map of Western Skyrim, Hanging",
+            furnDataId = "7205",
+            furnCategory = "Library:Maps (4:64)",
+            description = "From impressive heights to treacherous waters, the lands of Western Skyrim depicted on this map show almost invisible political boundaries as well—almost. Someone tried to hide them by mimicking the artistry of the original cartographer.",
+        },
+    }
+    return maps
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
@@ -1,512 +0,0 @@
-local musicBoxes = {
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxscalesong001.dds",
-        itemId = 151909,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151909&quality=5",
-        name = "Music Box, A Clash of Fang and Flame",
-        allNames = "Music Box, A Clash of Fang and Flame",
-        furnDataId = "6305",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the rousing music box composition \"A Clash of Fang and Flame.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_newlifemusicbox001.dds",
-        itemId = 156554,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156554&quality=5",
-        name = "Music Box, A Frost Melt Melody",
-        allNames = "Music Box, A Frost Melt Melody",
-        furnDataId = "6530",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the traditional New Life Festival song, \"A Frost Melt Melody.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_rubythronemusicbox001.dds",
-        itemId = 204422,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204422&quality=5",
-        name = "Music Box, Ascension to the Ruby Throne",
-        allNames = "Music Box, Ascension to the Ruby Throne",
-        furnDataId = "9862",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the majestic music box composition \"Ascension to the Ruby Throne.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_standingstonemusicbox001.dds",
-        itemId = 190938,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=190938&quality=5",
-        name = "Music Box, Blessings of Stone",
-        allNames = "Music Box, Blessings of Stone",
-        furnDataId = "8690",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the contemplative \"Blessings of Stone\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxeso001.dds",
-        itemId = 145322,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145322&quality=5",
-        name = "Music Box, Blood and Glory",
-        allNames = "Music Box, Blood and Glory",
-        furnDataId = "5625",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the stirring \"For Blood, For Glory, For Honor\" theme.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxsweetblossom001.dds",
-        itemId = 151910,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151910&quality=5",
-        name = "Music Box, Dancing Among the Flowers Fine",
-        allNames = "Music Box, Dancing Among the Flowers Fine",
-        furnDataId = "6306",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the soothing \"Dancing Among the Flowers Fine\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_meridiadawnbreakermusicbox001.dds",
-        itemId = 190939,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=190939&quality=5",
-        name = "Music Box, Dawnbreaker's Forging",
-        allNames = "Music Box, Dawnbreaker's Forging",
-        furnDataId = "8691",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the exultant \"Dawnbreaker's Forging\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_earthenrootmusicbox001.dds",
-        itemId = 189464,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=189464&quality=5",
-        name = "Music Box, Deeproot Dirge",
-        allNames = "Music Box, Deeproot Dirge",
-        furnDataId = "8624",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the meditative \"Deeproot\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboximperial001.dds",
-        itemId = 153634,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=153634&quality=5",
-        name = "Music Box, Diamond Melody",
-        allNames = "Music Box, Diamond Melody",
-        furnDataId = "6436",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box composition of the traditional imperial song \"Chim-el Adabal.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_mechanicalswanmusicbox001.dds",
-        itemId = 190941,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=190941&quality=5",
-        name = "Music Box, Direnni's Swan",
-        allNames = "Music Box, Direnni's Swan",
-        furnDataId = "8693",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the \"Direnni's Swan\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxaldmerisymphonia001.dds",
-        itemId = 163431,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=163431&quality=5",
-        name = "Music Box, Dreams and Memories",
-        allNames = "Music Box, Dreams and Memories",
-        furnDataId = "6839",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the poignant \"Dreams and Memories\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxyokudan001.dds",
-        itemId = 159598,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=159598&quality=5",
-        name = "Music Box, Dreams of Yokuda",
-        allNames = "Music Box, Dreams of Yokuda",
-        furnDataId = "6712",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the soothing \"Dreams of Yokuda\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_psijicmusicbox001.dds",
-        itemId = 163429,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=163429&quality=5",
-        name = "Music Box, Enigmas of the Elder Way",
-        allNames = "Music Box, Enigmas of the Elder Way",
-        furnDataId = "6771",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the mesmerizing \"Enigmas of the Elder Way\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_ayleidmusicbox001.dds",
-        itemId = 171542,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171542&quality=5",
-        name = "Music Box, Farewell to Nenalata",
-        allNames = "Music Box, Farewell to Nenalata",
-        furnDataId = "7511",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the wistful \"Farewell to Nenalata\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_inc_fargravemusicbox001.dds",
-        itemId = 181636,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=181636&quality=5",
-        name = "Music Box, Fargrave Daydreams",
-        allNames = "Music Box, Fargrave Daydreams",
-        furnDataId = "8056",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, this artistic rendering of the Celestial Palanquin plays a music box arrangement of the ominous \"Fargrave Daydreams\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxmorrowindvolcanic001.dds",
-        itemId = 171543,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171543&quality=5",
-        name = "Music Box, Feast of All Flames",
-        allNames = "Music Box, Feast of All Flames",
-        furnDataId = "7512",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the playfully tumultuous \"Feast of All Flames\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxdaedric001.dds",
-        itemId = 142235,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=142235&quality=5",
-        name = "Music Box, Flickering Shadows",
-        allNames = "Music Box, Flickering Shadows",
-        furnDataId = "5585",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the mysterious \"Flickering Shadows\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_glyphicmusicbox001.dds",
-        itemId = 197829,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197829&quality=5",
-        name = "Music Box, Glyphic Secrets",
-        allNames = "Music Box, Glyphic Secrets",
-        furnDataId = "9241",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the recondite \"Glyphic Motion\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_dancermusicbox001.dds",
-        itemId = 189465,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=189465&quality=5",
-        name = "Music Box, Gonfalon Galliard",
-        allNames = "Music Box, Gonfalon Galliard",
-        furnDataId = "8625",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the sprightly \"Gonfalon Galliard\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_systresmusicbox001.dds",
-        itemId = 187667,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=187667&quality=5",
-        name = "Music Box, High Isle Duel",
-        allNames = "Music Box, High Isle Duel",
-        furnDataId = "8425",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the dramatic \"High Isle Duel\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxebonhart001.dds",
-        itemId = 147507,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=147507&quality=5",
-        name = "Music Box, Hinterlands",
-        allNames = "Music Box, Hinterlands",
-        furnDataId = "5890",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the Ebonheart Pact \"Hinterlands\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_ysgramormusicbox001.dds",
-        itemId = 167006,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=167006&quality=5",
-        name = "Music Box, Hymn of Five-Hundred Axes",
-        allNames = "Music Box, Hymn of Five-Hundred Axes",
-        furnDataId = "7248",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the Nord favorite \"Hymn of Five-Hundred Axes\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxdreadcellar001.dds",
-        itemId = 178521,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178521&quality=5",
-        name = "Music Box, Invitation to Chaos",
-        allNames = "Music Box, Invitation to Chaos",
-        furnDataId = "7893",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the ominous \"Invitation to Chaos\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/icon_missing.dds",
-        itemId = 212420,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=212420&quality=5",
-        name = "Unknown Item #212420",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "",
-        description = "No item found matching itemId # 212420, level 66, and quality 5!",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxmirrormoor001.dds",
-        itemId = 204423,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204423&quality=5",
-        name = "Music Box, Lament for the Path Not Taken",
-        allNames = "Music Box, Lament for the Path Not Taken",
-        furnDataId = "9863",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the haunting \"Lament for the Path Not Taken\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_sheogorathmusicbox001.dds",
-        itemId = 190942,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=190942&quality=5",
-        name = "Music Box, Mad God's Garden",
-        allNames = "Music Box, Mad God's Garden",
-        furnDataId = "8694",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the frenetic \"Mad God's Garden\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_mudcrabmusicbox001.dds",
-        itemId = 211498,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211498&quality=5",
-        name = "Music Box, Merry Mudcrab Melody",
-        allNames = "Music Box, Merry Mudcrab Melody",
-        furnDataId = "10383",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the jaunty music box composition \"Merry Mudcrab Melody.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_almalexiamusicbox001.dds",
-        itemId = 167428,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=167428&quality=5",
-        name = "Music Box, Mother Morrowind's Sacred Lullaby",
-        allNames = "Music Box, Mother Morrowind's Sacred Lullaby",
-        furnDataId = "7376",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the soporific \"Mother Morrowind's Sacred Lullaby\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxundaunted001.dds",
-        itemId = 167429,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=167429&quality=5",
-        name = "Music Box, Never Fall, Never Die",
-        allNames = "Music Box, Never Fall, Never Die",
-        furnDataId = "7377",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the Undaunted's rousing \"Never Fall, Never Die\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_snowglobemusicbox001.dds",
-        itemId = 199113,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199113&quality=5",
-        name = "Music Box, New Life Snow Symphony",
-        allNames = "Music Box, New Life Snow Symphony",
-        furnDataId = "9531",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the ephemeral music box composition \"New Life Snow Symphony.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_necfunerarymusicbox001.dds",
-        itemId = 197625,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197625&quality=5",
-        name = "Music Box, Oath of the Keepers",
-        allNames = "Music Box, Oath of the Keepers",
-        furnDataId = "0",
-        furnCategory = ": (:)",
-        description = "When activated, plays a music box arrangement of the profound \"Oath of the Keepers\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxdaggerfall001.dds",
-        itemId = 147506,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=147506&quality=5",
-        name = "Music Box, Sands of the Alik'r",
-        allNames = "Music Box, Sands of the Alik'r",
-        furnDataId = "5889",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the Daggerfall Covenant \"Sands of the Alik'r\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxsilverrose001.dds",
-        itemId = 178522,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=178522&quality=5",
-        name = "Music Box, Silver Rose",
-        allNames = "Music Box, Silver Rose",
-        furnDataId = "7894",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the devotional \"Silver Rose\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_iridglassgardenmusicbox001.dds",
-        itemId = 190940,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=190940&quality=5",
-        name = "Music Box, Songbird's Paradise",
-        allNames = "Music Box, Songbird's Paradise",
-        furnDataId = "8692",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the uplifting \"Songbird's Paradise\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxnightmother001.dds",
-        itemId = 208160,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=208160&quality=5",
-        name = "Music Box, Sorrow of the Night Mother",
-        allNames = "Music Box, Sorrow of the Night Mother",
-        furnDataId = "10235",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the woeful music box composition \"Sorrow of the Night Mother.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxsteadfast001.dds",
-        itemId = 187666,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=187666&quality=5",
-        name = "Music Box, Steadfast Armistice",
-        allNames = "Music Box, Steadfast Armistice",
-        furnDataId = "8424",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the solemn \"Steadfast Armistice\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxblackreach001.dds",
-        itemId = 167007,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=167007&quality=5",
-        name = "Music Box, Subterranean Sonata",
-        allNames = "Music Box, Subterranean Sonata",
-        furnDataId = "7249",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the otherworldly \"Subterranean Sonata\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_heartsdaymusicbox001.dds",
-        itemId = 156553,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156553&quality=5",
-        name = "Music Box, That Breezy Night in Bruma",
-        allNames = "Music Box, That Breezy Night in Bruma",
-        furnDataId = "6529",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the romantic Heart's Day favorite, \"That Breezy Night in Bruma.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxwitch001.dds",
-        itemId = 153633,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=153633&quality=5",
-        name = "Music Box, The Ghosts of Frostfall",
-        allNames = "Music Box, The Ghosts of Frostfall",
-        furnDataId = "6435",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the music box composition \"The Ghosts of Frostfall.\"",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxleyawiin001.dds",
-        itemId = 171943,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171943&quality=5",
-        name = "Music Box, The Liberation of Leyawiin",
-        allNames = "Music Box, The Liberation of Leyawiin",
-        furnDataId = "7610",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the adventurous \"The Liberation of Leyawiin\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxjester001.dds",
-        itemId = 159596,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=159596&quality=5",
-        name = "Music Box, The Mad Harlequin's Reverie",
-        allNames = "Music Box, The Mad Harlequin's Reverie",
-        furnDataId = "6711",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the playful \"The Mad Harlequin's Reverie\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxbardscollege001.dds",
-        itemId = 163432,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=163432&quality=5",
-        name = "Music Box, The Merry Meadmaker",
-        allNames = "Music Box, The Merry Meadmaker",
-        furnDataId = "6840",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the jaunty \"The Merry Meadmaker\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxmurkmire001.dds",
-        itemId = 171944,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=171944&quality=5",
-        name = "Music Box, The Mirefrog's Hymn",
-        allNames = "Music Box, The Mirefrog's Hymn",
-        furnDataId = "7611",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the curiously adorable \"The Mirefrog's Hymn\" composition",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxgreyhost001.dds",
-        itemId = 163428,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=163428&quality=5",
-        name = "Music Box, The Shadows Stir",
-        allNames = "Music Box, The Shadows Stir",
-        furnDataId = "6770",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the haunting \"The Shadows Stir\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_clockworkmusicbox001.dds",
-        itemId = 181637,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=181637&quality=5",
-        name = "Music Box, Time's Architect",
-        allNames = "Music Box, Time's Architect",
-        furnDataId = "8057",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the enigmatic \"Time's Architect\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_hermaeusmoramusicbox001.dds",
-        itemId = 194399,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=194399&quality=5",
-        name = "Music Box, Unfathomable Knowledge",
-        allNames = "Music Box, Unfathomable Knowledge",
-        furnDataId = "8935",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the cryptic \"Unfathomable Knowledge\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxwitchmother001.dds",
-        itemId = 197826,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=197826&quality=5",
-        name = "Music Box, Witchmother's Bubbling Brew",
-        allNames = "Music Box, Witchmother's Bubbling Brew",
-        furnDataId = "9240",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "\"Pulp of pumpkin, dash of guts. Prep your cauldron, make your cuts. Capture death 'cause it's your due. Stir it all and then you're through.\" When activated, plays a music box arrangement of the macabre \"Witchmother's Bubbling Brew\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxaldmeri001.dds",
-        itemId = 147505,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=147505&quality=5",
-        name = "Music Box, Y'ffre in Every Leaf",
-        allNames = "Music Box, Y'ffre in Every Leaf",
-        furnDataId = "5888",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the Aldmeri Dominion \"Y'ffre in Every Leaf\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_musicboxspookylighthouse001.dds",
-        itemId = 183201,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=183201&quality=5",
-        name = "Music Box: Bleak Beacon Shanty",
-        allNames = "Music Box: Bleak Beacon Shanty",
-        furnDataId = "8248",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the eldritch \"Bleak Beacon Shanty\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_coralmusicbox001.dds",
-        itemId = 183200,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=183200&quality=5",
-        name = "Music Box: Wonders of the Shoals",
-        allNames = "Music Box: Wonders of the Shoals",
-        furnDataId = "8247",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays a music box arrangement of the whimsical \"Wonders of the Shoals\" composition.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_snowglobemusicbox001.dds",
-        itemId = 199113,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199113&quality=5",
-        name = "Music Box, New Life Snow Symphony",
-        allNames = "Music Box, New Life Snow Symphony",
-        furnDataId = "9531",
-        furnCategory = "Services:Music Boxes (25:182)",
-        description = "When activated, plays the ephemeral music box composition \"New Life Snow Symphony.\"",
-    },
-}
\ No newline at end of file
@@ -0,0 +1,1350 @@
+-- Generated by scripts/data_excel_to_lua.py: chunk 1 of paintings, built by modules/Loader.lua.
+local Data = _G["RanckorsGalleryData"] or {}
+Data.chunks = Data.chunks or {}
+Data.chunks.paintings = Data.chunks.paintings or {}
+Data.chunks.paintings[1] = function()
+    local paintings = {
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_metalframepainting005.dds",
+            itemId = 204807,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204807&quality=4",
+            name = "A Clear Day in Colovia Painting, Metal",
+            allNames = "A Clear Day in Colovia Painting, Metal",
+            furnDataId = "10091",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_metalframepainting008.dds",
+            itemId = 165834,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165834&quality=4",
+            name = "A Simple Five-Claw Life Painting, Gold",
+            allNames = "A Simple Five-Claw Life Painting, Gold",
+            furnDataId = "7097",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leywoodframepainting005.dds",
+            itemId = 178444,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178444&quality=4",
+            name = "A Study in Structure Painting, Wood",
+            allNames = "A Study in Structure Painting, Wood",
+            furnDataId = "7868",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_woodframepainting001.dds",
+            itemId = 165836,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165836&quality=4",
+            name = "A Warm Welcome Awaits Painting, Wood",
+            allNames = "A Warm Welcome Awaits Painting, Wood",
+            furnDataId = "7099",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_woodframepainting009.dds",
+            itemId = 187873,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187873&quality=4",
+            name = "Abecean Bounty Painting, Wood",
+            allNames = "Abecean Bounty Painting, Wood",
+            furnDataId = "8531",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe014.dds",
+            itemId = 197782,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197782&quality=4",
+            name = "Alleyway Still Life Painting",
+            allNames = "Alleyway Still Life Painting",
+            furnDataId = "9225",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_metalframepainting001.dds",
+            itemId = 204803,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204803&quality=4",
+            name = "An Alfiq in Skingrad Painting, Metal",
+            allNames = "An Alfiq in Skingrad Painting, Metal",
+            furnDataId = "10087",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepaintinggiant01.dds",
+            itemId = 204804,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204804&quality=4",
+            name = "Arch to Ayleid Mysteries Painting, Wood",
+            allNames = "Arch to Ayleid Mysteries Painting, Wood",
+            furnDataId = "10088",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_metalframepainting002.dds",
+            itemId = 187868,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187868&quality=4",
+            name = "Ascendant Silence Painting, Metal",
+            allNames = "Ascendant Silence Painting, Metal",
+            furnDataId = "8526",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepaintinggiant03.dds",
+            itemId = 204806,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204806&quality=4",
+            name = "Autumn on the Gold Road Painting, Wood",
+            allNames = "Autumn on the Gold Road Painting, Wood",
+            furnDataId = "10090",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_woodframepainting007.dds",
+            itemId = 165829,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165829&quality=4",
+            name = "Before the Trade Gathering Painting, Wood",
+            allNames = "Before the Trade Gathering Painting, Wood",
+            furnDataId = "7092",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leyunfinishedpainting001.dds",
+            itemId = 181507,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=181507&quality=5",
+            name = "Blackwood Cottage Painting, Unframed",
+            allNames = "Blackwood Cottage Painting, Unframed",
+            furnDataId = "7984",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting011.dds",
+            itemId = 166447,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166447&quality=4",
+            name = "Boon Companion, Brass",
+            allNames = "Boon Companion, Brass",
+            furnDataId = "7198",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_metalframepainting002.dds",
+            itemId = 165831,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165831&quality=4",
+            name = "Catnap Painting, Gold",
+            allNames = "Catnap Painting, Gold",
+            furnDataId = "7094",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_exc_wantedposterxed001.dds",
+            itemId = 120855,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=120855&quality=4",
+            name = "Collected Wanted Poster",
+            allNames = "Collected Wanted Poster",
+            furnDataId = "3065",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepaintingsimple005.dds",
+            itemId = 204755,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204755&quality=4",
+            name = "Colovian Bounty Painting, Wood",
+            allNames = "Colovian Bounty Painting, Wood",
+            furnDataId = "10039",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepaintinggiant02.dds",
+            itemId = 204805,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204805&quality=4",
+            name = "Colovian Windmill Painting, Wood",
+            allNames = "Colovian Windmill Painting, Wood",
+            furnDataId = "10089",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting007.dds",
+            itemId = 166443,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166443&quality=4",
+            name = "Contrasts Painting, Brass",
+            allNames = "Contrasts Painting, Brass",
+            furnDataId = "7194",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting003.dds",
+            itemId = 166439,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166439&quality=4",
+            name = "Depths of Darkness Painting, Brass",
+            allNames = "Depths of Darkness Painting, Brass",
+            furnDataId = "7190",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_metalframepainting004.dds",
+            itemId = 165842,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165842&quality=4",
+            name = "Dockside Painting, Silver",
+            allNames = "Dockside Painting, Silver",
+            furnDataId = "7105",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_antechoesofaldmeris001.dds",
+            itemId = 165849,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165849&quality=5",
+            name = "Echoes of Aldmeris",
+            allNames = "Echoes of Aldmeris",
+            furnDataId = "7112",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This triptych may stir ancestral memories in Mer—a longing of the soul for home. Or so the antiquarian claimed.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_metalframepainting005.dds",
+            itemId = 165833,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165833&quality=4",
+            name = "Elsweyr Dome Architecture Painting, Gold",
+            allNames = "Elsweyr Dome Architecture Painting, Gold",
+            furnDataId = "7096",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_metalframepainting003.dds",
+            itemId = 165832,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165832&quality=4",
+            name = "Elsweyr Landscape Painting, Gold",
+            allNames = "Elsweyr Landscape Painting, Gold",
+            furnDataId = "7095",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_woodframepainting009.dds",
+            itemId = 165830,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165830&quality=4",
+            name = "Elsweyr Vista Painting, Wood",
+            allNames = "Elsweyr Vista Painting, Wood",
+            furnDataId = "7093",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_woodframepainting004.dds",
+            itemId = 165827,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165827&quality=4",
+            name = "Eternal Moment Painting, Wood",
+            allNames = "Eternal Moment Painting, Wood",
+            furnDataId = "7090",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_woodframepainting001.dds",
+            itemId = 165826,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165826&quality=3",
+            name = "Fields of Plenty Painting, Wood",
+            allNames = "Fields of Plenty Painting, Wood",
+            furnDataId = "7089",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leymetalframepainting004.dds",
+            itemId = 178446,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178446&quality=4",
+            name = "Fire-Shaped Shadows Painting, Silver",
+            allNames = "Fire-Shaped Shadows Painting, Silver",
+            furnDataId = "7870",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting005.dds",
+            itemId = 166441,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166441&quality=4",
+            name = "Gargoyle Guardians Painting, Wood",
+            allNames = "Gargoyle Guardians Painting, Wood",
+            furnDataId = "7192",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_woodpaintinglarge006.dds",
+            itemId = 187877,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187877&quality=4",
+            name = "Gates of Gonfalon Bay Painting, Wood",
+            allNames = "Gates of Gonfalon Bay Painting, Wood",
+            furnDataId = "8535",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_metalframepainting005.dds",
+            itemId = 187870,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187870&quality=4",
+            name = "Gifts of the Sun Painting, Metal",
+            allNames = "Gifts of the Sun Painting, Metal",
+            furnDataId = "8528",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_woodpaintinglarge005.dds",
+            itemId = 187876,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187876&quality=4",
+            name = "Gonfalon Colossus Painting, Wood",
+            allNames = "Gonfalon Colossus Painting, Wood",
+            furnDataId = "8534",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepainting03.dds",
+            itemId = 204801,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204801&quality=4",
+            name = "Great Chapel of Julianos Painting, Wood",
+            allNames = "Great Chapel of Julianos Painting, Wood",
+            furnDataId = "10085",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leywoodpaintinglarge004.dds",
+            itemId = 178450,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178450&quality=4",
+            name = "Harvest's Gifts Painting, Wood",
+            allNames = "Harvest's Gifts Painting, Wood",
+            furnDataId = "7874",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_metalframepainting006.dds",
+            itemId = 187871,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187871&quality=4",
+            name = "High Isle Seahome Painting, Metal",
+            allNames = "High Isle Seahome Painting, Metal",
+            furnDataId = "8529",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_woodframepainting001.dds",
+            itemId = 178442,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178442&quality=4",
+            name = "Idylls of Gideon Painting, Wood",
+            allNames = "Idylls of Gideon Painting, Wood",
+            furnDataId = "7866",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_woodframepainting002.dds",
+            itemId = 165837,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165837&quality=4",
+            name = "Jarl of Morthal Painting, Wood",
+            allNames = "Jarl of Morthal Painting, Wood",
+            furnDataId = "7100",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leywoodframepainting008.dds",
+            itemId = 178445,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178445&quality=4",
+            name = "Leyawiin at Night Painting, Wood",
+            allNames = "Leyawiin at Night Painting, Wood",
+            furnDataId = "7869",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_woodframepainting006.dds",
+            itemId = 165828,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165828&quality=4",
+            name = "Life in Repose Painting, Wood",
+            allNames = "Life in Repose Painting, Wood",
+            furnDataId = "7091",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting004.dds",
+            itemId = 166440,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166440&quality=4",
+            name = "Light as Art Painting, Wood",
+            allNames = "Light as Art Painting, Wood",
+            furnDataId = "7191",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_woodframepainting003.dds",
+            itemId = 187872,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187872&quality=4",
+            name = "Light's Warning Painting, Wood",
+            allNames = "Light's Warning Painting, Wood",
+            furnDataId = "8530",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting008.dds",
+            itemId = 166444,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166444&quality=4",
+            name = "Luminescence Painting, Brass",
+            allNames = "Luminescence Painting, Brass",
+            furnDataId = "7195",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_woodframepainting010.dds",
+            itemId = 187874,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187874&quality=4",
+            name = "Masted Behemoth Painting, Wood",
+            allNames = "Masted Behemoth Painting, Wood",
+            furnDataId = "8532",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leymetalframepainting009.dds",
+            itemId = 178447,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178447&quality=4",
+            name = "Music in Repose Painting, Silver",
+            allNames = "Music in Repose Painting, Silver",
+            furnDataId = "7871",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe006.dds",
+            itemId = 197752,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197752&quality=4",
+            name = "Mycoturge's Retreat Painting, Wood",
+            allNames = "Mycoturge's Retreat Painting, Wood",
+            furnDataId = "9216",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe001.dds",
+            itemId = 197749,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197749&quality=4",
+            name = "Necrom Still Life Painting, Wood",
+            allNames = "Necrom Still Life Painting, Wood",
+            furnDataId = "9213",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_metalframepainting004.dds",
+            itemId = 187869,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187869&quality=4",
+            name = "Noble Still Life Painting, Metal",
+            allNames = "Noble Still Life Painting, Metal",
+            furnDataId = "8527",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe009.dds",
+            itemId = 197754,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197754&quality=4",
+            name = "Offerings to the Dead Painting, Wood",
+            allNames = "Offerings to the Dead Painting, Wood",
+            furnDataId = "9218",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood006.dds",
+            itemId = 139074,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139074&quality=4",
+            name = "Painting of Aldmeri Ruins, Refined",
+            allNames = "Painting of Aldmeri Ruins, Refined",
+            furnDataId = "5025",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood008.dds",
+            itemId = 139076,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139076&quality=4",
+            name = "Painting of Ancient Road, Refined",
+            allNames = "Painting of Ancient Road, Refined",
+            furnDataId = "5027",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varpuzzlepaintings003.dds",
+            itemId = 118267,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118267&quality=4",
+            name = "Painting of Autumn, Bolted",
+            allNames = "Painting of Autumn, Bolted",
+            furnDataId = "1743",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_housingpaintinggloomspore001.dds",
+            itemId = 159437,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=159437&quality=5",
+            name = "Painting of Blackreach, Rough",
+            allNames = "Painting of Blackreach, Rough",
+            furnDataId = "6678",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varpuzzlepaintings002.dds",
+            itemId = 118266,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118266&quality=4",
+            name = "Painting of Bridge, Bolted",
+            allNames = "Painting of Bridge, Bolted",
+            furnDataId = "1742",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood002.dds",
+            itemId = 139070,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139070&quality=4",
+            name = "Painting of College of the Sapiarchs, Refined",
+            allNames = "Painting of College of the Sapiarchs, Refined",
+            furnDataId = "5021",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain004.dds",
+            itemId = 118141,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118141&quality=4",
+            name = "Painting of Cottage, Refined",
+            allNames = "Painting of Cottage, Refined",
+            furnDataId = "1630",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant005.dds",
+            itemId = 118220,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118220&quality=4",
+            name = "Painting of Crags, Sturdy",
+            allNames = "Painting of Crags, Sturdy",
+            furnDataId = "1705",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant003.dds",
+            itemId = 118218,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118218&quality=4",
+            name = "Painting of Creek, Sturdy",
+            allNames = "Painting of Creek, Sturdy",
+            furnDataId = "1703",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varpuzzlepaintings004.dds",
+            itemId = 118268,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118268&quality=4",
+            name = "Painting of Great Ruins, Bolted",
+            allNames = "Painting of Great Ruins, Bolted",
+            furnDataId = "1744",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood001.dds",
+            itemId = 139069,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139069&quality=4",
+            name = "Painting of Gryphon Nest, Elegant",
+            allNames = "Painting of Gryphon Nest, Elegant",
+            furnDataId = "5020",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood003.dds",
+            itemId = 139071,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139071&quality=4",
+            name = "Painting of High Elf Tower, Refined",
+            allNames = "Painting of High Elf Tower, Refined",
+            furnDataId = "5022",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant007.dds",
+            itemId = 118222,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118222&quality=4",
+            name = "Painting of Jungle, Sturdy",
+            allNames = "Painting of Jungle, Sturdy",
+            furnDataId = "1707",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_els_inc_metalframepainting010.dds",
+            itemId = 165835,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165835&quality=4",
+            name = "Painting of Khajiiti Arch, Gold",
+            allNames = "Painting of Khajiiti Arch, Gold",
+            furnDataId = "7098",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant004.dds",
+            itemId = 118219,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118219&quality=4",
+            name = "Painting of Lakes, Sturdy",
+            allNames = "Painting of Lakes, Sturdy",
+            furnDataId = "1704",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood004.dds",
+            itemId = 139072,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139072&quality=4",
+            name = "Painting of Monastery of Serene Harmony, Refined",
+            allNames = "Painting of Monastery of Serene Harmony, Refined",
+            furnDataId = "5023",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain001.dds",
+            itemId = 118138,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118138&quality=4",
+            name = "Painting of Mountains, Refined",
+            allNames = "Painting of Mountains, Refined",
+            furnDataId = "1627",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_woodframepainting005.dds",
+            itemId = 165838,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165838&quality=4",
+            name = "Painting of Nord Ship, Wood",
+            allNames = "Painting of Nord Ship, Wood",
+            furnDataId = "7101",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant008.dds",
+            itemId = 118223,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118223&quality=4",
+            name = "Painting of Palms, Sturdy",
+            allNames = "Painting of Palms, Sturdy",
+            furnDataId = "1708",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant002.dds",
+            itemId = 118217,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118217&quality=4",
+            name = "Painting of Pasture, Sturdy",
+            allNames = "Painting of Pasture, Sturdy",
+            furnDataId = "1702",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood007.dds",
+            itemId = 139075,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139075&quality=4",
+            name = "Painting of Sinkhole, Refined",
+            allNames = "Painting of Sinkhole, Refined",
+            furnDataId = "5026",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant001.dds",
+            itemId = 118216,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118216&quality=4",
+            name = "Painting of Spring, Sturdy",
+            allNames = "Painting of Spring, Sturdy",
+            furnDataId = "1701",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_elegant006.dds",
+            itemId = 118221,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118221&quality=4",
+            name = "Painting of Summer, Sturdy",
+            allNames = "Painting of Summer, Sturdy",
+            furnDataId = "1706",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sum_inc_paintingwood005.dds",
+            itemId = 139073,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=139073&quality=4",
+            name = "Painting of Summerset Coast, Refined",
+            allNames = "Painting of Summerset Coast, Refined",
+            furnDataId = "5024",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain005.dds",
+            itemId = 118142,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118142&quality=4",
+            name = "Painting of Swamp, Refined",
+            allNames = "Painting of Swamp, Refined",
+            furnDataId = "1631",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain006.dds",
+            itemId = 118143,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118143&quality=4",
+            name = "Painting of Tree, Refined",
+            allNames = "Painting of Tree, Refined",
+            furnDataId = "1632",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain002.dds",
+            itemId = 118139,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118139&quality=4",
+            name = "Painting of Valley, Refined",
+            allNames = "Painting of Valley, Refined",
+            furnDataId = "1628",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_red_inc_varpuzzlepaintings001.dds",
+            itemId = 118265,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118265&quality=4",
+            name = "Painting of Winter, Bolted",
+            allNames = "Painting of Winter, Bolted",
+            furnDataId = "1741",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain008.dds",
+            itemId = 118145,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118145&quality=4",
+            name = "Painting of a Desert, Refined",
+            allNames = "Painting of a Desert, Refined",
+            furnDataId = "1634",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain007.dds",
+            itemId = 118144,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118144&quality=4",
+            name = "Painting of a Forest, Refined",
+            allNames = "Painting of a Forest, Refined",
+            furnDataId = "1633",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bre_inc_painting_plain003.dds",
+            itemId = 118140,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=118140&quality=4",
+            name = "Painting of a Waterfall, Refined",
+            allNames = "Painting of a Waterfall, Refined",
+            furnDataId = "1629",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_metalframepainting010.dds",
+            itemId = 165845,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165845&quality=4",
+            name = "Painting of the Arch, Silver",
+            allNames = "Painting of the Arch, Silver",
+            furnDataId = "7108",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leywoodframepainting004.dds",
+            itemId = 178443,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178443&quality=4",
+            name = "Path of Eternity Painting, Wood",
+            allNames = "Path of Eternity Painting, Wood",
+            furnDataId = "7867",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe017.dds",
+            itemId = 197783,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197783&quality=4",
+            name = "Pilgrimage Triptych Painting, Wood",
+            allNames = "Pilgrimage Triptych Painting, Wood",
+            furnDataId = "9226",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepainting02.dds",
+            itemId = 204800,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204800&quality=4",
+            name = "Preparing to Entertain Painting, Wood",
+            allNames = "Preparing to Entertain Painting, Wood",
+            furnDataId = "10084",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting002.dds",
+            itemId = 166438,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166438&quality=4",
+            name = "Red Mist Blooming Painting, Brass",
+            allNames = "Red Mist Blooming Painting, Brass",
+            furnDataId = "7189",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leywoodpaintinglarge005.dds",
+            itemId = 178451,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178451&quality=4",
+            name = "Reverence's Mandate Painting, Wood",
+            allNames = "Reverence's Mandate Painting, Wood",
+            furnDataId = "7875",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_metalframepainting007.dds",
+            itemId = 165843,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165843&quality=4",
+            name = "River's Journey Painting, Silver",
+            allNames = "River's Journey Painting, Silver",
+            furnDataId = "7106",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting013.dds",
+            itemId = 166449,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166449&quality=4",
+            name = "Scion's Throne Painting, Wood",
+            allNames = "Scion's Throne Painting, Wood",
+            furnDataId = "7200",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe010.dds",
+            itemId = 197755,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197755&quality=4",
+            name = "Shadow Over Necrom Painting",
+            allNames = "Shadow Over Necrom Painting",
+            furnDataId = "9219",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_metalframepainting003.dds",
+            itemId = 165841,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165841&quality=4",
+            name = "Silent Solitude Painting, Silver",
+            allNames = "Silent Solitude Painting, Silver",
+            furnDataId = "7104",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting010.dds",
+            itemId = 166446,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166446&quality=4",
+            name = "Still Life in Death Painting, Wood",
+            allNames = "Still Life in Death Painting, Wood",
+            furnDataId = "7197",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting001.dds",
+            itemId = 166437,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166437&quality=4",
+            name = "Stillness Everlasting Painting, Wood",
+            allNames = "Stillness Everlasting Painting, Wood",
+            furnDataId = "7188",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_metalframepaintinggiant003.dds",
+            itemId = 204754,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204754&quality=4",
+            name = "Sun-Gilded Vineyard Painting, Metal",
+            allNames = "Sun-Gilded Vineyard Painting, Metal",
+            furnDataId = "10038",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe005.dds",
+            itemId = 197751,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197751&quality=4",
+            name = "Sunset Fleet Painting, Wood",
+            allNames = "Sunset Fleet Painting, Wood",
+            furnDataId = "9215",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe002.dds",
+            itemId = 197750,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197750&quality=4",
+            name = "Telvanni Mushroom Spire Painting, Wood",
+            allNames = "Telvanni Mushroom Spire Painting, Wood",
+            furnDataId = "9214",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingbmedorg001.dds",
+            itemId = 126469,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126469&quality=4",
+            name = "Telvanni Painting, Classic Forest",
+            allNames = "Telvanni Painting, Classic Forest",
+            furnDataId = "3544",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingcmedorg001.dds",
+            itemId = 126470,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126470&quality=4",
+            name = "Telvanni Painting, Classic Valley",
+            allNames = "Telvanni Painting, Classic Valley",
+            furnDataId = "3545",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingamedorg001.dds",
+            itemId = 126468,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126468&quality=4",
+            name = "Telvanni Painting, Classic Volcanic",
+            allNames = "Telvanni Painting, Classic Volcanic",
+            furnDataId = "3543",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingbsmlorg001.dds",
+            itemId = 126466,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126466&quality=4",
+            name = "Telvanni Painting, Modest Forest",
+            allNames = "Telvanni Painting, Modest Forest",
+            furnDataId = "3541",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingcsmlorg001.dds",
+            itemId = 126467,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126467&quality=4",
+            name = "Telvanni Painting, Modest Valley",
+            allNames = "Telvanni Painting, Modest Valley",
+            furnDataId = "3542",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingasmlorg001.dds",
+            itemId = 126465,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126465&quality=4",
+            name = "Telvanni Painting, Modest Volcanic",
+            allNames = "Telvanni Painting, Modest Volcanic",
+            furnDataId = "3540",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingblrgorg001.dds",
+            itemId = 126463,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126463&quality=4",
+            name = "Telvanni Painting, Oversized Forest",
+            allNames = "Telvanni Painting, Oversized Forest",
+            furnDataId = "3538",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingclrgorg001.dds",
+            itemId = 126464,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126464&quality=4",
+            name = "Telvanni Painting, Oversized Valley",
+            allNames = "Telvanni Painting, Oversized Valley",
+            furnDataId = "3539",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_telpaintingalrgorg001.dds",
+            itemId = 126462,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126462&quality=4",
+            name = "Telvanni Painting, Oversized Volcanic",
+            allNames = "Telvanni Painting, Oversized Volcanic",
+            furnDataId = "3537",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe007.dds",
+            itemId = 197753,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197753&quality=4",
+            name = "Telvanni Peninsula Painting, Wood",
+            allNames = "Telvanni Peninsula Painting, Wood",
+            furnDataId = "9217",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_woodframepainting009.dds",
+            itemId = 165840,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165840&quality=4",
+            name = "The Bridge of Dragon Painting, Wood",
+            allNames = "The Bridge of Dragon Painting, Wood",
+            furnDataId = "7103",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_tlv_inc_necwoodpictureframe011.dds",
+            itemId = 197781,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=197781&quality=4",
+            name = "The City of Necrom Painting, Wood",
+            allNames = "The City of Necrom Painting, Wood",
+            furnDataId = "9224",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting006.dds",
+            itemId = 166442,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166442&quality=4",
+            name = "The Deception of Light Painting, Wood",
+            allNames = "The Deception of Light Painting, Wood",
+            furnDataId = "7193",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_uni_inc_antheartland001.dds",
+            itemId = 166434,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166434&quality=4",
+            name = "The Heartland",
+            allNames = "The Heartland",
+            furnDataId = "7185",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "Bask in the beauty and grandeur of Cyrodiil and the Imperial City, unmarred by the Three Banners War.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting009.dds",
+            itemId = 166445,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166445&quality=4",
+            name = "The Keep Painting, Brass",
+            allNames = "The Keep Painting, Brass",
+            furnDataId = "7196",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leywoodpaintinglarge003.dds",
+            itemId = 178449,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178449&quality=4",
+            name = "The Legacy of Kaladas Painting, Wood",
+            allNames = "The Legacy of Kaladas Painting, Wood",
+            furnDataId = "7873",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_metalframepainting008.dds",
+            itemId = 165844,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165844&quality=4",
+            name = "The Light Within Painting, Silver",
+            allNames = "The Light Within Painting, Silver",
+            furnDataId = "7107",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_housingmetalframepainting001.dds",
+            itemId = 167332,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=167332&quality=5",
+            name = "The Mage's Staff Painting, Gold",
+            allNames = "The Mage's Staff Painting, Gold",
+            furnDataId = "7251",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_metalframepainting004.dds",
+            itemId = 204799,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204799&quality=4",
+            name = "The Optimism of Dogs Painting, Metal",
+            allNames = "The Optimism of Dogs Painting, Metal",
+            furnDataId = "10083",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_vampirepainting012.dds",
+            itemId = 166448,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=166448&quality=4",
+            name = "The Scion Strides Forth Painting, Brass",
+            allNames = "The Scion Strides Forth Painting, Brass",
+            furnDataId = "7199",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_sys_inc_woodpaintinglarge002.dds",
+            itemId = 187875,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=187875&quality=4",
+            name = "Tor Draioch Towers Painting, Wood",
+            allNames = "Tor Draioch Towers Painting, Wood",
+            furnDataId = "8533",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a large house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_bad_inc_leymetalframepainting010.dds",
+            itemId = 178448,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=178448&quality=4",
+            name = "Undying Light Painting, Silver",
+            allNames = "Undying Light Painting, Silver",
+            furnDataId = "7872",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_woodframepainting006.dds",
+            itemId = 165839,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=165839&quality=4",
+            name = "Ursine Wandering Painting, Wood",
+            allNames = "Ursine Wandering Painting, Wood",
+            furnDataId = "7102",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingbmed001.dds",
+            itemId = 126602,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126602&quality=4",
+            name = "Velothi Painting, Classic Geyser",
+            allNames = "Velothi Painting, Classic Geyser",
+            furnDataId = "3673",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingamed001.dds",
+            itemId = 126594,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126594&quality=4",
+            name = "Velothi Painting, Classic Volcano",
+            allNames = "Velothi Painting, Classic Volcano",
+            furnDataId = "3665",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingcmed001.dds",
+            itemId = 126608,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126608&quality=4",
+            name = "Velothi Painting, Classic Waterfall",
+            allNames = "Velothi Painting, Classic Waterfall",
+            furnDataId = "3679",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingbsml001.dds",
+            itemId = 126603,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126603&quality=4",
+            name = "Velothi Painting, Modest Geyser",
+            allNames = "Velothi Painting, Modest Geyser",
+            furnDataId = "3674",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingasml001.dds",
+            itemId = 126595,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126595&quality=4",
+            name = "Velothi Painting, Modest Volcano",
+            allNames = "Velothi Painting, Modest Volcano",
+            furnDataId = "3666",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingcsml001.dds",
+            itemId = 126609,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126609&quality=4",
+            name = "Velothi Painting, Modest Waterfall",
+            allNames = "Velothi Painting, Modest Waterfall",
+            furnDataId = "3680",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a small house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingblrg001.dds",
+            itemId = 126601,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126601&quality=4",
+            name = "Velothi Painting, Oversized Geyser",
+            allNames = "Velothi Painting, Oversized Geyser",
+            furnDataId = "3672",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingalrg001.dds",
+            itemId = 126597,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126597&quality=4",
+            name = "Velothi Painting, Oversized Volcano",
+            allNames = "Velothi Painting, Oversized Volcano",
+            furnDataId = "3668",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingclrg001.dds",
+            itemId = 126607,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126607&quality=4",
+            name = "Velothi Painting, Oversized Waterfall",
+            allNames = "Velothi Painting, Oversized Waterfall",
+            furnDataId = "3678",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingblrg002.dds",
+            itemId = 126604,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126604&quality=4",
+            name = "Velothi Panels, Geyser",
+            allNames = "Velothi Panels, Geyser",
+            furnDataId = "3675",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingalrg002.dds",
+            itemId = 126592,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126592&quality=4",
+            name = "Velothi Panels, Volcano",
+            allNames = "Velothi Panels, Volcano",
+            furnDataId = "3663",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingclrg002.dds",
+            itemId = 126598,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126598&quality=4",
+            name = "Velothi Panels, Waterfall",
+            allNames = "Velothi Panels, Waterfall",
+            furnDataId = "3669",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingblrg004.dds",
+            itemId = 126599,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126599&quality=4",
+            name = "Velothi Triptych, Geyser",
+            allNames = "Velothi Triptych, Geyser",
+            furnDataId = "3670",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingalrg004.dds",
+            itemId = 126593,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126593&quality=4",
+            name = "Velothi Triptych, Volcano",
+            allNames = "Velothi Triptych, Volcano",
+            furnDataId = "3664",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_vrd_inc_paintingclrg004.dds",
+            itemId = 126605,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=126605&quality=4",
+            name = "Velothi Triptych, Waterfall",
+            allNames = "Velothi Triptych, Waterfall",
+            furnDataId = "3676",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_metalframepaintinggiant002.dds",
+            itemId = 204808,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204808&quality=4",
+            name = "West Weald Adventures Painting, Metal",
+            allNames = "West Weald Adventures Painting, Metal",
+            furnDataId = "10092",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_skr_inc_unfinishedpainting002.dds",
+            itemId = 167340,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=167340&quality=5",
+            name = "Winter Cardinal Painting, In Progress",
+            allNames = "Winter Cardinal Painting, In Progress",
+            furnDataId = "7322",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+        {
+            icon = "/esoui/art/icons/housing_chl_inc_woodframepainting04.dds",
+            itemId = 204802,
+            link = "https://esoitem.uesp.net/itemLink.php?&itemid=204802&quality=4",
+            name = "Wonders of Water Painting, Wood",
+            allNames = "Wonders of Water Painting, Wood",
+            furnDataId = "10086",
+            furnCategory = "Gallery:Paintings (9:54)",
+            description = "This is a standard house item.",
+        },
+    }
+    return paintings
+end
+_G["RanckorsGalleryData"] = Data
\ No newline at end of file
@@ -1,1582 +0,0 @@
-local tapestries = {
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_housingmuseumdrape001.dds",
-        itemId = 210896,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=210896&quality=3",
-        name = "10-Year Anniversary Drape, Wall",
-        allNames = "10-Year Anniversary Drape, Wall",
-        furnDataId = "10273",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "Celebrate the 10-Year Anniversary of The Elder Scrolls Online with this drape.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_inc_drapesmedium001.dds",
-        itemId = 139313,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139313&quality=3",
-        name = "Alinor Curtains, Drawn",
-        allNames = "Alinor Curtains, Drawn",
-        furnDataId = "5264",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_inc_drapeslong001.dds",
-        itemId = 139312,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139312&quality=3",
-        name = "Alinor Curtains, Tall Drawn",
-        allNames = "Alinor Curtains, Tall Drawn",
-        furnDataId = "5263",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_inc_drapesshort001.dds",
-        itemId = 139314,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139314&quality=4",
-        name = "Alinor Drapes, Noble",
-        allNames = "Alinor Drapes, Noble",
-        furnDataId = "5265",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_inc_tapestry001.dds",
-        itemId = 139321,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139321&quality=3",
-        name = "Alinor Tapestry, Alinor Dawn",
-        allNames = "Alinor Tapestry, Alinor Dawn",
-        furnDataId = "5272",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_inc_tapestry002.dds",
-        itemId = 139322,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139322&quality=3",
-        name = "Alinor Tapestry, Alinor Dusk",
-        allNames = "Alinor Tapestry, Alinor Dusk",
-        furnDataId = "5273",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sum_inc_tapestry003.dds",
-        itemId = 139323,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139323&quality=3",
-        name = "Alinor Tapestry, Royal Gryphons",
-        allNames = "Alinor Tapestry, Royal Gryphons",
-        furnDataId = "5274",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_curtain001.dds",
-        itemId = 115508,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115508&quality=4",
-        name = "Argonian Curtain of Smoke",
-        allNames = "Argonian Curtain of Smoke",
-        furnDataId = "810",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_curtain002.dds",
-        itemId = 115509,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115509&quality=4",
-        name = "Argonian Curtain of the Nest",
-        allNames = "Argonian Curtain of the Nest",
-        furnDataId = "811",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkwalldivider001.dds",
-        itemId = 115487,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115487&quality=3",
-        name = "Argonian Curtain, Woven",
-        allNames = "Argonian Curtain, Woven",
-        furnDataId = "789",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrkwalldivider002.dds",
-        itemId = 115488,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115488&quality=3",
-        name = "Argonian Curtains, Woven",
-        allNames = "Argonian Curtains, Woven",
-        furnDataId = "790",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryblackfeatherknightsmall001.dds",
-        itemId = 188272,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188272&quality=3",
-        name = "Blackfeather Knight Tapestry",
-        allNames = "Blackfeather Knight Tapestry",
-        furnDataId = "8582",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryblackfeatherknightlarge001.dds",
-        itemId = 188273,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188273&quality=4",
-        name = "Blackfeather Knight Tapestry, Large",
-        allNames = "Blackfeather Knight Tapestry, Large",
-        furnDataId = "8583",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_leyblackwoodtapestry001.dds",
-        itemId = "",
-        link = "https://esoitem.uesp.net/itemLink.php?&collectid=9524&quality=5",
-        name = "Blackwood Tapestry",
-        allNames = "",
-        furnDataId = "",
-        furnCategory = "Parlor",
-        description = "Exquisitely designed, this warm-hued tapestry of Blackwood serves as both an art piece and a practical guide to the region.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_drapelarge001.dds",
-        itemId = 115255,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115255&quality=4",
-        name = "Breton Curtains, Window",
-        allNames = "Breton Curtains, Window",
-        furnDataId = "560",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_lsb_drapesmall001.dds",
-        itemId = 115244,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115244&quality=4",
-        name = "Breton Drapes, Grand",
-        allNames = "Breton Drapes, Grand",
-        furnDataId = "549",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_tapestry002.dds",
-        itemId = 115239,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115239&quality=4",
-        name = "Breton Tapestry, Boughs",
-        allNames = "Breton Tapestry, Boughs",
-        furnDataId = "544",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bre_inc_tapestry001.dds",
-        itemId = 115253,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115253&quality=4",
-        name = "Breton Tapestry, Vines",
-        allNames = "Breton Tapestry, Vines",
-        furnDataId = "558",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhsantuarytap001.dds",
-        itemId = 121271,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=121271&quality=4",
-        name = "Brotherhood Tapestry",
-        allNames = "Brotherhood Tapestry",
-        furnDataId = "3203",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhsantuarytap002.dds",
-        itemId = 134845,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134845&quality=4",
-        name = "Brotherhood Tapestry, Small",
-        allNames = "Brotherhood Tapestry, Small",
-        furnDataId = "4834",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrychromaticreservoirsmall001.dds",
-        itemId = 199116,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199116&quality=3",
-        name = "Chromatic Reservoir Tapestry",
-        allNames = "Chromatic Reservoir Tapestry",
-        furnDataId = "9534",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrychromaticreservoirsmall001.dds",
-        itemId = 199117,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199117&quality=4",
-        name = "Chromatic Reservoir Tapestry, Large",
-        allNames = "Chromatic Reservoir Tapestry, Large",
-        furnDataId = "9535",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_curtain008.dds",
-        itemId = 204721,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204721&quality=3",
-        name = "Colovian Curtains, Ivory",
-        allNames = "Colovian Curtains, Ivory",
-        furnDataId = "10005",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_curtain001.dds",
-        itemId = 204723,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204723&quality=4",
-        name = "Colovian Curtains, Noble",
-        allNames = "Colovian Curtains, Noble",
-        furnDataId = "10007",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_curtain004.dds",
-        itemId = 204722,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204722&quality=4",
-        name = "Colovian Curtains, Sage",
-        allNames = "Colovian Curtains, Sage",
-        furnDataId = "10006",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_tapestrymural004.dds",
-        itemId = 204625,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204625&quality=2",
-        name = "Colovian Tapestry, Fancy Gate",
-        allNames = "Colovian Tapestry, Fancy Gate",
-        furnDataId = "9909",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "A faded holdover from a more prosperous time in the Empire's past.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_tapestrymural003.dds",
-        itemId = 204624,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204624&quality=2",
-        name = "Colovian Tapestry, Pastoral Farm",
-        allNames = "Colovian Tapestry, Pastoral Farm",
-        furnDataId = "9908",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "The fertile ground of West Weald is ideal for all kinds of planting and growing. Its art speaks to this tradition, and this strength.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_tapestrymural002.dds",
-        itemId = 208117,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=208117&quality=5",
-        name = "Colovian Tapestry, Red Diamond",
-        allNames = "Colovian Tapestry, Red Diamond",
-        furnDataId = "10202",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_chl_inc_tapestrymural001.dds",
-        itemId = 204623,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204623&quality=2",
-        name = "Colovian Tapestry, Worn",
-        allNames = "Colovian Tapestry, Worn",
-        furnDataId = "9907",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "The rich blue dyes featured on this tapestry come from over the border in Hammerfell, commemorating the centuries-long trade relationship between that region and Colovia.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cra_inc_tapestry001.dds",
-        itemId = 119931,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119931&quality=5",
-        name = "Craglorn Tapestry",
-        allNames = "Craglorn Tapestry",
-        furnDataId = "2376",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "A reconstruction of the famous tapestry depicting the conflict of the Constellations.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_cld_lsb_bannerlarge001.dds",
-        itemId = 130084,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130084&quality=4",
-        name = "Daedric Tapestry, Molag Bal",
-        allNames = "Daedric Tapestry, Molag Bal",
-        furnDataId = "3908",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_inc_tapestry001.dds",
-        itemId = 115284,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115284&quality=2",
-        name = "Dark Elf Tapestry, Emblazoned",
-        allNames = "Dark Elf Tapestry, Emblazoned",
-        furnDataId = "588",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_dedcurtains001.dds",
-        itemId = 182245,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182245&quality=3",
-        name = "Deadlands Curtains, Closed",
-        allNames = "Deadlands Curtains, Closed",
-        furnDataId = "8113",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_dedcurtains002.dds",
-        itemId = 182243,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182243&quality=3",
-        name = "Deadlands Curtains, Open",
-        allNames = "Deadlands Curtains, Open",
-        furnDataId = "8111",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_dedtapestry008.dds",
-        itemId = 182244,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182244&quality=3",
-        name = "Deadlands Tapestry",
-        allNames = "Deadlands Tapestry",
-        furnDataId = "8112",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_dedtapestry006.dds",
-        itemId = 182246,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=182246&quality=3",
-        name = "Deadlands Tapestry, Long",
-        allNames = "Deadlands Tapestry, Long",
-        furnDataId = "8114",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_fardagontapestry001.dds",
-        itemId = 184097,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=184097&quality=5",
-        name = "Deadlands Tapestry, Mehrunes Dagon",
-        allNames = "Deadlands Tapestry, Mehrunes Dagon",
-        furnDataId = "8327",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_exc_joustingbuntinghoriz001.dds",
-        itemId = 192570,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192570&quality=3",
-        name = "Decorative Wall Drape, Mauve",
-        allNames = "Decorative Wall Drape, Mauve",
-        furnDataId = "8828",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerdres001.dds",
-        itemId = 126774,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126774&quality=4",
-        name = "Dres Tapestry, House",
-        allNames = "Dres Tapestry, House",
-        furnDataId = "3800",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_hlatapestry001.dds",
-        itemId = 126364,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126364&quality=3",
-        name = "Dres Tapestry, Vines",
-        allNames = "Dres Tapestry, Vines",
-        furnDataId = "3439",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_inc_druwallhanging001.dds",
-        itemId = 191189,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=191189&quality=3",
-        name = "Druidic Tapestry, Woven",
-        allNames = "Druidic Tapestry, Woven",
-        furnDataId = "8744",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_drapes001.dds",
-        itemId = 151677,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151677&quality=3",
-        name = "Elsweyr Curtains, Flat Panel Maroon",
-        allNames = "Elsweyr Curtains, Flat Panel Maroon",
-        furnDataId = "6074",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_drapes002.dds",
-        itemId = 151678,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151678&quality=3",
-        name = "Elsweyr Curtains, Tied-Back Blue",
-        allNames = "Elsweyr Curtains, Tied-Back Blue",
-        furnDataId = "6075",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_clothbeddivider001.dds",
-        itemId = 151676,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151676&quality=4",
-        name = "Elsweyr Curtains, Wide Maroon",
-        allNames = "Elsweyr Curtains, Wide Maroon",
-        furnDataId = "6073",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestry002.dds",
-        itemId = 151759,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151759&quality=3",
-        name = "Elsweyr Tapestry, Amber Vines",
-        allNames = "Elsweyr Tapestry, Amber Vines",
-        furnDataId = "6156",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestry004.dds",
-        itemId = 151761,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151761&quality=3",
-        name = "Elsweyr Tapestry, Ruby-Maroon",
-        allNames = "Elsweyr Tapestry, Ruby-Maroon",
-        furnDataId = "6158",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestry003.dds",
-        itemId = 151760,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151760&quality=3",
-        name = "Elsweyr Tapestry, Verdant Blossom",
-        allNames = "Elsweyr Tapestry, Verdant Blossom",
-        furnDataId = "6157",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestry001.dds",
-        itemId = 151758,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151758&quality=3",
-        name = "Elsweyr Tapestry, Water Flowers",
-        allNames = "Elsweyr Tapestry, Water Flowers",
-        furnDataId = "6155",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_farwallfabrics003.dds",
-        itemId = 211562,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=211562&quality=3",
-        name = "Fabric Wall",
-        allNames = "Fabric Wall",
-        furnDataId = "10447",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryforestwraithsmall001.dds",
-        itemId = 192403,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192403&quality=3",
-        name = "Forest Wraith Tapestry",
-        allNames = "Forest Wraith Tapestry",
-        furnDataId = "8787",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryforestwraithlarge001.dds",
-        itemId = 192404,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192404&quality=4",
-        name = "Forest Wraith Tapestry, Large",
-        allNames = "Forest Wraith Tapestry, Large",
-        furnDataId = "8788",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_inc_grayhosttapestry001.dds",
-        itemId = 166030,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166030&quality=5",
-        name = "Greymoor Tapestry, Harrowstorm",
-        allNames = "Greymoor Tapestry, Harrowstorm",
-        furnDataId = "7182",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryhagravenmatronsmall001.dds",
-        itemId = 188274,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188274&quality=3",
-        name = "Hagraven Matron Tapestry",
-        allNames = "Hagraven Matron Tapestry",
-        furnDataId = "8584",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryhagravenmatronlarge001.dds",
-        itemId = 188275,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188275&quality=4",
-        name = "Hagraven Matron Tapestry, Large",
-        allNames = "Hagraven Matron Tapestry, Large",
-        furnDataId = "8585",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryhandofalmalexiasmall001.dds",
-        itemId = 193784,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=193784&quality=3",
-        name = "Hand of Almalexia Tapestry",
-        allNames = "Hand of Almalexia Tapestry",
-        furnDataId = "8847",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryhandofalmalexia001.dds",
-        itemId = 193783,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=193783&quality=4",
-        name = "Hand of Almalexia Tapestry, Large",
-        allNames = "Hand of Almalexia Tapestry, Large",
-        furnDataId = "8846",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_alt_inc_tapestry004.dds",
-        itemId = 114400,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=114400&quality=4",
-        name = "High Elf Tapestry, Eagle",
-        allNames = "High Elf Tapestry, Eagle",
-        furnDataId = "327",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_alt_inc_tapestry005.dds",
-        itemId = 114424,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=114424&quality=4",
-        name = "High Elf Tapestry, Gilded",
-        allNames = "High Elf Tapestry, Gilded",
-        furnDataId = "351",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_alt_inc_tapestry003.dds",
-        itemId = 114339,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=114339&quality=2",
-        name = "High Elf Tapestry, Rustic",
-        allNames = "High Elf Tapestry, Rustic",
-        furnDataId = "274",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_alt_inc_tapestry002.dds",
-        itemId = 114364,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=114364&quality=3",
-        name = "High Elf Tapestry, Tree-Themed",
-        allNames = "High Elf Tapestry, Tree-Themed",
-        furnDataId = "291",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_alt_inc_tapestry001.dds",
-        itemId = 114363,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=114363&quality=3",
-        name = "High Elf Tapestry, Water-Themed",
-        allNames = "High Elf Tapestry, Water-Themed",
-        furnDataId = "290",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_inc_tapestry001.dds",
-        itemId = 189468,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=189468&quality=5",
-        name = "High Isle Tapestry, Seaside Tourney",
-        allNames = "High Isle Tapestry, Seaside Tourney",
-        furnDataId = "8632",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryhlaalucouncilorsmall001.dds",
-        itemId = 188276,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188276&quality=3",
-        name = "Hlaalu Councilor Tapestry",
-        allNames = "Hlaalu Councilor Tapestry",
-        furnDataId = "8586",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryhlaalucouncilorlarge001.dds",
-        itemId = 188277,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188277&quality=4",
-        name = "Hlaalu Councilor Tapestry, Large",
-        allNames = "Hlaalu Councilor Tapestry, Large",
-        furnDataId = "8587",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_hlatapestryplain001.dds",
-        itemId = 126365,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126365&quality=3",
-        name = "Hlaalu Tapestry, Floral",
-        allNames = "Hlaalu Tapestry, Floral",
-        furnDataId = "3440",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerhlaalu001.dds",
-        itemId = 126775,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126775&quality=4",
-        name = "Hlaalu Tapestry, House",
-        allNames = "Hlaalu Tapestry, House",
-        furnDataId = "3801",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhcurtains001.dds",
-        itemId = 175761,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175761&quality=4",
-        name = "Imperial Curtains, Heavy",
-        allNames = "Imperial Curtains, Heavy",
-        furnDataId = "7826",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestryakatoshlargea003.dds",
-        itemId = 94129,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94129&quality=3",
-        name = "Imperial Tapestry, Arkay",
-        allNames = "Imperial Tapestry, Arkay",
-        furnDataId = "188",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_col_inc_dbhtapestrydibellaflowerlg001.dds",
-        itemId = 94191,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94191&quality=4",
-        name = "Imperial Tapestry, Dibella",
-        allNames = "Imperial Tapestry, Dibella",
-        furnDataId = "250",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestrykynelargea003.dds",
-        itemId = 94130,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94130&quality=3",
-        name = "Imperial Tapestry, Kynareth",
-        allNames = "Imperial Tapestry, Kynareth",
-        furnDataId = "189",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestrywidea003.dds",
-        itemId = 94158,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94158&quality=4",
-        name = "Imperial Tapestry, Stars",
-        allNames = "Imperial Tapestry, Stars",
-        furnDataId = "217",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_imp_inc_tapestrystendarrlargea003.dds",
-        itemId = 94131,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=94131&quality=3",
-        name = "Imperial Tapestry, Stendarr",
-        allNames = "Imperial Tapestry, Stendarr",
-        furnDataId = "190",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_hlatapestryalmalexia001.dds",
-        itemId = 126550,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126550&quality=4",
-        name = "Indoril Tapestry, Almalexia",
-        allNames = "Indoril Tapestry, Almalexia",
-        furnDataId = "3625",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerindoril001.dds",
-        itemId = 126776,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126776&quality=4",
-        name = "Indoril Tapestry, House",
-        allNames = "Indoril Tapestry, House",
-        furnDataId = "3802",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_hlatapestrysothasil001.dds",
-        itemId = 126551,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126551&quality=4",
-        name = "Indoril Tapestry, Sotha Sil",
-        allNames = "Indoril Tapestry, Sotha Sil",
-        furnDataId = "3626",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_hlatapestryvivec001.dds",
-        itemId = 126552,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126552&quality=4",
-        name = "Indoril Tapestry, Vivec",
-        allNames = "Indoril Tapestry, Vivec",
-        furnDataId = "3627",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_inc_curtain002.dds",
-        itemId = 115676,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115676&quality=3",
-        name = "Khajiit Curtains, Moons",
-        allNames = "Khajiit Curtains, Moons",
-        furnDataId = "976",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_inc_curtain003.dds",
-        itemId = 115692,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115692&quality=4",
-        name = "Khajiit Drapes, Grand",
-        allNames = "Khajiit Drapes, Grand",
-        furnDataId = "992",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_kha_inc_curtain001.dds",
-        itemId = 115642,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115642&quality=2",
-        name = "Khajiit Drapes, Tattered",
-        allNames = "Khajiit Drapes, Tattered",
-        furnDataId = "942",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryknightcommandersmall001.dds",
-        itemId = 188278,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188278&quality=3",
-        name = "Knight Commander Tapestry",
-        allNames = "Knight Commander Tapestry",
-        furnDataId = "8588",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryknightcommanderlarge001.dds",
-        itemId = 188279,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188279&quality=4",
-        name = "Knight Commander Tapestry, Large",
-        allNames = "Knight Commander Tapestry, Large",
-        furnDataId = "8589",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrysmall008.dds",
-        itemId = 175602,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175602&quality=2",
-        name = "Leyawiin Banner, Abstract",
-        allNames = "Leyawiin Banner, Abstract",
-        furnDataId = "7696",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrylarge001.dds",
-        itemId = 175696,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175696&quality=4",
-        name = "Leyawiin Tapestry, Divines Horizontal",
-        allNames = "Leyawiin Tapestry, Divines Horizontal",
-        furnDataId = "7790",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrylarge005.dds",
-        itemId = 175697,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175697&quality=4",
-        name = "Leyawiin Tapestry, Divines Vertical",
-        allNames = "Leyawiin Tapestry, Divines Vertical",
-        furnDataId = "7791",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrylarge009.dds",
-        itemId = 175605,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175605&quality=4",
-        name = "Leyawiin Tapestry, Fleet",
-        allNames = "Leyawiin Tapestry, Fleet",
-        furnDataId = "7699",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_leycathedraltapestry001.dds",
-        itemId = 175601,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175601&quality=4",
-        name = "Leyawiin Tapestry, Floral",
-        allNames = "Leyawiin Tapestry, Floral",
-        furnDataId = "7695",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrylarge003.dds",
-        itemId = 181504,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=181504&quality=5",
-        name = "Leyawiin Tapestry, Hunting Party",
-        allNames = "Leyawiin Tapestry, Hunting Party",
-        furnDataId = "7981",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrysmall004.dds",
-        itemId = 175603,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175603&quality=3",
-        name = "Leyawiin Tapestry, Lone Vessel",
-        allNames = "Leyawiin Tapestry, Lone Vessel",
-        furnDataId = "7697",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bad_inc_tapestrysmall009.dds",
-        itemId = 175604,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175604&quality=3",
-        name = "Leyawiin Tapestry, Twin Vessels",
-        allNames = "Leyawiin Tapestry, Twin Vessels",
-        furnDataId = "7698",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestrymoondancer002.dds",
-        itemId = 151826,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151826&quality=4",
-        name = "Lunar Tapestry, The Dance",
-        allNames = "Lunar Tapestry, The Dance",
-        furnDataId = "6223",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestrymoondancer004.dds",
-        itemId = 151828,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151828&quality=4",
-        name = "Lunar Tapestry, The Demon",
-        allNames = "Lunar Tapestry, The Demon",
-        furnDataId = "6225",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestrymoondancer003.dds",
-        itemId = 151827,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151827&quality=4",
-        name = "Lunar Tapestry, The Gate",
-        allNames = "Lunar Tapestry, The Gate",
-        furnDataId = "6224",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestrymoondancer001.dds",
-        itemId = 151825,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151825&quality=4",
-        name = "Lunar Tapestry, The Gathering",
-        allNames = "Lunar Tapestry, The Gathering",
-        furnDataId = "6222",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_els_inc_tapestrymoonpath001.dds",
-        itemId = 151824,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=151824&quality=4",
-        name = "Lunar Tapestry, The Open Path",
-        allNames = "Lunar Tapestry, The Open Path",
-        furnDataId = "6221",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_sys_inc_magetowertapestry001.dds",
-        itemId = 193810,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=193810&quality=5",
-        name = "Mage Tapestry, Aurbic Phoenix",
-        allNames = "Mage Tapestry, Aurbic Phoenix",
-        furnDataId = "8886",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_mao_fur_dividerwallsmall001.dds",
-        itemId = 192412,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192412&quality=4",
-        name = "Maormer Curtain, Serpentine Cloth",
-        allNames = "Maormer Curtain, Serpentine Cloth",
-        furnDataId = "8796",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrymercymothersmaraudersmall001.dds",
-        itemId = 193786,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=193786&quality=3",
-        name = "Mercymother Elite Tapestry",
-        allNames = "Mercymother Elite Tapestry",
-        furnDataId = "8849",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrymercymothersmarauder001.dds",
-        itemId = 193785,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=193785&quality=4",
-        name = "Mercymother Elite Tapestry, Large",
-        allNames = "Mercymother Elite Tapestry, Large",
-        furnDataId = "8848",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrymorihausarchersmall001.dds",
-        itemId = 204413,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204413&quality=3",
-        name = "Morihaus the Archer Tapestry",
-        allNames = "Morihaus the Archer Tapestry",
-        furnDataId = "9850",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrymorihausarcher001.dds",
-        itemId = 204414,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204414&quality=4",
-        name = "Morihaus the Archer Tapestry, Large",
-        allNames = "Morihaus the Archer Tapestry, Large",
-        furnDataId = "9851",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrktapestryclean002.dds",
-        itemId = 145390,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145390&quality=3",
-        name = "Murkmire Tapestry, Hist Gathering",
-        allNames = "Murkmire Tapestry, Hist Gathering",
-        furnDataId = "5693",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrktapestry002.dds",
-        itemId = 145396,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145396&quality=3",
-        name = "Murkmire Tapestry, Hist Gathering Worn",
-        allNames = "Murkmire Tapestry, Hist Gathering Worn",
-        furnDataId = "5699",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrktapestryclean001.dds",
-        itemId = 145395,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145395&quality=2",
-        name = "Murkmire Tapestry, Xanmeer",
-        allNames = "Murkmire Tapestry, Xanmeer",
-        furnDataId = "5698",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_arg_inc_mrktapestry001.dds",
-        itemId = 145401,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=145401&quality=2",
-        name = "Murkmire Tapestry, Xanmeer Worn",
-        allNames = "Murkmire Tapestry, Xanmeer Worn",
-        furnDataId = "5704",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_nor_inc_tapestry002.dds",
-        itemId = 115392,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115392&quality=3",
-        name = "Nord Tapestry, Dragon",
-        allNames = "Nord Tapestry, Dragon",
-        furnDataId = "694",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_nor_inc_tapestry003.dds",
-        itemId = 115414,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115414&quality=4",
-        name = "Nord Tapestry, Ship",
-        allNames = "Nord Tapestry, Ship",
-        furnDataId = "716",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_wtgtapestry001.dds",
-        itemId = 116454,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116454&quality=4",
-        name = "Orcish Tapestry, Axe",
-        allNames = "Orcish Tapestry, Axe",
-        furnDataId = "1125",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_wtgtapestry002.dds",
-        itemId = 116455,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116455&quality=4",
-        name = "Orcish Tapestry, Heroes",
-        allNames = "Orcish Tapestry, Heroes",
-        furnDataId = "1126",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_wtgtapestrylarge002.dds",
-        itemId = 116513,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116513&quality=4",
-        name = "Orcish Tapestry, Hunt",
-        allNames = "Orcish Tapestry, Hunt",
-        furnDataId = "1179",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_wtgtapestry004.dds",
-        itemId = 116457,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116457&quality=5",
-        name = "Orcish Tapestry, Spear",
-        allNames = "Orcish Tapestry, Spear",
-        furnDataId = "1128",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_wtgtapestry003.dds",
-        itemId = 116456,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116456&quality=4",
-        name = "Orcish Tapestry, Sword",
-        allNames = "Orcish Tapestry, Sword",
-        furnDataId = "1127",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_wtgtapestrylarge001.dds",
-        itemId = 116477,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=116477&quality=4",
-        name = "Orcish Tapestry, War",
-        allNames = "Orcish Tapestry, War",
-        furnDataId = "1148",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryprowlingshadowsmall001.dds",
-        itemId = 188280,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188280&quality=3",
-        name = "Prowling Shadow Tapestry",
-        allNames = "Prowling Shadow Tapestry",
-        furnDataId = "8590",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryprowlingshadowlarge001.dds",
-        itemId = 188281,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188281&quality=4",
-        name = "Prowling Shadow Tapestry, Large",
-        allNames = "Prowling Shadow Tapestry, Large",
-        furnDataId = "8591",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrypyandoneanwarfleetsmall001.dds",
-        itemId = 188282,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188282&quality=3",
-        name = "Pyandonean War Fleet Tapestry",
-        allNames = "Pyandonean War Fleet Tapestry",
-        furnDataId = "8592",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrypyandoneanwarfleetlarge001.dds",
-        itemId = 188283,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188283&quality=4",
-        name = "Pyandonean War Fleet Tapestry, Large",
-        allNames = "Pyandonean War Fleet Tapestry, Large",
-        furnDataId = "8593",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_tapestrysmall002.dds",
-        itemId = 117694,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=117694&quality=2",
-        name = "Redguard Curtain, Desert Rose",
-        allNames = "Redguard Curtain, Desert Rose",
-        furnDataId = "1216",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_tapestrysmall001.dds",
-        itemId = 117693,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=117693&quality=2",
-        name = "Redguard Curtain, Smoky",
-        allNames = "Redguard Curtain, Smoky",
-        furnDataId = "1215",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_tapestrymedium001.dds",
-        itemId = 117738,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=117738&quality=3",
-        name = "Redguard Tapestry, Lattice",
-        allNames = "Redguard Tapestry, Lattice",
-        furnDataId = "1260",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_inc_tapestrylarge001.dds",
-        itemId = 117808,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=117808&quality=4",
-        name = "Redguard Tapestry, Oasis",
-        allNames = "Redguard Tapestry, Oasis",
-        furnDataId = "1327",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_red_str_varawningstandaloneside001.dds",
-        itemId = 117861,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=117861&quality=4",
-        name = "Redguard Tapestry, Starry",
-        allNames = "Redguard Tapestry, Starry",
-        furnDataId = "1374",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannerredoran001.dds",
-        itemId = 126777,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126777&quality=4",
-        name = "Redoran Tapestry, House",
-        allNames = "Redoran Tapestry, House",
-        furnDataId = "3803",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryladyofheavenswrathsmall001.dds",
-        itemId = 204415,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204415&quality=3",
-        name = "Saint's Wrath Tapestry",
-        allNames = "Saint's Wrath Tapestry",
-        furnDataId = "9852",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryladyofheavenswrath001.dds",
-        itemId = 204416,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=204416&quality=4",
-        name = "Saint's Wrath Tapestry, Large",
-        allNames = "Saint's Wrath Tapestry, Large",
-        furnDataId = "9853",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryseekeraspirantsmall001.dds",
-        itemId = 199114,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199114&quality=3",
-        name = "Seeker Aspirant Tapestry",
-        allNames = "Seeker Aspirant Tapestry",
-        furnDataId = "9532",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryseekeraspirant001.dds",
-        itemId = 199115,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=199115&quality=4",
-        name = "Seeker Aspirant Tapestry, Large",
-        allNames = "Seeker Aspirant Tapestry, Large",
-        furnDataId = "9533",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryserpentguardridersmall001.dds",
-        itemId = 188284,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188284&quality=3",
-        name = "Serpentguard Rider Tapestry",
-        allNames = "Serpentguard Rider Tapestry",
-        furnDataId = "8594",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestryserpentguardriderlarge001.dds",
-        itemId = 188285,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=188285&quality=4",
-        name = "Serpentguard Rider Tapestry, Large",
-        allNames = "Serpentguard Rider Tapestry, Large",
-        furnDataId = "8595",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_antsweetkhenarthisong001.dds",
-        itemId = 166015,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=166015&quality=4",
-        name = "Sweet Khenarthi's Song",
-        allNames = "Sweet Khenarthi's Song",
-        furnDataId = "7167",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "The rich blues and golds of this tapestry, along with its subject matter, might just tempt you into hanging it opposite your bed, allowing it to be the first thing you see in the morning and last thing you see at night.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerazura001.dds",
-        itemId = 126117,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126117&quality=5",
-        name = "Tapestry of Azura",
-        allNames = "Tapestry of Azura",
-        furnDataId = "3374",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large sized house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerhircine001.dds",
-        itemId = 119685,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=119685&quality=5",
-        name = "Tapestry of Hircine",
-        allNames = "Tapestry of Hircine",
-        furnDataId = "2164",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a huge house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannernamira001.dds",
-        itemId = 147600,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=147600&quality=5",
-        name = "Tapestry of Namira",
-        allNames = "Tapestry of Namira",
-        furnDataId = "5939",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerperyite001.dds",
-        itemId = 134854,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=134854&quality=5",
-        name = "Tapestry of Peryite",
-        allNames = "Tapestry of Peryite",
-        furnDataId = "4837",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannersheogorath001.dds",
-        itemId = 130189,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=130189&quality=5",
-        name = "Tapestry of Sheogorath",
-        allNames = "Tapestry of Sheogorath",
-        furnDataId = "3939",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_incarnatestapestries001.dds",
-        itemId = 175765,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=175765&quality=4",
-        name = "Tapestry of a Failed Incarnate, The Brute",
-        allNames = "Tapestry of a Failed Incarnate, The Brute",
-        furnDataId = "7830",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_incarnatestapestries003.dds",
-        itemId = 165998,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=165998&quality=4",
-        name = "Tapestry of a Failed Incarnate, The Fool",
-        allNames = "Tapestry of a Failed Incarnate, The Fool",
-        furnDataId = "7150",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_incarnatestapestries002.dds",
-        itemId = 165999,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=165999&quality=4",
-        name = "Tapestry of a Failed Incarnate, The Warseeker",
-        allNames = "Tapestry of a Failed Incarnate, The Warseeker",
-        furnDataId = "7151",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerfiredrakeslarge001.dds",
-        itemId = 126713,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126713&quality=4",
-        name = "Tapestry of the Fire Drakes",
-        allNames = "Tapestry of the Fire Drakes",
-        furnDataId = "3776",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This large wall tapestry displaying the stylized symbol of the Fire Drakes waves slightly in the wind.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerpitdaemonslarge001.dds",
-        itemId = 126715,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126715&quality=4",
-        name = "Tapestry of the Pit Daemons",
-        allNames = "Tapestry of the Pit Daemons",
-        furnDataId = "3778",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This large wall tapestry displaying the stylized symbol of the Pit Daemons waves slightly in the wind.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_gen_lsb_bannerstormlordslarge001.dds",
-        itemId = 126714,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126714&quality=4",
-        name = "Tapestry of the Storm Lords",
-        allNames = "Tapestry of the Storm Lords",
-        furnDataId = "3777",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This large wall tapestry displaying the stylized symbol of the Storm Lords waves slightly in the wind.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannerclavicusvile001.dds",
-        itemId = 125654,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=125654&quality=5",
-        name = "Tapestry, Clavicus Vile",
-        allNames = "Tapestry, Clavicus Vile",
-        furnDataId = "3351",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_orc_inc_pelthanging001.dds",
-        itemId = 118243,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=118243&quality=4",
-        name = "Tapestry, Echatere Pelt",
-        allNames = "Tapestry, Echatere Pelt",
-        furnDataId = "1722",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_heartsdaytapestry001.dds",
-        itemId = 156774,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=156774&quality=3",
-        name = "Tapestry, Love-Blessed",
-        allNames = "Tapestry, Love-Blessed",
-        furnDataId = "6623",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_lsb_housingmoragtongbanner002.dds",
-        itemId = 126627,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126627&quality=4",
-        name = "Tapestry, Morag Tong",
-        allNames = "Tapestry, Morag Tong",
-        furnDataId = "3698",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "A tattered reminder of the Morag Tong.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dae_lsb_bannernocturnal001.dds",
-        itemId = 139137,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=139137&quality=5",
-        name = "Tapestry, Nocturnal",
-        allNames = "Tapestry, Nocturnal",
-        furnDataId = "5088",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_lsb_varhlavivecbanner001.dds",
-        itemId = 126149,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126149&quality=4",
-        name = "Tapestry, Vivec",
-        allNames = "Tapestry, Vivec",
-        furnDataId = "3398",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_dun_lsb_housebannertelvanni001.dds",
-        itemId = 126778,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126778&quality=4",
-        name = "Telvanni Tapestry, House",
-        allNames = "Telvanni Tapestry, House",
-        furnDataId = "3804",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrychimerasmall001.dds",
-        itemId = 192401,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192401&quality=3",
-        name = "The Chimera Tapestry",
-        allNames = "The Chimera Tapestry",
-        furnDataId = "8785",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_uni_inc_tottapestrychimeralarge001.dds",
-        itemId = 192402,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=192402&quality=4",
-        name = "The Chimera Tapestry, Large",
-        allNames = "The Chimera Tapestry, Large",
-        furnDataId = "8786",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_vampiredrape004.dds",
-        itemId = 165617,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=165617&quality=3",
-        name = "Vampiric Drapes, Pulled Back",
-        allNames = "Vampiric Drapes, Pulled Back",
-        furnDataId = "6880",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_vampiredrape001.dds",
-        itemId = 165615,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=165615&quality=3",
-        name = "Vampiric Drapes, Tall",
-        allNames = "Vampiric Drapes, Tall",
-        furnDataId = "6878",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_skr_inc_vampiredrape003.dds",
-        itemId = 165616,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=165616&quality=3",
-        name = "Vampiric Drapes, Tall Arch",
-        allNames = "Vampiric Drapes, Tall Arch",
-        furnDataId = "6879",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_tapestryblrg001.dds",
-        itemId = 126600,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126600&quality=4",
-        name = "Velothi Tapestry, Geyser",
-        allNames = "Velothi Tapestry, Geyser",
-        furnDataId = "3671",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_tapestryalrg001.dds",
-        itemId = 126596,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126596&quality=4",
-        name = "Velothi Tapestry, Volcano",
-        allNames = "Velothi Tapestry, Volcano",
-        furnDataId = "3667",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_vrd_inc_tapestryclrg001.dds",
-        itemId = 126606,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=126606&quality=4",
-        name = "Velothi Tapestry, Waterfall",
-        allNames = "Velothi Tapestry, Waterfall",
-        furnDataId = "3677",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a standard house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bos_lsb_bannersmall002.dds",
-        itemId = 115616,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115616&quality=4",
-        name = "Wood Elf Tapestry, Deer",
-        allNames = "Wood Elf Tapestry, Deer",
-        furnDataId = "916",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bos_lsb_bannersmall001.dds",
-        itemId = 115615,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115615&quality=4",
-        name = "Wood Elf Tapestry, Painted",
-        allNames = "Wood Elf Tapestry, Painted",
-        furnDataId = "915",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-    {
-        icon = "/esoui/art/icons/housing_bos_lsb_bannersmall003.dds",
-        itemId = 115617,
-        link = "https://esoitem.uesp.net/itemLink.php?&itemid=115617&quality=4",
-        name = "Wood Elf Tapestry, Vine",
-        allNames = "Wood Elf Tapestry, Vine",
-        furnDataId = "917",
-        furnCategory = "Parlor:Tapestries (3:52)",
-        description = "This is a large house item.",
-    },
-}
\ No newline at end of file
@@ -0,0 +1,47 @@
+-- Decodes the data tables written by data_excel_to_lua.py --format columnar.
+-- A columnar table keeps one array per field; GetRow rebuilds an item with the
+-- same fields as the rows format.
+local Columnar = {}
+
+local LINK_FORMAT = "https://esoitem.uesp.net/itemLink.php?&itemid=%s&quality=%d"
+
+function Columnar.IsColumnar(data)
+    return type(data) == "table" and data.format == "columnar"
+end
+
+-- Returns item i (1-based) of a columnar table.
+function Columnar.GetRow(data, i)
+    local name = data.name[i]
+    local furnDataId = data.furnDataId[i]
+    local link = data.links[i]
+    if link == nil then
+        link = string.format(LINK_FORMAT, tostring(data.itemId[i]), data.quality[i])
+    end
+    return {
+        icon = data.iconPrefixes[data.iconPrefix[i]] .. data.icon[i],
+        itemId = data.itemId[i],
+        link = link,
+        name = name,
+        allNames = data.allNames[i] or name,
+        furnDataId = tostring(furnDataId),
+        furnCategory = data.furnCategories[data.furnCategory[i]],
+        description = data.description[i],
+    }
+end
+
+-- Returns the items of a data table as an array of rows. Tables already in
+-- the rows format are returned as they are.
+function Columnar.Decode(data)
+    if not Columnar.IsColumnar(data) then
+        return data
+    end
+    local rows = {}
+    for i = 1, data.count do
+        rows[i] = Columnar.GetRow(data, i)
+    end
+    return rows
+end
+
+_G["RanckorsGalleryColumnar"] = Columnar
+
+return Columnar
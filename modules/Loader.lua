@@ -0,0 +1,93 @@
+-- Builds the data tables written by data_excel_to_lua.py on demand. Each
+-- data/<category>/<n>.lua file only registers a function that builds its
+-- chunk of the table; a chunk is built the first time one of its items is
+-- needed (e.g. when the category's view opens), and Release drops the built
+-- chunks of a table again once it is no longer shown.
+local Columnar = _G["RanckorsGalleryColumnar"]
+
+local Loader = {}
+
+-- Built chunks by table name, then chunk number.
+local built = {}
+
+local function GetData()
+    return _G["RanckorsGalleryData"]
+end
+
+-- Returns the chunk count and size of a data table (see data/categories.lua), or nil.
+function Loader.GetCategory(tableName)
+    return GetData().categories[tableName]
+end
+
+-- Returns the number of items in a data table.
+function Loader.GetCount(tableName)
+    local category = Loader.GetCategory(tableName)
+    return category and category.count or 0
+end
+
+-- Returns chunk n of a data table, building it if needed, as written (rows or columnar).
+function Loader.GetChunk(tableName, n)
+    local chunks = built[tableName]
+    if chunks == nil then
+        chunks = {}
+        built[tableName] = chunks
+    end
+    local chunk = chunks[n]
+    if chunk == nil then
+        chunk = GetData().chunks[tableName][n]()
+        chunks[n] = chunk
+    end
+    return chunk
+end
+
+-- Returns item i (1-based, as in data/indexes.lua) of a data table, building only its chunk.
+function Loader.GetItem(tableName, i)
+    local category = Loader.GetCategory(tableName)
+    if category == nil or i < 1 or i > category.count then return nil end
+    local n = math.floor((i - 1) / category.chunkSize) + 1
+    local chunk = Loader.GetChunk(tableName, n)
+    local position = i - (n - 1) * category.chunkSize
+    if Columnar.IsColumnar(chunk) then
+        return Columnar.GetRow(chunk, position)
+    end
+    return chunk[position]
+end
+
+-- Index entries in data/indexes.lua are table number * INDEX_STRIDE + position,
+-- the table numbered as in Data.categoryOrder (see data_excel_to_lua.py).
+local INDEX_STRIDE = 65536
+
+-- Returns the item an index entry points at and the name of its data table, or nil.
+function Loader.GetIndexedItem(entry)
+    if entry == nil then return nil end
+    local tableName = GetData().categoryOrder[math.floor(entry / INDEX_STRIDE)]
+    if tableName == nil then return nil end
+    return Loader.GetItem(tableName, entry % INDEX_STRIDE), tableName
+end
+
+-- Returns every item of a data table, in order, building all of its chunks.
+function Loader.GetItems(tableName)
+    local items = {}
+    local category = Loader.GetCategory(tableName)
+    if category == nil then return items end
+    for n = 1, category.chunks do
+        for _, item in ipairs(Columnar.Decode(Loader.GetChunk(tableName, n))) do
+            items[#items + 1] = item
+        end
+    end
+    return items
+end
+
+-- Drops the built chunks of a data table (all of them with no table name),
+-- so they can be garbage collected. They are built again when next needed.
+function Loader.Release(tableName)
+    if tableName == nil then
+        built = {}
+    else
+        built[tableName] = nil
+    end
+end
+
+_G["RanckorsGalleryLoader"] = Loader
+
+return Loader
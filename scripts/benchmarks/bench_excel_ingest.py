@@ -0,0 +1,116 @@
+"""
+Benchmarks the Excel -> Lua conversion on a synthetic results workbook:
+  - full: load_workbook in edit mode, a list of every row, one Lua string (the old path).
+  - streaming: data_excel_to_lua.iter_excel_rows piped into write_lua.
+
+The workbook is generated and each conversion runs in a fresh process, so
+the peak RSS of a conversion is measured on its own (a forked child starts
+from its parent's resident set). Both must write the same Lua file.
+
+Run from the scripts folder:
+    python benchmarks/bench_excel_ingest.py                      # 100k rows
+    python benchmarks/bench_excel_ingest.py --rows 10000 100000  # check that time and memory scale
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+from openpyxl import load_workbook
+
+import data_excel_to_lua
+import fixtures
+from uesp_scraper import export_to_excel
+
+
+def convert_full(excel_file, lua_file):
+    wb = load_workbook(excel_file)
+    ws = wb.active
+    data = []
+    headers = []
+    for i, row in enumerate(ws.iter_rows(values_only=True)):
+        if i == 0:
+            headers = list(row)
+        else:
+            entry = {}
+            for j, cell in enumerate(row):
+                entry[headers[j]] = cell if cell is not None else ""
+            data.append(entry)
+    with open(lua_file, "w", encoding="utf-8") as f:
+        f.write(data_excel_to_lua.convert_to_lua(data, "items"))
+
+
+def convert_streaming(excel_file, lua_file):
+    data_excel_to_lua.write_lua(data_excel_to_lua.iter_excel_rows(excel_file), "items", lua_file)
+
+
+CONVERTERS = {"full": convert_full, "streaming": convert_streaming}
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(name, excel_file, lua_file):
+    """Converts once in this process and prints "<seconds> <peak RSS MB>"."""
+    start = time.perf_counter()
+    CONVERTERS[name](excel_file, lua_file)
+    print(f"{time.perf_counter() - start} {peak_rss_mb()}")
+
+
+def run_self(*args):
+    return subprocess.run([sys.executable, os.path.abspath(__file__), *args],
+                          check=True, capture_output=True, text=True).stdout
+
+
+def measure(name, excel_file, lua_file):
+    output = run_self("--child", name, excel_file, lua_file).split()
+    return float(output[0]), float(output[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Excel -> Lua conversion.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000],
+                        help="Workbook sizes to benchmark, in rows (default: 100000).")
+    parser.add_argument("--child", nargs=3, metavar=("CONVERTER", "EXCEL", "LUA"), help=argparse.SUPPRESS)
+    parser.add_argument("--write-workbook", nargs=2, metavar=("ROWS", "EXCEL"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(*args.child)
+        return
+    if args.write_workbook:
+        count, excel_file = args.write_workbook
+        export_to_excel(fixtures.sample_rows(int(count)), excel_file)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.rows:
+            excel_file = os.path.join(tmp, f"items_{count}.xlsx")
+            run_self("--write-workbook", str(count), excel_file)
+            size_mb = os.path.getsize(excel_file) / (1024 * 1024)
+            print(f"{count} rows, {size_mb:.1f} MB workbook:")
+
+            outputs = {}
+            for name in CONVERTERS:
+                lua_file = os.path.join(tmp, f"items_{count}_{name}.lua")
+                elapsed, peak = measure(name, excel_file, lua_file)
+                print(f"  {name:<10} {elapsed:8.2f} s  {peak:8.1f} MB peak RSS")
+                with open(lua_file, "rb") as f:
+                    outputs[name] = f.read()
+            if len(set(outputs.values())) != 1:
+                sys.exit("The converters wrote different Lua files.")
+
+
+if __name__ == "__main__":
+    main()
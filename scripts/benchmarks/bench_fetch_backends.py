@@ -0,0 +1,178 @@
+"""
+Compares the two ways of reading detail pages, offline:
+  - pages: one request per item page, skin and all (the default).
+  - api:   the wiki API's action=parse, BATCH_SIZE pages per request (--api).
+
+Every category is scraped with both backends against a local stand-in that
+serves generated list and item pages and answers api.php like MediaWiki.
+Every --missing-every'th item has no wiki page, so the API backend has to
+fall back to its item page. Reports the requests, bytes downloaded and time
+of each backend, and fails if the records they produce differ.
+
+The stand-in's api.php answers are generated from the same Online:<name>
+titles the backend guesses (the list pages link to esoitem.uesp.net, not to
+wiki pages), so matching records only show the backends agree. The answers
+recorded from the real wiki by record_api_responses.py (in
+benchmarks/api_responses) are replayed through uesp_wikiapi to report how
+many items really match and what the API backend would then send; without
+them the API figures are unverified.
+
+Run from the scripts folder:
+    python benchmarks/bench_fetch_backends.py
+    python benchmarks/bench_fetch_backends.py --scale 10
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from urllib.parse import parse_qs, urlsplit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import bench_pipeline
+import fixtures
+import record_api_responses
+import uesp_cache
+import uesp_categories
+import uesp_fetch
+import uesp_metrics
+import uesp_pipeline
+import uesp_records
+import uesp_scraper
+import uesp_wikiapi
+
+BACKENDS = {"pages": [], "api": ["--api"]}
+
+
+class StandIn:
+    """
+    The list pages, item pages and api.php of every category at one scale.
+    """
+
+    def __init__(self, counts, base_url, missing_every):
+        self.list_pages = {}
+        self.detail_pages = {}
+        self.wiki_pages = {}
+        for seed, category in enumerate(uesp_categories.CATEGORIES):
+            rows = fixtures.sample_rows(counts[category.key], seed)
+            self.list_pages[category.list_path] = fixtures.list_page(rows, f"{base_url}/{category.key}", seed)
+            self.detail_pages[category.key] = rows
+            for index, row in enumerate(rows):
+                if not missing_every or index % missing_every:
+                    self.wiki_pages[f"{uesp_wikiapi.ITEM_NAMESPACE}:{row['name']}"] = row
+
+    def route(self, path):
+        parts = urlsplit(path)
+        if parts.path == "/w/api.php":
+            return fixtures.api_parse_response(parse_qs(parts.query), self.wiki_pages)
+        if parts.path in self.list_pages:
+            return self.list_pages[parts.path]
+        key, _, index = parts.path.lstrip("/").partition("/item/")
+        rows = self.detail_pages.get(key)
+        if rows and index.isdigit() and int(index) < len(rows):
+            return fixtures.detail_page(rows[int(index)])
+        return None
+
+
+def scrape(backend_argv):
+    """
+    Scrapes every category from the stand-in, in the current folder.
+    Returns the records of every category and the run's metrics report.
+    """
+    uesp_scraper.forget_seen_details()
+    metrics = uesp_metrics.reset()
+    records = {}
+    # The scrapers report every page; only the totals matter here.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for category in uesp_categories.CATEGORIES:
+            uesp_scraper.main(category, backend_argv)
+            records[category.key] = list(uesp_records.iter_records(uesp_scraper.records_path(category)))
+    return records, metrics.report()
+
+
+def replay_recorded(directory):
+    """
+    Replays the api.php answers recorded in directory through uesp_wikiapi.
+    Returns the number of items they matched and the number recorded, or
+    None if nothing was recorded.
+    """
+    if not os.path.isdir(directory):
+        return None
+    matched = total = 0
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                recorded = json.load(f)
+            content = json.dumps(recorded["response"]).encode("utf-8")
+            matched += len(uesp_wikiapi.parse_batch(recorded["items"], content))
+            total += len(recorded["items"])
+    return (matched, total) if total else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the per-page and batched API detail-page backends offline.")
+    parser.add_argument("--scale", type=int, default=1, help="Multiple of today's item counts (default: 1).")
+    parser.add_argument("--missing-every", type=int, default=10,
+                        help="Every Nth item has no wiki page and must be fetched page by page; 0 for none (default: 10).")
+    args = parser.parse_args(argv)
+
+    uesp_fetch.configure(requests_per_second=1e6, burst=1000)
+    uesp_cache.configure(enabled=False)
+    counts = {key: count * args.scale for key, count in bench_pipeline.todays_counts().items()}
+
+    server, base_url = fixtures.start_server(lambda path: stand_in.route(path))
+    stand_in = StandIn(counts, base_url, args.missing_every)
+    uesp_scraper.BASE_URL = base_url
+    uesp_wikiapi.API_URL = base_url + "/w/api.php"
+
+    results = {}
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            for name, backend_argv in BACKENDS.items():
+                start_time = time.perf_counter()
+                records, report = scrape(backend_argv)
+                results[name] = (records, report, time.perf_counter() - start_time)
+    finally:
+        os.chdir(cwd)
+        uesp_pipeline.close()
+        server.shutdown()
+        server.server_close()
+
+    print(f"{sum(counts.values())} items, {len(stand_in.wiki_pages)} of them with a wiki page.")
+    print(f"{'backend':<8} {'requests':>9} {'MB':>9} {'seconds':>9}")
+    for name, (_, report, seconds) in results.items():
+        print(f"{name:<8} {report['requests']:9} {report['bytes_downloaded'] / (1024 * 1024):9.2f} {seconds:9.2f}")
+    pages, api = results["pages"][1], results["api"][1]
+    print(f"Against the stand-in, the API backend sends {pages['requests'] / max(api['requests'], 1):.1f}x fewer "
+          f"requests and downloads {pages['bytes_downloaded'] / max(api['bytes_downloaded'], 1):.1f}x fewer bytes.")
+    if results["pages"][0] != results["api"][0]:
+        sys.exit("The backends produced different records.")
+    # The stand-in renders the very titles the backend guesses, so this only
+    # shows the two backends agree, not that the real wiki has those pages.
+    print("Both backends produced the same records from the stand-in.")
+    recorded = replay_recorded(record_api_responses.RESPONSES_DIR)
+    if recorded is None:
+        print("UNVERIFIED: no recorded api.php answers in benchmarks/api_responses (run "
+              "benchmarks/record_api_responses.py with network access). The figures above assume the real wiki "
+              "has a page for every item the stand-in does; keep --api off until the recordings show it.")
+    else:
+        matched, total = recorded
+        share = matched / total
+        items = sum(counts.values())
+        batches = -(-items // uesp_wikiapi.BATCH_SIZE)
+        print(f"Recorded api.php answers matched {matched} of {total} items ({share:.0%}). At that share the API "
+              f"backend would send about {batches + round(items * (1 - share))} requests for {items} items, "
+              f"against {items} page by page.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compares holding scraped rows as dictionaries (what the records files decode
+to) with holding them as uesp_item.Item, at 100,000 synthetic items:
+  - memory: the bytes allocated to keep every row of a records file loaded;
+  - throughput: loading the records file, writing it back, building the
+    lookup index keys and writing the Lua table, for each representation.
+
+Fails if the two representations write different records or Lua files.
+
+Run from the scripts folder:
+    python benchmarks/bench_item_records.py
+    python benchmarks/bench_item_records.py --items 20000 --repeat 5
+"""
+import argparse
+import filecmp
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import data_excel_to_lua
+import fixtures
+import uesp_item
+import uesp_records
+
+FIELDS = list(uesp_item.FIELDS)
+
+LOADERS = {
+    "dict": lambda filename: list(uesp_records.iter_records(filename)),
+    "Item": lambda filename: [uesp_item.Item.from_row(row) for row in uesp_records.iter_records(filename)],
+}
+
+
+def allocated(func):
+    """Returns func()'s result and the bytes it allocated that are still held."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the memory and throughput of dictionary and Item rows.")
+    parser.add_argument("--items", type=int, default=100000, help="Synthetic items (default: 100000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per step; the best is reported (default: 3).")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.jsonl")
+        uesp_records.write_records(fixtures.sample_rows(args.items), source, FIELDS)
+
+        results = {}
+        for name, load in LOADERS.items():
+            rows, size = allocated(lambda: load(source))
+            records_file = os.path.join(tmp, f"{name}.jsonl")
+            lua_file = os.path.join(tmp, f"{name}.lua")
+            results[name] = {
+                "memory": size,
+                "load": best_time(lambda: load(source), args.repeat),
+                "write records": best_time(lambda: uesp_records.write_records(rows, records_file, FIELDS),
+                                           args.repeat),
+                "index keys": best_time(lambda: [data_excel_to_lua.index_keys(row) for row in rows], args.repeat),
+                "write Lua": best_time(lambda: data_excel_to_lua.write_lua(rows, "Bench", lua_file), args.repeat),
+            }
+
+        for kind in ("jsonl", "lua"):
+            if not filecmp.cmp(os.path.join(tmp, f"dict.{kind}"), os.path.join(tmp, f"Item.{kind}"), shallow=False):
+                sys.exit(f"Dictionary and Item rows wrote different .{kind} files.")
+
+    dicts, items = results["dict"], results["Item"]
+    print(f"{args.items} items")
+    print(f"{'':<14} {'dict':>10} {'Item':>10}")
+    print(f"{'memory MB':<14} {dicts['memory'] / (1024 * 1024):10.1f} {items['memory'] / (1024 * 1024):10.1f}")
+    for step in ("load", "write records", "index keys", "write Lua"):
+        print(f"{step + ' s':<14} {dicts[step]:10.3f} {items[step]:10.3f}")
+    print(f"Item rows take {dicts['memory'] / max(items['memory'], 1):.1f}x less memory "
+          f"({(dicts['memory'] - items['memory']) / args.items:.0f} bytes less per item).")
+    print("Both representations wrote the same records and Lua files.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Compares the Lua data formats written by data_excel_to_lua.py:
+  - rows: one table of named fields per item (the default).
+  - columnar: one array per field, decoded by modules/Columnar.lua.
+
+Reports the size of every category's file in both formats. If lupa is
+installed (pip install lupa), it also times loading each file in Lua 5.1, the
+dialect ESO's scripting is based on. It then checks that Columnar.Decode gives
+back exactly the items of the rows format, and times decoding too.
+
+Run from the scripts folder, after a scrape or with the committed results:
+    python benchmarks/bench_lua_format.py
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+try:
+    from lupa import lua51
+except ImportError:
+    lua51 = None
+
+import data_excel_to_lua
+import uesp_categories
+
+COLUMNAR_MODULE = os.path.join(os.path.dirname(SCRIPTS_DIR), "modules", "Columnar.lua")
+
+# Fields of an item in the rows format.
+ITEM_KEYS = ["icon", "itemId", "link", "name", "allNames", "furnDataId", "furnCategory", "description"]
+
+
+def write_formats(category, directory):
+    """Writes the category in every format and returns the file of each format."""
+    files = {}
+    for lua_format in data_excel_to_lua.FORMATS:
+        _, rows = data_excel_to_lua.iter_results(category)
+        files[lua_format] = os.path.join(directory, f"{category.key}.{lua_format}.lua")
+        data_excel_to_lua.write_lua(rows, category.lua_table, files[lua_format], lua_format)
+    return files
+
+
+def best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class LuaRuntime:
+    """A Lua 5.1 state with modules/Columnar.lua loaded."""
+
+    def __init__(self):
+        self.lua = lua51.LuaRuntime(unpack_returned_tuples=True)
+        with open(COLUMNAR_MODULE, encoding="utf-8") as f:
+            self.columnar = self.lua.execute(f.read())
+        self._loadstring = self.lua.eval("loadstring")
+
+    def compile(self, filename, table_name):
+        # The data files only declare a local table; return it so it can be inspected.
+        with open(filename, encoding="utf-8") as f:
+            result = self._loadstring(f.read() + f"\nreturn {table_name}")
+        # loadstring returns the chunk, or nil and the error message.
+        if isinstance(result, tuple):
+            sys.exit(f"{filename} does not compile: {result[1]}")
+        return result
+
+    def items(self, table):
+        rows = self.columnar.Decode(table)
+        return [tuple(rows[i][key] for key in ITEM_KEYS) for i in range(1, len(rows) + 1)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the size and load time of the Lua data formats.")
+    parser.add_argument("--repeat", type=int, default=20, help="Loads per file; the best is reported (default: 20).")
+    args = parser.parse_args(argv)
+
+    runtime = LuaRuntime() if lua51 is not None else None
+    if runtime is None:
+        print("lupa is not installed; reporting sizes only.")
+
+    totals = {lua_format: [0, 0.0, 0.0] for lua_format in data_excel_to_lua.FORMATS}
+    with tempfile.TemporaryDirectory() as tmp:
+        header = f"{'category':<14}" + "".join(f"{lua_format:>12} KB" for lua_format in data_excel_to_lua.FORMATS)
+        if runtime is not None:
+            header += "".join(f"{lua_format:>12} ms" for lua_format in data_excel_to_lua.FORMATS)
+        print(header)
+        for category in uesp_categories.CATEGORIES:
+            files = write_formats(category, tmp)
+            line = f"{category.key:<14}"
+            for lua_format, filename in files.items():
+                size = os.path.getsize(filename)
+                totals[lua_format][0] += size
+                line += f"{size / 1024:15.1f}"
+            if runtime is not None:
+                chunks = {lua_format: runtime.compile(filename, category.lua_table)
+                          for lua_format, filename in files.items()}
+                expected = runtime.items(chunks["rows"]())
+                for lua_format, chunk in chunks.items():
+                    if runtime.items(chunk()) != expected:
+                        sys.exit(f"{category.key}: the {lua_format} file decodes to different items.")
+                    # Loading = compiling the file and running it; decoding is timed separately.
+                    load = best_time(lambda: runtime.compile(files[lua_format], category.lua_table)(), args.repeat)
+                    table = chunk()
+                    decode = best_time(lambda: runtime.columnar.Decode(table), args.repeat)
+                    totals[lua_format][1] += load
+                    totals[lua_format][2] += decode
+                    line += f"{load * 1000:15.2f}"
+            print(line)
+
+    print(f"{'total':<14}" + "".join(f"{totals[lua_format][0] / 1024:15.1f}" for lua_format in totals)
+          + ("".join(f"{totals[lua_format][1] * 1000:15.2f}" for lua_format in totals) if runtime else ""))
+    if runtime is not None:
+        print(f"Decoding every columnar table into rows takes {totals['columnar'][2] * 1000:.2f} ms in total.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Compares what loading the add-on's data costs in Lua 5.1 (needs lupa:
+pip install lupa), for the committed results:
+  - single: one file per category whose table is built when ESO loads it.
+  - chunks: the chunk files data_excel_to_lua.py writes (--chunk-size items
+    each), built by modules/Loader.lua only when a category's items are needed.
+
+Both layouts load the lookup indexes (data/indexes.lua) after the data files.
+For each layout it reports the time to run every data file (what login costs)
+and the Lua memory held afterwards, then the time to open every category's
+items and the memory held until the add-on releases them, and the memory the
+lookup indexes hold on their own. Fails if the two layouts give different
+items, or if an itemId index entry resolves to another item.
+
+Run from the scripts folder, after a scrape or with the committed results:
+    python benchmarks/bench_lua_loading.py
+    python benchmarks/bench_lua_loading.py --format columnar --chunk-size 100
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+try:
+    from lupa import lua51
+except ImportError:
+    lua51 = None
+
+import bench_lua_format
+import data_excel_to_lua
+import uesp_categories
+
+MODULES_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "modules")
+MODULES = ["Columnar.lua", "Loader.lua"]
+
+
+def write_layouts(directory, lua_format, chunk_size):
+    """
+    Writes every category in both layouts, and the lookup indexes both load
+    last. Returns the data files of each layout, in load order.
+    """
+    files = {"single": [], "chunks": []}
+    reports = []
+    for category in uesp_categories.CATEGORIES:
+        _, rows = data_excel_to_lua.iter_results(category)
+        filename = os.path.join(directory, category.lua_file)
+        data_excel_to_lua.write_lua(rows, category.lua_table, filename, lua_format)
+        files["single"].append(filename)
+
+        _, rows = data_excel_to_lua.iter_results(category)
+        rows = list(rows)
+        items, outputs = data_excel_to_lua.write_chunks(rows, category.lua_table,
+                                                        os.path.join(directory, category.chunk_folder),
+                                                        lua_format, chunk_size)
+        files["chunks"].extend(filename for filename, _ in outputs)
+        reports.append({"key": category.key, "items": items, "outputs": outputs,
+                        "index_keys": [data_excel_to_lua.index_keys(row) for row in rows],
+                        "fingerprint": {"chunk_size": chunk_size}})
+    category_index = os.path.join(directory, "categories.lua")
+    data_excel_to_lua.write_lines(data_excel_to_lua.iter_category_index_lines(reports), category_index)
+    files["chunks"].append(category_index)
+    index_file = os.path.join(directory, "indexes.lua")
+    data_excel_to_lua.write_lines(data_excel_to_lua.iter_index_lines(reports), index_file)
+    for layout_files in files.values():
+        layout_files.append(index_file)
+    return files, index_file
+
+
+class AddonState:
+    """A fresh Lua 5.1 state with the add-on's modules and the given data files loaded."""
+
+    def __init__(self, data_files):
+        self.lua = lua51.LuaRuntime(unpack_returned_tuples=True)
+        self.base_kb = self.memory_kb()
+        for name in MODULES:
+            self.run(os.path.join(MODULES_DIR, name))
+        self.modules_kb = self.memory_kb()
+        start = time.perf_counter()
+        for filename in data_files:
+            self.run(filename)
+        self.load_seconds = time.perf_counter() - start
+        self.loaded_kb = self.memory_kb() - self.modules_kb
+        globals_ = self.lua.globals()
+        self.data, self.loader, self.columnar = (globals_.RanckorsGalleryData, globals_.RanckorsGalleryLoader,
+                                                 globals_.RanckorsGalleryColumnar)
+
+    def run(self, filename):
+        with open(filename, encoding="utf-8") as f:
+            self.lua.execute(f.read())
+
+    def memory_kb(self):
+        self.lua.execute('collectgarbage("collect")')
+        return self.lua.eval('collectgarbage("count")')
+
+    def open_category(self, table_name):
+        # Every item of a table, as the category's view would ask for them.
+        if self.data.categories is not None:
+            return self.loader.GetItems(table_name)
+        return self.columnar.Decode(self.data[table_name])
+
+    def release(self):
+        if self.data.categories is not None:
+            self.loader.Release()
+
+
+def item_tuples(items):
+    return [tuple(items[i][key] for key in bench_lua_format.ITEM_KEYS) for i in range(1, len(items) + 1)]
+
+
+def misresolved_item_ids(state):
+    """Returns the itemIds whose byItemId entry resolves, through the Loader, to an item with another itemId."""
+    return [item_id for item_id, entry in state.data.byItemId.items()
+            if state.loader.GetIndexedItem(entry)[0].itemId != item_id]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare loading the Lua data as single files and as chunks.")
+    parser.add_argument("--format", choices=data_excel_to_lua.FORMATS, default="rows",
+                        help="Layout of the Lua tables (default: rows).")
+    parser.add_argument("--chunk-size", type=int, default=data_excel_to_lua.CHUNK_SIZE,
+                        help=f"Items per chunk file (default: {data_excel_to_lua.CHUNK_SIZE}).")
+    parser.add_argument("--repeat", type=int, default=5, help="Loads per layout; the best is reported (default: 5).")
+    args = parser.parse_args(argv)
+    if lua51 is None:
+        sys.exit("lupa is not installed (pip install lupa).")
+
+    table_names = [category.lua_table for category in uesp_categories.CATEGORIES]
+    results = {}
+    items = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        layouts, index_file = write_layouts(tmp, args.format, args.chunk_size)
+        index_kb = AddonState([index_file]).loaded_kb
+        for layout, data_files in layouts.items():
+            states = [AddonState(data_files) for _ in range(args.repeat)]
+            state = states[-1]
+            start = time.perf_counter()
+            items[layout] = {table_name: item_tuples(state.open_category(table_name)) for table_name in table_names}
+            open_seconds = time.perf_counter() - start
+            open_kb = state.memory_kb() - state.modules_kb
+            if layout == "chunks" and misresolved_item_ids(state):
+                sys.exit(f"byItemId entries resolve to other items: {misresolved_item_ids(state)[:10]}")
+            state.release()
+            results[layout] = {
+                "files": len(data_files),
+                "load_ms": min(loaded.load_seconds for loaded in states) * 1000,
+                "loaded_kb": state.loaded_kb,
+                "open_ms": open_seconds * 1000,
+                "open_kb": open_kb,
+                "released_kb": state.memory_kb() - state.modules_kb,
+            }
+    if items["single"] != items["chunks"]:
+        sys.exit("The single files and the chunks give different items.")
+
+    print(f"{args.format} format, {args.chunk_size} items per chunk")
+    print(f"{'layout':<8} {'files':>6} {'login ms':>9} {'login KB':>9} {'open ms':>9} {'open KB':>9} {'closed KB':>10}")
+    for layout, result in results.items():
+        print(f"{layout:<8} {result['files']:6} {result['load_ms']:9.2f} {result['loaded_kb']:9.0f} "
+              f"{result['open_ms']:9.2f} {result['open_kb']:9.0f} {result['released_kb']:10.0f}")
+    single, chunks = results["single"], results["chunks"]
+    print(f"Chunks hold {single['loaded_kb'] - chunks['loaded_kb']:.0f} KB less after login "
+          f"({chunks['loaded_kb'] / single['loaded_kb']:.0%} of the single files) until a category is opened.")
+    print(f"The lookup indexes hold {index_kb:.0f} KB of that in both layouts; every itemId entry resolves "
+          "to its item.")
+    print("Both layouts give the same items.")
+
+
+if __name__ == "__main__":
+    main()
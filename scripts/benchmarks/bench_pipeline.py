@@ -0,0 +1,225 @@
+"""
+Offline benchmark of the scrape -> export -> convert pipeline.
+
+Every category's list and detail pages are generated look-alikes (see
+fixtures.py) served by a local HTTP stand-in, at 1x, 10x and 100x today's item
+counts. These stages are timed:
+  - get_item_links: fetch and parse every category's list page.
+  - fetch_details: fetch detail pages through uesp_fetch.fetch_all.
+  - get_raw_item_data: the BeautifulSoup reference extraction of a detail page.
+  - extract_raw_item_data: the streaming extraction the scrapers use.
+  - export_to_excel / read_excel_data: the optional workbook round trip.
+  - write_records / iter_records: the JSON Lines records the scrapers write.
+  - convert_to_lua: the Lua tables.
+
+The per-page stages run on at most --max-pages pages per scale and report the
+time projected for every item as well. Results are written as JSON, and
+--compare prints the change against an earlier results file.
+
+Run from the scripts folder:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --scales 1 10 --output new.json --compare old.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+from bs4 import BeautifulSoup
+
+import data_excel_to_lua
+import fixtures
+import uesp_cache
+import uesp_categories
+import uesp_fetch
+import uesp_incremental
+import uesp_rawdata
+import uesp_records
+import uesp_scraper
+
+DEFAULT_OUTPUT = os.path.join("results", "bench_pipeline.json")
+
+# Used when a category has no results yet to count today's items from.
+DEFAULT_ITEM_COUNT = 200
+
+# Distinct detail pages generated per category; bigger item counts reuse them.
+DETAIL_PAGE_VARIANTS = 64
+
+
+def todays_counts():
+    """Returns the number of items of each category in its latest results."""
+    counts = {}
+    for category in uesp_categories.CATEGORIES:
+        rows = uesp_incremental.load_results(uesp_scraper.latest_results_path(category))
+        counts[category.key] = len(rows) or DEFAULT_ITEM_COUNT
+    return counts
+
+
+class Corpus:
+    """
+    The generated rows and pages of every category at one scale, and the
+    stand-in route that serves them.
+    """
+
+    def __init__(self, counts, base_url):
+        self.rows = {}
+        self.list_pages = {}
+        self.detail_pages = {}
+        for seed, category in enumerate(uesp_categories.CATEGORIES):
+            rows = fixtures.sample_rows(counts[category.key], seed)
+            self.rows[category.key] = rows
+            self.list_pages[category.list_path] = fixtures.list_page(rows, f"{base_url}/{category.key}", seed)
+            self.detail_pages[category.key] = [fixtures.detail_page(row, seed)
+                                               for row in rows[:DETAIL_PAGE_VARIANTS]]
+
+    def route(self, path):
+        if path in self.list_pages:
+            return self.list_pages[path]
+        key, _, index = path.lstrip("/").partition("/item/")
+        pages = self.detail_pages.get(key)
+        if pages and index.isdigit():
+            return pages[int(index) % len(pages)]
+        return None
+
+
+def measure(func, items, total=None):
+    """
+    Runs func once and returns its timing. total is the number of items the
+    stage would handle without sampling, for the projected time.
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    result = {"items": items, "seconds": round(seconds, 4),
+              "items_per_second": round(items / seconds, 1) if seconds else None}
+    if total is not None and total != items:
+        result["projected_seconds"] = round(seconds / items * total, 2) if items else None
+    return result
+
+
+def run_scale(scale, counts, max_pages, workdir):
+    """Times every stage at one scale and returns {stage: timing}."""
+    counts = {key: count * scale for key, count in counts.items()}
+    total = sum(counts.values())
+    server = None
+    stages = {}
+    try:
+        server, base_url = fixtures.start_server(lambda path: corpus.route(path))
+        corpus = Corpus(counts, base_url)
+        uesp_scraper.BASE_URL = base_url
+
+        links = {}
+
+        def get_links():
+            for category in uesp_categories.CATEGORIES:
+                links[category.key] = uesp_scraper.get_item_links(category)
+
+        stages["get_item_links"] = measure(get_links, total)
+
+        urls = [link["webLink"] for category_links in links.values() for link in category_links][:max_pages]
+        pages = []
+        stages["fetch_details"] = measure(
+            lambda: pages.extend(uesp_fetch.fetch_all(urls, lambda index, response: response.content)),
+            len(urls), total)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    stages["get_raw_item_data"] = measure(
+        lambda: [uesp_scraper.get_raw_item_data(BeautifulSoup(page, "html.parser")) for page in pages],
+        len(pages), total)
+    stages["extract_raw_item_data"] = measure(
+        lambda: [uesp_rawdata.extract_raw_item_data(page) for page in pages], len(pages), total)
+
+    files = {category.key: os.path.join(workdir, f"{category.key}_{scale}") for category in uesp_categories.CATEGORIES}
+    stages["export_to_excel"] = measure(lambda: [
+        uesp_scraper.export_to_excel(corpus.rows[category.key], files[category.key] + ".xlsx",
+                                     uesp_scraper.result_fields(category))
+        for category in uesp_categories.CATEGORIES
+    ], total)
+    read = {}
+    stages["read_excel_data"] = measure(lambda: read.update(
+        (key, data_excel_to_lua.read_excel_data(filename + ".xlsx")) for key, filename in files.items()
+    ), total)
+    stages["write_records"] = measure(lambda: [
+        uesp_records.write_records(corpus.rows[category.key], files[category.key] + ".jsonl",
+                                   uesp_scraper.result_fields(category))
+        for category in uesp_categories.CATEGORIES
+    ], total)
+    stages["iter_records"] = measure(lambda: [
+        list(uesp_records.iter_records(filename + ".jsonl")) for filename in files.values()
+    ], total)
+    stages["convert_to_lua"] = measure(lambda: [
+        data_excel_to_lua.convert_to_lua(read[category.key], category.lua_table)
+        for category in uesp_categories.CATEGORIES
+    ], total)
+    return {"scale": scale, "items": total, "stages": stages}
+
+
+def compare(results, previous):
+    """Prints each stage's time per item against an earlier results file."""
+    before = {(run["scale"], stage): timing
+              for run in previous.get("runs", []) for stage, timing in run["stages"].items()}
+    print(f"\nCompared with {previous.get('timestamp', 'the previous run')} (time per item, new / old):")
+    for run in results["runs"]:
+        for stage, timing in run["stages"].items():
+            old = before.get((run["scale"], stage))
+            if old and old["items"] and timing["items"] and old["seconds"]:
+                ratio = (timing["seconds"] / timing["items"]) / (old["seconds"] / old["items"])
+                print(f"  {run['scale']:>4}x {stage:<22} {ratio:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scrape -> export -> convert pipeline offline.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="Multiples of today's item counts to run (default: 1 10 100).")
+    parser.add_argument("--max-pages", type=int, default=200,
+                        help="Detail pages fetched and parsed per scale; more items are projected (default: 200).")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"JSON results file (default: {DEFAULT_OUTPUT}).")
+    parser.add_argument("--compare", help="Earlier results file to compare with.")
+    args = parser.parse_args(argv)
+
+    # Offline and as fast as the stand-in allows: no rate limit, no HTTP cache.
+    uesp_fetch.configure(requests_per_second=1e6, burst=1000)
+    uesp_cache.configure(enabled=False)
+
+    counts = todays_counts()
+    results = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "todays_items": counts,
+        "max_pages": args.max_pages,
+        "runs": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in args.scales:
+            run = run_scale(scale, counts, args.max_pages, workdir)
+            results["runs"].append(run)
+            print(f"{scale}x ({run['items']} items):")
+            for stage, timing in run["stages"].items():
+                projected = f"  (all items: {timing['projected_seconds']:.2f}s)" if "projected_seconds" in timing else ""
+                print(f"  {stage:<22} {timing['items']:7} items {timing['seconds']:9.3f}s{projected}")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
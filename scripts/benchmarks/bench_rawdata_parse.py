@@ -0,0 +1,83 @@
+"""
+Benchmarks the esoil_rawdata extraction of a detail page:
+  - bs4: BeautifulSoup(content, "html.parser") + get_raw_item_data (the old path).
+  - html.parser / lxml: uesp_rawdata.extract_raw_item_data with each backend.
+
+Every backend must return the same dictionary as bs4 for every page.
+
+Run from the scripts folder:
+    python benchmarks/bench_rawdata_parse.py                 # generated look-alike pages
+    python benchmarks/bench_rawdata_parse.py --fixtures DIR  # saved UESP detail pages (*.html)
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCHMARKS_DIR), "scrapers"))
+
+from bs4 import BeautifulSoup
+
+import fixtures
+import uesp_rawdata
+from uesp_scraper import get_raw_item_data
+
+
+def parse_bs4(content):
+    return get_raw_item_data(BeautifulSoup(content, "html.parser"))
+
+
+def parse_with(backend):
+    return lambda content: uesp_rawdata.extract_raw_item_data(content, backend)
+
+
+def time_parser(parse, pages, repeat):
+    """Returns the best time over `repeat` runs of parsing every page once, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            parse(page)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark esoil_rawdata extraction backends.")
+    parser.add_argument("--fixtures", help="Folder of saved detail pages (*.html) to use instead of generated ones.")
+    parser.add_argument("--pages", type=int, default=50, help="Number of generated pages (default: 50).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend; the best is reported (default: 3).")
+    args = parser.parse_args(argv)
+
+    if args.fixtures:
+        pages = fixtures.load_pages(args.fixtures)
+    else:
+        pages = [fixtures.detail_page(row) for row in fixtures.sample_rows(args.pages)]
+    if not pages:
+        sys.exit("No pages to benchmark.")
+
+    parsers = {"bs4": parse_bs4, "html.parser": parse_with("html.parser")}
+    if uesp_rawdata.etree is not None:
+        parsers["lxml"] = parse_with("lxml")
+    else:
+        print("lxml is not installed; skipping the lxml backend.")
+
+    expected = [parse_bs4(page) for page in pages]
+    for name, parse in parsers.items():
+        mismatches = sum(1 for page, want in zip(pages, expected) if parse(page) != want)
+        if mismatches:
+            sys.exit(f"{name} returned different data than bs4 for {mismatches} of {len(pages)} pages.")
+
+    total_kb = sum(len(page) for page in pages) / 1024
+    print(f"{len(pages)} pages, {total_kb / len(pages):.0f} KB each on average, best of {args.repeat} runs.")
+    baseline = None
+    for name, parse in parsers.items():
+        elapsed = time_parser(parse, pages, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  {name:<12} {elapsed / len(pages) * 1000:8.2f} ms/page  {baseline / elapsed:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Checks the fetch policy of uesp_fetch against a local stand-in whose pages
+are scripted to fail (see fixtures.FaultScript), offline:
+  - retries: a 503 is retried, honouring its Retry-After, and a slow answer
+    that times out is tried again; a 404 is not retried, and a page that
+    keeps failing is given up after MAX_ATTEMPTS requests.
+  - circuit breaker: FAILURE_THRESHOLD failures in a row hold the host back
+    for the cooldown, and once it trips more than MAX_TRIPS times no request
+    is sent to it any more.
+  - dead letters: a crawl lists the pages that failed, with their error,
+    status and attempts, in <category>_failed.json, and keeps their stored
+    rows; when most of them fail it leaves the stored results untouched.
+
+The retry timings are shortened so the checks run in a few seconds. Prints
+every check and exits with an error at the first one that fails.
+
+Run from the scripts folder:
+    python benchmarks/check_fetch_policy.py
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import fixtures
+import uesp_cache
+import uesp_categories
+import uesp_fetch
+import uesp_pipeline
+import uesp_records
+import uesp_scraper
+from fixtures import Fault
+
+# Shortened retry policy: the checks only depend on the number of attempts.
+POLICY = {
+    "REQUEST_TIMEOUT": 0.5,
+    "MAX_ATTEMPTS": 3,
+    "BACKOFF_BASE": 0.01,
+    "FAILURE_THRESHOLD": 2,
+    "BREAKER_COOLDOWN": 0.3,
+    "MAX_TRIPS": 1,
+}
+
+PAGE = b"<html><body>ok</body></html>"
+
+
+def expect(condition, message):
+    if not condition:
+        sys.exit(f"FAILED: {message}")
+    print(f"ok: {message}")
+
+
+def fetch_error(url):
+    """Returns the FetchError uesp_fetch.get raises for url, or None if it succeeds."""
+    try:
+        uesp_fetch.get(url)
+    except uesp_fetch.FetchError as exc:
+        return exc
+    return None
+
+
+def check_retries(base_url, faults):
+    uesp_fetch.configure(requests_per_second=1000, burst=100)
+    faults.add("/retry", [Fault(503, retry_after=1), Fault(503)])
+    start_time = time.monotonic()
+    response = uesp_fetch.get(base_url + "/retry")
+    expect(response.status_code == 200 and faults.hits["/retry"] == 3,
+           "503, 503, 200 takes 3 requests")
+    expect(time.monotonic() - start_time >= 1.0, "Retry-After: 1 holds the retry back for a second")
+
+    faults.add("/slow", [Fault(delay=uesp_fetch.REQUEST_TIMEOUT * 3)])
+    response = uesp_fetch.get(base_url + "/slow")
+    expect(response.status_code == 200 and faults.hits["/slow"] == 2, "an answer that times out is tried again")
+
+    faults.add("/gone", [], then=Fault(404))
+    error = fetch_error(base_url + "/gone")
+    expect(error is not None and error.status == 404 and error.attempts == 1 and faults.hits["/gone"] == 1,
+           "a 404 fails after 1 request")
+
+    faults.add("/down", [], then=Fault(503))
+    error = fetch_error(base_url + "/down")
+    expect(error is not None and error.status == 503 and error.attempts == uesp_fetch.MAX_ATTEMPTS
+           and faults.hits["/down"] == uesp_fetch.MAX_ATTEMPTS,
+           f"a page that keeps answering 503 is given up after {uesp_fetch.MAX_ATTEMPTS} requests")
+
+
+def check_breaker(base_url, faults):
+    uesp_fetch.configure(requests_per_second=1000, burst=100)
+    faults.add("/flaky", [Fault(503)] * uesp_fetch.FAILURE_THRESHOLD)
+    start_time = time.monotonic()
+    response = uesp_fetch.get(base_url + "/flaky")
+    expect(response.status_code == 200 and time.monotonic() - start_time >= uesp_fetch.BREAKER_COOLDOWN,
+           f"{uesp_fetch.FAILURE_THRESHOLD} failures in a row trip the breaker for its cooldown")
+
+    faults.add("/broken", [], then=Fault(503))
+    fetch_error(base_url + "/broken")
+    error = fetch_error(base_url + "/broken")
+    breaker = uesp_fetch.breaker_for(base_url)
+    expect(isinstance(error, uesp_fetch.CircuitOpenError) and breaker.broken,
+           f"the breaker stays open after tripping more than {uesp_fetch.MAX_TRIPS} times")
+    error = fetch_error(base_url + "/fine")
+    expect(isinstance(error, uesp_fetch.CircuitOpenError) and "/fine" not in faults.hits,
+           "no request is sent to a host whose breaker is open")
+
+
+def check_dead_letters(base_url, faults, route):
+    uesp_fetch.configure(requests_per_second=1000, burst=100)
+    # No breaker trips here: only the dead letters are checked.
+    uesp_fetch.FAILURE_THRESHOLD = 100
+    category = uesp_categories.CATEGORIES_BY_KEY["paintings"]
+    rows = fixtures.sample_rows(6)
+    item_url = f"{base_url}/{category.key}/item/"
+    route.pages = {category.list_path: fixtures.list_page(rows, base_url + "/" + category.key)}
+    route.pages.update({f"/{category.key}/item/{i}": fixtures.detail_page(row) for i, row in enumerate(rows)})
+    # A maintenance page is answered with 200 but holds no raw data.
+    route.pages[f"/{category.key}/item/3"] = PAGE
+    faults.add(f"/{category.key}/item/0", [Fault(503, retry_after=0)])
+    faults.add(f"/{category.key}/item/1", [], then=Fault(404))
+    faults.add(f"/{category.key}/item/2", [], then=Fault(503))
+
+    def crawl():
+        uesp_scraper.forget_seen_details()
+        with contextlib.redirect_stdout(io.StringIO()):
+            return uesp_scraper.main(category, [])
+
+    def stored_records():
+        return list(uesp_records.iter_records(uesp_scraper.records_path(category)))
+
+    def dead_letters():
+        with open(uesp_scraper.failures_path(category), encoding="utf-8") as f:
+            return json.load(f)
+
+    failed_name = os.path.basename(uesp_scraper.failures_path(category))
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            summary = crawl()
+            records = stored_records()
+            expect(summary["items"] == 3 and sorted(record["webLink"] for record in records)
+                   == [item_url + str(i) for i in (0, 4, 5)],
+                   "the crawl keeps the 3 pages that were fetched, one of them after a retry")
+            expect(dead_letters() == [
+                {"url": item_url + "1", "error": "HTTP 404", "status": 404, "attempts": 1},
+                {"url": item_url + "2", "error": f"gave up after {uesp_fetch.MAX_ATTEMPTS} attempts: HTTP 503",
+                 "status": 503, "attempts": uesp_fetch.MAX_ATTEMPTS},
+                {"url": item_url + "3", "error": "ValueError: no esoil_rawdata table on the page",
+                 "status": None, "attempts": 1},
+            ], f"{failed_name} lists the 404, the given up 503 and the page without raw data")
+
+            # The next crawl: only item 4 fails, and keeps the row stored for it.
+            faults.clear()
+            route.pages[f"/{category.key}/item/3"] = fixtures.detail_page(rows[3])
+            faults.add(f"/{category.key}/item/4", [], then=Fault(404))
+            stored_row = next(record for record in records if record["webLink"] == item_url + "4")
+            summary = crawl()
+            records = stored_records()
+            expect(summary["items"] == 6 and records[4] == stored_row,
+                   "a page that fails keeps its stored row instead of leaving the results")
+
+            # An outage: every page fails, and nothing stored is rewritten.
+            for i in range(len(rows)):
+                faults.add(f"/{category.key}/item/{i}", [], then=Fault(404))
+            with open(uesp_scraper.records_path(category), "rb") as f:
+                before = f.read()
+            try:
+                crawl()
+                error = None
+            except RuntimeError as exc:
+                error = exc
+            with open(uesp_scraper.records_path(category), "rb") as f:
+                after = f.read()
+            expect(error is not None and after == before and len(dead_letters()) == len(rows),
+                   f"a crawl where more than {uesp_scraper.MAX_FAILED_SHARE:.0%} of the pages fail raises and "
+                   f"leaves the records file as it was, listing every page in {failed_name}")
+    finally:
+        os.chdir(cwd)
+
+
+class Route:
+    """The stand-in's pages by path; the fault checks only use their status."""
+
+    def __init__(self):
+        self.pages = {}
+
+    def __call__(self, path):
+        return self.pages.get(path, PAGE if path.count("/") == 1 else None)
+
+
+def main():
+    for name, value in POLICY.items():
+        setattr(uesp_fetch, name, value)
+    uesp_cache.configure(enabled=False)
+    uesp_pipeline.configure(workers=0)
+
+    faults = fixtures.FaultScript()
+    route = Route()
+    server, base_url = fixtures.start_server(route, faults)
+    uesp_scraper.BASE_URL = base_url
+    try:
+        check_retries(base_url, faults)
+        check_breaker(base_url, faults)
+        check_dead_letters(base_url, faults, route)
+    finally:
+        uesp_pipeline.close()
+        server.shutdown()
+        server.server_close()
+    print("The fetch policy behaves as configured.")
+
+
+if __name__ == "__main__":
+    main()
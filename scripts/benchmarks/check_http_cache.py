@@ -0,0 +1,117 @@
+"""
+Checks the conditional-GET cache of uesp_cache, through uesp_fetch, against
+a local stand-in whose pages carry an ETag and Last-Modified and that answers
+304 Not Modified while the page is unchanged, offline:
+  - store: a first download stores every page with its validators.
+  - revalidate: the next request sends If-None-Match and If-Modified-Since,
+    and a 304 is answered with the stored body.
+  - changed page: a page whose ETag changed is downloaded and stored again.
+  - expiry: an entry older than max_age is dropped and the page downloaded
+    without validators.
+  - eviction: past max_size the least recently used entries are deleted.
+
+Prints every check and exits with an error at the first one that fails.
+
+Run from the scripts folder:
+    python benchmarks/check_http_cache.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import fixtures
+import uesp_cache
+import uesp_fetch
+from check_fetch_policy import expect
+
+PAGES = 5
+
+
+def fetch(urls):
+    """Fetches the URLs in order and returns their bodies."""
+    return [uesp_fetch.get(url).content for url in urls]
+
+
+def use_cache(directory, **settings):
+    uesp_cache.configure(directory=directory, **settings)
+    return uesp_cache.get_cache()
+
+
+def check_revalidation(directory, server, base_url, pages):
+    cache = use_cache(directory)
+    paths = sorted(pages)
+    urls = [base_url + path for path in paths]
+    expect(fetch(urls) == [pages[path] for path in paths] and cache.stats["stored"] == PAGES
+           and not server.conditional, f"a first download stores all {PAGES} pages, without validators")
+
+    cached = cache.lookup(urls[0])
+    expect(cache.validators(cached) == {"If-None-Match": cached["headers"]["ETag"],
+                                        "If-Modified-Since": fixtures.LAST_MODIFIED},
+           "a stored page has an If-None-Match and an If-Modified-Since to send")
+
+    responses = [uesp_fetch.get(url) for url in urls]
+    expect(all(getattr(response, "from_cache", False) and response.status_code == 200 for response in responses)
+           and [response.content for response in responses] == [pages[path] for path in paths]
+           and sum(server.not_modified.values()) == PAGES and cache.stats["revalidated"] == PAGES
+           and cache.stats["stored"] == PAGES,
+           f"the next {PAGES} requests are answered 304 and served from the stored bodies")
+
+    pages[paths[0]] = pages[paths[0]].replace(b"</body>", b"<p>changed</p></body>")
+    body = uesp_fetch.get(urls[0]).content
+    expect(body == pages[paths[0]] and cache.stats["stored"] == PAGES + 1 and server.conditional[paths[0]] == 2
+           and server.not_modified[paths[0]] == 1,
+           "a changed page no longer matches its ETag and is downloaded and stored again")
+
+
+def check_expiry(directory, server, base_url, pages):
+    cache = use_cache(directory, max_age=0.5)
+    path = sorted(pages)[1]
+    fetch([base_url + path])
+    conditional = server.conditional.get(path, 0)
+    time.sleep(0.6)
+    fetch([base_url + path])
+    expect(cache.stats["expired"] == 1 and cache.stats["stored"] == 2
+           and server.conditional.get(path, 0) == conditional,
+           "an entry older than max_age is dropped and the page downloaded without validators")
+
+
+def check_eviction(directory, base_url, pages):
+    paths = sorted(pages)
+    page_size = max(len(page) for page in pages.values())
+    # Room for 2.5 pages: evicting down to EVICT_TO_RATIO of that keeps the 2 newest.
+    cache = use_cache(directory, max_size=int(page_size * 2.5))
+    for path in paths:
+        fetch([base_url + path])
+        # The entries are ordered by the time they were last used.
+        time.sleep(0.01)
+    kept = [path for path in paths if cache.lookup(base_url + path) is not None]
+    stored = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)
+                 if name.endswith(".body"))
+    expect(kept == paths[-2:] and cache.stats["evicted"] == PAGES - 2 and stored <= cache.max_size,
+           f"past max_size the {PAGES - 2} least recently used pages are evicted")
+
+
+def main():
+    uesp_fetch.configure(requests_per_second=1000, burst=100)
+    pages = {f"/item/{i}": fixtures.detail_page(row) for i, row in enumerate(fixtures.sample_rows(PAGES))}
+    server, base_url = fixtures.start_server(pages.get, validators=True)
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            check_revalidation(os.path.join(workdir, "revalidation"), server, base_url, pages)
+            check_expiry(os.path.join(workdir, "expiry"), server, base_url, pages)
+            check_eviction(os.path.join(workdir, "eviction"), base_url, pages)
+    finally:
+        uesp_cache.configure()
+        server.shutdown()
+        server.server_close()
+    print("The HTTP cache behaves as configured.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Checks the list columns --fast relies on (uesp_incremental.LIST_COLUMNS),
+offline:
+  - saved list pages: every LIST_COLUMNS header is on the real list pages
+    saved by record_list_pages.py, and reports the share of cells whose text
+    matches the stored field. Skipped, and reported as unverified, while
+    benchmarks/list_pages holds no saved pages.
+  - --fast, then --incremental: against a stand-in, a --fast run takes a new
+    name from the list page, fetches the detail page of every entry whose
+    list cell differs from its stored field and stores the detail page's
+    value, not the cell's; the --incremental run after it fetches nothing and
+    leaves the records as they were.
+
+Prints every check and exits with an error at the first one that fails.
+
+Run from the scripts folder:
+    python benchmarks/check_incremental.py
+"""
+import contextlib
+import copy
+import io
+import os
+import sys
+import tempfile
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import fixtures
+import uesp_cache
+import uesp_categories
+import uesp_fetch
+import uesp_incremental
+import uesp_pipeline
+import uesp_records
+import uesp_scraper
+from check_fetch_policy import expect
+from record_list_pages import LIST_PAGES_DIR
+
+
+def check_saved_list_pages(pages):
+    saved = {category: os.path.join(LIST_PAGES_DIR, f"{category.key}.html")
+             for category in uesp_categories.CATEGORIES}
+    saved = {category: filename for category, filename in saved.items() if os.path.exists(filename)}
+    if not saved:
+        print(f"UNVERIFIED: no list pages saved in {LIST_PAGES_DIR}; LIST_COLUMNS "
+              f"({', '.join(uesp_incremental.LIST_COLUMNS)}) only matches the stand-in's own header. "
+              "Run benchmarks/record_list_pages.py with network access and commit its pages.")
+        return
+    for category, filename in saved.items():
+        with open(filename, "rb") as f:
+            pages[category.list_path] = f.read()
+        with contextlib.redirect_stdout(io.StringIO()):
+            links = uesp_scraper.get_item_links(category)
+        headers = {header for link in links for header in link["columns"]}
+        expect(links and set(uesp_incremental.LIST_COLUMNS) <= headers,
+               f"the saved {category.key} list page has the columns {', '.join(uesp_incremental.LIST_COLUMNS)}")
+        stored = {row["webLink"]: row for row in uesp_incremental.load_results(uesp_scraper.records_path(category))}
+        compared = matched = 0
+        for link in links:
+            row = stored.get(link["webLink"])
+            if row is None:
+                continue
+            for field, value in uesp_incremental.list_fields(link).items():
+                compared += 1
+                matched += row.get(field) == value
+        share = matched / compared if compared else 0.0
+        print(f"{category.key}: {matched} of {compared} list cells ({share:.0%}) match the stored fields; "
+              f"--fast fetches the detail pages of the other {compared - matched}.")
+
+
+def check_fast_then_incremental(base_url, faults, pages):
+    category = uesp_categories.CATEGORIES_BY_KEY["paintings"]
+    rows = fixtures.sample_rows(4)
+    detail_paths = [f"/{category.key}/item/{i}" for i in range(len(rows))]
+    item_url = f"{base_url}/{category.key}/item/"
+
+    def show(list_rows):
+        pages[category.list_path] = fixtures.list_page(list_rows, base_url + "/" + category.key)
+        pages.update({path: fixtures.detail_page(row) for path, row in zip(detail_paths, rows)})
+
+    def crawl(*argv):
+        uesp_scraper.forget_seen_details()
+        hits = {path: faults.hits.get(path, 0) for path in detail_paths}
+        with contextlib.redirect_stdout(io.StringIO()):
+            uesp_scraper.main(category, list(argv))
+        return [i for i, path in enumerate(detail_paths) if faults.hits.get(path, 0) > hits[path]]
+
+    def stored_records():
+        return {record["webLink"]: record for record in uesp_records.iter_records(uesp_scraper.records_path(category))}
+
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            show(rows)
+            expect(crawl() == [0, 1, 2, 3], "a full crawl fetches every detail page")
+
+            list_rows = copy.deepcopy(rows)
+            # Item 0 is renamed, item 1's list cell shows a shortened description,
+            # and item 2's description changes on both pages.
+            list_rows[0]["name"] = "Renamed Painting 0"
+            list_rows[1]["description"] = rows[1]["description"][:20] + "..."
+            rows[2]["description"] = list_rows[2]["description"] = "A new description."
+            show(list_rows)
+            expect(crawl("--fast") == [1, 2], "--fast only fetches the items whose list cell differs")
+            records = stored_records()
+            expect(records[item_url + "0"]["name"] == "Renamed Painting 0"
+                   and records[item_url + "0"]["description"] == rows[0]["description"],
+                   "--fast takes a new name from the list page and keeps the stored description")
+            expect(records[item_url + "1"]["description"] == rows[1]["description"]
+                   and records[item_url + "2"]["description"] == "A new description.",
+                   "--fast stores the detail page's description, never the list cell's")
+
+            with open(uesp_scraper.records_path(category), "rb") as f:
+                before = f.read()
+            fetched = crawl("--incremental")
+            with open(uesp_scraper.records_path(category), "rb") as f:
+                after = f.read()
+            expect(fetched == [] and after == before,
+                   "the --incremental run after it fetches nothing and leaves the records as they were")
+    finally:
+        os.chdir(cwd)
+
+
+def main():
+    uesp_cache.configure(enabled=False)
+    uesp_fetch.configure(requests_per_second=1000, burst=100)
+    uesp_pipeline.configure(workers=0)
+
+    pages = {}
+    faults = fixtures.FaultScript()
+    server, base_url = fixtures.start_server(pages.get, faults)
+    uesp_scraper.BASE_URL = base_url
+    try:
+        check_saved_list_pages(pages)
+        check_fast_then_incremental(base_url, faults, pages)
+    finally:
+        uesp_pipeline.close()
+        server.shutdown()
+        server.server_close()
+    print("--fast and --incremental behave as configured.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Look-alike UESP pages for the offline benchmarks.
+
+The generated pages mirror the shape of the real ones: a large wiki skin
+around the content, the esoil_rawdata table on item pages, and a wikitable
+of name links on list pages. They are deterministic for a given seed.
+"""
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Real detail pages carry roughly this much markup around the raw-data table.
+SKIN_BYTES_BEFORE = 60 * 1024
+SKIN_BYTES_AFTER = 90 * 1024
+
+# Last-Modified of every page the stand-in serves with validators.
+LAST_MODIFIED = "Mon, 02 Jun 2025 12:00:00 GMT"
+
+RAW_DATA_KEYS = ["itemId", "allNames", "description", "icon", "furnDataId", "furnCategory"]
+
+CATEGORIES = [
+    "Gallery:Paintings (9:54)",
+    "Parlor:Banners (3:58)",
+    "Library:Literature (4:62)",
+    "Library:Maps (4:64)",
+    "Services:Music Boxes (25:182)",
+    "Parlor:Tapestries (3:52)",
+]
+
+WORDS = ("ancient dwemer painting banner tapestry volume map music box of the "
+         "crown guild imperial nord khajiit elsweyr skyrim morrowind").split()
+
+
+def _skin(size, rng):
+    """Returns roughly `size` bytes of wiki-like navigation markup and scripts."""
+    parts = ['<div id="mw-navigation"><script>var wgPageName = "Online:Item";</script>']
+    total = 0
+    while total < size:
+        words = " ".join(rng.choice(WORDS) for _ in range(8))
+        chunk = (f'<li class="mw-list-item"><a href="/wiki/Online:{words.replace(" ", "_")}" '
+                 f'title="{words}">{html.escape(words.title())}</a></li><!-- nav -->\n')
+        parts.append(chunk)
+        total += len(chunk)
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def sample_rows(count, seed=0):
+    """
+    Returns `count` item dictionaries with the same keys the scrapers produce.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        item_id = 100000 + i
+        name = " ".join(rng.choice(WORDS) for _ in range(4)).title() + f" {i}"
+        rows.append({
+            "itemId": str(item_id),
+            "webLink": f"https://esoitem.uesp.net/itemLink.php?&itemid={item_id}&quality={rng.randint(1, 5)}",
+            "name": name,
+            "allNames": name,
+            "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 30))).capitalize()
+                           + ' "quoted" & <escaped>.',
+            "icon": f"/esoui/art/icons/housing_gen_inc_{rng.choice(WORDS)}{i:03d}.dds",
+            "furnDataId": str(2000 + i),
+            "furnCategory": rng.choice(CATEGORIES),
+            "link": "",
+        })
+    return rows
+
+
+def raw_data_div(row):
+    """
+    Returns the esoil_rawdata div of an item page, as rendered page content (str).
+    """
+    cells = "".join(
+        f'<tr>\n<td>{key}</td>\n<td id="">{html.escape(str(row.get(key, "")), quote=False)}</td>\n</tr>\n'
+        for key in RAW_DATA_KEYS
+    )
+    return ('<div id="esoil_rawdata"><h3>Raw Data</h3>'
+            f'<table id="esoil_rawdatatable">\n{cells}</table></div>')
+
+
+def detail_page(row, seed=0):
+    """
+    Returns the HTML (bytes) of an item page holding the row in its esoil_rawdata table.
+    """
+    rng = random.Random(f"{seed}:{row['itemId']}")
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>"
+        f"{html.escape(row['name'])}</title></head><body>"
+        f"{_skin(SKIN_BYTES_BEFORE, rng)}"
+        f"{raw_data_div(row)}"
+        f"{_skin(SKIN_BYTES_AFTER, rng)}"
+        "</body></html>"
+    ).encode("utf-8")
+
+
+def api_parse_response(query, pages):
+    """
+    Returns the JSON (bytes) a MediaWiki api.php answers to an action=parse
+    request with the given parsed query string (formatversion=2), generated
+    rather than recorded (see record_api_responses.py for real answers). The text
+    parameter may transclude pages ({{:Title}}); pages maps the titles that
+    exist to their rows, which render as their esoil_rawdata div. Other
+    transclusions render as red links, like on the wiki.
+    """
+    if query.get("action", [""])[0] != "parse" or "text" not in query:
+        return json.dumps({"error": {"code": "badparams", "info": "Only action=parse with text is recorded."}}).encode()
+
+    def render(match):
+        title = match.group(1).strip()
+        row = pages.get(title)
+        if row is None:
+            return f'<a href="/w/index.php?title={html.escape(title)}&amp;action=edit&amp;redlink=1" class="new">{html.escape(title)}</a>'
+        return raw_data_div(row)
+
+    text = re.sub(r"\{\{:([^{}]+)\}\}", render, query["text"][0])
+    # Inline markup on a line of its own is wrapped in a paragraph.
+    text = re.sub(r"^(<span[^>]*></span>)$", r"<p>\1\n</p>", text, flags=re.MULTILINE)
+    return json.dumps({"parse": {"title": "API", "pageid": 0,
+                                 "text": f'<div class="mw-parser-output">{text}</div>'}}).encode("utf-8")
+
+
+def list_page(rows, base_url="", seed=0):
+    """
+    Returns the HTML (bytes) of a list page linking to every row.
+    If base_url is given, links point at <base_url>/item/<index> instead of the row's webLink.
+    """
+    rng = random.Random(seed)
+    body = ["<table class=\"wikitable\"><tr><th>Icon</th><th>Name</th><th>Description</th></tr>"]
+    for i, row in enumerate(rows):
+        href = f"{base_url}/item/{i}" if base_url else row["webLink"]
+        body.append(
+            f'<tr><td><img src="/icons/{i}.png"></td>'
+            f'<td><a href="{html.escape(href)}">{html.escape(row["name"])}</a></td>'
+            f'<td>{html.escape(row["description"])}</td></tr>'
+        )
+    body.append("</table>")
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"></head><body>"
+        f"{_skin(SKIN_BYTES_BEFORE, rng)}{''.join(body)}{_skin(SKIN_BYTES_AFTER, rng)}</body></html>"
+    ).encode("utf-8")
+
+
+def load_pages(directory):
+    """
+    Returns the bytes of every saved .html page in directory, sorted by file name.
+    """
+    pages = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".html"):
+            with open(os.path.join(directory, name), "rb") as f:
+                pages.append(f.read())
+    return pages
+
+
+class Fault:
+    """
+    One scripted answer of the stand-in: wait `delay` seconds, then answer
+    with `status` (and a Retry-After header if `retry_after` is given). With
+    no status the page is served as usual after the delay, which is how a
+    slow response is scripted.
+    """
+
+    def __init__(self, status=None, retry_after=None, delay=0.0):
+        self.status = status
+        self.retry_after = retry_after
+        self.delay = delay
+
+
+class FaultScript:
+    """
+    Per-path scripts of Fault answers for start_server(). Counts the
+    requests to every path in `hits`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scripts = {}
+        self._then = {}
+        self.hits = {}
+
+    def add(self, path, faults, then=None):
+        """
+        Scripts the next requests to path (the path and query, as requested):
+        each plays the next Fault of `faults`. Once they run out the path is
+        answered normally, or with the Fault `then` if given, e.g. for a page
+        that keeps failing.
+        """
+        with self._lock:
+            self._scripts[path] = list(faults)
+            if then is not None:
+                self._then[path] = then
+
+    def clear(self):
+        """Drops every script; the counts are kept."""
+        with self._lock:
+            self._scripts.clear()
+            self._then.clear()
+
+    def next(self, path):
+        """Counts a request to path and returns the Fault to play, or None."""
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            faults = self._scripts.get(path)
+            if faults:
+                return faults.pop(0)
+            return self._then.get(path)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        fault = self.server.faults.next(self.path)
+        if fault is not None:
+            if fault.delay:
+                time.sleep(fault.delay)
+            if fault.status is not None:
+                self._send_empty(fault.status, fault.retry_after)
+                return
+        body = self.server.route(self.path)
+        if body is None:
+            self._send_empty(404)
+            return
+        etag = None
+        if self.server.validators:
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            conditional = self.headers.get("If-None-Match")
+            with self.server.lock:
+                if conditional:
+                    self.server.conditional[self.path] = self.server.conditional.get(self.path, 0) + 1
+                not_modified = conditional == etag
+                if not_modified:
+                    self.server.not_modified[self.path] = self.server.not_modified.get(self.path, 0) + 1
+            if not_modified:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            if etag is not None:
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", LAST_MODIFIED)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # The client timed out on a slow answer and hung up.
+            self.close_connection = True
+
+    def _send_empty(self, status, retry_after=None):
+        self.send_response(status)
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(route, faults=None, validators=False):
+    """
+    Starts a local HTTP stand-in for UESP on a free port, in a daemon thread.
+    route(path) returns the bytes of the page at path, or None for a 404.
+    faults is an optional FaultScript whose scripted answers are played
+    before route is asked; its hits count the requests to every path.
+    With validators, pages carry an ETag (a hash of the page) and
+    Last-Modified, and a request whose If-None-Match still matches is
+    answered 304 Not Modified. The server's conditional and not_modified
+    count those requests and answers by path.
+    Returns the server (call shutdown() when done) and its base URL.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.daemon_threads = True
+    server.route = route
+    server.faults = faults or FaultScript()
+    server.validators = validators
+    server.lock = threading.Lock()
+    server.conditional = {}
+    server.not_modified = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
@@ -0,0 +1,62 @@
+"""
+Records what the real UESP wiki's api.php answers to the --api backend, so
+bench_fetch_backends.py can check its stand-in against it: for the first
+--items items of every category (from the results records files), sends the
+action=parse request uesp_wikiapi would send and saves the items and the
+JSON answer to benchmarks/api_responses/<category>.json.
+
+Needs network access, and sends one request per category at the scrapers'
+default rate. Run from the scripts folder, with results to read:
+    python benchmarks/record_api_responses.py
+    python benchmarks/record_api_responses.py --items 10
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import uesp_categories
+import uesp_fetch
+import uesp_records
+import uesp_scraper
+import uesp_wikiapi
+
+RESPONSES_DIR = os.path.join(BENCHMARKS_DIR, "api_responses")
+
+
+def record(category, count):
+    """
+    Sends the batch request for the category's first `count` items and
+    returns what is saved for it: the request URL, the items and the answer.
+    """
+    rows = uesp_records.iter_records(uesp_scraper.records_path(category))
+    items = [{"name": row["name"], "webLink": row["webLink"]} for row in itertools.islice(rows, count)]
+    url = uesp_wikiapi.batch_url([uesp_wikiapi.page_title(item) for item in items])
+    response = uesp_fetch.get(url)
+    return {"url": url, "items": items, "response": json.loads(response.content)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record real api.php answers for bench_fetch_backends.py.")
+    parser.add_argument("--items", type=int, default=uesp_wikiapi.BATCH_SIZE,
+                        help=f"Items recorded per category, in one request (default: {uesp_wikiapi.BATCH_SIZE}).")
+    args = parser.parse_args(argv)
+
+    os.makedirs(RESPONSES_DIR, exist_ok=True)
+    for category in uesp_categories.CATEGORIES:
+        recorded = record(category, args.items)
+        filename = os.path.join(RESPONSES_DIR, f"{category.key}.json")
+        with uesp_records.open_atomic(filename) as f:
+            json.dump(recorded, f, indent=1, ensure_ascii=False)
+        matched = uesp_wikiapi.parse_batch(recorded["items"], json.dumps(recorded["response"]).encode("utf-8"))
+        print(f"{category.key}: {len(matched)} of {len(recorded['items'])} items matched; saved to {filename}")
+
+
+if __name__ == "__main__":
+    main()
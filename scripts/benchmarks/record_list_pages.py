@@ -0,0 +1,36 @@
+"""
+Saves the real UESP list page of every category, so check_incremental.py can
+check uesp_incremental.LIST_COLUMNS against it: downloads each category's
+list page and saves it to benchmarks/list_pages/<category>.html.
+
+Needs network access, and sends one request per category at the scrapers'
+default rate. Run from the scripts folder:
+    python benchmarks/record_list_pages.py
+"""
+import os
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "scrapers"))
+
+import uesp_categories
+import uesp_fetch
+import uesp_scraper
+
+LIST_PAGES_DIR = os.path.join(BENCHMARKS_DIR, "list_pages")
+
+
+def main():
+    os.makedirs(LIST_PAGES_DIR, exist_ok=True)
+    for category in uesp_categories.CATEGORIES:
+        response = uesp_fetch.get(uesp_scraper.BASE_URL + category.list_path)
+        filename = os.path.join(LIST_PAGES_DIR, f"{category.key}.html")
+        with open(filename, "wb") as f:
+            f.write(response.content)
+        print(f"{category.key}: {len(response.content)} bytes saved to {filename}")
+
+
+if __name__ == "__main__":
+    main()
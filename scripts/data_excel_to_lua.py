@@ -1,27 +1,159 @@
+import argparse
+import functools
+import hashlib
+import json
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from openpyxl import load_workbook
 
-def read_excel_data(filename):
+# The category registry lives with the scrapers.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scrapers"))
+import uesp_catalog
+import uesp_categories
+import uesp_item
+import uesp_records
+
+# Size of the write buffer of the Lua files, in bytes.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Layouts of the generated Lua tables:
+#   - rows: an array with one table of named fields per item.
+#   - columnar: one array per field, with interned furnishing categories and
+#     icon prefixes and links rebuilt from itemId and quality. Decoded in the
+#     add-on by modules/Columnar.lua.
+FORMATS = ("rows", "columnar")
+
+# Item links that follow this pattern are rebuilt in the add-on instead of being stored.
+LINK_FORMAT = "https://esoitem.uesp.net/itemLink.php?&itemid={item_id}&quality={quality}"
+
+# Numbers written per line in the columnar format's numeric arrays.
+NUMBERS_PER_LINE = 20
+
+# Global table every data file registers its table in, under the table's name.
+# The chunk files register the functions that build their chunks, under
+# chunks.<table name>[chunk number].
+DATA_GLOBAL = "RanckorsGalleryData"
+
+# Items per chunk. Each category is written as data/<chunk_folder>/<n>.lua
+# files, which the add-on only builds (modules/Loader.lua) once one of their
+# items is needed, e.g. when the category's view opens.
+CHUNK_SIZE = 200
+
+# Lookup indexes over every category, loaded after the data files.
+INDEX_FILE = os.path.join("..", "data", "indexes.lua")
+
+# Index entries are single numbers, table number * INDEX_STRIDE + position,
+# where the table number is 1-based in Data.categoryOrder; modules/Loader.lua
+# decodes them. A number takes no table of its own in the add-on's memory.
+INDEX_STRIDE = 65536
+
+# The chunk count and size of every data table, read by modules/Loader.lua.
+CATEGORY_INDEX_FILE = os.path.join("..", "data", "categories.lua")
+
+# The add-on's manifest. Its data/ lines are rewritten to list the files written.
+ADDON_DIR = ".."
+ADDON_MANIFEST = os.path.join(ADDON_DIR, "RanckorsGallery.txt")
+
+# Content hashes of the inputs and outputs of the last conversion, used to
+# skip the categories whose results have not changed since.
+BUILD_MANIFEST = os.path.join("results", "lua_build.json")
+
+# The code that decides what the Lua files hold: this script, the item records
+# (how values are parsed and written), the category registry and the records reader.
+GENERATOR_MODULES = (__file__, uesp_item.__file__, uesp_categories.__file__, uesp_records.__file__)
+
+def iter_excel_rows(filename):
     """
-    Reads the given Excel file and returns a list of dictionaries.
+    Streams the rows of the given Excel file as dictionaries, one at a time.
     The first row is assumed to be headers.
     Expected headers (as produced by your scraper) are:
       itemId, webLink, name, allNames, description, icon, furnDataId, furnCategory
+
+    The workbook is opened in read-only mode, so only the current row is held
+    in memory however large the file grows. Empty cells become "".
     """
-    wb = load_workbook(filename)
-    ws = wb.active
-    data = []
-    headers = []
-    for i, row in enumerate(ws.iter_rows(values_only=True)):
-        if i == 0:
-            headers = list(row)
-        else:
-            entry = {}
-            for j, cell in enumerate(row):
-                header = headers[j]
-                entry[header] = cell if cell is not None else ""
-            data.append(entry)
-    return data
+    wb = load_workbook(filename, read_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        for row in rows:
+            yield {header: "" if cell is None else cell for header, cell in zip(headers, row)}
+    finally:
+        wb.close()
+
+def read_excel_data(filename):
+    """
+    Reads the given Excel file and returns a list of dictionaries (see iter_excel_rows).
+    """
+    return list(iter_excel_rows(filename))
+
+def select_source(category, catalog=None, read_from=None):
+    """
+    Picks where the category's scraped rows are read from. Its records file
+    (results/<key>_data.jsonl) is authoritative: the catalog
+    (uesp_catalog.Catalog), if one is given and holds the category, is only
+    read when there is no records file, and the results workbook only when
+    there is neither. read_from ("catalog" or "excel") reads that source
+    instead, whatever else exists.
+    Returns the kind of source ("catalog", "records" or "excel") and its path.
+    Raises FileNotFoundError if there is none.
+    """
+    records_file = os.path.join("results", category.records_file)
+    excel_file = os.path.join("results", category.results_file)
+    in_catalog = catalog is not None and catalog.synced_at(category.key) is not None
+    if read_from == "excel":
+        if not os.path.exists(excel_file):
+            raise FileNotFoundError(f"No workbook for {category.label}: expected {excel_file}")
+        return "excel", excel_file
+    if read_from == "catalog":
+        if not in_catalog:
+            raise FileNotFoundError(f"{category.label} are not in the catalog {uesp_catalog.DEFAULT_PATH}")
+        return "catalog", catalog.path
+    if os.path.exists(records_file):
+        return "records", records_file
+    if in_catalog:
+        return "catalog", catalog.path
+    if os.path.exists(excel_file):
+        return "excel", excel_file
+    raise FileNotFoundError(f"No results for {category.label}: expected {records_file} or {excel_file}")
+
+def iter_results(category, catalog=None, read_from=None):
+    """
+    Streams the category's scraped rows, as uesp_item.Item, from the source
+    select_source picks, and returns a description of that source along with the rows.
+    """
+    kind, source = select_source(category, catalog, read_from)
+    if kind == "catalog":
+        return f"{source} ({category.key})", map(uesp_item.Item.from_row, catalog.iter_category(category.key))
+    if kind == "records":
+        return source, map(uesp_item.Item.from_row, uesp_records.iter_records(source))
+    return source, map(uesp_item.Item.from_row, iter_excel_rows(source))
+
+def file_hash(filename):
+    """
+    Returns the SHA-256 hex digest of a file's bytes, or None if it does not exist.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(filename, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+def source_hash(category, catalog=None, read_from=None):
+    """
+    Returns the content hash of the source select_source picks for the category.
+    """
+    kind, source = select_source(category, catalog, read_from)
+    if kind == "catalog":
+        return catalog.content_hash(category.key)
+    return file_hash(source)
 
 def format_value(key, value):
     """
@@ -40,102 +172,569 @@ def format_value(key, value):
     escaped = value.replace('"', '\\"')
     return f'"{escaped}"'
 
-def convert_to_lua(data, table_name):
+def format_item_id(item):
+    """
+    Formats an item's itemId for Lua output, as format_value("itemId", ...)
+    does; an id already parsed to an integer is written as is.
+    """
+    if type(item.item_id) is int:
+        return str(item.item_id)
+    return format_value("itemId", item["itemId"])
+
+def iter_lua_lines(data, table_name):
     """
-    Converts the list of dictionaries (Excel rows) into a Lua table formatted string.
+    Yields the lines of the Lua table for the given rows (any iterable of
+    uesp_item.Item or dictionaries), without newlines, so a table can be
+    written while the rows are still being read.
     The Excel column "webLink" is mapped to the Lua key "link".
     The resulting Lua table is assigned to the variable named table_name.
     """
-    lua_lines = []
-    lua_lines.append(f"local {table_name} = {{")
+    yield from _rows_table_lines(data, table_name)
+    yield from _registration_lines(table_name)
+
+def _rows_table_lines(data, table_name):
+    # The table of iter_lua_lines, without registering it.
+    yield f"local {table_name} = {{"
     for entry in data:
-        lua_lines.append("    {")
-        lua_lines.append(f'        icon = {format_value("icon", entry.get("icon", ""))},')
-        lua_lines.append(f'        itemId = {format_value("itemId", entry.get("itemId", ""))},')
-        lua_lines.append(f'        link = {format_value("link", entry.get("webLink", ""))},')
-        lua_lines.append(f'        name = {format_value("name", entry.get("name", ""))},')
-        lua_lines.append(f'        allNames = {format_value("allNames", entry.get("allNames", ""))},')
-        lua_lines.append(f'        furnDataId = {format_value("furnDataId", entry.get("furnDataId", ""))},')
-        lua_lines.append(f'        furnCategory = {format_value("furnCategory", entry.get("furnCategory", ""))},')
-        lua_lines.append(f'        description = {format_value("description", entry.get("description", ""))},')
-        lua_lines.append("    },")
-    lua_lines.append("}")
-    return "\n".join(lua_lines)
-
-def main():
-    # Define paths to the Excel files (assumed to be in the "results" folder).
-    paintings_excel   = os.path.join("results", "paintings_data.xlsx")
-    music_boxes_excel = os.path.join("results", "music_boxes_data.xlsx")
-    banners_excel     = os.path.join("results", "banners_data.xlsx")
-    tapestries_excel  = os.path.join("results", "tapestries_data.xlsx")
-    esoplus_excel     = os.path.join("results", "esoplus_data.xlsx")
-    literature_excel  = os.path.join("results", "literature_data.xlsx")
-    maps_excel        = os.path.join("results", "maps_data.xlsx")
-    
-    # Define output file paths in the data folder (one level up).
-    paintings_lua_file   = os.path.join("..", "data", "paintings.lua")
-    music_boxes_lua_file = os.path.join("..", "data", "music_box.lua")
-    banners_lua_file     = os.path.join("..", "data", "banners.lua")
-    tapestries_lua_file  = os.path.join("..", "data", "tapestries.lua")
-    esoplus_lua_file     = os.path.join("..", "data", "esoplus.lua")
-    literature_lua_file  = os.path.join("..", "data", "literature.lua")
-    maps_lua_file        = os.path.join("..", "data", "maps.lua")
-    
-    # Process Paintings
-    print("Processing paintings...")
-    paintings_data = read_excel_data(paintings_excel)
-    paintings_lua = convert_to_lua(paintings_data, "paintings")
-    with open(paintings_lua_file, "w", encoding="utf-8") as f:
-        f.write(paintings_lua)
-    print(f"Lua file created for paintings: {paintings_lua_file}")
-    
-    # Process Music Boxes
-    print("Processing music boxes...")
-    music_boxes_data = read_excel_data(music_boxes_excel)
-    music_boxes_lua = convert_to_lua(music_boxes_data, "musicBoxes")
-    with open(music_boxes_lua_file, "w", encoding="utf-8") as f:
-        f.write(music_boxes_lua)
-    print(f"Lua file created for music boxes: {music_boxes_lua_file}")
-    
-    # Process Banners
-    print("Processing banners...")
-    banners_data = read_excel_data(banners_excel)
-    banners_lua = convert_to_lua(banners_data, "banners")
-    with open(banners_lua_file, "w", encoding="utf-8") as f:
-        f.write(banners_lua)
-    print(f"Lua file created for banners: {banners_lua_file}")
-    
-    # Process Tapestries
-    print("Processing tapestries...")
-    tapestries_data = read_excel_data(tapestries_excel)
-    tapestries_lua = convert_to_lua(tapestries_data, "tapestries")
-    with open(tapestries_lua_file, "w", encoding="utf-8") as f:
-        f.write(tapestries_lua)
-    print(f"Lua file created for tapestries: {tapestries_lua_file}")
-    
-    # Process ESO_Plus
-    print("Processing ESO_Plus...")
-    esoplus_data = read_excel_data(esoplus_excel)
-    esoplus_lua = convert_to_lua(esoplus_data, "esoplus")
-    with open(esoplus_lua_file, "w", encoding="utf-8") as f:
-        f.write(esoplus_lua)
-    print(f"Lua file created for ESO_Plus: {esoplus_lua_file}")
-    
-    # Process Literature
-    print("Processing Literature...")
-    literature_data = read_excel_data(literature_excel)
-    literature_lua = convert_to_lua(literature_data, "literature")
-    with open(literature_lua_file, "w", encoding="utf-8") as f:
-        f.write(literature_lua)
-    print(f"Lua file created for Literature: {literature_lua_file}")
-    
-    # Process Maps
-    print("Processing Maps...")
-    maps_data = read_excel_data(maps_excel)
-    maps_lua = convert_to_lua(maps_data, "maps")
-    with open(maps_lua_file, "w", encoding="utf-8") as f:
-        f.write(maps_lua)
-    print(f"Lua file created for Maps: {maps_lua_file}")
+        item = uesp_item.as_item(entry)
+        yield "    {"
+        yield f'        icon = {format_value("icon", item.icon)},'
+        yield f'        itemId = {format_item_id(item)},'
+        yield f'        link = {format_value("link", item.web_link)},'
+        yield f'        name = {format_value("name", item.name)},'
+        yield f'        allNames = {format_value("allNames", item.all_names)},'
+        yield f'        furnDataId = {format_value("furnDataId", item["furnDataId"])},'
+        yield f'        furnCategory = {format_value("furnCategory", item.furn_category)},'
+        yield f'        description = {format_value("description", item.description)},'
+        yield "    },"
+    yield "}"
+
+def _registration_lines(table_name):
+    # Makes the file's table reachable from the add-on as RanckorsGalleryData.<table_name>.
+    yield ""
+    yield f'local Data = _G["{DATA_GLOBAL}"] or {{}}'
+    yield f"Data.{table_name} = {table_name}"
+    yield f'_G["{DATA_GLOBAL}"] = Data'
+
+def convert_to_lua(data, table_name):
+    """
+    Converts the rows (uesp_item.Item or dictionaries) into a Lua table formatted string.
+    """
+    return "\n".join(iter_lua_lines(data, table_name))
+
+def split_icon(icon):
+    """
+    Splits an icon path into the prefix shared by related icons (the folder
+    and the file name up to its last underscore) and the rest.
+    """
+    folder, _, name = icon.rpartition("/")
+    stem = name.rpartition("_")[0]
+    prefix = f"{folder}/{stem}_" if stem else (f"{folder}/" if folder or icon.startswith("/") else "")
+    return prefix, icon[len(prefix):]
+
+def derived_link_quality(entry):
+    """
+    Returns the quality to rebuild the entry's link from (see LINK_FORMAT),
+    or None if its link does not follow the pattern and must be stored.
+    """
+    item = uesp_item.as_item(entry)
+    item_id = format_item_id(item)
+    link = item.web_link
+    if not item_id.isdigit():
+        return None
+    prefix = LINK_FORMAT.format(item_id=item_id, quality="")
+    quality = link[len(prefix):]
+    if link.startswith(prefix) and quality.isdigit() and str(int(quality)) == quality:
+        return int(quality)
+    return None
+
+def format_number_or_string(value):
+    """
+    Formats a value as a Lua number if it reads back as the same string, otherwise as a string.
+    """
+    value = str(value)
+    if value.isdigit() and str(int(value)) == value:
+        return value
+    return format_value("", value)
+
+def _intern(table, value):
+    # Returns the 1-based Lua index of value in table, adding it if it is new.
+    if value not in table:
+        table[value] = len(table) + 1
+    return table[value]
+
+def _lua_array(name, values, per_line=1):
+    yield f"    {name} = {{"
+    for start in range(0, len(values), per_line):
+        yield "        " + " ".join(f"{value}," for value in values[start:start + per_line])
+    yield "    },"
+
+def _lua_sparse(name, values):
+    # Only the set entries of a mostly empty column, keyed by row index.
+    yield f"    {name} = {{"
+    for index, value in values:
+        yield f"        [{index}] = {value},"
+    yield "    },"
+
+def iter_columnar_lines(data, table_name):
+    """
+    Yields the lines of the Lua table for the given rows in the columnar
+    format (see FORMATS), without newlines. Decoding it with
+    modules/Columnar.lua gives back the same items as the rows format.
+
+    The columns are built in memory before the first line is written.
+    """
+    yield from _columnar_table_lines(data, table_name)
+    yield from _registration_lines(table_name)
+
+def _columnar_table_lines(data, table_name):
+    # The table of iter_columnar_lines, without registering it.
+    furn_categories = {}
+    icon_prefixes = {}
+    columns = {field: [] for field in ("itemId", "quality", "name", "furnDataId",
+                                       "furnCategory", "iconPrefix", "icon", "description")}
+    all_names = []
+    links = []
+    count = 0
+    for count, entry in enumerate(data, start=1):
+        item = uesp_item.as_item(entry)
+        prefix, icon = split_icon(item.icon)
+        quality = derived_link_quality(item)
+        columns["itemId"].append(format_item_id(item))
+        columns["quality"].append(str(quality or 0))
+        columns["name"].append(format_value("name", item.name))
+        columns["furnDataId"].append(format_number_or_string(item["furnDataId"]))
+        columns["furnCategory"].append(str(_intern(furn_categories, item.furn_category)))
+        columns["iconPrefix"].append(str(_intern(icon_prefixes, prefix)))
+        columns["icon"].append(format_value("icon", icon))
+        columns["description"].append(format_value("description", item.description))
+        if item.all_names != item.name:
+            all_names.append((count, format_value("allNames", item.all_names)))
+        if quality is None:
+            links.append((count, format_value("link", item.web_link)))
+
+    yield f"local {table_name} = {{"
+    yield '    format = "columnar",'
+    yield f"    count = {count},"
+    yield from _lua_array("furnCategories", [format_value("", value) for value in furn_categories])
+    yield from _lua_array("iconPrefixes", [format_value("", value) for value in icon_prefixes])
+    for field in ("itemId", "quality", "furnDataId", "furnCategory", "iconPrefix"):
+        yield from _lua_array(field, columns[field], NUMBERS_PER_LINE)
+    for field in ("name", "icon", "description"):
+        yield from _lua_array(field, columns[field])
+    yield from _lua_sparse("allNames", all_names)
+    yield from _lua_sparse("links", links)
+    yield "}"
+
+def write_lines(lines, filename):
+    """
+    Writes the lines, separated by newlines, to filename and returns the
+    SHA-256 hex digest of what was written.
+
+    The lines go through a buffered writer into a temporary file next to
+    filename, which replaces it only once it is complete (see
+    uesp_records.open_atomic). If the conversion fails or is interrupted, the
+    previous file is left as it was and the add-on never loads a truncated table.
+    """
+    digest = hashlib.sha256()
+    with uesp_records.open_atomic(filename, buffering=WRITE_BUFFER_SIZE) as f:
+        lines = iter(lines)
+        text = next(lines, "")
+        while True:
+            f.write(text)
+            digest.update(text.encode("utf-8"))
+            text = next(lines, None)
+            if text is None:
+                break
+            text = "\n" + text
+    return digest.hexdigest()
+
+def write_lua(data, table_name, filename, lua_format="rows"):
+    """
+    Writes the Lua table for the given rows to filename in the given format
+    (see FORMATS; the rows format has the same content convert_to_lua
+    returns) with write_lines. Returns the number of rows written and the
+    hash of the file.
+    """
+    count = 0
+
+    def counted(rows):
+        nonlocal count
+        for entry in rows:
+            count += 1
+            yield entry
+
+    iter_lines = iter_columnar_lines if lua_format == "columnar" else iter_lua_lines
+    digest = write_lines(iter_lines(counted(data), table_name), filename)
+    return count, digest
+
+def iter_chunks(rows, size):
+    """
+    Yields the rows in lists of `size` (the last one may be shorter).
+    """
+    chunk = []
+    for entry in rows:
+        chunk.append(entry)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_chunk_lines(rows, table_name, number, lua_format="rows"):
+    """
+    Yields the lines of chunk `number` (1-based) of a data table: a function,
+    registered under RanckorsGalleryData.chunks.<table_name>[number], that
+    builds the Lua table of the given rows in the given format (see FORMATS).
+    Loading the file only defines the function; modules/Loader.lua calls it
+    when one of the chunk's items is needed.
+    """
+    table_lines = _columnar_table_lines if lua_format == "columnar" else _rows_table_lines
+    yield f"-- Generated by scripts/data_excel_to_lua.py: chunk {number} of {table_name}, built by modules/Loader.lua."
+    yield f'local Data = _G["{DATA_GLOBAL}"] or {{}}'
+    yield "Data.chunks = Data.chunks or {}"
+    yield f"Data.chunks.{table_name} = Data.chunks.{table_name} or {{}}"
+    yield f"Data.chunks.{table_name}[{number}] = function()"
+    for line in table_lines(rows, table_name):
+        yield f"    {line}"
+    yield f"    return {table_name}"
+    yield "end"
+    yield f'_G["{DATA_GLOBAL}"] = Data'
+
+def write_chunks(data, table_name, folder, lua_format="rows", chunk_size=CHUNK_SIZE):
+    """
+    Writes the Lua table for the given rows as chunk files of chunk_size
+    items, folder/1.lua, folder/2.lua, ... (see iter_chunk_lines), with
+    write_lines, and removes the folder's other .lua files (the chunks of a
+    bigger earlier build). Rows are read one chunk at a time.
+    Returns the number of rows written and the [file, hash] of every chunk, in order.
+    """
+    os.makedirs(folder, exist_ok=True)
+    count = 0
+    outputs = []
+    for number, rows in enumerate(iter_chunks(data, chunk_size), start=1):
+        filename = os.path.join(folder, f"{number}.lua")
+        outputs.append([filename, write_lines(iter_chunk_lines(rows, table_name, number, lua_format), filename)])
+        count += len(rows)
+    written = {filename for filename, _ in outputs}
+    for name in os.listdir(folder):
+        filename = os.path.join(folder, name)
+        if name.endswith(".lua") and filename not in written:
+            os.remove(filename)
+    return count, outputs
+
+def index_keys(entry):
+    """
+    Returns the keys an entry is indexed by in the lookup indexes: its itemId
+    as a Lua number literal and its furnDataId, each None when it has none.
+    """
+    item = uesp_item.as_item(entry)
+    item_id = format_item_id(item)
+    furn_data_id = item["furnDataId"]
+    return (item_id if item_id.isdigit() else None,
+            furn_data_id if furn_data_id not in ("", "0") else None)
+
+def generator_hash():
+    """
+    Returns one hash over the GENERATOR_MODULES, so changing how the Lua is
+    generated, in this script or the modules it relies on, rebuilds every file.
+    """
+    digest = hashlib.sha256()
+    for filename in GENERATOR_MODULES:
+        digest.update(f"{os.path.basename(filename)}:{file_hash(os.path.abspath(filename))}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def convert_category(key, previous=None, lua_format="rows", chunk_size=CHUNK_SIZE, read_from=None):
+    """
+    Converts one category's scraped results (see iter_results, with the
+    catalog if there is one, and read_from) into its Lua
+    chunk files (see write_chunks).
+    Takes the category key so it can run in a worker process.
+    Returns a report dictionary with the category key, the chunk folder, the
+    number of items and the time taken in seconds, or the error that stopped it.
+    The report also holds the index keys (see index_keys) of every item, in
+    order, and the build fingerprint and the [file, hash] of every chunk
+    recorded in the build manifest.
+
+    previous is the category's entry in the last build manifest. If the
+    inputs have the same fingerprint (source, content hash, format, chunk
+    size, table name and generator) and the chunk files still have the hashes
+    written then, the category is skipped and its report copied from the manifest.
+    """
+    category = uesp_categories.get(key)
+    # Results are read from the "results" folder; Lua files are written
+    # to the data folder one level up.
+    lua_folder = os.path.join("..", "data", category.chunk_folder)
+    report = {"key": key, "source": None, "lua_folder": lua_folder, "items": 0, "seconds": 0.0, "error": None,
+              "index_keys": [], "fingerprint": None, "outputs": [], "skipped": False}
+    start_time = time.perf_counter()
+    catalog = None
+    try:
+        if os.path.exists(uesp_catalog.DEFAULT_PATH):
+            catalog = uesp_catalog.Catalog(uesp_catalog.DEFAULT_PATH)
+        kind, source = select_source(category, catalog, read_from)
+        report["fingerprint"] = {
+            "source": source if kind != "catalog" else f"{source} ({key})",
+            "source_hash": source_hash(category, catalog, read_from),
+            "format": lua_format,
+            "chunk_size": chunk_size,
+            "lua_table": category.lua_table,
+            "generator": generator_hash(),
+        }
+        if (previous and previous.get("fingerprint") == report["fingerprint"]
+                and all(file_hash(filename) == digest for filename, digest in previous["outputs"])):
+            report.update(source=report["fingerprint"]["source"], items=previous["items"],
+                          index_keys=[tuple(keys) for keys in previous["index_keys"]],
+                          outputs=previous["outputs"], skipped=True)
+        else:
+            report["source"], rows = iter_results(category, catalog, read_from)
+
+            def indexed(rows):
+                for entry in rows:
+                    report["index_keys"].append(index_keys(entry))
+                    yield entry
+
+            report["items"], report["outputs"] = write_chunks(indexed(rows), category.lua_table, lua_folder,
+                                                              lua_format, chunk_size)
+            # The whole table in one file, as written before chunks.
+            single_file = os.path.join("..", "data", category.lua_file)
+            if os.path.exists(single_file):
+                os.remove(single_file)
+    except Exception as exc:
+        report["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        if catalog is not None:
+            catalog.close()
+    report["seconds"] = time.perf_counter() - start_time
+    return report
+
+def convert_all(categories=None, jobs=None, lua_format="rows", manifest=None, chunk_size=CHUNK_SIZE, read_from=None):
+    """
+    Converts every category (the whole registry by default) across a pool of
+    worker processes. Each category writes its own Lua file, so the output
+    does not depend on the order the workers finish in. Categories unchanged
+    since the build manifest (see load_manifest) are skipped.
+    Returns the report of every category, in registry order.
+    """
+    keys = [category.key for category in (categories or uesp_categories.CATEGORIES)]
+    previous = [(manifest or {}).get("categories", {}).get(key) for key in keys]
+    convert = functools.partial(convert_category, lua_format=lua_format, chunk_size=chunk_size, read_from=read_from)
+    if jobs == 1:
+        return [convert(key, previous=entry) for key, entry in zip(keys, previous)]
+    with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(keys))) as executor:
+        return list(executor.map(convert, keys, previous))
+
+def load_manifest(filename=BUILD_MANIFEST):
+    """
+    Returns the build manifest written by the last conversion, or an empty one.
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_manifest(manifest, filename=BUILD_MANIFEST):
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with uesp_records.open_atomic(filename) as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+def update_manifest(manifest, reports):
+    """
+    Records the fingerprint, chunk hashes and index keys of every category that
+    converted; failed categories keep no entry, so they are retried next time.
+    """
+    categories = manifest.setdefault("categories", {})
+    for report in reports:
+        if report["error"]:
+            categories.pop(report["key"], None)
+        else:
+            categories[report["key"]] = {
+                "fingerprint": report["fingerprint"],
+                "outputs": report["outputs"],
+                "items": report["items"],
+                "index_keys": report["index_keys"],
+            }
+    return manifest
+
+def iter_index_lines(reports):
+    """
+    Yields the lines of data/indexes.lua from the reports of every category,
+    in registry order:
+      - byItemId: itemId -> index entry (see INDEX_STRIDE).
+      - byFurnDataId: furnDataId (a string) -> index entry.
+      - members: table name -> set of the itemIds it holds.
+    An id found in several places points at the first one.
+    """
+    by_item_id = {}
+    by_furn_data_id = {}
+    members = {}
+    for table_number, report in enumerate(reports, start=1):
+        table_name = uesp_categories.get(report["key"]).lua_table
+        if len(report["index_keys"]) >= INDEX_STRIDE:
+            raise ValueError(f"{table_name} has {len(report['index_keys'])} items; "
+                             f"index entries hold positions below {INDEX_STRIDE}")
+        members[table_name] = {}
+        for position, (item_id, furn_data_id) in enumerate(report["index_keys"], start=1):
+            entry = table_number * INDEX_STRIDE + position
+            if item_id is not None:
+                by_item_id.setdefault(item_id, entry)
+                members[table_name].setdefault(item_id, True)
+            if furn_data_id is not None:
+                by_furn_data_id.setdefault(format_value("furnDataId", furn_data_id), entry)
+
+    yield "-- Generated by scripts/data_excel_to_lua.py: lookups over every table in RanckorsGalleryData."
+    yield (f"-- Entries are table number * {INDEX_STRIDE} + position, the table numbered as in "
+           "Data.categoryOrder; Loader.GetIndexedItem resolves them.")
+    yield f'local Data = _G["{DATA_GLOBAL}"] or {{}}'
+    yield ""
+    yield "Data.byItemId = {"
+    for key, entry in by_item_id.items():
+        yield f"    [{key}] = {entry},"
+    yield "}"
+    yield ""
+    yield "Data.byFurnDataId = {"
+    for key, entry in by_furn_data_id.items():
+        yield f"    [{key}] = {entry},"
+    yield "}"
+    yield ""
+    yield "Data.members = {"
+    for table_name, item_ids in members.items():
+        yield f"    {table_name} = {{"
+        for item_id in item_ids:
+            yield f"        [{item_id}] = true,"
+        yield "    },"
+    yield "}"
+    yield ""
+    yield f'_G["{DATA_GLOBAL}"] = Data'
+
+def iter_category_index_lines(reports):
+    """
+    Yields the lines of data/categories.lua from the reports of every
+    category: the item count, chunk size and number of chunks of every data
+    table, and the table names in registry order, which number the tables
+    in the lookup indexes (see INDEX_STRIDE).
+    """
+    yield "-- Generated by scripts/data_excel_to_lua.py: the data tables and their chunks, built by modules/Loader.lua."
+    yield f'local Data = _G["{DATA_GLOBAL}"] or {{}}'
+    yield ""
+    yield "Data.categories = {"
+    for report in reports:
+        table_name = uesp_categories.get(report["key"]).lua_table
+        yield (f"    {table_name} = {{ count = {report['items']}, chunkSize = {report['fingerprint']['chunk_size']}, "
+               f"chunks = {len(report['outputs'])} }},")
+    yield "}"
+    yield ""
+    yield "Data.categoryOrder = {"
+    for report in reports:
+        yield f'    "{uesp_categories.get(report["key"]).lua_table}",'
+    yield "}"
+    yield ""
+    yield f'_G["{DATA_GLOBAL}"] = Data'
+
+def addon_path(filename):
+    """
+    Returns a file's path as listed in the add-on manifest: relative to the add-on folder, with forward slashes.
+    """
+    return os.path.relpath(filename, ADDON_DIR).replace(os.sep, "/")
+
+def addon_manifest_lines(lines, data_files):
+    """
+    Returns the lines of the add-on manifest with its data/ lines replaced by
+    data_files, where the first of them was (or before RanckorsGallery.lua,
+    which uses the data, if there were none).
+    """
+    kept = [line for line in lines if not line.startswith("data/")]
+    position = next((index for index, line in enumerate(lines) if line.startswith("data/")), None)
+    if position is None:
+        position = kept.index("RanckorsGallery.lua") if "RanckorsGallery.lua" in kept else len(kept)
+    else:
+        position -= sum(1 for line in lines[:position] if line.startswith("data/"))
+    return kept[:position] + list(data_files) + kept[position:]
+
+def update_addon_manifest(reports, filename=ADDON_MANIFEST):
+    """
+    Lists the chunk files of every category, then the category index and the
+    lookup indexes, in the add-on manifest. Returns True if the manifest changed.
+    """
+    data_files = [addon_path(chunk_file) for report in reports for chunk_file, _ in report["outputs"]]
+    data_files += [addon_path(CATEGORY_INDEX_FILE), addon_path(INDEX_FILE)]
+    with open(filename, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+    lines = addon_manifest_lines(text.split("\n"), data_files)
+    if "\n".join(lines) == text:
+        return False
+    write_lines(lines, filename)
+    return True
+
+def write_if_changed(lines, filename):
+    """
+    Writes the lines with write_lines unless filename already holds them. Returns True if it wrote them.
+    """
+    if hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest() == file_hash(filename):
+        return False
+    write_lines(lines, filename)
+    return True
+
+def print_report(reports, elapsed):
+    """
+    Prints one line per category and a total, and returns the keys of the categories that failed.
+    """
+    for report in reports:
+        category = uesp_categories.get(report["key"])
+        if report["error"]:
+            print(f"  {category.label:<18} FAILED: {report['error']}")
+        elif report["skipped"]:
+            print(f"  {category.label:<18} {report['items']:6} items  unchanged  {report['lua_folder']}")
+        else:
+            print(f"  {category.label:<18} {report['items']:6} items  {report['seconds']:6.2f}s  {report['source']} -> "
+                  f"{report['lua_folder']} ({len(report['outputs'])} chunk(s))")
+    failed = [report["key"] for report in reports if report["error"]]
+    skipped = sum(1 for report in reports if report["skipped"])
+    total = sum(report["items"] for report in reports)
+    print(f"Converted {len(reports) - len(failed) - skipped} of {len(reports)} categories, "
+          f"{skipped} unchanged ({total} items) in {elapsed:.2f}s.")
+    return failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the scraped results into the add-on's Lua data files.")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes used for the conversion (default: one per CPU; 1 converts in this process).")
+    parser.add_argument("--format", choices=FORMATS, default="rows",
+                        help="Layout of the Lua tables (default: rows; columnar is smaller and needs modules/Columnar.lua).")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help=f"Items per Lua chunk file; the add-on builds a chunk when one of its items is needed (default: {CHUNK_SIZE}).")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--from-catalog", action="store_const", const="catalog", dest="read_from",
+                        help=f"Read every category from the catalog ({uesp_catalog.DEFAULT_PATH}) "
+                             "instead of its records file.")
+    source.add_argument("--from-excel", action="store_const", const="excel", dest="read_from",
+                        help="Read every category from its results workbook instead of its records file.")
+    parser.add_argument("--force", action="store_true",
+                        help=f"Regenerate every Lua file, even the ones {BUILD_MANIFEST} shows are up to date.")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    start_time = time.perf_counter()
+    manifest = {} if args.force else load_manifest()
+    reports = convert_all(jobs=args.jobs, lua_format=args.format, manifest=manifest, chunk_size=args.chunk_size,
+                          read_from=args.read_from)
+    failed = print_report(reports, time.perf_counter() - start_time)
+    update_manifest(manifest, reports)
+    if failed:
+        save_manifest(manifest)
+        raise RuntimeError(f"Lua conversion failed for: {', '.join(failed)}")
+    # Built only from a complete conversion, so they never point at missing items.
+    # Rewritten only when their content changes, like the data files.
+    if write_if_changed(list(iter_index_lines(reports)), INDEX_FILE):
+        print(f"Lookup indexes created: {INDEX_FILE}")
+    if write_if_changed(list(iter_category_index_lines(reports)), CATEGORY_INDEX_FILE):
+        print(f"Category index created: {CATEGORY_INDEX_FILE}")
+    if update_addon_manifest(reports):
+        print(f"Add-on manifest updated: {ADDON_MANIFEST}")
+    save_manifest(manifest)
+    return reports
 
 if __name__ == "__main__":
     main()
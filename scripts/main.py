@@ -1,7 +1,30 @@
-import subprocess
-import sys
+import argparse
+import contextlib
+import functools
 import os
+import sys
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRAPERS_DIR = os.path.join(SCRIPTS_DIR, "scrapers")
+# The scrapers import their shared helpers as top-level modules.
+sys.path.insert(0, SCRAPERS_DIR)
+
+import data_excel_to_lua
+import uesp_cache
+import uesp_categories
+import uesp_dedup
+import uesp_fetch
+import uesp_metrics
+import uesp_pipeline
+import uesp_rawdata
+import uesp_scraper
+import uesp_session
+
+# Seconds between two lines of the --live-metrics summary.
+LIVE_METRICS_INTERVAL = 10.0
 
 def print_progress_bar(current, total, bar_length=40):
     """
@@ -15,52 +38,203 @@ def print_progress_bar(current, total, bar_length=40):
     sys.stdout.write(f"\rProgress: |{bar}| {percent*100:.0f}%")
     sys.stdout.flush()
 
-def run_script(script_path):
+def format_duration(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}m {seconds:04.1f}s"
+
+def run_stage(name, func):
+    """
+    Runs one stage (a scraper's or the converter's main function) and
+    returns how long it took in seconds along with the function's result.
+    """
+    print(f"\nRunning {name}...")
+    start_time = time.perf_counter()
+    with uesp_metrics.stage(name):
+        result = func()
+    return time.perf_counter() - start_time, result
+
+def write_metrics(args):
+    """
+    Writes the run's metrics file (see scrapers/uesp_metrics.py) and prints where it went.
+    """
+    path = uesp_metrics.get_metrics().write(extra={"connections": uesp_session.connection_stats(),
+                                                   "settings": vars(args)})
+    print(f"Run metrics written to {path}")
+
+def print_failure_report(categories, summaries):
     """
-    Runs the given Python script using the current interpreter.
-    If the script fails (non-zero exit code), the program exits.
+    Lists the detail pages that failed for good in each category.
+    Returns the total number of failures.
     """
-    print(f"\nRunning {script_path}...")
-    result = subprocess.run([sys.executable, script_path], capture_output=True, text=True)
-    print(result.stdout)
-    if result.returncode != 0:
-        print(f"Error running {script_path}:")
-        print(result.stderr)
-        sys.exit(result.returncode)
-    else:
-        print(f"Finished running {script_path}.\n")
-
-def main():
+    total = sum(len(summaries[category.key]["failures"]) for category in categories)
+    if not total:
+        return 0
+    print(f"\n{total} detail page(s) could not be scraped (their stored rows, if any, were kept):")
+    for category in categories:
+        failures = summaries[category.key]["failures"]
+        if failures:
+            print(f"  {category.key}: {len(failures)} (see {uesp_scraper.failures_path(category)})")
+            for failure in failures[:3]:
+                print(f"    {failure['url']}: {failure['error']}")
+            if len(failures) > 3:
+                print("    ...")
+    return total
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape every gallery category and convert the results to Lua.")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Requests per second allowed to each host, shared by all categories (default: 2).")
+    parser.add_argument("--burst", type=int, default=2,
+                        help="Requests a host may receive back to back before the rate applies (default: 2).")
+    parser.add_argument("--max-in-flight", type=int, default=8,
+                        help="Global limit on requests open at the same time (default: 8).")
+    parser.add_argument("--concurrency", type=int, default=uesp_fetch.DEFAULT_CONCURRENCY,
+                        help=f"Detail pages each category keeps pending at once (default: {uesp_fetch.DEFAULT_CONCURRENCY}).")
+    parser.add_argument("--pool-size", type=int, default=None,
+                        help="Keep-alive connections kept open per host (default: same as --max-in-flight).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Download every page in full instead of revalidating the HTTP cache in results/http_cache.")
+    parser.add_argument("--cache-max-age", type=float, default=uesp_cache.DEFAULT_MAX_AGE / 86400,
+                        help="Days a cached page is trusted for revalidation before it is downloaded again (default: 7).")
+    parser.add_argument("--cache-max-size", type=int, default=uesp_cache.DEFAULT_MAX_SIZE // (1024 * 1024),
+                        help="Size limit of the HTTP cache in MB (default: 256).")
+    parser.add_argument("--parser", choices=uesp_rawdata.BACKENDS, default=uesp_rawdata.DEFAULT_BACKEND,
+                        help="Backend used to read the raw-data table of detail pages (lxml must be installed separately).")
+    parser.add_argument("--parse-workers", type=int, default=uesp_pipeline.DEFAULT_WORKERS,
+                        help="Processes parsing detail pages while the next ones download; 0 parses on a thread "
+                             f"instead (default: {uesp_pipeline.DEFAULT_WORKERS}).")
+    parser.add_argument("--parse-queue", type=int, default=uesp_pipeline.DEFAULT_QUEUE_SIZE,
+                        help="Downloaded pages allowed to wait for a parser before downloads pause "
+                             f"(default: {uesp_pipeline.DEFAULT_QUEUE_SIZE}).")
+    parser.add_argument("--api", action="store_true",
+                        help="Experimental, unverified against the real wiki: read detail pages in batches through "
+                             "the wiki's API; pages it cannot read are still fetched one by one.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only fetch detail pages for new or changed items and merge them into the existing results.")
+    parser.add_argument("--fast", action="store_true",
+                        help="Quick \"what's new\" refresh: take renamed items' names from the list pages and only fetch "
+                             "detail pages for new items, items whose list columns changed and items still missing "
+                             "details (implies --incremental).")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue interrupted crawls from their checkpoint journals instead of starting over.")
+    parser.add_argument("--merge-duplicates", action="store_true",
+                        help="Drop rows repeated within a category before the Lua conversion (duplicates are always reported).")
+    parser.add_argument("--excel", action="store_true",
+                        help="Also export each category's results to an Excel workbook in results/ for review by hand.")
+    parser.add_argument("--live-metrics", type=float, nargs="?", const=LIVE_METRICS_INTERVAL, default=None,
+                        metavar="SECONDS",
+                        help=f"Print a summary of requests, bytes, latency and pages parsed every SECONDS "
+                             f"(default: {LIVE_METRICS_INTERVAL:g}) while scraping.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     start_time = time.time()
 
-    directory_url = os.path.join(os.getcwd(), "scrapers") + os.sep
-    
-    # List your scraper and conversion scripts in the order you want them to run.
-    tasks = [
-        directory_url + "uesp_banners_scraper.py",
-        directory_url + "uesp_esoplus_scraper.py",
-        directory_url + "uesp_literature_scraper.py",
-        directory_url + "uesp_maps_scraper.py",
-        directory_url + "uesp_music_boxes_scraper.py",
-        directory_url + "uesp_paintings_scraper.py",
-        directory_url + "uesp_tapestries_scraper.py",
-        directory_url + "uesp_maps_scraper.py",
-        "data_excel_to_lua.py"
-    ]
-    
-    total_tasks = len(tasks)
-    
-    # Run each script sequentially.
-    for i, script in enumerate(tasks, start=1):
-        run_script(script)
-        print_progress_bar(i, total_tasks)
-        # Optional: pause a bit to let you see the progress bar update.
-        time.sleep(0.5)
-    
+    # Scrapers and the converter read and write paths relative to this folder.
+    os.chdir(SCRIPTS_DIR)
+    uesp_fetch.configure(args.rate, args.burst, args.max_in_flight, args.concurrency)
+    uesp_session.configure(args.pool_size or args.max_in_flight)
+    uesp_rawdata.DEFAULT_BACKEND = args.parser
+    uesp_pipeline.configure(args.parse_workers, args.parse_queue)
+    uesp_cache.configure(enabled=not args.no_cache,
+                         max_age=args.cache_max_age * 86400,
+                         max_size=args.cache_max_size * 1024 * 1024)
+
+    scraper_argv = []
+    if args.incremental:
+        scraper_argv.append("--incremental")
+    if args.fast:
+        scraper_argv.append("--fast")
+    if args.resume:
+        scraper_argv.append("--resume")
+    if args.excel:
+        scraper_argv.append("--excel")
+    if args.api:
+        scraper_argv.append("--api")
+    categories = uesp_categories.CATEGORIES
+    total_tasks = len(categories) + 2
+    completed = 0
+    timings = {}
+    summaries = {}
+    failures = {}
+
+    # Every category crawl, run in-process and at the same time. Detail pages
+    # linked by several categories are fetched once per run.
+    uesp_scraper.forget_seen_details()
+    uesp_metrics.reset()
+    live = uesp_metrics.LiveSummary(args.live_metrics) if args.live_metrics else contextlib.nullcontext()
+    executor = ThreadPoolExecutor(max_workers=len(categories))
+    try:
+        with live:
+            futures = {
+                executor.submit(run_stage, category.key,
+                                functools.partial(uesp_scraper.main, category, scraper_argv)): category.key
+                for category in categories
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    timings[name], summaries[name] = future.result()
+                    print(f"\nFinished {name} in {format_duration(timings[name])}.")
+                except Exception as exc:
+                    failures[name] = exc
+                    print(f"\nError running {name}:")
+                    traceback.print_exception(type(exc), exc, exc.__traceback__)
+                completed += 1
+                print_progress_bar(completed, total_tasks)
+    except KeyboardInterrupt:
+        # The crawls run on worker threads: make their pending requests fail
+        # at once so they end quickly, keeping their journals for --resume.
+        print("\nInterrupted: stopping the crawls (run again with --resume to continue)...")
+        uesp_fetch.stop()
+        raise
+    finally:
+        executor.shutdown(cancel_futures=True)
+        uesp_pipeline.close()
+
+    if failures:
+        print(f"\n\n{len(failures)} scraper(s) failed: {', '.join(sorted(failures))}. Skipping Lua conversion.")
+        print("Run again with --resume to continue from where they stopped.")
+        write_metrics(args)
+        sys.exit(1)
+
+    dedup_argv = ["--merge"] if args.merge_duplicates else []
+    timings["duplicate check"], _ = run_stage("duplicate check", functools.partial(uesp_dedup.main, dedup_argv))
+    print_progress_bar(total_tasks - 1, total_tasks)
+
+    # Every crawl and the duplicate check above synced the catalog, so the Lua is built from it.
+    timings["lua conversion"], _ = run_stage("lua conversion",
+                                             functools.partial(data_excel_to_lua.main, ["--from-catalog"]))
+    print_progress_bar(total_tasks, total_tasks)
+
+    print("\n\nTiming per stage:")
+    for category in categories:
+        print(f"  {category.key:<16} {format_duration(timings[category.key])}")
+    print(f"  {'duplicate check':<16} {format_duration(timings['duplicate check'])}")
+    print(f"  {'lua conversion':<16} {format_duration(timings['lua conversion'])}")
+
+    stats = uesp_session.connection_stats()
+    print(f"\n{stats['requests']} requests over {stats['connections_opened']} connections "
+          f"({stats['connections_reused']} reused).")
+    write_metrics(args)
+    uesp_session.close()
+
+    cache = uesp_cache.get_cache()
+    if cache is not None:
+        print(f"HTTP cache: {cache.stats['revalidated']} pages unchanged, {cache.stats['stored']} stored, "
+              f"{cache.stats['expired'] + cache.stats['evicted']} dropped.")
+
+    failed_pages = print_failure_report(categories, summaries)
+
     end_time = time.time()
     total_run_time = end_time - start_time
     minutes, seconds = divmod(total_run_time, 60)
-    print(f"\n\nAll scripts completed successfully in {int(minutes)} minutes {int(seconds)} seconds.")
+    if failed_pages:
+        # Partial results were still exported and converted; exit code 2 flags them.
+        print(f"\nAll scripts completed with {failed_pages} failed page(s) in {int(minutes)} minutes {int(seconds)} seconds.")
+        sys.exit(2)
+    print(f"\nAll scripts completed successfully in {int(minutes)} minutes {int(seconds)} seconds.")
 
 if __name__ == "__main__":
     main()
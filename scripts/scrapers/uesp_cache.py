@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import uesp_records
+
+# The cache lives next to the scraped results (paths are relative to the scripts folder).
+DEFAULT_CACHE_DIR = os.path.join("results", "http_cache")
+# Entries not downloaded or revalidated for this long are dropped (7 days).
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+# Total size of cached bodies before the least recently used ones are evicted (256 MB).
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+# Eviction trims the cache to this share of max_size so it does not run on every store.
+EVICT_TO_RATIO = 0.9
+
+# Response headers kept with a cached body.
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class HttpCache:
+    """
+    An on-disk HTTP cache keyed by URL, used for conditional GET requests.
+
+    Each entry is two files named after the SHA-256 of the URL:
+      - <key>.body: the decoded response body.
+      - <key>.json: the URL, stored headers (including ETag/Last-Modified)
+        and when the entry was last stored or revalidated.
+
+    Files are written to a temporary name and renamed into place, so a
+    crash never leaves a half-written entry behind.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_age=DEFAULT_MAX_AGE, max_size=DEFAULT_MAX_SIZE):
+        self.directory = os.path.abspath(directory)
+        self.max_age = max_age
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._size = None
+        self.stats = {"stored": 0, "revalidated": 0, "expired": 0, "evicted": 0}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".body", base + ".json"
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _remove(self, url):
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def lookup(self, url):
+        """
+        Returns the stored metadata for url, or None if there is no usable entry.
+        Entries older than max_age are deleted.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not os.path.exists(body_path):
+            return None
+        if time.time() - meta.get("stored_at", 0) > self.max_age:
+            self._remove(url)
+            self._count("expired")
+            return None
+        return meta
+
+    @staticmethod
+    def validators(meta):
+        """
+        Returns the conditional request headers for a stored entry.
+        """
+        headers = {}
+        stored = meta.get("headers", {})
+        if stored.get("ETag"):
+            headers["If-None-Match"] = stored["ETag"]
+        if stored.get("Last-Modified"):
+            headers["If-Modified-Since"] = stored["Last-Modified"]
+        return headers
+
+    def _write_meta(self, meta_path, meta):
+        with uesp_records.open_atomic(meta_path) as f:
+            json.dump(meta, f)
+
+    def store(self, url, response):
+        """
+        Stores a 200 response if it carries an ETag or Last-Modified validator.
+        """
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return
+        body_path, meta_path = self._paths(url)
+        body = response.content
+        try:
+            old_size = os.path.getsize(body_path)
+        except OSError:
+            old_size = 0
+        with uesp_records.open_atomic(body_path, "wb") as f:
+            f.write(body)
+        self._write_meta(meta_path, {"url": url, "headers": headers, "stored_at": time.time()})
+        self._count("stored")
+        with self._lock:
+            if self._size is not None:
+                self._size += len(body) - old_size
+            over_limit = self._size is None or self._size > self.max_size
+        if over_limit:
+            self.evict()
+
+    def revalidated(self, url, meta, response):
+        """
+        Marks an entry as fresh after a 304 Not Modified and returns a
+        200 response built from the stored body.
+        """
+        body_path, meta_path = self._paths(url)
+        # A 304 may carry updated validators.
+        for name in ("ETag", "Last-Modified"):
+            if name in response.headers:
+                meta["headers"][name] = response.headers[name]
+        meta["stored_at"] = time.time()
+        self._write_meta(meta_path, meta)
+        self._count("revalidated")
+
+        cached = requests.Response()
+        with open(body_path, "rb") as f:
+            cached._content = f.read()
+        cached.status_code = 200
+        cached.reason = "OK"
+        cached.url = url
+        cached.headers = CaseInsensitiveDict(meta["headers"])
+        cached.encoding = requests.utils.get_encoding_from_headers(cached.headers)
+        cached.request = response.request
+        cached.from_cache = True
+        return cached
+
+    def evict(self):
+        """
+        Deletes expired entries, then the least recently stored or revalidated
+        ones until the cache is back under max_size.
+        """
+        with self._lock:
+            entries = []
+            now = time.time()
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(self.directory, name)
+                body_path = meta_path[:-len(".json")] + ".body"
+                try:
+                    used_at = os.path.getmtime(meta_path)
+                    size = os.path.getsize(body_path)
+                except OSError:
+                    continue
+                entries.append((used_at, size, meta_path, body_path))
+            entries.sort()
+
+            total = sum(size for _, size, _, _ in entries)
+            target = self.max_size * EVICT_TO_RATIO
+            for used_at, size, meta_path, body_path in entries:
+                expired = now - used_at > self.max_age
+                if not expired and total <= target:
+                    break
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                self.stats["expired" if expired else "evicted"] += 1
+            self._size = total
+
+
+_lock = threading.Lock()
+_cache = None
+_settings = {"enabled": True, "directory": DEFAULT_CACHE_DIR,
+             "max_age": DEFAULT_MAX_AGE, "max_size": DEFAULT_MAX_SIZE}
+
+
+def configure(enabled=True, directory=DEFAULT_CACHE_DIR, max_age=DEFAULT_MAX_AGE, max_size=DEFAULT_MAX_SIZE):
+    """
+    Sets up the process-wide cache used by the fetch layer. Takes effect on the next get_cache() call.
+    """
+    global _cache
+    with _lock:
+        _settings.update(enabled=enabled, directory=directory, max_age=max_age, max_size=max_size)
+        _cache = None
+
+
+def get_cache():
+    """
+    Returns the shared cache, creating it on first use, or None if caching is disabled.
+    """
+    global _cache
+    with _lock:
+        if not _settings["enabled"]:
+            return None
+        if _cache is None:
+            _cache = HttpCache(_settings["directory"], _settings["max_age"], _settings["max_size"])
+            # Drop stale entries left over from earlier runs.
+            _cache.evict()
+        return _cache
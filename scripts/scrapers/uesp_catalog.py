@@ -0,0 +1,258 @@
+"""
+SQLite catalog of every scraped gallery item, across all categories.
+
+The scrapers sync each category into it after a crawl, and the Lua converter
+can read from it. It can also be queried from the command line, from the
+scripts folder:
+    python scrapers/uesp_catalog.py import                    # load the current results files
+    python scrapers/uesp_catalog.py item 204807               # by itemId
+    python scrapers/uesp_catalog.py furn 6800                 # by furnDataId
+    python scrapers/uesp_catalog.py furn-category Library:Literature
+    python scrapers/uesp_catalog.py name "Antique Map"        # names containing the text
+    python scrapers/uesp_catalog.py changed --since 2026-10-01
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+
+import uesp_categories
+
+DEFAULT_PATH = os.path.join("results", "catalog.sqlite3")
+
+# Columns stored for every item. Values are kept as the scraped strings, so a
+# Lua file converted from the catalog is the same as one converted from the results files.
+ITEM_FIELDS = ["itemId", "webLink", "name", "allNames", "description", "icon", "furnDataId", "furnCategory", "link"]
+
+# Seconds a writer waits for another one (a parallel category sync) to commit.
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    category TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    occurrence INTEGER NOT NULL,
+    itemId TEXT NOT NULL DEFAULT '',
+    webLink TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    allNames TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    icon TEXT NOT NULL DEFAULT '',
+    furnDataId TEXT NOT NULL DEFAULT '',
+    furnCategory TEXT NOT NULL DEFAULT '',
+    link TEXT NOT NULL DEFAULT '',
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (category, webLink, occurrence)
+);
+CREATE INDEX IF NOT EXISTS items_item_id ON items (itemId);
+CREATE INDEX IF NOT EXISTS items_furn_data_id ON items (furnDataId);
+CREATE INDEX IF NOT EXISTS items_furn_category ON items (furnCategory);
+CREATE INDEX IF NOT EXISTS items_name ON items (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS items_updated_at ON items (updated_at);
+CREATE TABLE IF NOT EXISTS categories (
+    key TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    items INTEGER NOT NULL
+);
+"""
+
+_CONTENT_FIELDS = [field for field in ITEM_FIELDS if field != "webLink"]
+
+_UPSERT = f"""
+INSERT INTO items (category, position, occurrence, {", ".join(ITEM_FIELDS)}, first_seen, updated_at, seen_at)
+VALUES (?, ?, ?, {", ".join("?" for _ in ITEM_FIELDS)}, ?, ?, ?)
+ON CONFLICT (category, webLink, occurrence) DO UPDATE SET
+    position = excluded.position,
+    {", ".join(f"{field} = excluded.{field}" for field in _CONTENT_FIELDS)},
+    updated_at = CASE WHEN {" OR ".join(f"{field} IS NOT excluded.{field}" for field in _CONTENT_FIELDS)}
+                      THEN excluded.updated_at ELSE items.updated_at END,
+    seen_at = excluded.seen_at
+"""
+
+
+class Catalog:
+    """
+    A connection to the catalog database. Use one per thread; SQLite
+    serializes the writers of concurrent connections.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def sync(self, category_key, records):
+        """
+        Makes the catalog's items of a category match the given records, in
+        their order: new and changed items are upserted and items no longer
+        listed are deleted, in one transaction. An item's updated_at only
+        moves when one of its values changes. Returns the number of records.
+
+        Items are identified by webLink; a list page that links the same page
+        twice gives two items, told apart by their occurrence.
+        """
+        now = time.time()
+        rows = []
+        occurrences = {}
+        for position, record in enumerate(records):
+            web_link = str(record.get("webLink", ""))
+            occurrence = occurrences[web_link] = occurrences.get(web_link, -1) + 1
+            rows.append((category_key, position, occurrence,
+                         *(str(record.get(field, "")) for field in ITEM_FIELDS), now, now, now))
+        with self._conn:
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.execute("DELETE FROM items WHERE category = ? AND seen_at < ?", (category_key, now))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO categories (key, synced_at, items) VALUES (?, ?, ?)",
+                (category_key, now, len(rows))
+            )
+        return len(rows)
+
+    def synced_at(self, category_key):
+        """
+        Returns when the category was last synced (seconds since the epoch), or None.
+        """
+        row = self._conn.execute("SELECT synced_at FROM categories WHERE key = ?", (category_key,)).fetchone()
+        return row["synced_at"] if row else None
+
+    def _query(self, where, params=()):
+        return [dict(row) for row in self._conn.execute(
+            f"SELECT * FROM items WHERE {where} ORDER BY category, position", params)]
+
+    def iter_category(self, category_key):
+        """
+        Streams a category's items in the order they were synced, as dictionaries.
+        """
+        cursor = self._conn.execute(
+            "SELECT * FROM items WHERE category = ? ORDER BY position", (category_key,))
+        for row in cursor:
+            yield dict(row)
+
+    def content_hash(self, category_key):
+        """
+        Returns a SHA-256 hex digest of a category's items and their order.
+        It only changes when the synced values do.
+        """
+        digest = hashlib.sha256()
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(ITEM_FIELDS)} FROM items WHERE category = ? ORDER BY position", (category_key,))
+        for row in cursor:
+            digest.update(json.dumps(list(row), ensure_ascii=False).encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def by_item_id(self, item_id):
+        return self._query("itemId = ?", (str(item_id),))
+
+    def by_furn_data_id(self, furn_data_id):
+        return self._query("furnDataId = ?", (str(furn_data_id),))
+
+    def in_furn_category(self, furn_category):
+        """
+        Returns the items of a furnishing category, given as shown in game
+        ("Library:Literature") or with its ids ("Library:Literature (4:62)").
+        A top-level category ("Library") includes its subcategories.
+        """
+        # Ranges over the index: "X:..." and "X (...)" sort between these bounds.
+        return self._query(
+            "furnCategory = ? OR (furnCategory >= ? AND furnCategory < ?) OR (furnCategory >= ? AND furnCategory < ?)",
+            (furn_category, furn_category + ":", furn_category + ";",
+             furn_category + " (", furn_category + " )")
+        )
+
+    def search_name(self, text):
+        """
+        Returns the items whose name contains text, ignoring case.
+        """
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._query("name LIKE ? ESCAPE '\\'", (f"%{escaped}%",))
+
+    def changed_since(self, timestamp):
+        """
+        Returns the items added or changed since timestamp (seconds since the epoch).
+        """
+        return self._query("updated_at >= ?", (timestamp,))
+
+
+def parse_since(value):
+    """
+    Parses an ISO date or date-time (UTC unless it has an offset) into seconds since the epoch.
+    """
+    when = datetime.fromisoformat(value)
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def import_results(catalog):
+    """
+    Syncs every category from its current results file (records or workbook).
+    Returns the number of items per category key.
+    """
+    # Imported here: the converter lives one folder up and is only needed for this command.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import data_excel_to_lua
+
+    counts = {}
+    for category in uesp_categories.CATEGORIES:
+        _, rows = data_excel_to_lua.iter_results(category)
+        counts[category.key] = catalog.sync(category.key, rows)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the catalog of scraped gallery items.")
+    parser.add_argument("--db", default=DEFAULT_PATH, help=f"Catalog database (default: {DEFAULT_PATH}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("import", help="Sync every category from its current results file.")
+    commands.add_parser("item", help="Items with an itemId.").add_argument("item_id")
+    commands.add_parser("furn", help="Items with a furnDataId.").add_argument("furn_data_id")
+    commands.add_parser("furn-category", help="Items in a furnishing category.").add_argument("furn_category")
+    commands.add_parser("name", help="Items whose name contains the text.").add_argument("text")
+    changed = commands.add_parser("changed", help="Items added or changed since a date.")
+    changed.add_argument("--since", required=True, type=parse_since,
+                         help="ISO date or date-time, UTC unless an offset is given (e.g. 2026-10-01).")
+    args = parser.parse_args(argv)
+
+    with Catalog(args.db) as catalog:
+        if args.command == "import":
+            for key, count in import_results(catalog).items():
+                print(f"{key}: {count} items")
+            return
+        start_time = time.perf_counter()
+        if args.command == "item":
+            items = catalog.by_item_id(args.item_id)
+        elif args.command == "furn":
+            items = catalog.by_furn_data_id(args.furn_data_id)
+        elif args.command == "furn-category":
+            items = catalog.in_furn_category(args.furn_category)
+        elif args.command == "name":
+            items = catalog.search_name(args.text)
+        else:
+            items = catalog.changed_since(args.since)
+        elapsed = time.perf_counter() - start_time
+    for item in items:
+        print(json.dumps(item, ensure_ascii=False))
+    print(f"{len(items)} items in {elapsed * 1000:.1f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
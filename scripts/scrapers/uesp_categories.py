@@ -0,0 +1,69 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Category:
+    """
+    One gallery collection, described by where it is scraped from and where it ends up.
+      - key: short identifier used on the command line and in file names.
+      - label: plural name used in console messages.
+      - list_path: path of the UESP list page, relative to the wiki's base URL.
+      - results_file: workbook written under scripts/results (with --excel).
+      - lua_file: name of the category's Lua data under data/, written as chunks in chunk_folder.
+      - lua_table: name of the Lua table in that file.
+      - extra_fields: raw-data fields kept in addition to the common ones.
+    """
+    key: str
+    label: str
+    list_path: str
+    results_file: str
+    lua_file: str
+    lua_table: str
+    extra_fields: tuple = ()
+
+    @property
+    def records_file(self):
+        """
+        JSON Lines file of scraped records written under scripts/results, named after results_file.
+        """
+        return os.path.splitext(self.results_file)[0] + ".jsonl"
+
+    @property
+    def chunk_folder(self):
+        """
+        Folder under data/, named after lua_file, that holds the table's chunks (see data_excel_to_lua.py).
+        """
+        return os.path.splitext(self.lua_file)[0]
+
+
+# Every collection the add-on tracks. Adding a category here is enough for the
+# scrapers, main.py and the Lua converter to pick it up.
+CATEGORIES = [
+    Category("banners", "banners", "/wiki/Online:Parlor_Furnishings/Banners",
+             "banners_data.xlsx", "banners.lua", "banners"),
+    Category("esoplus", "ESO_Plus items", "/wiki/Online:Gallery_Furnishings/ESO_Plus",
+             "esoplus_data.xlsx", "esoplus.lua", "esoplus"),
+    Category("literature", "literature items", "/wiki/Online:Library_Furnishings/Literature",
+             "literature_data.xlsx", "literature.lua", "literature"),
+    Category("maps", "maps", "/wiki/Online:Library_Furnishings/Maps",
+             "maps_data.xlsx", "maps.lua", "maps"),
+    Category("music_boxes", "music boxes", "/wiki/Online:Services_Furnishings/Music_Boxes",
+             "music_boxes_data.xlsx", "music_box.lua", "musicBoxes"),
+    Category("paintings", "paintings", "/wiki/Online:Gallery_Furnishings/Paintings",
+             "paintings_data.xlsx", "paintings.lua", "paintings", extra_fields=("link",)),
+    Category("tapestries", "tapestries", "/wiki/Online:Parlor_Furnishings/Tapestries",
+             "tapestries_data.xlsx", "tapestries.lua", "tapestries"),
+]
+
+CATEGORIES_BY_KEY = {category.key: category for category in CATEGORIES}
+
+
+def get(key):
+    """
+    Returns the category registered under key.
+    """
+    try:
+        return CATEGORIES_BY_KEY[key]
+    except KeyError:
+        raise ValueError(f"Unknown category {key!r}; expected one of {', '.join(CATEGORIES_BY_KEY)}") from None
@@ -0,0 +1,173 @@
+"""
+Cross-category consistency checks over the scraped results.
+
+Builds one in-memory index of every category's rows and reports:
+  - items (by itemId) listed in more than one category;
+  - items listed more than once in the same category;
+  - furnDataIds shared by different items.
+With --merge, the repeated rows within a category are dropped from its
+results (the first one is kept). Items found in several categories are only
+reported, since a furnishing can belong to more than one collection.
+
+Run from the scripts folder:
+    python scrapers/uesp_dedup.py           # report
+    python scrapers/uesp_dedup.py --merge   # report, then drop repeated rows
+"""
+import argparse
+import os
+from collections import defaultdict
+
+import uesp_catalog
+import uesp_categories
+import uesp_incremental
+import uesp_records
+import uesp_scraper
+
+
+def row_key(row):
+    """
+    Returns what identifies a row's item: its itemId, or its webLink when it has none.
+    """
+    return row.get("itemId") or row.get("webLink", "")
+
+
+class ConsistencyIndex:
+    """
+    An index of every category's rows by item and by furnDataId.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self._by_item = defaultdict(list)
+        self._by_furn_data_id = defaultdict(list)
+
+    def add_category(self, category_key, rows):
+        self.rows[category_key] = rows
+        for position, row in enumerate(rows):
+            self._by_item[row_key(row)].append((category_key, position))
+            furn_data_id = row.get("furnDataId", "")
+            if furn_data_id not in ("", "0"):
+                self._by_furn_data_id[furn_data_id].append((category_key, position))
+
+    def cross_category(self):
+        """
+        Returns {itemId: [category keys]} for the items listed in more than one category.
+        """
+        found = {}
+        for key, places in self._by_item.items():
+            categories = list(dict.fromkeys(category_key for category_key, _ in places))
+            if len(categories) > 1:
+                found[key] = categories
+        return found
+
+    def repeated(self):
+        """
+        Returns {category key: {item key: [positions]}} for the items listed more
+        than once in the same category.
+        """
+        found = defaultdict(dict)
+        for key, places in self._by_item.items():
+            positions = defaultdict(list)
+            for category_key, position in places:
+                positions[category_key].append(position)
+            for category_key, category_positions in positions.items():
+                if len(category_positions) > 1:
+                    found[category_key][key] = category_positions
+        return dict(found)
+
+    def shared_furn_data_ids(self):
+        """
+        Returns {furnDataId: [(category key, itemId)]} for the furnDataIds used by different items.
+        """
+        found = {}
+        for furn_data_id, places in self._by_furn_data_id.items():
+            items = list(dict.fromkeys(
+                (category_key, row_key(self.rows[category_key][position])) for category_key, position in places
+            ))
+            if len({item_key for _, item_key in items}) > 1:
+                found[furn_data_id] = items
+        return found
+
+    def deduplicated(self, category_key):
+        """
+        Returns the category's rows without its repeated items, keeping the first of each.
+        """
+        seen = set()
+        rows = []
+        for row in self.rows[category_key]:
+            key = row_key(row)
+            if key not in seen:
+                seen.add(key)
+                rows.append(row)
+        return rows
+
+    def report(self):
+        """
+        Returns the lines of a human-readable report; empty when everything is consistent.
+        """
+        lines = []
+        cross_category = self.cross_category()
+        if cross_category:
+            lines.append(f"{len(cross_category)} item(s) listed in more than one category:")
+            lines.extend(f"  {key}: {', '.join(categories)}" for key, categories in cross_category.items())
+        for category_key, items in self.repeated().items():
+            extra = sum(len(positions) - 1 for positions in items.values())
+            lines.append(f"{category_key}: {extra} repeated row(s) for {len(items)} item(s): {', '.join(items)}")
+        shared = self.shared_furn_data_ids()
+        if shared:
+            lines.append(f"{len(shared)} furnDataId(s) shared by different items:")
+            lines.extend(f"  {furn_data_id}: " + ", ".join(f"{category_key}/{key}" for category_key, key in items)
+                         for furn_data_id, items in shared.items())
+        return lines
+
+
+def build_index(categories=None):
+    """
+    Loads the latest results of every category (see uesp_scraper.latest_results_path) into a ConsistencyIndex.
+    """
+    index = ConsistencyIndex()
+    for category in categories or uesp_categories.CATEGORIES:
+        index.add_category(category.key,
+                           uesp_incremental.load_results(uesp_scraper.latest_results_path(category)))
+    return index
+
+
+def merge_repeats(index, categories=None):
+    """
+    Rewrites the records file (and the catalog, if there is one) of every
+    category that has repeated rows, without them. Returns the number of rows dropped.
+    """
+    repeated = index.repeated()
+    dropped = 0
+    for category in categories or uesp_categories.CATEGORIES:
+        if category.key not in repeated:
+            continue
+        rows = index.deduplicated(category.key)
+        dropped += len(index.rows[category.key]) - len(rows)
+        uesp_records.write_records(rows, uesp_scraper.records_path(category), uesp_scraper.result_fields(category))
+        if os.path.exists(uesp_catalog.DEFAULT_PATH):
+            with uesp_catalog.Catalog() as catalog:
+                catalog.sync(category.key, rows)
+    return dropped
+
+
+def main(argv=None):
+    """
+    Reports the inconsistencies across the categories' results and, with
+    --merge, drops the repeated rows. Returns the ConsistencyIndex.
+    """
+    parser = argparse.ArgumentParser(description="Check the scraped results for duplicates across and within categories.")
+    parser.add_argument("--merge", action="store_true",
+                        help="Drop the repeated rows within each category, keeping the first one.")
+    args = parser.parse_args(argv)
+
+    index = build_index()
+    lines = index.report()
+    print("\n".join(lines) if lines else "No duplicates found.")
+    if args.merge and index.repeated():
+        print(f"Dropped {merge_repeats(index)} repeated row(s).")
+    return index
+
+
+if __name__ == "__main__":
+    main()
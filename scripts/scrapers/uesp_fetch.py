@@ -0,0 +1,493 @@
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+import uesp_cache
+import uesp_metrics
+import uesp_session
+
+# Defaults for a single scraper run on its own: about one request per second
+# to each host, like the old "sleep for 1 second" loop, with a few requests
+# allowed in flight so network latency overlaps.
+DEFAULT_REQUESTS_PER_SECOND = 1.0
+DEFAULT_BURST = 1
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_CONCURRENCY = 8
+
+# Seconds to wait for a server to connect or send data before giving up on an attempt.
+REQUEST_TIMEOUT = 30
+
+# Retry policy: a request is tried up to MAX_ATTEMPTS times. Between attempts
+# it backs off exponentially with full jitter: a random delay between 0 and
+# BACKOFF_BASE * 2 ** (attempt - 1) seconds, capped at BACKOFF_MAX. A longer
+# Retry-After from the server wins over the backoff.
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+# Upper bound for a single Retry-After pause, in seconds.
+MAX_RETRY_AFTER = 120.0
+
+# Answers that mean "try again later". Any other 4xx/5xx fails at once.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Circuit breaker: after FAILURE_THRESHOLD retryable failures in a row, a host
+# gets no requests for BREAKER_COOLDOWN seconds (longer each time it trips).
+# Once it has tripped more than MAX_TRIPS times without recovering, every
+# further request to it fails at once.
+FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+MAX_TRIPS = 3
+
+# Longest a waiting request sleeps before checking again whether the fetches were stopped.
+STOP_CHECK_INTERVAL = 0.25
+
+
+class FetchError(Exception):
+    """
+    A URL that could not be fetched, after retries where they made sense.
+    """
+
+    def __init__(self, url, reason, status=None, attempts=1):
+        super().__init__(f"{url}: {reason}")
+        self.url = url
+        self.reason = reason
+        self.status = status
+        self.attempts = attempts
+
+
+class CircuitOpenError(FetchError):
+    """
+    Raised instead of sending a request to a host whose circuit breaker is open for good.
+    """
+
+
+class FetchStopped(FetchError):
+    """
+    Raised instead of sending a request once the fetches were stopped (see
+    stop()). fetch_all never records it as a failure: it ends the whole call.
+    """
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket used to rate limit requests to one host.
+
+    Tokens refill at `rate` per second up to `capacity`. Callers reserve a
+    token with reserve(), which returns how long they must wait before
+    sending. Reservations are handed out in order, so waiting callers never
+    overtake each other. pause() empties the bucket until a given time, which
+    is how a server's Retry-After is honoured by every caller for that host.
+
+    The bucket only does bookkeeping under a threading lock and never sleeps
+    itself, so it can be shared by several threads and event loops.
+    """
+
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self):
+        """
+        Takes one token and returns the number of seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # The bucket is in debt: wait until it has refilled back to zero.
+            return -self._tokens / self.rate + max(0.0, self._updated - now)
+
+    def pause(self, seconds):
+        """
+        Stops handing out tokens for the next `seconds` seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            resume_at = now + seconds
+            if resume_at > self._updated:
+                # Refilling restarts from the resume time with an empty bucket.
+                self._updated = resume_at
+                self._tokens = min(self._tokens, 0.0)
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures for one host. It trips after failure_threshold
+    of them, holding requests back for a cooldown that grows with every trip,
+    and after max_trips trips without a success it stays open for good.
+    Any success closes it again.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, cooldown=BREAKER_COOLDOWN, max_trips=MAX_TRIPS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._trips = 0
+        self._open_until = 0.0
+
+    @property
+    def broken(self):
+        return self._trips > self.max_trips
+
+    def wait_time(self):
+        """
+        Returns how long a request must wait for the breaker to let it through.
+        Raises CircuitOpenError if the breaker is open for good.
+        """
+        with self._lock:
+            if self.broken:
+                raise CircuitOpenError("", "circuit breaker open: host keeps failing")
+            return max(0.0, self._open_until - time.monotonic())
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._trips = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._failures = 0
+                self._trips += 1
+                self._open_until = time.monotonic() + self.cooldown * self._trips
+
+
+_config_lock = threading.Lock()
+_buckets = {}
+_breakers = {}
+_requests_per_second = DEFAULT_REQUESTS_PER_SECOND
+_burst = DEFAULT_BURST
+_in_flight = threading.BoundedSemaphore(DEFAULT_MAX_IN_FLIGHT)
+_concurrency = DEFAULT_CONCURRENCY
+# Set by stop(): no request starts any more, in any thread.
+_stopped = threading.Event()
+
+
+def configure(requests_per_second=DEFAULT_REQUESTS_PER_SECOND, burst=DEFAULT_BURST,
+              max_in_flight=DEFAULT_MAX_IN_FLIGHT, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Sets the process-wide fetch limits. Call this before any scraper starts requesting.
+      - requests_per_second: token refill rate for each host.
+      - burst: how many requests a host may receive back to back.
+      - max_in_flight: how many requests may be open at once across all hosts.
+      - concurrency: default number of pending fetches per fetch_all() call.
+    """
+    global _requests_per_second, _burst, _in_flight, _concurrency
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    # Validate the rate before touching any state.
+    TokenBucket(requests_per_second, burst)
+    with _config_lock:
+        _requests_per_second = requests_per_second
+        _burst = burst
+        _in_flight = threading.BoundedSemaphore(max_in_flight)
+        _concurrency = concurrency
+        _buckets.clear()
+        _breakers.clear()
+    _stopped.clear()
+
+
+def stop():
+    """
+    Stops every fetch in the process, e.g. on Ctrl-C: requests waiting for
+    their turn or for a retry, and every later one, raise FetchStopped
+    instead of being sent. Requests already sent finish. configure() lets
+    requests through again.
+    """
+    _stopped.set()
+
+
+def _stop_requested(stop_event=None):
+    return _stopped.is_set() or (stop_event is not None and stop_event.is_set())
+
+
+def _check_stopped(url, stop_event=None):
+    if _stop_requested(stop_event):
+        raise FetchStopped(url, "fetching was stopped")
+
+
+def _sleep(seconds, stop_event=None):
+    # time.sleep that wakes up early once the fetches are stopped.
+    deadline = time.monotonic() + seconds
+    while not _stop_requested(stop_event):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        _stopped.wait(min(remaining, STOP_CHECK_INTERVAL))
+
+
+async def _sleep_async(seconds, stop_event=None):
+    # asyncio.sleep that wakes up early once the fetches are stopped.
+    deadline = time.monotonic() + seconds
+    while not _stop_requested(stop_event):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(remaining, STOP_CHECK_INTERVAL))
+
+
+def bucket_for(url):
+    """
+    Returns the token bucket for the host of the given URL, creating it on first use.
+    """
+    host = urlsplit(url).netloc.lower()
+    with _config_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(_requests_per_second, _burst)
+        return bucket
+
+
+def breaker_for(url):
+    """
+    Returns the circuit breaker for the host of the given URL, creating it on first use.
+    """
+    host = urlsplit(url).netloc.lower()
+    with _config_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(FAILURE_THRESHOLD, BREAKER_COOLDOWN, MAX_TRIPS)
+        return breaker
+
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header, given either in seconds or as an HTTP date.
+    Returns the delay in seconds (capped at MAX_RETRY_AFTER), or None if the
+    header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = retry_at.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def _downloaded_bytes(response):
+    """
+    Returns the bytes read off the wire for a response (compressed, if it
+    was), or the size of its decoded body when that is not known.
+    """
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError):
+        return len(response.content)
+
+
+def _send(url, headers):
+    """
+    Sends one GET request over the shared session. Runs in a worker thread;
+    the semaphore bounds requests across all threads.
+
+    When the HTTP cache holds the URL, the request is made conditional and a
+    304 Not Modified answer is turned into a 200 response with the cached body.
+    """
+    cache = uesp_cache.get_cache()
+    cached = cache.lookup(url) if cache is not None else None
+    if cached is not None:
+        # Extra headers are merged over the shared session's defaults.
+        headers = {**(headers or {}), **cache.validators(cached)}
+    with _in_flight:
+        start_time = time.perf_counter()
+        try:
+            response = uesp_session.get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            uesp_metrics.get_metrics().record_request(time.perf_counter() - start_time, 0, error=True)
+            raise
+    uesp_metrics.get_metrics().record_request(time.perf_counter() - start_time, _downloaded_bytes(response),
+                                              error=response.status_code >= 400)
+    if cache is not None:
+        if response.status_code == 304 and cached is not None:
+            return cache.revalidated(url, cached, response)
+        if response.status_code == 200:
+            cache.store(url, response)
+    return response
+
+
+def _wait_before_attempt(url, bucket, breaker):
+    """
+    Returns how long to wait before the next attempt at url: until the host's
+    breaker lets requests through and a rate-limit token is available.
+    """
+    try:
+        wait = breaker.wait_time()
+    except CircuitOpenError as exc:
+        raise CircuitOpenError(url, exc.reason) from None
+    return wait + bucket.reserve()
+
+
+def _check_outcome(url, attempt, bucket, breaker, response, error):
+    """
+    Applies the retry policy to one attempt. Returns None if the response is
+    good, or the number of seconds to back off before retrying. Raises
+    FetchError once the URL has failed for good.
+    """
+    status = response.status_code if response is not None else None
+    if error is None and status < 400:
+        breaker.record_success()
+        return None
+
+    if error is not None:
+        retryable = isinstance(error, (requests.ConnectionError, requests.Timeout))
+        reason = f"{type(error).__name__}: {error}"
+    else:
+        retryable = status in RETRY_STATUSES
+        reason = f"HTTP {status}"
+    if not retryable:
+        # The host answered; only this URL is bad.
+        breaker.record_success()
+        raise FetchError(url, reason, status, attempt)
+
+    breaker.record_failure()
+    if attempt >= MAX_ATTEMPTS:
+        raise FetchError(url, f"gave up after {attempt} attempts: {reason}", status, attempt)
+    backoff = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)))
+    retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+    if retry_after is not None:
+        # Every request to this host waits, not only this one.
+        bucket.pause(retry_after)
+        return max(backoff, retry_after)
+    return backoff
+
+
+def get(url, headers=None):
+    """
+    Performs a rate-limited GET request with retries, blocking the calling thread.
+    Raises FetchError if the URL cannot be fetched, and FetchStopped once stop() was called.
+    """
+    bucket = bucket_for(url)
+    breaker = breaker_for(url)
+    attempt = 0
+    while True:
+        _check_stopped(url)
+        delay = _wait_before_attempt(url, bucket, breaker)
+        if delay > 0:
+            _sleep(delay)
+            _check_stopped(url)
+        attempt += 1
+        response, error = None, None
+        try:
+            response = _send(url, headers)
+        except requests.RequestException as exc:
+            error = exc
+        backoff = _check_outcome(url, attempt, bucket, breaker, response, error)
+        if backoff is None:
+            return response
+        _sleep(backoff)
+
+
+async def get_async(url, headers=None, stop_event=None):
+    """
+    Performs a rate-limited GET request with retries without blocking the event loop.
+    Raises FetchError if the URL cannot be fetched, and FetchStopped once
+    stop() was called or stop_event (a threading.Event) is set.
+    """
+    bucket = bucket_for(url)
+    breaker = breaker_for(url)
+    attempt = 0
+    while True:
+        _check_stopped(url, stop_event)
+        delay = _wait_before_attempt(url, bucket, breaker)
+        if delay > 0:
+            await _sleep_async(delay, stop_event)
+            _check_stopped(url, stop_event)
+        attempt += 1
+        response, error = None, None
+        try:
+            response = await asyncio.to_thread(_send, url, headers)
+        except requests.RequestException as exc:
+            error = exc
+        backoff = _check_outcome(url, attempt, bucket, breaker, response, error)
+        if backoff is None:
+            return response
+        await _sleep_async(backoff, stop_event)
+
+
+def describe_failure(url, error):
+    """
+    Returns a dead-letter entry for a URL that failed for good.
+    """
+    return {
+        "url": url,
+        "error": getattr(error, "reason", None) or f"{type(error).__name__}: {error}",
+        "status": getattr(error, "status", None),
+        "attempts": getattr(error, "attempts", 1),
+    }
+
+
+async def fetch_all_async(urls, handler=None, concurrency=None, headers=None, failures=None, stop_event=None):
+    """
+    Fetches every URL with at most `concurrency` requests pending at once
+    (the configured default if not given).
+
+    If `handler` is given it is called as handler(index, response) as soon as
+    each response arrives, and its return values are collected instead of the
+    responses, so page bodies do not pile up in memory. Results are returned
+    in the same order as `urls`.
+
+    If a `failures` list is given, a URL that fails for good (or whose handler
+    raises) does not stop the others: a describe_failure() entry is appended
+    to the list and None is returned in its place. Otherwise the first
+    failure is raised.
+
+    Once stop() is called or stop_event (a threading.Event) is set, no new
+    request starts and FetchStopped is raised; the handler may raise it too
+    to end the call.
+    """
+    semaphore = asyncio.Semaphore(concurrency or _concurrency)
+
+    async def fetch_one(index, url):
+        try:
+            async with semaphore:
+                response = await get_async(url, headers, stop_event)
+            if handler is not None:
+                return handler(index, response)
+            return response
+        except Exception as exc:
+            if failures is None or isinstance(exc, FetchStopped):
+                raise
+            failures.append(describe_failure(url, exc))
+            return None
+
+    return await asyncio.gather(*(fetch_one(i, url) for i, url in enumerate(urls)))
+
+
+def fetch_all(urls, handler=None, concurrency=None, headers=None, failures=None, stop_event=None):
+    """
+    Synchronous entry point for fetch_all_async(); see there for details.
+    Each call runs its own event loop, so several scrapers may call it from
+    different threads at the same time while sharing the per-host limits.
+    """
+    return asyncio.run(fetch_all_async(urls, handler, concurrency, headers, failures, stop_event))
@@ -0,0 +1,172 @@
+import os
+from urllib.parse import parse_qs, urlsplit
+
+from openpyxl import load_workbook
+
+import uesp_item
+import uesp_records
+
+
+def load_results(filename):
+    """
+    Reads a records file (.jsonl) or a results workbook written by
+    export_to_excel and returns its rows as a list of uesp_item.Item.
+    Returns an empty list if the file is None or does not exist.
+    """
+    if filename is None or not os.path.exists(filename):
+        return []
+    if filename.endswith(".jsonl"):
+        return [uesp_item.Item.from_row(record) for record in uesp_records.iter_records(filename)]
+    wb = load_workbook(filename, read_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return []
+        return [
+            uesp_item.Item.from_row({header: ("" if cell is None else str(cell)) for header, cell in zip(headers, row)})
+            for row in rows
+        ]
+    finally:
+        wb.close()
+
+
+def item_id_from_link(web_link):
+    """
+    Returns the itemid query parameter of an esoitem.uesp.net link, or "" if it has none.
+    """
+    return parse_qs(urlsplit(web_link).query).get("itemid", [""])[0]
+
+
+# Fields that only come from the detail page. A stored row with none of them
+# set was never filled in (its detail page failed to load).
+DETAIL_FIELDS = ("itemId", "icon", "description", "furnCategory")
+
+
+def missing_details(row):
+    return not any(row.get(field) for field in DETAIL_FIELDS)
+
+
+def list_entry_changed(link, row):
+    """
+    Returns True if the list-page entry no longer matches the stored row.
+    The stored name may come from the detail page, so it also counts as
+    unchanged when the list name is one of the stored allNames.
+    """
+    name = link["name"]
+    return name != row.get("name", "") and name not in row.get("allNames", "")
+
+
+# List-page columns that show a result field, by column header. Fast refreshes
+# (--fast) fetch the detail page of an entry whose cell no longer matches its
+# stored field, and never store the cell itself: the header and the cell text
+# are not checked against a saved real list page yet (see
+# benchmarks/record_list_pages.py), and a refreshed row is never fetched again.
+LIST_COLUMNS = {
+    "Description": "description",
+}
+
+
+def list_fields(link):
+    """
+    Returns the result fields a list-page entry shows (see LIST_COLUMNS), skipping empty cells.
+    """
+    columns = link.get("columns", {})
+    return {field: columns[header] for header, field in LIST_COLUMNS.items() if columns.get(header)}
+
+
+def list_fields_changed(link, row):
+    """
+    Returns True if a field the list-page entry shows differs from the stored row.
+    """
+    return any(row.get(field) != value for field, value in list_fields(link).items())
+
+
+def refreshed_row(link, row):
+    """
+    Returns the stored row with the name its list-page entry shows, or the
+    row itself when it is unchanged. A new list name (one that is not among
+    the stored allNames) replaces the stored name.
+    """
+    if list_entry_changed(link, row):
+        return uesp_item.Item.from_row({**row, "name": link["name"]})
+    return row
+
+
+class IncrementalPlan:
+    """
+    The difference between a fresh list page and the previously stored results.
+
+    Stored rows are matched to list entries by webLink first, then by itemId
+    (taken from the link) for entries whose link changed. A list entry needs
+    its detail page fetched when it is:
+      - added: it matches no stored row.
+      - updated: its name or link changed, or the stored row has no detail
+        fields (its detail page failed to load last time).
+    Stored rows that match no list entry are removed.
+
+    With refresh_from_list, a changed name does not make an entry updated:
+    its stored row takes the name from the list page instead. An entry whose
+    list fields (see LIST_COLUMNS) differ from its stored row is updated, so
+    the fields themselves always come from the detail page.
+    """
+
+    def __init__(self, links, previous_rows, refresh_from_list=False):
+        by_link = {}
+        by_item_id = {}
+        for row in previous_rows:
+            by_link.setdefault(row.get("webLink", ""), row)
+            if row.get("itemId"):
+                by_item_id.setdefault(row["itemId"], row)
+
+        self.links = links
+        self.kept = {}
+        self.previous = {}
+        self.to_fetch = []
+        self.added = 0
+        self.updated = 0
+        self.refreshed = 0
+        matched = set()
+        for link in links:
+            row = by_link.get(link["webLink"])
+            link_changed = False
+            if row is None:
+                row = by_item_id.get(item_id_from_link(link["webLink"]))
+                link_changed = row is not None
+            if row is None:
+                self.added += 1
+                self.to_fetch.append(link)
+                continue
+            matched.add(id(row))
+            if (link_changed or missing_details(row)
+                    or (list_fields_changed(link, row) if refresh_from_list else list_entry_changed(link, row))):
+                self.updated += 1
+                self.to_fetch.append(link)
+                self.previous[link["webLink"]] = row
+            elif refresh_from_list:
+                refreshed = refreshed_row(link, row)
+                self.refreshed += refreshed is not row
+                self.kept[link["webLink"]] = refreshed
+            else:
+                self.kept[link["webLink"]] = row
+        self.removed = sum(1 for row in previous_rows if id(row) not in matched)
+
+    def merge(self, fetched):
+        """
+        Combines the freshly fetched rows with the kept ones, in list-page order.
+        An updated entry whose detail page could not be fetched keeps its
+        previous row; an added one is left out.
+        """
+        fetched_by_link = {row["webLink"]: row for row in fetched}
+        merged = []
+        for link in self.links:
+            web_link = link["webLink"]
+            row = fetched_by_link.get(web_link) or self.kept.get(web_link) or self.previous.get(web_link)
+            if row is not None:
+                merged.append(row)
+        return merged
+
+    def summary(self):
+        refreshed = f"{self.refreshed} renamed from the list page, " if self.refreshed else ""
+        return (f"{self.added} added, {self.updated} updated, {self.removed} removed, "
+                f"{refreshed}{len(self.kept) - self.refreshed} unchanged.")
@@ -0,0 +1,152 @@
+"""
+The record of one scraped gallery item.
+
+An Item keeps its fields in __slots__ instead of a dictionary per row, with
+itemId and furnDataId as integers and the furnishing category interned (a
+few dozen values are shared by every item) and parsed on demand. This is
+what the scrapers build, what the results readers return and what the Lua
+converter writes from.
+
+Typed values are attributes (item.item_id, item.furn_data_id, ...). An Item
+also reads like the dictionaries it replaces: item["itemId"],
+item.get("furnDataId", "") and dict(item) give each of its fields as the string
+written to the records files, the workbooks and the catalog, so a row
+round-trips unchanged.
+"""
+import functools
+import re
+import sys
+from collections import namedtuple
+
+# Field names of the records files, in order: the common result columns,
+# then link, which only some categories fill in (see Category.extra_fields).
+FIELDS = ("itemId", "webLink", "name", "allNames", "description", "icon", "furnDataId", "furnCategory", "link")
+
+# "Library:Literature (4:62)": category, subcategory and their ids, each optional but the first.
+_FURN_CATEGORY_RE = re.compile(r"^(?P<category>[^:(]*?)(?::(?P<subcategory>[^(]*?))?"
+                               r"(?: \((?P<category_id>\d+)(?::(?P<subcategory_id>\d+))?\))?$")
+
+FurnCategory = namedtuple("FurnCategory", "category subcategory category_id subcategory_id")
+
+
+@functools.lru_cache(maxsize=None)
+def parse_furn_category(text):
+    """
+    Parses a furnishing category as shown in the raw data ("Library:Literature (4:62)")
+    into a FurnCategory. Missing parts are None; text that does not parse is
+    returned whole as the category.
+    """
+    match = _FURN_CATEGORY_RE.match(text)
+    if match is None:
+        return FurnCategory(text, None, None, None)
+    category_id, subcategory_id = match.group("category_id"), match.group("subcategory_id")
+    return FurnCategory(match.group("category"), match.group("subcategory"),
+                        int(category_id) if category_id else None,
+                        int(subcategory_id) if subcategory_id else None)
+
+
+def parse_id(value):
+    """
+    Returns an id as an int, None when empty, or the value itself when it is
+    not written as a plain number (so it is written back exactly as read).
+    """
+    if value is None or value == "":
+        return None
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and value.isascii() and value.isdigit() and (value == "0" or value[0] != "0"):
+        return int(value)
+    return value
+
+
+def _text(value):
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+class Item:
+    """
+    One gallery item; see the module docstring.
+    """
+
+    __slots__ = ("item_id", "web_link", "name", "all_names", "description", "icon",
+                 "furn_data_id", "furn_category", "link")
+
+    def __init__(self, item_id=None, web_link="", name="", all_names="", description="", icon="",
+                 furn_data_id=None, furn_category="", link=None):
+        self.item_id = parse_id(item_id)
+        self.web_link = _text(web_link)
+        self.name = _text(name)
+        self.all_names = _text(all_names)
+        self.description = _text(description)
+        self.icon = _text(icon)
+        self.furn_data_id = parse_id(furn_data_id)
+        self.furn_category = sys.intern(_text(furn_category) or "")
+        self.link = _text(link)
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Builds an Item from a results row (any mapping of field names, such
+        as a records line, a workbook row or a catalog row). Other keys are ignored.
+        """
+        get = row.get
+        return cls(get("itemId"), get("webLink", ""), get("name", ""), get("allNames", ""),
+                   get("description", ""), get("icon", ""), get("furnDataId"), get("furnCategory", ""),
+                   get("link"))
+
+    @property
+    def furn_category_parts(self):
+        return parse_furn_category(self.furn_category)
+
+    # Read-only mapping view, by field name, of the values as strings. An
+    # item without a link (see Category.extra_fields) has no "link" key.
+
+    def __getitem__(self, field):
+        try:
+            value = getattr(self, _ATTRIBUTES[field])
+        except KeyError:
+            raise KeyError(field) from None
+        if value is None:
+            if field == "link":
+                raise KeyError(field)
+            return ""
+        return value if isinstance(value, str) else str(value)
+
+    def get(self, field, default=None):
+        if field not in self:
+            return default
+        return self[field]
+
+    def keys(self):
+        return FIELDS if self.link is not None else FIELDS[:-1]
+
+    def __contains__(self, field):
+        return field in _ATTRIBUTES and (field != "link" or self.link is not None)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if not isinstance(other, Item):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in Item.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Item(item_id={self.item_id!r}, name={self.name!r}, web_link={self.web_link!r})"
+
+
+_ATTRIBUTES = dict(zip(FIELDS, Item.__slots__))
+
+
+def as_item(row):
+    """
+    Returns row as an Item, converting a dictionary row.
+    """
+    return row if isinstance(row, Item) else Item.from_row(row)
@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+import time
+
+import uesp_item
+
+# A checkpoint (flush + fsync) is written after this many records or seconds,
+# whichever comes first. A hard kill loses at most this much work.
+CHECKPOINT_EVERY = 25
+CHECKPOINT_SECONDS = 5.0
+
+
+class CheckpointJournal:
+    """
+    An append-only JSON Lines journal of the records scraped so far in a crawl.
+
+    Records are appended as they are scraped and checkpointed to disk
+    periodically. If the crawl dies, load() returns what was saved, keyed by
+    webLink, so the next run can skip those items. The journal is deleted
+    once the crawl's results have been exported.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending = 0
+        self._last_checkpoint = time.monotonic()
+
+    def load(self):
+        """
+        Returns the journaled records (uesp_item.Item) keyed by webLink. A
+        line cut short by a crash (the last one) is ignored.
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("webLink"):
+                    records[record["webLink"]] = uesp_item.Item.from_row(record)
+        return records
+
+    def open(self, resume=False):
+        """
+        Opens the journal for appending. Unless resuming, earlier records are discarded.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if resume and os.path.exists(self.path):
+            self._drop_partial_line()
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        self._last_checkpoint = time.monotonic()
+
+    def _drop_partial_line(self):
+        # A crash mid-write can leave the last line without its newline; cut it
+        # off so the next record starts on a line of its own.
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def append(self, record):
+        with self._lock:
+            self._file.write(json.dumps(dict(record), ensure_ascii=False) + "\n")
+            self._pending += 1
+            if (self._pending >= CHECKPOINT_EVERY
+                    or time.monotonic() - self._last_checkpoint >= CHECKPOINT_SECONDS):
+                self._checkpoint()
+
+    def _checkpoint(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_checkpoint = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._checkpoint()
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """
+        Closes and deletes the journal, once its records are safely exported.
+        """
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,286 @@
+"""
+Run metrics: what every stage of a scrape costs, per category.
+
+The fetch layer and the scrapers record into one process-wide RunMetrics:
+  - every request's latency and the bytes it downloaded;
+  - the time spent parsing detail pages and the items scraped;
+  - the queue depths of the fetch/parse pipeline;
+  - the wall time of each stage (list page, detail pages, export);
+  - the process's peak memory when a category finishes.
+Requests are attributed to the category set with category(), which follows
+the fetch layer's event loops and worker threads. main.py writes the totals
+to results/metrics/ after every run, and can print a live summary.
+"""
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is then reported as null.
+    resource = None
+
+DEFAULT_FOLDER = os.path.join("results", "metrics")
+
+# Upper bounds (milliseconds) of the latency histogram buckets; slower requests go in the last one.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Key of whatever is recorded outside a category (e.g. a scraper's helper run on its own).
+NO_CATEGORY = ""
+
+_category = contextvars.ContextVar("uesp_metrics_category", default=NO_CATEGORY)
+
+
+def peak_memory_mb():
+    """
+    Returns the peak resident memory of this process so far in MB, or None where it cannot be read.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def latency_summary(latencies):
+    """
+    Summarizes request latencies (seconds) in milliseconds: count, mean,
+    p50/p90/p99, max and a histogram keyed by bucket upper bound.
+    """
+    ordered = sorted(latencies)
+    histogram = {f"<={bound}ms": 0 for bound in LATENCY_BUCKETS_MS}
+    histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] = 0
+    for seconds in ordered:
+        ms = seconds * 1000
+        for bound in LATENCY_BUCKETS_MS:
+            if ms <= bound:
+                histogram[f"<={bound}ms"] += 1
+                break
+        else:
+            histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] += 1
+
+    def ms(value):
+        return round(value * 1000, 1) if value is not None else None
+
+    return {
+        "count": len(ordered),
+        "mean_ms": ms(sum(ordered) / len(ordered)) if ordered else None,
+        "p50_ms": ms(_percentile(ordered, 0.5)),
+        "p90_ms": ms(_percentile(ordered, 0.9)),
+        "p99_ms": ms(_percentile(ordered, 0.99)),
+        "max_ms": ms(ordered[-1]) if ordered else None,
+        "histogram": histogram,
+    }
+
+
+class _CategoryMetrics:
+    def __init__(self):
+        self.latencies = []
+        self.bytes = 0
+        self.errors = 0
+        self.parse_seconds = 0.0
+        self.parsed = 0
+        self.items = None
+        self.stages = {}
+        self.pipeline = None
+        self.peak_memory_mb = None
+
+
+class RunMetrics:
+    """
+    Thread-safe counters for one run. Categories are created on first use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self._categories = {}
+        self._stages = {}
+
+    def _get(self, key):
+        metrics = self._categories.get(key)
+        if metrics is None:
+            metrics = self._categories[key] = _CategoryMetrics()
+        return metrics
+
+    def record_request(self, seconds, size, error=False):
+        with self._lock:
+            metrics = self._get(_category.get())
+            metrics.latencies.append(seconds)
+            metrics.bytes += size
+            metrics.errors += error
+
+    def record_parse(self, seconds):
+        with self._lock:
+            metrics = self._get(_category.get())
+            metrics.parse_seconds += seconds
+            metrics.parsed += 1
+
+    def record_pipeline(self, queue_stats):
+        """
+        Records the queue depths of the current category's fetch/parse pipeline (see uesp_pipeline).
+        """
+        with self._lock:
+            self._get(_category.get()).pipeline = queue_stats
+
+    def record_stage(self, name, seconds):
+        """
+        Records a stage's wall time for the current category, or for the run
+        as a whole outside of a category.
+        """
+        key = _category.get()
+        with self._lock:
+            if key == NO_CATEGORY:
+                self._stages[name] = self._stages.get(name, 0.0) + seconds
+            else:
+                stages = self._get(key).stages
+                stages[name] = stages.get(name, 0.0) + seconds
+
+    def finish_category(self, items):
+        """
+        Records the current category's item count and the process's peak memory so far.
+        """
+        with self._lock:
+            metrics = self._get(_category.get())
+            metrics.items = items
+            metrics.peak_memory_mb = peak_memory_mb()
+
+    def live_line(self):
+        """
+        Returns a one-line summary of the run so far.
+        """
+        with self._lock:
+            latencies = [seconds for metrics in self._categories.values() for seconds in metrics.latencies]
+            downloaded = sum(metrics.bytes for metrics in self._categories.values())
+            parsed = sum(metrics.parsed for metrics in self._categories.values())
+        p50 = _percentile(sorted(latencies), 0.5)
+        elapsed = time.time() - self.started_at
+        return (f"[metrics] {elapsed:.0f}s: {len(latencies)} requests, {downloaded / (1024 * 1024):.1f} MB, "
+                f"p50 {p50 * 1000 if p50 is not None else 0:.0f} ms, {parsed} pages parsed "
+                f"({parsed / elapsed if elapsed else 0:.1f}/s), peak memory {peak_memory_mb()} MB")
+
+    def report(self):
+        """
+        Returns the run's metrics as a JSON-serializable dictionary.
+        """
+        finished_at = time.time()
+        with self._lock:
+            categories = {}
+            all_latencies = []
+            for key, metrics in self._categories.items():
+                all_latencies.extend(metrics.latencies)
+                busy = sum(metrics.stages.values())
+                items = metrics.items if metrics.items is not None else metrics.parsed
+                categories[key or "(none)"] = {
+                    "items": items,
+                    "items_per_second": round(items / busy, 2) if busy else None,
+                    "requests": len(metrics.latencies),
+                    "request_errors": metrics.errors,
+                    "bytes_downloaded": metrics.bytes,
+                    "latency": latency_summary(metrics.latencies),
+                    "parse_seconds": round(metrics.parse_seconds, 3),
+                    "pages_parsed": metrics.parsed,
+                    "stages": {name: round(seconds, 3) for name, seconds in metrics.stages.items()},
+                    "pipeline": metrics.pipeline,
+                    "peak_memory_mb": metrics.peak_memory_mb,
+                }
+            stages = {name: round(seconds, 3) for name, seconds in self._stages.items()}
+        return {
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(timespec="seconds"),
+            "seconds": round(finished_at - self.started_at, 3),
+            "requests": len(all_latencies),
+            "bytes_downloaded": sum(category["bytes_downloaded"] for category in categories.values()),
+            "latency": latency_summary(all_latencies),
+            "peak_memory_mb": peak_memory_mb(),
+            "stages": stages,
+            "categories": categories,
+        }
+
+    def write(self, folder=DEFAULT_FOLDER, extra=None):
+        """
+        Writes report() (with any extra keys) to a new file named after the run's start time. Returns its path.
+        """
+        report = self.report()
+        report.update(extra or {})
+        os.makedirs(folder, exist_ok=True)
+        stamp = datetime.fromtimestamp(self.started_at, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = os.path.join(folder, f"run_{stamp}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return path
+
+
+_metrics = RunMetrics()
+
+
+def get_metrics():
+    return _metrics
+
+
+def reset():
+    """
+    Starts a new run: drops everything recorded so far and returns the new RunMetrics.
+    """
+    global _metrics
+    _metrics = RunMetrics()
+    return _metrics
+
+
+@contextlib.contextmanager
+def category(key):
+    """
+    Attributes everything recorded in this block (and in the tasks and threads it starts) to a category.
+    """
+    token = _category.set(key)
+    try:
+        yield
+    finally:
+        _category.reset(token)
+
+
+@contextlib.contextmanager
+def stage(name):
+    """
+    Times the block as a stage of the current category, or of the run outside a category.
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        _metrics.record_stage(name, time.perf_counter() - start_time)
+
+
+class LiveSummary:
+    """
+    Prints RunMetrics.live_line() every `interval` seconds from a background
+    thread, until stopped. Use as a context manager.
+    """
+
+    def __init__(self, interval=10.0):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="live-metrics", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            print(f"\n{_metrics.live_line()}", flush=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
@@ -0,0 +1,219 @@
+"""
+A staged fetch -> parse -> consume pipeline for detail pages.
+
+  fetch:   uesp_fetch.fetch_all downloads the pages and puts their bodies on a
+           bounded queue. When the queue is full the fetch event loop waits,
+           so no new requests start until the parsers catch up.
+  parse:   a dispatcher hands the bodies to a pool of parser processes (or to
+           a parser thread with no workers configured), with at most
+           `workers + queue_size` pages being parsed or waiting to be consumed.
+  consume: the calling thread receives every parsed page, in the order the
+           parsers finish, and builds the records from it.
+
+Memory stays bounded by the two limits whatever the number of pages. The
+process pool is shared by every scraper in the process; configure() sets its
+size and the queue size, and close() shuts it down.
+"""
+import concurrent.futures
+import contextvars
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import uesp_fetch
+import uesp_metrics
+import uesp_rawdata
+
+# Parser processes started for the pipeline. With none, pages are parsed on a
+# thread of the scraping process instead.
+DEFAULT_WORKERS = max(0, min(4, (os.cpu_count() or 1) - 1))
+# Downloaded pages allowed to wait for a parser.
+DEFAULT_QUEUE_SIZE = 32
+
+_DONE = object()
+
+_lock = threading.Lock()
+_executor = None
+_workers = DEFAULT_WORKERS
+_queue_size = DEFAULT_QUEUE_SIZE
+
+
+def configure(workers=DEFAULT_WORKERS, queue_size=DEFAULT_QUEUE_SIZE):
+    """
+    Sets the number of parser processes and the size of the page queue.
+    Shuts the current pool down; the next pipeline starts a new one.
+    """
+    global _workers, _queue_size
+    if workers < 0:
+        raise ValueError("workers must be 0 or more")
+    if queue_size < 1:
+        raise ValueError("queue_size must be at least 1")
+    with _lock:
+        _workers = workers
+        _queue_size = queue_size
+    close()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            if _workers:
+                # spawn behaves the same on every platform and does not copy
+                # the scraper threads' state into the workers.
+                _executor = concurrent.futures.ProcessPoolExecutor(
+                    _workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                _executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="parser")
+        return _executor
+
+
+def close():
+    """
+    Shuts the shared parser pool down.
+    """
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def _parse(content, backend):
+    """
+    Runs in a parser worker: returns the page's raw data and the seconds it took to parse.
+    """
+    start_time = time.perf_counter()
+    raw_data = uesp_rawdata.extract_raw_item_data(content, backend)
+    return raw_data, time.perf_counter() - start_time
+
+
+class QueueStats:
+    """
+    Depths of the pipeline's queues, sampled every time a page moves on:
+      - fetched: pages downloaded and waiting for a parser.
+      - parsing: pages handed to the parsers and not yet consumed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = 0
+        self.max = {"fetched": 0, "parsing": 0}
+        self._total = {"fetched": 0, "parsing": 0}
+        self.fetch_waits = 0
+
+    def sample(self, fetched, parsing):
+        with self._lock:
+            self.samples += 1
+            for name, depth in (("fetched", fetched), ("parsing", parsing)):
+                self.max[name] = max(self.max[name], depth)
+                self._total[name] += depth
+
+    def summary(self):
+        with self._lock:
+            return {
+                "max_fetched": self.max["fetched"],
+                "max_parsing": self.max["parsing"],
+                "mean_fetched": round(self._total["fetched"] / self.samples, 2) if self.samples else 0,
+                "mean_parsing": round(self._total["parsing"] / self.samples, 2) if self.samples else 0,
+                # Times the fetch stage had to wait for the parsers (backpressure).
+                "fetch_waits": self.fetch_waits,
+            }
+
+
+def run(urls, consume, failures, backend=None):
+    """
+    Fetches and parses the raw data of every URL, and calls
+    consume(index, raw_data) on the calling thread for each page, where index
+    is the URL's position in urls. A page that cannot be fetched or parsed,
+    or that consume() rejects by raising, is appended to failures as a
+    uesp_fetch.describe_failure entry.
+
+    Returns consume's results in the order of urls (None for the failed
+    ones) and the QueueStats of the run, which are also recorded in the run
+    metrics with the parse times.
+    """
+    backend = backend or uesp_rawdata.DEFAULT_BACKEND
+    with _lock:
+        queue_size = _queue_size
+        limit = max(1, _workers) + _queue_size
+    executor = _get_executor()
+    fetched = queue.Queue(maxsize=queue_size)
+    parsed = queue.Queue()
+    # Bounds the pages between the fetched queue and consume().
+    slots = threading.BoundedSemaphore(limit)
+    stop = threading.Event()
+    stats = QueueStats()
+    counts = {"submitted": 0, "consumed": 0}
+    fetch_error = []
+
+    def enqueue(index, response):
+        if stop.is_set():
+            raise uesp_fetch.FetchStopped(urls[index], "pipeline stopped")
+        if fetched.full():
+            stats.fetch_waits += 1
+        # Blocking here holds the fetch event loop until a parser is free.
+        fetched.put((index, response.content))
+        stats.sample(fetched.qsize(), counts["submitted"] - counts["consumed"])
+
+    def fetch_stage():
+        try:
+            # Once stopped, no new request starts and the downloads in flight are dropped.
+            uesp_fetch.fetch_all(urls, enqueue, failures=failures, stop_event=stop)
+        except BaseException as exc:
+            fetch_error.append(exc)
+        finally:
+            fetched.put(_DONE)
+
+    def parse_stage():
+        # Runs until the fetch stage is done, even once stopped, so it never stays blocked on a full queue.
+        while True:
+            entry = fetched.get()
+            if entry is _DONE:
+                break
+            while not stop.is_set() and not slots.acquire(timeout=0.1):
+                pass
+            if stop.is_set():
+                continue
+            index, content = entry
+            counts["submitted"] += 1
+            future = executor.submit(_parse, content, backend)
+            future.add_done_callback(lambda future, index=index: parsed.put((index, future)))
+        parsed.put(_DONE)
+
+    # The stages run in the caller's context, so the requests they make are
+    # recorded for the caller's category (see uesp_metrics.category).
+    fetcher = threading.Thread(target=contextvars.copy_context().run, args=(fetch_stage,),
+                               name="pipeline-fetch", daemon=True)
+    dispatcher = threading.Thread(target=contextvars.copy_context().run, args=(parse_stage,),
+                                  name="pipeline-parse", daemon=True)
+    fetcher.start()
+    dispatcher.start()
+
+    results = [None] * len(urls)
+    try:
+        dispatched = False
+        while not dispatched or counts["consumed"] < counts["submitted"]:
+            entry = parsed.get()
+            if entry is _DONE:
+                dispatched = True
+                continue
+            index, future = entry
+            counts["consumed"] += 1
+            slots.release()
+            try:
+                raw_data, seconds = future.result()
+                uesp_metrics.get_metrics().record_parse(seconds)
+                results[index] = consume(index, raw_data)
+            except Exception as exc:
+                failures.append(uesp_fetch.describe_failure(urls[index], exc))
+    finally:
+        stop.set()
+        fetcher.join()
+        dispatcher.join()
+    if fetch_error:
+        raise fetch_error[0]
+    uesp_metrics.get_metrics().record_pipeline(stats.summary())
+    return results, stats
@@ -0,0 +1,199 @@
+import codecs
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; the html.parser backend always works.
+    etree = None
+
+RAW_DATA_DIV_ID = "esoil_rawdata"
+RAW_DATA_TABLE_ID = "esoil_rawdatatable"
+
+# Pages are fed to the parsers in chunks of this many bytes, so parsing can
+# stop as soon as the raw-data table has been read.
+CHUNK_SIZE = 16 * 1024
+
+# Text inside these tags is left out, as BeautifulSoup's get_text() does.
+SKIPPED_TEXT_TAGS = ("script", "style", "template")
+
+BACKENDS = ("html.parser", "lxml")
+# The standard-library parser is the default: after seeking to the raw-data
+# div there is so little left to parse that it beats lxml's setup cost.
+DEFAULT_BACKEND = "html.parser"
+
+
+class _TableFinished(Exception):
+    """Raised inside the parser to stop it once the raw-data table is closed."""
+
+
+class _RawDataParser(HTMLParser):
+    """
+    Collects the rows of <div id="esoil_rawdata"> <table id="esoil_rawdatatable">
+    and raises _TableFinished at the table's closing tag.
+
+    Cell text matches BeautifulSoup's get_text(separator=" ", strip=True):
+    every run of text between two tags is stripped, and the non-empty runs
+    are joined with a single space. Like BeautifulSoup's html.parser tree, a
+    <td> opened before the previous one is closed is nested inside it, so its
+    text counts towards both cells.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.raw_data = {}
+        self._div_depth = 0       # open <div> tags inside the raw-data div, itself included
+        self._table_depth = 0     # open <table> tags inside the raw-data table, itself included
+        self._cells = None        # cells of the current <tr>, as lists of text runs
+        self._open_cells = []     # cells of the current row whose <td> is still open
+        self._skip_depth = 0      # open <script>/<style> tags inside the table
+        self._text = []           # text runs seen since the last tag
+
+    def _flush_text(self):
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text = []
+            if text:
+                for cell in self._open_cells:
+                    cell.append(text)
+
+    def _finish_row(self):
+        if self._cells is not None and len(self._cells) >= 2:
+            self.raw_data[" ".join(self._cells[0])] = " ".join(self._cells[1])
+        self._cells = None
+        self._open_cells = []
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if not self._div_depth:
+            if tag == "div" and dict(attrs).get("id") == RAW_DATA_DIV_ID:
+                self._div_depth = 1
+            return
+        if tag == "div":
+            self._div_depth += 1
+        if not self._table_depth:
+            if tag == "table" and dict(attrs).get("id") == RAW_DATA_TABLE_ID:
+                self._table_depth = 1
+            return
+        if tag in SKIPPED_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "table":
+            self._table_depth += 1
+        elif tag == "tr":
+            self._finish_row()
+            self._cells = []
+        elif tag == "td" and self._cells is not None:
+            cell = []
+            self._cells.append(cell)
+            self._open_cells.append(cell)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if not self._div_depth:
+            return
+        if self._table_depth:
+            if tag in SKIPPED_TEXT_TAGS and self._skip_depth:
+                self._skip_depth -= 1
+            elif tag == "td" and self._open_cells:
+                self._open_cells.pop()
+            elif tag == "tr":
+                self._finish_row()
+            elif tag == "table":
+                self._table_depth -= 1
+                if not self._table_depth:
+                    self._finish_row()
+                    raise _TableFinished()
+            return
+        if tag == "div":
+            self._div_depth -= 1
+            if not self._div_depth:
+                # The raw-data div closed without the table: nothing to find.
+                raise _TableFinished()
+
+    def handle_data(self, data):
+        if self._table_depth and not self._skip_depth:
+            self._text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+
+def _iter_chunks(content, start):
+    for offset in range(start, len(content), CHUNK_SIZE):
+        yield content[offset:offset + CHUNK_SIZE]
+
+
+def _extract_html_parser(content, start):
+    parser = _RawDataParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        for chunk in _iter_chunks(content, start):
+            parser.feed(decoder.decode(chunk))
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+    except _TableFinished:
+        pass
+    return parser.raw_data
+
+
+def _element_text(element):
+    texts = []
+    # text() nodes leave out comments; the text inside <script>/<style> is dropped here.
+    for text in element.xpath(".//text()"):
+        if text.is_text and text.getparent().tag in SKIPPED_TEXT_TAGS:
+            continue
+        text = text.strip()
+        if text:
+            texts.append(text)
+    return " ".join(texts)
+
+
+def _extract_lxml(content, start):
+    parser = etree.HTMLPullParser(events=("end",), tag="table", encoding="utf-8")
+    for chunk in _iter_chunks(content, start):
+        parser.feed(chunk)
+        for _, table in parser.read_events():
+            if table.get("id") != RAW_DATA_TABLE_ID:
+                continue
+            div = next((a for a in table.iterancestors("div") if a.get("id") == RAW_DATA_DIV_ID), None)
+            if div is None:
+                continue
+            raw_data = {}
+            for row in table.iter("tr"):
+                cells = list(row.iter("td"))
+                if len(cells) >= 2:
+                    raw_data[_element_text(cells[0])] = _element_text(cells[1])
+            return raw_data
+    return {}
+
+
+def extract_raw_item_data(content, backend=None):
+    """
+    Returns the same dictionary as get_raw_item_data(BeautifulSoup(content, "html.parser")),
+    without building a tree of the whole page.
+
+    The page is scanned for the raw-data div and parsed from just before it,
+    in chunks, stopping as soon as the raw-data table is closed. If the div
+    cannot be found that way, the whole page is parsed as a fallback.
+
+    backend is "html.parser" or "lxml" and defaults to DEFAULT_BACKEND. The
+    lxml backend needs the optional lxml package, and it repairs unclosed
+    <td> tags the way browsers do instead of nesting them, so it can differ
+    from BeautifulSoup on such broken markup.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown raw data backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    if backend == "lxml" and etree is None:
+        raise ImportError("The lxml backend needs the lxml package (pip install lxml).")
+    extract = _extract_lxml if backend == "lxml" else _extract_html_parser
+
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    marker = content.find(RAW_DATA_DIV_ID.encode("ascii"))
+    if marker < 0:
+        return {}
+    start = content.rfind(b"<", 0, marker)
+    raw_data = extract(content, max(start, 0))
+    if not raw_data and start > 0:
+        raw_data = extract(content, 0)
+    return raw_data
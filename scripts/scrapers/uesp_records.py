@@ -0,0 +1,53 @@
+import contextlib
+import json
+import os
+import threading
+
+
+@contextlib.contextmanager
+def open_atomic(filename, mode="w", encoding="utf-8", buffering=-1):
+    """
+    Opens a temporary file next to filename for writing (text or binary, per
+    mode) and yields it. When the block completes, the file is flushed to disk
+    and moved over filename, so readers see the old file or the new one but
+    never a partial one. If the block fails or is interrupted, the temporary
+    file is removed and filename is left as it was.
+    """
+    tmp_path = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode, buffering=buffering, encoding=None if "b" in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filename)
+    except BaseException:
+        # Also on Ctrl-C: drop the partial file and keep the old one.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_records(records, filename, fields):
+    """
+    Writes the records to a JSON Lines file, one object per line with the
+    given fields in order, and returns the number of records written.
+    The file is replaced only once complete (see open_atomic).
+    """
+    count = 0
+    with open_atomic(filename) as f:
+        for record in records:
+            f.write(json.dumps({field: record.get(field, "") for field in fields}, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def iter_records(filename):
+    """
+    Streams the records of a JSON Lines file written by write_records.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
@@ -0,0 +1,466 @@
+import argparse
+import concurrent.futures
+import json
+import os
+import threading
+import uesp_catalog
+import uesp_fetch
+import uesp_incremental
+import uesp_item
+import uesp_journal
+import uesp_metrics
+import uesp_pipeline
+import uesp_rawdata
+import uesp_records
+import uesp_wikiapi
+from bs4 import BeautifulSoup
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+# BASE_URL is used only to load the list pages.
+BASE_URL = "https://en.uesp.net"
+
+RESULTS_FOLDER = "results"
+
+# Share of a category's detail pages that may fail before the crawl counts as
+# failed as a whole (e.g. UESP is down): its stored results are then left as
+# they are instead of being rewritten without the failed items.
+MAX_FAILED_SHARE = 0.5
+
+# Columns of every results workbook, in order. Categories may add extra_fields after them.
+RESULT_FIELDS = ["itemId", "webLink", "name", "allNames", "description", "icon", "furnDataId", "furnCategory"]
+
+# Preset column widths for readability.
+COLUMN_WIDTHS = {
+    "itemId": 15,
+    "webLink": 50,
+    "name": 30,
+    "allNames": 50,
+    "description": 70,
+    "icon": 30,
+    "furnDataId": 20,
+    "furnCategory": 20,
+    "link": 40
+}
+
+# Raw data of the detail pages scraped in this run, by URL, shared by every
+# category scraped in the process. A page linked more than once, from one
+# list page or several, is only fetched once: the first category to claim its
+# URL fetches it, and the others wait for its raw data (a Future) instead of
+# fetching it too, even when the categories are scraped at the same time.
+_seen_details = {}
+_seen_lock = threading.Lock()
+
+
+def claim_detail(url):
+    """
+    Returns the Future of the URL's raw data and whether this call claimed it.
+    The caller that claims a URL must fetch it and settle the Future, with
+    remember_detail or release_details; other callers wait for its result.
+    """
+    with _seen_lock:
+        future = _seen_details.get(url)
+        if future is not None:
+            return future, False
+        future = _seen_details[url] = concurrent.futures.Future()
+        return future, True
+
+
+def remember_detail(url, raw_data):
+    with _seen_lock:
+        future = _seen_details.get(url)
+        if future is None:
+            future = _seen_details[url] = concurrent.futures.Future()
+        if not future.done():
+            future.set_result(raw_data)
+
+
+def release_details(urls):
+    """
+    Gives up the claims on the URLs that were not remembered, e.g. because
+    they failed: their waiters get None and the next category to see them
+    claims them again.
+    """
+    with _seen_lock:
+        for url in urls:
+            future = _seen_details.get(url)
+            if future is not None and not future.done():
+                del _seen_details[url]
+                future.set_result(None)
+
+
+def forget_seen_details():
+    """
+    Clears the detail pages remembered so far, so the next run fetches them again.
+    """
+    with _seen_lock:
+        _seen_details.clear()
+
+
+def result_fields(category):
+    return RESULT_FIELDS + list(category.extra_fields)
+
+
+def results_path(category):
+    return os.path.join(RESULTS_FOLDER, category.results_file)
+
+
+def records_path(category):
+    return os.path.join(RESULTS_FOLDER, category.records_file)
+
+
+def latest_results_path(category):
+    """
+    Returns the category's records file, which is authoritative, or its
+    results workbook if there is no records file yet, or None if neither exists.
+    """
+    for path in (records_path(category), results_path(category)):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def journal_path(category):
+    return os.path.join(RESULTS_FOLDER, f"{category.key}_journal.jsonl")
+
+
+def failures_path(category):
+    return os.path.join(RESULTS_FOLDER, f"{category.key}_failed.json")
+
+
+def write_failures(category, failures):
+    """
+    Writes the dead-letter list of detail pages that failed for good next to
+    the results, sorted by URL. Removes a stale list when nothing failed.
+    """
+    path = failures_path(category)
+    if not failures:
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+    with uesp_records.open_atomic(path) as f:
+        json.dump(sorted(failures, key=lambda failure: failure["url"]), f, indent=2)
+    return path
+
+
+def get_item_links(category):
+    """
+    Loads the category's UESP list page and returns a list of dictionaries.
+    Each dictionary contains:
+      - name: the item's displayed name from the table.
+      - webLink: the URL obtained from the item's name link.
+      - columns: the text of every cell of the item's row, by column header.
+
+    Processing rules for href:
+      - If it starts with "//", prepend "https:".
+      - If it starts with "http", leave it unchanged.
+      - Otherwise, leave it unchanged.
+    """
+    url = BASE_URL + category.list_path
+    response = uesp_fetch.get(url)
+    soup = BeautifulSoup(response.content, "html.parser")
+
+    item_links = []
+    table = soup.find("table", class_="wikitable")
+    if table:
+        rows = table.find_all("tr")
+        headers = [th.get_text(" ", strip=True) for th in rows[0].find_all("th")] if rows else []
+        # Skip the header row.
+        for row in rows[1:]:
+            cells = row.find_all("td")
+            if not cells:
+                continue
+            # Assume the item name (with its link) is in the second cell.
+            if len(cells) > 1:
+                a_tag = cells[1].find("a")
+            else:
+                a_tag = cells[0].find("a")
+            if a_tag and a_tag.has_attr("href"):
+                href = a_tag["href"]
+                # Process href without appending any BASE_URL.
+                if href.startswith("//"):
+                    webLink = "https:" + href
+                elif href.startswith("http"):
+                    webLink = href
+                else:
+                    webLink = href
+                name = a_tag.get_text(strip=True)
+                item_links.append({
+                    "name": name,
+                    "webLink": webLink,
+                    "columns": {header: cell.get_text(" ", strip=True) for header, cell in zip(headers, cells)}
+                })
+    else:
+        print(f"Could not find the {category.label} table on the page.")
+    return item_links
+
+
+def get_raw_item_data(soup):
+    """
+    Extracts extra data from the detail page.
+
+    Expects the extra data to be contained in:
+      <div id="esoil_rawdata">
+         <table id="esoil_rawdatatable">
+            <tr>
+              <td>itemId</td>
+              <td id="">204807</td>
+            </tr>
+            <tr>
+              <td>allNames</td>
+              <td id="">A Clear Day in Colovia Painting, Metal; ...</td>
+            </tr>
+            ...
+         </table>
+      </div>
+
+    Returns a dictionary of key/value pairs extracted from the table.
+    This is the reference BeautifulSoup implementation; the scrapers use the
+    faster uesp_rawdata.extract_raw_item_data, which returns the same data.
+    """
+    raw_data = {}
+    div_data = soup.find("div", id="esoil_rawdata")
+    if not div_data:
+        return raw_data
+    table = div_data.find("table", id="esoil_rawdatatable")
+    if not table:
+        return raw_data
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) >= 2:
+            key = cells[0].get_text(separator=" ", strip=True)
+            value = cells[1].get_text(separator=" ", strip=True)
+            raw_data[key] = value
+    return raw_data
+
+
+def parse_item_data(category, item, content):
+    """
+    Builds the result record for an item (with 'name' and 'webLink' keys
+    from the list page) from the HTML of its detail page. It holds:
+      - itemId
+      - allNames
+      - description
+      - icon
+      - furnDataId
+      - furnCategory
+      - webLink (from the list page)
+      - name (from raw data if available; otherwise, the list page name)
+      - the category's extra_fields
+    """
+    return build_item_result(category, item, uesp_rawdata.extract_raw_item_data(content))
+
+
+def build_item_result(category, item, raw_data):
+    """
+    Builds the result record (a uesp_item.Item) for an item from its detail
+    page's raw data; see parse_item_data.
+    """
+    return uesp_item.Item(
+        item_id=raw_data.get("itemId", ""),
+        web_link=item["webLink"],
+        name=raw_data.get("name", item["name"]),
+        all_names=raw_data.get("allNames", ""),
+        description=raw_data.get("description", ""),
+        icon=raw_data.get("icon", ""),
+        furn_data_id=raw_data.get("furnDataId", ""),
+        furn_category=raw_data.get("furnCategory", ""),
+        link=raw_data.get("link", "") if "link" in category.extra_fields else None,
+    )
+
+
+def scrape_item_data(category, item):
+    """
+    Loads an item's detail page via its webLink and returns parse_item_data's dictionary.
+    """
+    response = uesp_fetch.get(item["webLink"])
+    return parse_item_data(category, item, response.content)
+
+
+def export_to_excel(results, filename, headers=RESULT_FIELDS):
+    """
+    Exports the results to an Excel (.xlsx) file using openpyxl.
+    Sets preset column widths for readability.
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.append(headers)
+
+    # Append each data row.
+    for data in results:
+        row = [data.get(col, "") for col in headers]
+        ws.append(row)
+
+    for i, col in enumerate(headers, start=1):
+        col_letter = get_column_letter(i)
+        ws.column_dimensions[col_letter].width = COLUMN_WIDTHS.get(col, 20)
+
+    wb.save(filename)
+
+
+def main(category, argv=None):
+    """
+    Command-line entry point shared by every uesp_<kind>_scraper.py: scrapes
+    the category's list and detail pages into its records file and the
+    catalog, and into its results workbook too with --excel.
+
+    A detail page that cannot be fetched or holds no raw data does not stop
+    the crawl: it keeps its row from the stored results (it is left out if
+    it has none) and is listed in the category's dead-letter file. When more
+    than MAX_FAILED_SHARE of the pages fail, nothing is written and
+    RuntimeError is raised, so an outage never empties the results. Returns
+    a summary dictionary with the number of exported items and the failures.
+    """
+    records_filename = records_path(category)
+    excel_filename = results_path(category)
+    parser = argparse.ArgumentParser(description=f"Scrape the UESP {category.label} list into {records_filename}.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only fetch detail pages for new or changed list entries and merge them into the existing results.")
+    parser.add_argument("--fast", action="store_true",
+                        help="Like --incremental, but take a renamed item's name from the list page instead of "
+                             "fetching its detail page again.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted crawl, skipping the items saved in its checkpoint journal.")
+    parser.add_argument("--excel", action="store_true",
+                        help=f"Also export the results to {excel_filename} for review by hand.")
+    parser.add_argument("--api", action="store_true",
+                        help="Experimental, unverified against the real wiki: read detail pages in batches through the "
+                             "wiki's API, fetching only the ones it misses page by page.")
+    args = parser.parse_args(argv)
+
+    # Requests, parse time and stage timings below are recorded for this category.
+    with uesp_metrics.category(category.key):
+        summary = _crawl(category, args)
+        uesp_metrics.get_metrics().finish_category(summary["items"])
+    return summary
+
+
+def _crawl(category, args):
+    records_filename = records_path(category)
+    excel_filename = results_path(category)
+
+    # Create the results folder if it doesn't exist.
+    os.makedirs(RESULTS_FOLDER, exist_ok=True)
+
+    with uesp_metrics.stage("list"):
+        items = get_item_links(category)
+    print(f"Found {len(items)} {category.label} on the list page.")
+
+    # The stored rows stand in for the detail pages that fail this time.
+    stored = uesp_incremental.load_results(latest_results_path(category))
+    to_fetch = items
+    incremental = args.incremental or args.fast
+    if incremental:
+        plan = uesp_incremental.IncrementalPlan(items, stored, refresh_from_list=args.fast)
+        to_fetch = plan.to_fetch
+        print(f"Incremental update: {plan.summary()}")
+
+    # Every scraped record is journaled, so an interrupted crawl can be resumed.
+    journal = uesp_journal.CheckpointJournal(journal_path(category))
+    done = journal.load() if args.resume else {}
+    if done:
+        print(f"Resuming: {len(done)} {category.label} already scraped.")
+    pending = [item for item in to_fetch if item["webLink"] not in done]
+
+    # Each detail page is fetched once, even if it is linked several times or
+    # is scraped for another category in this run (see claim_detail).
+    urls = []
+    shared = {}
+    first_item = {}
+    for item in pending:
+        url = item["webLink"]
+        if url in first_item:
+            continue
+        first_item[url] = item
+        future, claimed = claim_detail(url)
+        if claimed:
+            urls.append(url)
+        else:
+            shared[url] = future
+    if len(urls) < len(pending):
+        print(f"Fetching {len(urls)} detail pages for {len(pending)} {category.label} "
+              f"({len(shared)} scraped for another category in this run).")
+
+    def handle_raw_data(url, raw_data):
+        item = first_item[url]
+        result = build_item_result(category, item, raw_data)
+        # Error and maintenance pages can come back as 200 without the raw-data table.
+        if uesp_incremental.missing_details(result):
+            raise ValueError("no esoil_rawdata table on the page")
+        remember_detail(url, raw_data)
+        print(f"Scraped details for: {item['name']} ({item['webLink']})")
+        journal.append(result)
+        return result
+
+    failures = []
+    reused = {}
+    fetched = []
+    try:
+        try:
+            journal.open(resume=args.resume)
+            page_urls = urls
+            if args.api:
+                with uesp_metrics.stage("api"):
+                    batched, api_failures = uesp_wikiapi.fetch_raw_data([first_item[url] for url in urls])
+                fetched = [handle_raw_data(url, batched[url]) for url in urls if url in batched]
+                page_urls = [url for url in urls if url not in batched]
+                print(f"Read {len(batched)} {category.label} through the wiki API; "
+                      f"{len(page_urls)} left to fetch page by page"
+                      + (f" ({len(api_failures)} API batches failed)." if api_failures else "."))
+            # Pages are downloaded, parsed by the parser pool and turned into
+            # results at the same time (see uesp_pipeline).
+            with uesp_metrics.stage("details"):
+                page_results, queue_stats = uesp_pipeline.run(
+                    page_urls, lambda index, raw_data: handle_raw_data(page_urls[index], raw_data), failures)
+            fetched += page_results
+        finally:
+            # Settled even on failure, so the categories waiting for these pages never hang.
+            release_details(urls)
+        # The pages claimed by another category are taken from it once it has
+        # them; the ones it could not scrape are fetched here after all.
+        missed = []
+        for url, future in shared.items():
+            raw_data = future.result()
+            if raw_data is None:
+                missed.append(url)
+            else:
+                reused[url] = build_item_result(category, first_item[url], raw_data)
+                journal.append(reused[url])
+        if missed:
+            with uesp_metrics.stage("details"):
+                missed_results, _ = uesp_pipeline.run(
+                    missed, lambda index, raw_data: handle_raw_data(missed[index], raw_data), failures)
+            fetched += missed_results
+    finally:
+        journal.close()
+    depths = queue_stats.summary()
+    print(f"{category.label}: at most {depths['max_fetched']} pages waited for a parser and "
+          f"{depths['max_parsing']} were in the parsers; downloads waited for the parsers {depths['fetch_waits']} times.")
+
+    failed_file = write_failures(category, failures)
+    if failures and len(failures) > MAX_FAILED_SHARE * len(first_item):
+        # An outage, not a few bad pages: keep the stored results and the journal as they are.
+        raise RuntimeError(f"{len(failures)} of {len(first_item)} {category.label} could not be scraped "
+                           f"(see {failed_file}); the stored results were left unchanged")
+
+    by_link = {**done, **reused, **{result["webLink"]: result for result in fetched if result is not None}}
+    if incremental:
+        results = plan.merge([by_link[item["webLink"]] for item in to_fetch if item["webLink"] in by_link])
+    else:
+        # Like IncrementalPlan.merge: a page that failed keeps its stored row.
+        stored_by_link = {row["webLink"]: row for row in stored}
+        results = [by_link.get(item["webLink"]) or stored_by_link[item["webLink"]] for item in to_fetch
+                   if item["webLink"] in by_link or item["webLink"] in stored_by_link]
+
+    fields = result_fields(category)
+    with uesp_metrics.stage("export"):
+        uesp_records.write_records(results, records_filename, fields)
+        if args.excel:
+            export_to_excel(results, excel_filename, fields)
+        with uesp_catalog.Catalog() as catalog:
+            catalog.sync(category.key, results)
+    journal.discard()
+    print(f"Export complete. Data saved to {records_filename}" + (f" and {excel_filename}" if args.excel else ""))
+    if failed_file:
+        print(f"{len(failures)} {category.label} could not be scraped; their stored rows were kept. See {failed_file}")
+    return {"items": len(results), "failures": failures}
@@ -0,0 +1,96 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Connections kept open per host. Should be at least the number of requests
+# allowed in flight, otherwise requests wait for a free connection.
+DEFAULT_POOL_SIZE = 8
+# Number of hosts whose pools are kept (en.uesp.net and esoitem.uesp.net today).
+DEFAULT_POOL_HOSTS = 4
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    # Every encoding urllib3 can decode here (gzip and deflate, plus br/zstd
+    # when their optional packages are installed).
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+}
+
+_lock = threading.Lock()
+_session = None
+_pool_size = DEFAULT_POOL_SIZE
+
+
+def _create_session(pool_size):
+    session = requests.Session()
+    # pool_block makes threads wait for a pooled connection instead of
+    # opening throwaway extra ones when every connection is busy.
+    adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_HOSTS, pool_maxsize=pool_size, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+def configure(pool_size=DEFAULT_POOL_SIZE):
+    """
+    Sets the number of keep-alive connections kept per host.
+    Closes the current session; the next get_session() call opens a new one.
+    """
+    global _pool_size
+    if pool_size < 1:
+        raise ValueError("pool_size must be at least 1")
+    with _lock:
+        _pool_size = pool_size
+    close()
+
+
+def get_session():
+    """
+    Returns the session shared by every scraper in this process, creating it on first use.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _create_session(_pool_size)
+        return _session
+
+
+def close():
+    """
+    Closes the shared session and all of its pooled connections.
+    """
+    global _session
+    with _lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+
+
+def connection_stats():
+    """
+    Returns counters for the shared session's connection pools:
+      - requests: requests sent over pooled connections.
+      - connections_opened: new TCP (and TLS) connections made.
+      - connections_reused: requests that went over an already open connection.
+    """
+    requests_sent = 0
+    connections_opened = 0
+    with _lock:
+        session = _session
+    if session is not None:
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_sent += pool.num_requests
+                connections_opened += pool.num_connections
+    return {
+        "requests": requests_sent,
+        "connections_opened": connections_opened,
+        "connections_reused": max(0, requests_sent - connections_opened),
+    }
@@ -0,0 +1,126 @@
+"""
+Batched detail-page backend using the UESP wiki's MediaWiki API.
+
+Instead of downloading every item page with the whole wiki skin, one
+action=parse request renders the content of up to BATCH_SIZE item pages: each
+page is transcluded ({{:Title}}) after a marker, and the rendered HTML is cut
+at the markers and read with uesp_rawdata like a full page. A page's raw data
+is only used when it holds the same itemId as the item's webLink (when the
+link has one); every other item is left for the per-page fetch, so the
+results are the same as with that backend.
+
+Items are matched to wiki pages by their webLink when it is a /wiki/ link,
+and by their list-page name in the Online namespace otherwise. The list pages
+link to esoitem.uesp.net, so every title is such a guess: whether the wiki
+has those pages is unverified until benchmarks/record_api_responses.py has
+recorded real answers, and --api stays off by default.
+"""
+import json
+import re
+from urllib.parse import unquote, urlencode, urlsplit
+
+import uesp_fetch
+import uesp_incremental
+import uesp_rawdata
+
+API_URL = "https://en.uesp.net/w/api.php"
+
+# Titles transcluded per request. Keeps the GET URL well under common length limits.
+BATCH_SIZE = 25
+
+# Namespace of the item pages whose list entries do not link to the wiki.
+ITEM_NAMESPACE = "Online"
+
+_MARKER = '<span class="ranckors-batch" data-index="{}"></span>'
+_MARKER_RE = re.compile(r'<span class="ranckors-batch" data-index="(\d+)"></span>')
+
+
+def page_title(item):
+    """
+    Returns the wiki page title of an item (a dictionary with 'name' and 'webLink').
+    """
+    parts = urlsplit(item["webLink"])
+    if parts.path.startswith("/wiki/") and not parts.query:
+        return unquote(parts.path[len("/wiki/"):]).replace("_", " ")
+    return f"{ITEM_NAMESPACE}:{item['name']}"
+
+
+def batch_url(titles):
+    """
+    Returns the action=parse URL that renders the given pages, each after its marker.
+    """
+    text = "\n".join(f"{_MARKER.format(index)}\n{{{{:{title}}}}}" for index, title in enumerate(titles))
+    return API_URL + "?" + urlencode({
+        "action": "parse",
+        "format": "json",
+        "formatversion": 2,
+        "contentmodel": "wikitext",
+        "prop": "text",
+        "disablelimitreport": 1,
+        "disableeditsection": 1,
+        "text": text,
+    })
+
+
+def split_batch(rendered, count):
+    """
+    Cuts the rendered HTML of a batch at its markers. Returns a list of
+    `count` HTML fragments ("" for the pages that did not render).
+    """
+    fragments = [""] * count
+    matches = list(_MARKER_RE.finditer(rendered))
+    for position, match in enumerate(matches):
+        index = int(match.group(1))
+        end = matches[position + 1].start() if position + 1 < len(matches) else len(rendered)
+        if index < count:
+            fragments[index] = rendered[match.end():end]
+    return fragments
+
+
+def parse_batch(items, content):
+    """
+    Reads the raw data of the items' pages from the JSON (bytes) api.php
+    answered to their batch_url. Returns {webLink: raw data} for the items
+    whose page rendered with a matching esoil_rawdata table.
+    """
+    payload = json.loads(content)
+    if "error" in payload:
+        raise ValueError(f"API error: {payload['error'].get('info', payload['error'])}")
+    fragments = split_batch(payload["parse"]["text"], len(items))
+    found = {}
+    for item, fragment in zip(items, fragments):
+        raw_data = uesp_rawdata.extract_raw_item_data(fragment) if fragment else {}
+        expected = uesp_incremental.item_id_from_link(item["webLink"])
+        if not raw_data.get("itemId") or (expected and raw_data["itemId"] != expected):
+            continue
+        found[item["webLink"]] = raw_data
+    return found
+
+
+def fetch_raw_data(items, batch_size=BATCH_SIZE):
+    """
+    Fetches the raw data of the items' pages through the API, BATCH_SIZE
+    pages per request. Returns {webLink: raw data} for the items it could
+    read (the others should be fetched page by page) and the
+    uesp_fetch.describe_failure entries of the batches that failed.
+
+    The first batch is sent on its own as a probe: if it fails or none of
+    its pages match, the wiki does not render the pages as expected and the
+    other batches are not sent, so at most one request is wasted.
+    """
+    batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+    urls = [batch_url([page_title(item) for item in batch]) for batch in batches]
+    found = {}
+    failures = []
+    if not batches:
+        return found, failures
+    probe = uesp_fetch.fetch_all(urls[:1], lambda index, response: parse_batch(batches[0], response.content),
+                                 failures=failures)[0]
+    if not probe:
+        return found, failures
+    found.update(probe)
+    for batch_found in uesp_fetch.fetch_all(urls[1:],
+                                            lambda index, response: parse_batch(batches[index + 1], response.content),
+                                            failures=failures):
+        found.update(batch_found or {})
+    return found, failures